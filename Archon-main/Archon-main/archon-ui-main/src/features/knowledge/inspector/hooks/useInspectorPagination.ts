@@ -43,22 +43,23 @@ export function useInspectorPagination({
       viewMode === "documents" ? "chunks-infinite" : "code-examples-infinite",
     ],
     queryFn: ({ pageParam }: { pageParam: unknown }) => {
-      const page = Number(pageParam) || 0;
+      // Cursor from the previous page (keyset pagination, same cost at any depth)
+      const cursor = typeof pageParam === "string" ? pageParam : undefined;
       const service =
         viewMode === "documents" ? knowledgeService.getKnowledgeItemChunks : knowledgeService.getCodeExamples;
 
       return service(sourceId, {
         limit: PAGE_SIZE,
-        offset: page * PAGE_SIZE,
+        cursor,
       });
     },
-    getNextPageParam: (lastPage, allPages) => {
-      const hasMore = (lastPage as ChunksResponse | CodeExamplesResponse)?.has_more;
-      return hasMore ? allPages.length : undefined;
+    getNextPageParam: (lastPage) => {
+      const page = lastPage as ChunksResponse | CodeExamplesResponse;
+      return page?.has_more && page.next_cursor ? page.next_cursor : undefined;
     },
     enabled: !!sourceId,
     staleTime: STALE_TIMES.normal,
-    initialPageParam: 0,
+    initialPageParam: null,
   });
 
   // Flatten the paginated data and apply search filtering
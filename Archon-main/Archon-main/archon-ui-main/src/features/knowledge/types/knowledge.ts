@@ -108,9 +108,11 @@ export interface ChunksResponse {
   domain_filter?: string | null;
   chunks: DocumentChunk[];
   total: number;
+  total_estimated?: boolean;
   limit: number;
   offset: number;
   has_more: boolean;
+  next_cursor?: string | null;
 }
 
 export interface CodeExamplesResponse {
@@ -118,9 +120,11 @@ export interface CodeExamplesResponse {
   source_id: string;
   code_examples: CodeExample[];
   total: number;
+  total_estimated?: boolean;
   limit: number;
   offset: number;
   has_more: boolean;
+  next_cursor?: string | null;
 }
 
 // Request types
@@ -0,0 +1,47 @@
+-- =====================================================
+-- Add grouped task counts function
+-- =====================================================
+-- This migration adds get_project_task_counts(), which returns the
+-- number of non-archived tasks per project and status using
+-- GROUP BY in the database:
+-- - The /projects/task-counts endpoint no longer fetches one row
+--   per task and counts them in Python
+-- - A partial index on (project_id, status) keeps the aggregate
+--   cheap as archived task history grows
+--
+-- SAFE & IDEMPOTENT: Can be run multiple times without issues
+-- Compatible with complete_setup.sql for fresh installations
+-- =====================================================
+
+-- Index covering the grouped count over active tasks
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_active_project_status
+    ON archon_tasks(project_id, status)
+    WHERE archived IS NOT TRUE;
+
+-- Task counts per project and status, excluding archived tasks
+CREATE OR REPLACE FUNCTION get_project_task_counts()
+RETURNS TABLE (
+    project_id UUID,
+    status TEXT,
+    task_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT t.project_id, t.status::TEXT, COUNT(*) AS task_count
+    FROM archon_tasks t
+    WHERE t.archived IS NOT TRUE
+      AND t.project_id IS NOT NULL
+    GROUP BY t.project_id, t.status;
+$$;
+
+COMMENT ON FUNCTION get_project_task_counts() IS 'Number of non-archived tasks per project and status, for the task counts endpoint';
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '012_add_task_counts_function')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
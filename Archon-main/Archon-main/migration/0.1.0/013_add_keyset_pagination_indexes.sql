@@ -0,0 +1,28 @@
+-- =====================================================
+-- Add keyset pagination indexes for knowledge item browsing
+-- =====================================================
+-- The chunks and code examples endpoints page through a source with
+-- a cursor on (url, id) and (id) respectively. These composite
+-- indexes let every page start with an index seek at the cursor, so
+-- page 500 of a large source costs the same as page 1.
+--
+-- SAFE & IDEMPOTENT: Can be run multiple times without issues
+-- Compatible with complete_setup.sql for fresh installations
+-- =====================================================
+
+-- Chunks: WHERE source_id = ? AND (url, id) > (?, ?) ORDER BY url, id
+CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_source_url_id
+    ON archon_crawled_pages (source_id, url, id);
+
+-- Code examples: WHERE source_id = ? AND id > ? ORDER BY id
+CREATE INDEX IF NOT EXISTS idx_archon_code_examples_source_id_id
+    ON archon_code_examples (source_id, id);
+
+-- Record migration application for tracking
+INSERT INTO archon_migrations (version, migration_name)
+VALUES ('0.1.0', '013_add_keyset_pagination_indexes')
+ON CONFLICT (version, migration_name) DO NOTHING;
+
+-- =====================================================
+-- MIGRATION COMPLETE
+-- =====================================================
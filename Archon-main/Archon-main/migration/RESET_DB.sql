@@ -147,6 +147,7 @@ BEGIN
     
     -- Task management functions
     DROP FUNCTION IF EXISTS archive_task(UUID, TEXT) CASCADE;
+    DROP FUNCTION IF EXISTS get_project_task_counts() CASCADE;
     
     RAISE NOTICE 'Functions dropped successfully.';
     
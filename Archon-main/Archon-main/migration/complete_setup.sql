@@ -140,7 +140,11 @@ INSERT INTO archon_settings (key, value, is_encrypted, category, description) VA
 ('CRAWL_MAX_CONCURRENT', '10', false, 'rag_strategy', 'Maximum concurrent browser sessions for crawling (1-20)'),
 ('CRAWL_WAIT_STRATEGY', 'domcontentloaded', false, 'rag_strategy', 'When to consider page loaded: domcontentloaded, networkidle, or load'),
 ('CRAWL_PAGE_TIMEOUT', '30000', false, 'rag_strategy', 'Maximum time to wait for page load in milliseconds'),
-('CRAWL_DELAY_BEFORE_HTML', '0.5', false, 'rag_strategy', 'Time to wait for JavaScript rendering in seconds (0.1-5.0)')
+('CRAWL_DELAY_BEFORE_HTML', '0.5', false, 'rag_strategy', 'Time to wait for JavaScript rendering in seconds (0.1-5.0)'),
+('CRAWL_FRONTIER_MODE', 'continuous', false, 'rag_strategy', 'Recursive crawl scheduling: continuous (work-queue frontier) or depth (level-by-level batches)'),
+('CRAWL_MAX_PER_HOST', '10', false, 'rag_strategy', 'Maximum pages crawled concurrently per host in continuous frontier mode'),
+('CRAWL_CHECKPOINT_INTERVAL', '30', false, 'rag_strategy', 'Seconds between crawl checkpoint writes used to resume interrupted crawls'),
+('CRAWL_CHECKPOINT_MAX_AGE_HOURS', '168', false, 'rag_strategy', 'Hours before the checkpoint of a crawl that was never resumed is removed')
 ON CONFLICT (key) DO NOTHING;
 
 -- Document Storage Performance Settings (from add_performance_settings.sql and optimize_batch_sizes.sql)
@@ -238,6 +242,8 @@ CREATE INDEX IF NOT EXISTS idx_archon_crawled_pages_embedding_1536 ON archon_cra
 -- Other indexes for archon_crawled_pages
 CREATE INDEX idx_archon_crawled_pages_metadata ON archon_crawled_pages USING GIN (metadata);
 CREATE INDEX idx_archon_crawled_pages_source_id ON archon_crawled_pages (source_id);
+-- Keyset pagination index for browsing a source's chunks by (url, id)
+CREATE INDEX idx_archon_crawled_pages_source_url_id ON archon_crawled_pages (source_id, url, id);
 -- Hybrid search indexes
 CREATE INDEX idx_archon_crawled_pages_content_search ON archon_crawled_pages USING GIN (content_search_vector);
 CREATE INDEX idx_archon_crawled_pages_content_trgm ON archon_crawled_pages USING GIN (content gin_trgm_ops);
@@ -350,6 +356,8 @@ CREATE INDEX IF NOT EXISTS idx_archon_code_examples_embedding_1536 ON archon_cod
 -- Other indexes for archon_code_examples
 CREATE INDEX idx_archon_code_examples_metadata ON archon_code_examples USING GIN (metadata);
 CREATE INDEX idx_archon_code_examples_source_id ON archon_code_examples (source_id);
+-- Keyset pagination index for browsing a source's code examples by id
+CREATE INDEX idx_archon_code_examples_source_id_id ON archon_code_examples (source_id, id);
 -- Hybrid search indexes
 CREATE INDEX idx_archon_code_examples_content_search ON archon_code_examples USING GIN (content_search_vector);
 CREATE INDEX idx_archon_code_examples_content_trgm ON archon_code_examples USING GIN (content gin_trgm_ops);
@@ -950,6 +958,7 @@ CREATE INDEX IF NOT EXISTS idx_archon_tasks_order ON archon_tasks(task_order);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_priority ON archon_tasks(priority);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_archived ON archon_tasks(archived);
 CREATE INDEX IF NOT EXISTS idx_archon_tasks_archived_at ON archon_tasks(archived_at);
+CREATE INDEX IF NOT EXISTS idx_archon_tasks_active_project_status ON archon_tasks(project_id, status) WHERE archived IS NOT TRUE;
 CREATE INDEX IF NOT EXISTS idx_archon_project_sources_project_id ON archon_project_sources(project_id);
 CREATE INDEX IF NOT EXISTS idx_archon_project_sources_source_id ON archon_project_sources(source_id);
 CREATE INDEX IF NOT EXISTS idx_archon_document_versions_project_id ON archon_document_versions(project_id);
@@ -1008,6 +1017,23 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Task counts per project and status (excluding archived tasks) for the task counts endpoint
+CREATE OR REPLACE FUNCTION get_project_task_counts()
+RETURNS TABLE (
+    project_id UUID,
+    status TEXT,
+    task_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT t.project_id, t.status::TEXT, COUNT(*) AS task_count
+    FROM archon_tasks t
+    WHERE t.archived IS NOT TRUE
+      AND t.project_id IS NOT NULL
+    GROUP BY t.project_id, t.status;
+$$;
+
 -- Add comments to document the soft delete fields
 COMMENT ON COLUMN archon_tasks.assignee IS 'The agent or user assigned to this task. Can be any valid agent name or "User"';
 COMMENT ON COLUMN archon_tasks.priority IS 'Task priority level independent of visual ordering - used for semantic importance (low, medium, high, critical)';
@@ -1062,7 +1088,9 @@ VALUES
   ('0.1.0', '008_add_migration_tracking'),
   ('0.1.0', '009_add_cascade_delete_constraints'),
   ('0.1.0', '010_add_provider_placeholders'),
-  ('0.1.0', '011_add_page_metadata_table')
+  ('0.1.0', '011_add_page_metadata_table'),
+  ('0.1.0', '012_add_task_counts_function'),
+  ('0.1.0', '013_add_keyset_pagination_indexes')
 ON CONFLICT (version, migration_name) DO NOTHING;
 
 -- Enable Row Level Security on migrations table
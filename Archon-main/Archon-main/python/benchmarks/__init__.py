@@ -0,0 +1,6 @@
+"""
+Benchmarks for Archon server pipelines.
+
+Run from the python/ directory, e.g.:
+    uv run python -m benchmarks.ingestion_benchmark --help
+"""
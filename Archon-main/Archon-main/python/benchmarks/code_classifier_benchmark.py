@@ -0,0 +1,337 @@
+"""
+Code Classifier Benchmark
+
+Measures the per-block CPU cost of the code extraction heuristics over a
+fixture corpus of documentation-site code blocks (benchmarks/fixtures/
+code_blocks.json), comparing the precompiled classifier in
+src/server/services/crawling/code_classifier.py against reference copies of
+the original per-call regex implementations kept in this module.
+
+Each run first checks parity: both implementations must produce identical
+cleaned code, accept/reject decisions, detected languages and PDF section
+classifications for every block, otherwise the benchmark exits non-zero.
+
+Usage (from the python/ directory):
+    uv run python -m benchmarks.code_classifier_benchmark --iterations 200
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from src.server.services.crawling import code_classifier
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "code_blocks.json"
+
+# Default extraction settings (see CodeExtractionService._get_setting defaults)
+MIN_CODE_INDICATORS = 3
+MAX_PROSE_RATIO = 0.15
+
+
+def load_blocks(path: Path = FIXTURE_PATH) -> list[dict[str, str]]:
+    """Load the fixture corpus: a list of {"source", "language", "code"} entries."""
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+# --- Reference implementations (the original per-call regex versions) ---
+
+
+def legacy_decode_html_entities(text: str) -> str:
+    if "</span><span" in text:
+        text = re.sub(r"</span>", "", text)
+        text = re.sub(r"<span[^>]*>", "", text)
+    else:
+        text = re.sub(r"</span>(?=[A-Za-z0-9])", " ", text)
+        text = re.sub(r"<span[^>]*>", "", text)
+
+    text = re.sub(r"</?[^>]+>", "", text)
+
+    for entity, char in code_classifier.HTML_ENTITIES.items():
+        text = text.replace(entity, char)
+
+    text = text.replace("\\n", "\n")
+
+    cleaned_lines = []
+    for line in text.split("\n"):
+        line = re.sub(r" +", " ", line)
+        cleaned_lines.append(line.rstrip())
+    return "\n".join(cleaned_lines)
+
+
+def legacy_clean_code_content(code: str, language: str = "") -> str:
+    code = legacy_decode_html_entities(code)
+
+    spacing_fixes = [
+        (r"(\b(?:from|import|as)\b)([A-Za-z])", r"\1 \2"),
+        (r"(\b(?:def|class|async|await|return|raise|yield)\b)([A-Za-z])", r"\1 \2"),
+        (r"(\b(?:if|elif|else|for|while|try|except|finally|with)\b)([A-Za-z])", r"\1 \2"),
+        (
+            r"(\b(?:int|str|float|bool|list|dict|tuple|set|None|True|False)\b)([A-Za-z])",
+            r"\1 \2",
+        ),
+        (r"(\b(?:and|or|not|in|is|lambda)\b)([A-Za-z])", r"\1 \2"),
+        (r"([A-Za-z_)])(\+|-|\*|/|=|<|>|%)", r"\1 \2"),
+        (r"(\+|-|\*|/|=|<|>|%)([A-Za-z_(])", r"\1 \2"),
+    ]
+    for pattern, replacement in spacing_fixes:
+        code = re.sub(pattern, replacement, code)
+
+    if language.lower() in ["python", "py"]:
+        code = re.sub(r"(\b(?:from|import)\b)(\w+)(\b(?:import)\b)", r"\1 \2 \3", code)
+        code = re.sub(
+            r"(\b(?:def|class|if|elif|else|for|while|try|except|finally|with)\b[^:]+)$",
+            r"\1:",
+            code,
+            flags=re.MULTILINE,
+        )
+
+    if code.startswith("```") and code.endswith("```"):
+        lines = code.split("\n")
+        if len(lines) > 2:
+            code = "\n".join(lines[1:-1])
+    elif code.startswith("`") and code.endswith("`"):
+        code = code[1:-1]
+
+    cleaned_lines = []
+    for line in code.split("\n"):
+        stripped = line.lstrip()
+        indent = line[: len(line) - len(stripped)]
+        cleaned_lines.append(indent + re.sub(r" {2,}", " ", stripped))
+    return "\n".join(cleaned_lines).strip()
+
+
+def legacy_validate_code_quality(
+    code: str,
+    language: str = "",
+    min_indicators: int = MIN_CODE_INDICATORS,
+    max_prose_ratio: float = MAX_PROSE_RATIO,
+) -> bool:
+    if not code or len(code.strip()) < 20:
+        return False
+
+    if language.lower() in ["mermaid", "plantuml", "graphviz", "dot", "diagram"]:
+        return False
+
+    bad_patterns = [
+        r"\b(from|import|def|class|if|for|while|return)(?=[a-z])",
+        r"&[lg]t;|&amp;|&quot;|&#\d+;",
+        r"<[^>]{50,}>",
+        r"(<span[^>]*>){5,}",
+        r"[^\s]{200,}",
+    ]
+    for pattern in bad_patterns:
+        if re.search(pattern, code):
+            return False
+
+    indicator_count = 0
+    for pattern in code_classifier.CODE_INDICATORS.values():
+        if re.search(pattern, code):
+            indicator_count += 1
+    if indicator_count < min_indicators:
+        return False
+
+    lines = code.split("\n")
+    non_empty_lines = [line for line in lines if line.strip()]
+    if not non_empty_lines:
+        return False
+
+    comment_patterns = [r"^\s*(//|#|/\*|\*|<!--)", r'^\s*"""', r"^\s*'''", r"^\s*\*\s"]
+    comment_lines = 0
+    for line in lines:
+        for pattern in comment_patterns:
+            if re.match(pattern, line.strip()):
+                comment_lines += 1
+                break
+    if comment_lines / len(non_empty_lines) > 0.7:
+        return False
+
+    if language.lower() in code_classifier.LANGUAGE_PATTERNS:
+        indicators = code_classifier.LANGUAGE_PATTERNS[language.lower()]["min_indicators"]
+        if sum(1 for indicator in indicators if indicator in code.lower()) < 2:
+            return False
+
+    if len(non_empty_lines) < 3:
+        return False
+
+    very_long_lines = sum(1 for line in lines if len(line) > 300)
+    if very_long_lines > len(lines) * 0.5:
+        return False
+
+    prose_indicators = [
+        r"\b(the|this|that|these|those|is|are|was|were|will|would|should|could|have|has|had)\b",
+        r"[.!?]\s+[A-Z]",
+        r"\b(however|therefore|furthermore|moreover|nevertheless)\b",
+    ]
+    prose_score = sum(len(re.findall(p, code, re.IGNORECASE)) for p in prose_indicators)
+    word_count = len(code.split())
+    if word_count > 0 and prose_score / word_count > max_prose_ratio:
+        return False
+
+    return True
+
+
+def legacy_detect_language(code: str) -> str:
+    scores = {}
+    for lang, patterns in code_classifier.LANGUAGE_DETECTION_PATTERNS.items():
+        score = sum(1 for pattern in patterns if re.search(pattern, code, re.MULTILINE))
+        if score > 0:
+            scores[lang] = score
+    if scores:
+        return max(scores, key=scores.get)
+    return ""
+
+
+def legacy_is_pdf_section_code_like(section: str) -> bool:
+    code_score = 0
+    prose_score = 0
+    prose_patterns = [
+        (r"\b(the|this|that|these|those|are|is|was|were|will|would|should|could|have|has|had)\b", 1),
+        (r"[.!?]\s+[A-Z]", 2),
+        (r"\b(however|therefore|furthermore|moreover|additionally|specifically)\b", 2),
+        (r"\bTable of Contents\b", 3),
+        (r"\bAPI Reference\b", 2),
+    ]
+    for pattern, weight in code_classifier.PDF_CODE_PATTERNS:
+        code_score += len(re.findall(pattern, section, re.IGNORECASE | re.MULTILINE)) * weight
+    for pattern, weight in prose_patterns:
+        prose_score += len(re.findall(pattern, section, re.IGNORECASE | re.MULTILINE)) * weight
+
+    non_empty_lines = [line.strip() for line in section.split("\n") if line.strip()]
+    if not non_empty_lines:
+        return False
+    short_lines = sum(1 for line in non_empty_lines if len(line.split()) < 3)
+    if short_lines / len(non_empty_lines) > 0.7:
+        prose_score += 3
+    if any("(" in line and ")" in line for line in non_empty_lines[:5]):
+        code_score += 2
+    return code_score > prose_score and code_score > 2
+
+
+# --- Harness ---
+
+
+def _compiled_validate(code: str, language: str) -> bool:
+    passed, _ = code_classifier.check_code_quality(
+        code, language, min_indicators=MIN_CODE_INDICATORS, max_prose_ratio=MAX_PROSE_RATIO
+    )
+    return passed
+
+
+@dataclass
+class StageResult:
+    """Timing of one heuristic over the corpus."""
+
+    stage: str
+    legacy_us_per_block: float
+    compiled_us_per_block: float
+
+    @property
+    def speedup(self) -> float:
+        return self.legacy_us_per_block / self.compiled_us_per_block if self.compiled_us_per_block else 0.0
+
+
+def _stage_inputs(blocks: list[dict[str, str]]) -> dict[str, list[tuple[Any, ...]]]:
+    cleaned = [legacy_clean_code_content(b["code"], b["language"]) for b in blocks]
+    return {
+        "clean": [(b["code"], b["language"]) for b in blocks],
+        "validate": [(code, b["language"]) for code, b in zip(cleaned, blocks, strict=True)],
+        "detect_language": [(b["code"],) for b in blocks],
+        "pdf_section": [(b["code"],) for b in blocks],
+    }
+
+
+STAGE_FUNCTIONS: dict[str, tuple[Callable[..., Any], Callable[..., Any]]] = {
+    "clean": (legacy_clean_code_content, code_classifier.clean_code_content),
+    "validate": (legacy_validate_code_quality, _compiled_validate),
+    "detect_language": (legacy_detect_language, code_classifier.detect_language),
+    "pdf_section": (legacy_is_pdf_section_code_like, code_classifier.is_pdf_section_code_like),
+}
+
+
+def check_parity(blocks: list[dict[str, str]]) -> list[str]:
+    """Return a description of every block where the implementations disagree."""
+    mismatches = []
+    for stage, args_list in _stage_inputs(blocks).items():
+        legacy, compiled = STAGE_FUNCTIONS[stage]
+        for block, args in zip(blocks, args_list, strict=True):
+            expected, actual = legacy(*args), compiled(*args)
+            if expected != actual:
+                mismatches.append(f"{stage} {block['source']}: {expected!r} != {actual!r}")
+    return mismatches
+
+
+def _time_per_block(func: Callable[..., Any], args_list: list[tuple[Any, ...]], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for args in args_list:
+            func(*args)
+    return (time.perf_counter() - start) / (iterations * len(args_list)) * 1e6
+
+
+def run_benchmark(blocks: list[dict[str, str]], iterations: int = 100) -> list[StageResult]:
+    """Time every stage for both implementations."""
+    results = []
+    for stage, args_list in _stage_inputs(blocks).items():
+        legacy, compiled = STAGE_FUNCTIONS[stage]
+        results.append(
+            StageResult(
+                stage=stage,
+                legacy_us_per_block=_time_per_block(legacy, args_list, iterations),
+                compiled_us_per_block=_time_per_block(compiled, args_list, iterations),
+            )
+        )
+    return results
+
+
+def format_results(results: list[StageResult], block_count: int) -> str:
+    lines = [
+        f"{block_count} blocks",
+        f"{'stage':<16} {'legacy µs':>10} {'compiled µs':>12} {'speedup':>8}",
+    ]
+    for result in results:
+        lines.append(
+            f"{result.stage:<16} {result.legacy_us_per_block:>10.1f} "
+            f"{result.compiled_us_per_block:>12.1f} {result.speedup:>7.2f}x"
+        )
+    legacy_total = sum(r.legacy_us_per_block for r in results)
+    compiled_total = sum(r.compiled_us_per_block for r in results)
+    lines.append(
+        f"{'total':<16} {legacy_total:>10.1f} {compiled_total:>12.1f} "
+        f"{legacy_total / compiled_total if compiled_total else 0.0:>7.2f}x"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the code extraction classifier")
+    parser.add_argument("--iterations", type=int, default=100, help="Passes over the corpus per stage")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURE_PATH, help="Corpus JSON file")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    blocks = load_blocks(args.fixtures)
+    mismatches = check_parity(blocks)
+    if mismatches:
+        print("Classifier decisions differ from the reference implementation:")
+        print("\n".join(mismatches))
+        return 1
+
+    results = run_benchmark(blocks, args.iterations)
+    print(format_results(results, len(blocks)))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                [asdict(result) | {"speedup": result.speedup} for result in results], handle, indent=2
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,633 @@
+"""
+Ingestion Pipeline Benchmark
+
+Drives the real crawl-result-to-stored-chunks path:
+
+    DocumentStorageOperations.process_and_store_documents
+        -> smart_chunk_text_async
+        -> create_embeddings_batch
+        -> add_documents_to_supabase
+
+against a deterministic fake embedding provider and an in-memory Supabase
+stand-in, so throughput can be measured without network access or API keys.
+Provider and database latency plus 429 responses are injectable, which makes
+the harness useful both for catching regressions and for sizing
+EMBEDDING_BATCH_SIZE and CRAWL_MAX_CONCURRENT for a given deployment.
+
+The crawl stage is simulated: pages are "fetched" with a fixed latency under a
+CRAWL_MAX_CONCURRENT semaphore, mirroring how the batch and recursive
+strategies bound in-flight pages.
+
+Usage (from the python/ directory):
+    uv run python -m benchmarks.ingestion_benchmark --pages 200 \\
+        --embedding-batch-size 50,100,200 --crawl-max-concurrent 5,10,20
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import logging
+import math
+import random
+import resource
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass, field
+from multiprocessing import get_context
+from typing import Any
+from unittest.mock import patch
+
+from src.server.services import credential_service as credential_module
+from src.server.services import llm_provider_service
+from src.server.services.crawling import document_storage_operations
+from src.server.services.crawling.document_storage_operations import DocumentStorageOperations
+from src.server.services.crawling.page_storage_operations import PageStorageOperations
+from src.server.services.embeddings import embedding_service
+from src.server.services.embeddings.embedding_exceptions import EmbeddingRateLimitError
+from src.server.services.embeddings.embedding_service import EmbeddingProviderAdapter
+from src.server.services.storage import document_storage_service
+from src.server.services.threading_service import RateLimitConfig, ThreadingService
+
+CHUNK_TABLE = "archon_crawled_pages"
+BENCHMARK_PROVIDER = "benchmark"
+BENCHMARK_EMBEDDING_MODEL = "benchmark-embedding"
+
+# Stages reported in the per-stage breakdown, in pipeline order
+STAGES = ("crawl", "chunking", "source_records", "page_storage", "embedding", "chunk_storage")
+
+
+@dataclass
+class BenchmarkConfig:
+    """One point in the benchmark grid."""
+
+    pages: int = 50
+    page_kb: int = 12
+    embedding_batch_size: int = 100
+    crawl_max_concurrent: int = 10
+    embedding_dimensions: int = 1536
+    fetch_latency_ms: float = 0.0
+    embed_latency_ms: float = 50.0
+    embed_per_item_ms: float = 0.2
+    embed_429_rate: float = 0.0
+    db_latency_ms: float = 5.0
+    db_429_rate: float = 0.0
+    tokens_per_minute: int = RateLimitConfig.tokens_per_minute
+    seed: int = 42
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and stage timings for one :class:`BenchmarkConfig`."""
+
+    config: BenchmarkConfig
+    pages: int
+    chunks: int
+    chunks_stored: int
+    wall_seconds: float
+    pages_per_second: float
+    chunks_per_second: float
+    peak_rss_mb: float
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    embedding_requests: int = 0
+    embedding_429s: int = 0
+    db_round_trips: int = 0
+    db_429s: int = 0
+
+
+class StageTimer:
+    """Accumulates wall-clock seconds per pipeline stage."""
+
+    def __init__(self):
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] += time.perf_counter() - start
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        """Wrap an async callable so every await of it is charged to ``stage``."""
+
+        @functools.wraps(func)
+        async def timed(*args, **kwargs):
+            with self.measure(stage):
+                return await func(*args, **kwargs)
+
+        return timed
+
+
+# ---------------------------------------------------------------------------
+# Fake embedding provider
+# ---------------------------------------------------------------------------
+
+
+class FakeEmbeddingAdapter(EmbeddingProviderAdapter):
+    """
+    Deterministic embedding provider.
+
+    Vectors are derived from a SHA-256 of the text, so identical texts always
+    embed identically across runs. Each request sleeps for a fixed plus
+    per-item latency and fails with a rate limit error at ``rate_limit_rate``.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        per_item_ms: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.per_item_ms = per_item_ms
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(seed)
+        self.requests = 0
+        self.rate_limited = 0
+
+    async def create_embeddings(
+        self,
+        texts: list[str],
+        model: str,
+        dimensions: int | None = None,
+    ) -> list[list[float]]:
+        self.requests += 1
+        delay = (self.latency_ms + self.per_item_ms * len(texts)) / 1000
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.rate_limit_rate and self._rng.random() < self.rate_limit_rate:
+            self.rate_limited += 1
+            raise EmbeddingRateLimitError("429 Too Many Requests (injected by benchmark)")
+        return [fake_embedding(text, dimensions or 1536) for text in texts]
+
+
+def fake_embedding(text: str, dimensions: int) -> list[float]:
+    """Return a unit-length vector seeded by the text's content hash."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    vector = [rng.uniform(-1.0, 1.0) for _ in range(dimensions)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+class BenchmarkCredentials:
+    """Stand-in for credential_service serving fixed settings."""
+
+    def __init__(self, settings: dict[str, str]):
+        self.settings = settings
+
+    async def get_credentials_by_category(self, category: str) -> dict[str, str]:
+        return dict(self.settings)
+
+    async def get_credential(self, key: str, default: Any = None, decrypt: bool = False) -> Any:
+        return self.settings.get(key, default)
+
+    async def get_active_provider(self, service_type: str = "llm") -> dict[str, Any]:
+        return {
+            "provider": BENCHMARK_PROVIDER,
+            "api_key": "benchmark",
+            "chat_model": "benchmark-chat",
+            "embedding_model": BENCHMARK_EMBEDDING_MODEL,
+        }
+
+
+# ---------------------------------------------------------------------------
+# In-memory Supabase stand-in
+# ---------------------------------------------------------------------------
+
+
+class SupabaseRateLimitError(Exception):
+    """Mimics the PostgREST error surfaced when the gateway answers 429."""
+
+
+@dataclass
+class _Response:
+    data: list[dict[str, Any]]
+    count: int | None = None
+
+
+class _Query:
+    """Chainable query builder supporting the subset the pipeline uses."""
+
+    def __init__(self, client: "InMemorySupabase", table: str):
+        self._client = client
+        self.table = table
+        self.op = "select"
+        self.payload: Any = None
+        self.on_conflict: str | None = None
+        self.filters: list[Callable[[dict[str, Any]], bool]] = []
+        self.limit_to: int | None = None
+
+    def select(self, *columns, count: str | None = None) -> "_Query":
+        if self.op not in ("insert", "upsert", "update"):
+            self.op = "select"
+        return self
+
+    def insert(self, rows: Any) -> "_Query":
+        self.op, self.payload = "insert", rows
+        return self
+
+    def upsert(self, rows: Any, on_conflict: str | None = None) -> "_Query":
+        self.op, self.payload, self.on_conflict = "upsert", rows, on_conflict
+        return self
+
+    def update(self, values: dict[str, Any]) -> "_Query":
+        self.op, self.payload = "update", values
+        return self
+
+    def delete(self) -> "_Query":
+        self.op = "delete"
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column: str, values: list[Any]) -> "_Query":
+        wanted = set(values)
+        self.filters.append(lambda row: row.get(column) in wanted)
+        return self
+
+    def order(self, *args, **kwargs) -> "_Query":
+        return self
+
+    def limit(self, count: int) -> "_Query":
+        self.limit_to = count
+        return self
+
+    def execute(self) -> _Response:
+        return self._client._execute(self)
+
+
+class InMemorySupabase:
+    """
+    Synchronous Supabase client stand-in backed by Python dicts.
+
+    Latency is applied with ``time.sleep`` because the real supabase-py
+    client used by the pipeline is synchronous and blocks the event loop for
+    the duration of each round trip. Injected 429s only hit chunk inserts,
+    the one write path in the pipeline that has retry handling.
+    """
+
+    PRIMARY_KEYS = {"archon_sources": "source_id"}
+
+    def __init__(self, latency_ms: float = 0.0, rate_limit_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(seed)
+        self.tables: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        self._ids = itertools.count(1)
+        self.round_trips = 0
+        self.rate_limited = 0
+        self.seconds_by_table: dict[str, float] = defaultdict(float)
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def rows(self, table: str) -> list[dict[str, Any]]:
+        return list(self.tables[table].values())
+
+    def _execute(self, query: _Query) -> _Response:
+        start = time.perf_counter()
+        try:
+            self.round_trips += 1
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            if (
+                query.op == "insert"
+                and query.table == CHUNK_TABLE
+                and self.rate_limit_rate
+                and self._rng.random() < self.rate_limit_rate
+            ):
+                self.rate_limited += 1
+                raise SupabaseRateLimitError("429 Too Many Requests (injected by benchmark)")
+            return getattr(self, f"_{query.op}")(query)
+        finally:
+            self.seconds_by_table[query.table] += time.perf_counter() - start
+
+    def _matching(self, query: _Query) -> list[dict[str, Any]]:
+        rows = [row for row in self.tables[query.table].values() if all(f(row) for f in query.filters)]
+        return rows[: query.limit_to] if query.limit_to is not None else rows
+
+    def _select(self, query: _Query) -> _Response:
+        rows = [dict(row) for row in self._matching(query)]
+        return _Response(data=rows, count=len(rows))
+
+    def _insert(self, query: _Query) -> _Response:
+        rows = query.payload if isinstance(query.payload, list) else [query.payload]
+        stored = []
+        for row in rows:
+            record = {"id": f"{query.table}-{next(self._ids)}", **row}
+            self.tables[query.table][record["id"]] = record
+            stored.append(dict(record))
+        return _Response(data=stored, count=len(stored))
+
+    def _upsert(self, query: _Query) -> _Response:
+        rows = query.payload if isinstance(query.payload, list) else [query.payload]
+        key = query.on_conflict or self.PRIMARY_KEYS.get(query.table, "id")
+        table = self.tables[query.table]
+        stored = []
+        for row in rows:
+            existing = next((r for r in table.values() if r.get(key) == row.get(key)), None)
+            if existing is not None:
+                existing.update(row)
+                stored.append(dict(existing))
+                continue
+            record = {"id": f"{query.table}-{next(self._ids)}", **row}
+            table[record["id"]] = record
+            stored.append(dict(record))
+        return _Response(data=stored, count=len(stored))
+
+    def _update(self, query: _Query) -> _Response:
+        rows = self._matching(query)
+        for row in rows:
+            row.update(query.payload)
+        return _Response(data=[dict(row) for row in rows], count=len(rows))
+
+    def _delete(self, query: _Query) -> _Response:
+        rows = self._matching(query)
+        for row in rows:
+            del self.tables[query.table][row["id"]]
+        return _Response(data=[dict(row) for row in rows], count=len(rows))
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+_WORDS = (
+    "archon agent crawl embedding vector source chunk page knowledge index query "
+    "service provider batch token latency document markdown section context model "
+    "retrieval storage pipeline rerank hybrid keyword semantic table column schema"
+).split()
+
+
+def synthetic_pages(count: int, page_kb: int, seed: int = 42) -> list[dict[str, Any]]:
+    """Build deterministic markdown pages shaped like crawled documentation."""
+    target = page_kb * 1024
+    pages = []
+    for index in range(count):
+        rng = random.Random(seed * 1_000_003 + index)
+        parts = [f"# Page {index}\n"]
+        size = len(parts[0])
+        section = 0
+        while size < target:
+            section += 1
+            block = [f"\n## Section {section}\n\n"]
+            for _ in range(rng.randint(2, 5)):
+                block.append(" ".join(rng.choices(_WORDS, k=rng.randint(40, 120))) + ".\n\n")
+            if rng.random() < 0.3:
+                name = rng.choice(_WORDS)
+                block.append(
+                    f"```python\ndef {name}_{section}(value):\n    return value * {section}\n```\n"
+                )
+            text = "".join(block)
+            parts.append(text)
+            size += len(text)
+        pages.append(
+            {
+                "url": f"https://bench.archon.local/docs/page-{index}",
+                "markdown": "".join(parts),
+                "title": f"Page {index}",
+                "description": "",
+            }
+        )
+    return pages
+
+
+async def _simulate_crawl(
+    pages: list[dict[str, Any]], max_concurrent: int, latency_ms: float
+) -> list[dict[str, Any]]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def fetch(page: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            if latency_ms:
+                await asyncio.sleep(latency_ms / 1000)
+            return page
+
+    return await asyncio.gather(*(fetch(page) for page in pages))
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_ingestion(config: BenchmarkConfig) -> BenchmarkResult:
+    """Run the ingestion pipeline once for ``config`` and collect metrics."""
+    pages = synthetic_pages(config.pages, config.page_kb, config.seed)
+    client = InMemorySupabase(config.db_latency_ms, config.db_429_rate, config.seed)
+    adapter = FakeEmbeddingAdapter(
+        config.embed_latency_ms, config.embed_per_item_ms, config.embed_429_rate, config.seed
+    )
+    credentials = BenchmarkCredentials(
+        {
+            "EMBEDDING_BATCH_SIZE": str(config.embedding_batch_size),
+            "EMBEDDING_DIMENSIONS": str(config.embedding_dimensions),
+            "CRAWL_MAX_CONCURRENT": str(config.crawl_max_concurrent),
+            "USE_CONTEXTUAL_EMBEDDINGS": "false",
+        }
+    )
+    threading_service = ThreadingService(
+        rate_limit_config=RateLimitConfig(tokens_per_minute=config.tokens_per_minute)
+    )
+    timer = StageTimer()
+
+    @asynccontextmanager
+    async def fake_llm_client(*args, **kwargs):
+        yield None
+
+    async def fake_embedding_model(*args, **kwargs) -> str:
+        return BENCHMARK_EMBEDDING_MODEL
+
+    async def fake_source_summary(source_id: str, content: str, *args, **kwargs) -> str:
+        return f"Benchmark source {source_id}"
+
+    with ExitStack() as stack:
+        for target, attribute, replacement in (
+            (credential_module, "credential_service", credentials),
+            (embedding_service, "credential_service", credentials),
+            (embedding_service, "get_llm_client", fake_llm_client),
+            (embedding_service, "_get_embedding_adapter", lambda provider, llm_client: adapter),
+            (embedding_service, "get_embedding_model", fake_embedding_model),
+            (embedding_service, "get_threading_service", lambda: threading_service),
+            (llm_provider_service, "get_embedding_model", fake_embedding_model),
+            (document_storage_operations, "extract_source_summary", fake_source_summary),
+            (
+                document_storage_service,
+                "create_embeddings_batch",
+                timer.wrap("embedding", embedding_service.create_embeddings_batch),
+            ),
+            (
+                PageStorageOperations,
+                "store_pages",
+                timer.wrap("page_storage", PageStorageOperations.store_pages),
+            ),
+        ):
+            stack.enter_context(patch.object(target, attribute, replacement))
+
+        operations = DocumentStorageOperations(client)
+        storage = operations.doc_storage_service
+        storage.smart_chunk_text_async = timer.wrap("chunking", storage.smart_chunk_text_async)
+        operations._create_source_records = timer.wrap(
+            "source_records", operations._create_source_records
+        )
+
+        start = time.perf_counter()
+        with timer.measure("crawl"):
+            crawl_results = await _simulate_crawl(
+                pages, config.crawl_max_concurrent, config.fetch_latency_ms
+            )
+        stats = await operations.process_and_store_documents(
+            crawl_results=crawl_results,
+            request={"knowledge_type": "documentation", "tags": ["benchmark"]},
+            crawl_type="normal",
+            original_source_id="benchmark-source",
+            source_url="https://bench.archon.local",
+            source_display_name="Benchmark",
+        )
+        wall = time.perf_counter() - start
+
+    timer.seconds["chunk_storage"] = client.seconds_by_table.get(CHUNK_TABLE, 0.0)
+    stage_seconds = {stage: round(timer.seconds.get(stage, 0.0), 4) for stage in STAGES}
+    stage_seconds["other"] = round(max(0.0, wall - sum(stage_seconds.values())), 4)
+
+    return BenchmarkResult(
+        config=config,
+        pages=len(pages),
+        chunks=stats["chunk_count"],
+        chunks_stored=stats["chunks_stored"],
+        wall_seconds=round(wall, 4),
+        pages_per_second=round(len(pages) / wall, 2) if wall else 0.0,
+        chunks_per_second=round(stats["chunk_count"] / wall, 2) if wall else 0.0,
+        peak_rss_mb=round(_peak_rss_mb(), 1),
+        stage_seconds=stage_seconds,
+        embedding_requests=adapter.requests,
+        embedding_429s=adapter.rate_limited,
+        db_round_trips=client.round_trips,
+        db_429s=client.rate_limited,
+    )
+
+
+def run_benchmark(config: BenchmarkConfig, verbose: bool = False) -> BenchmarkResult:
+    """Synchronous entry point; also used as the per-configuration worker."""
+    if not verbose:
+        # Per-chunk info logging is not what we are measuring
+        logging.disable(logging.WARNING)
+    try:
+        return asyncio.run(run_ingestion(config))
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def run_grid(configs: list[BenchmarkConfig], isolate: bool = True, verbose: bool = False) -> list[BenchmarkResult]:
+    """
+    Run every configuration, each in a fresh process when ``isolate`` is set.
+
+    Peak RSS is a process high-water mark, so only isolated runs report a
+    figure attributable to a single configuration.
+    """
+    if not isolate:
+        return [run_benchmark(config, verbose) for config in configs]
+    results = []
+    for config in configs:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results.append(pool.submit(run_benchmark, config, verbose).result())
+    return results
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    header = (
+        f"{'batch':>6} {'crawl_conc':>10} {'pages':>6} {'chunks':>7} {'wall_s':>8} "
+        f"{'pages/s':>9} {'chunks/s':>9} {'rss_mb':>7} {'429s':>5}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.config.embedding_batch_size:>6} {result.config.crawl_max_concurrent:>10} "
+            f"{result.pages:>6} {result.chunks:>7} {result.wall_seconds:>8.2f} "
+            f"{result.pages_per_second:>9.2f} {result.chunks_per_second:>9.2f} "
+            f"{result.peak_rss_mb:>7.1f} {result.embedding_429s + result.db_429s:>5}"
+        )
+        stages = "  ".join(f"{name}={seconds:.3f}s" for name, seconds in result.stage_seconds.items())
+        lines.append(f"{'':>6} stages: {stages}")
+    return "\n".join(lines)
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description="Benchmark Archon's document ingestion pipeline")
+    parser.add_argument("--pages", type=int, default=defaults.pages)
+    parser.add_argument("--page-kb", type=int, default=defaults.page_kb, help="Approximate page size")
+    parser.add_argument(
+        "--embedding-batch-size",
+        type=_int_list,
+        default=[defaults.embedding_batch_size],
+        help="Comma-separated EMBEDDING_BATCH_SIZE values to sweep",
+    )
+    parser.add_argument(
+        "--crawl-max-concurrent",
+        type=_int_list,
+        default=[defaults.crawl_max_concurrent],
+        help="Comma-separated CRAWL_MAX_CONCURRENT values to sweep",
+    )
+    parser.add_argument("--dimensions", type=int, default=defaults.embedding_dimensions)
+    parser.add_argument("--fetch-latency-ms", type=float, default=defaults.fetch_latency_ms)
+    parser.add_argument("--embed-latency-ms", type=float, default=defaults.embed_latency_ms)
+    parser.add_argument("--embed-per-item-ms", type=float, default=defaults.embed_per_item_ms)
+    parser.add_argument("--embed-429-rate", type=float, default=defaults.embed_429_rate)
+    parser.add_argument("--db-latency-ms", type=float, default=defaults.db_latency_ms)
+    parser.add_argument("--db-429-rate", type=float, default=defaults.db_429_rate)
+    parser.add_argument("--tokens-per-minute", type=int, default=defaults.tokens_per_minute)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--in-process", action="store_true", help="Do not isolate runs in subprocesses")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Keep pipeline logging enabled")
+    args = parser.parse_args(argv)
+
+    configs = [
+        BenchmarkConfig(
+            pages=args.pages,
+            page_kb=args.page_kb,
+            embedding_batch_size=batch_size,
+            crawl_max_concurrent=max_concurrent,
+            embedding_dimensions=args.dimensions,
+            fetch_latency_ms=args.fetch_latency_ms,
+            embed_latency_ms=args.embed_latency_ms,
+            embed_per_item_ms=args.embed_per_item_ms,
+            embed_429_rate=args.embed_429_rate,
+            db_latency_ms=args.db_latency_ms,
+            db_429_rate=args.db_429_rate,
+            tokens_per_minute=args.tokens_per_minute,
+            seed=args.seed,
+        )
+        for batch_size, max_concurrent in itertools.product(
+            args.embedding_batch_size, args.crawl_max_concurrent
+        )
+    ]
+
+    results = run_grid(configs, isolate=not args.in_process, verbose=args.verbose)
+    print(format_results(results))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as handle:
+            json.dump([asdict(result) for result in results], handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,17 +16,23 @@ from datetime import datetime
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 # Basic validation - simplified inline version
 
 # Import unified logging
 from ..config.logfire_config import get_logger, safe_logfire_error, safe_logfire_info
 from ..services.crawler_manager import get_crawler
-from ..services.crawling import CrawlingService
+from ..services.crawling import CrawlCheckpoint, CrawlingService
 from ..services.credential_service import credential_service
 from ..services.embeddings.provider_error_adapters import ProviderErrorFactory
 from ..services.knowledge import DatabaseMetricsService, KnowledgeItemService, KnowledgeSummaryService
+from ..services.knowledge.knowledge_pagination import (
+    after_url_id_filter,
+    decode_cursor,
+    encode_cursor,
+    knowledge_count_cache,
+)
 from ..services.search.rag_service import RAGService
 from ..services.storage import DocumentStorageService
 from ..utils import get_supabase_client
@@ -55,6 +61,8 @@ crawl_semaphore = asyncio.Semaphore(CONCURRENT_CRAWL_LIMIT)
 
 # Track active async crawl tasks for cancellation support
 active_crawl_tasks: dict[str, asyncio.Task] = {}
+# Progress IDs with a resume request being set up (claimed before the first await)
+_resuming_crawls: set[str] = set()
 
 
 
@@ -337,6 +345,7 @@ async def delete_knowledge_item(source_id: str):
         }
 
         if result.get("success"):
+            knowledge_count_cache.invalidate(source_id)
             safe_logfire_info(f"Knowledge item deleted successfully | source_id={source_id}")
 
             return {"success": True, "message": f"Successfully deleted knowledge item {source_id}"}
@@ -365,7 +374,8 @@ async def get_knowledge_item_chunks(
     source_id: str,
     domain_filter: str | None = None,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str | None = None,
 ):
     """
     Get document chunks for a specific knowledge item with pagination.
@@ -375,6 +385,8 @@ async def get_knowledge_item_chunks(
         domain_filter: Optional domain filter for URLs
         limit: Maximum number of chunks to return (default 20, max 100)
         offset: Number of chunks to skip (for pagination)
+        cursor: next_cursor from the previous page; takes precedence over offset and
+            costs the same at any depth
     
     Returns:
         Paginated chunks with metadata
@@ -385,24 +397,24 @@ async def get_knowledge_item_chunks(
         limit = max(limit, 1)    # At least 1
         offset = max(offset, 0)   # Can't be negative
 
+        after_key = None
+        if cursor:
+            try:
+                after_key = decode_cursor(cursor, 2)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail={"error": str(e)})
+
         safe_logfire_info(
             f"Fetching chunks | source_id={source_id} | domain_filter={domain_filter} | "
-            f"limit={limit} | offset={offset}"
+            f"limit={limit} | offset={offset} | cursor={cursor}"
         )
 
         supabase = get_supabase_client()
 
-        # First get total count
-        count_query = supabase.from_("archon_crawled_pages").select(
-            "id", count="exact", head=True
+        # Cached total (estimated on first request, refreshed in the background)
+        total, total_exact = await knowledge_count_cache.get_total(
+            supabase, "archon_crawled_pages", source_id, domain_filter
         )
-        count_query = count_query.eq("source_id", source_id)
-
-        if domain_filter:
-            count_query = count_query.ilike("url", f"%{domain_filter}%")
-
-        count_result = count_query.execute()
-        total = count_result.count if hasattr(count_result, "count") else 0
 
         # Build the main query with pagination
         query = supabase.from_("archon_crawled_pages").select(
@@ -414,11 +426,18 @@ async def get_knowledge_item_chunks(
         if domain_filter:
             query = query.ilike("url", f"%{domain_filter}%")
 
+        # Keyset pagination: continue after the last (url, id) of the previous page
+        if after_key is not None:
+            query = query.or_(after_url_id_filter(*after_key))
+
         # Deterministic ordering (URL then id)
         query = query.order("url", desc=False).order("id", desc=False)
 
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
+        # Apply pagination, fetching one extra row to know whether another page exists
+        if after_key is not None:
+            query = query.limit(limit + 1)
+        else:
+            query = query.range(offset, offset + limit)
 
         result = query.execute()
         # Check for error more explicitly to work with mocks
@@ -429,6 +448,9 @@ async def get_knowledge_item_chunks(
             raise HTTPException(status_code=500, detail={"error": str(result.error)})
 
         chunks = result.data if result.data else []
+        has_more = len(chunks) > limit
+        chunks = chunks[:limit]
+        next_cursor = encode_cursor(chunks[-1]["url"], chunks[-1]["id"]) if has_more else None
 
         # Extract useful fields from metadata to top level for frontend
         # This ensures the API response matches the TypeScript DocumentChunk interface
@@ -496,7 +518,7 @@ async def get_knowledge_item_chunks(
             chunk["knowledge_type"] = metadata.get("knowledge_type")
 
         safe_logfire_info(
-            f"Fetched {len(chunks)} chunks for {source_id} | total={total}"
+            f"Fetched {len(chunks)} chunks for {source_id} | total={total} | total_exact={total_exact}"
         )
 
         return {
@@ -505,9 +527,11 @@ async def get_knowledge_item_chunks(
             "domain_filter": domain_filter,
             "chunks": chunks,
             "total": total,
+            "total_estimated": not total_exact,
             "limit": limit,
             "offset": offset,
-            "has_more": offset + limit < total,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
 
     except HTTPException:
@@ -523,7 +547,8 @@ async def get_knowledge_item_chunks(
 async def get_knowledge_item_code_examples(
     source_id: str,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str | None = None,
 ):
     """
     Get code examples for a specific knowledge item with pagination.
@@ -532,6 +557,8 @@ async def get_knowledge_item_code_examples(
         source_id: The source ID
         limit: Maximum number of examples to return (default 20, max 100)
         offset: Number of examples to skip (for pagination)
+        cursor: next_cursor from the previous page; takes precedence over offset and
+            costs the same at any depth
     
     Returns:
         Paginated code examples with metadata
@@ -542,30 +569,36 @@ async def get_knowledge_item_code_examples(
         limit = max(limit, 1)    # At least 1
         offset = max(offset, 0)   # Can't be negative
 
+        after_id = None
+        if cursor:
+            try:
+                after_id = int(decode_cursor(cursor, 1)[0])
+            except (TypeError, ValueError) as e:
+                raise HTTPException(status_code=400, detail={"error": str(e)})
+
         safe_logfire_info(
-            f"Fetching code examples | source_id={source_id} | limit={limit} | offset={offset}"
+            f"Fetching code examples | source_id={source_id} | limit={limit} | offset={offset} | cursor={cursor}"
         )
 
         supabase = get_supabase_client()
 
-        # First get total count
-        count_result = (
-            supabase.from_("archon_code_examples")
-            .select("id", count="exact", head=True)
-            .eq("source_id", source_id)
-            .execute()
+        # Cached total (estimated on first request, refreshed in the background)
+        total, total_exact = await knowledge_count_cache.get_total(
+            supabase, "archon_code_examples", source_id
         )
-        total = count_result.count if hasattr(count_result, "count") else 0
 
-        # Get paginated code examples
-        result = (
+        # Get paginated code examples, one extra row to know whether another page exists
+        query = (
             supabase.from_("archon_code_examples")
             .select("id, source_id, content, summary, metadata")
             .eq("source_id", source_id)
-            .order("id", desc=False)  # Deterministic ordering
-            .range(offset, offset + limit - 1)
-            .execute()
         )
+        if after_id is not None:
+            # Keyset pagination: continue after the last id of the previous page
+            query = query.gt("id", after_id).order("id", desc=False).limit(limit + 1)
+        else:
+            query = query.order("id", desc=False).range(offset, offset + limit)  # Deterministic ordering
+        result = query.execute()
 
         # Check for error to match chunks endpoint pattern
         if hasattr(result, "error") and result.error is not None:
@@ -575,6 +608,9 @@ async def get_knowledge_item_code_examples(
             raise HTTPException(status_code=500, detail={"error": str(result.error)})
 
         code_examples = result.data if result.data else []
+        has_more = len(code_examples) > limit
+        code_examples = code_examples[:limit]
+        next_cursor = encode_cursor(code_examples[-1]["id"]) if has_more else None
 
         # Extract title and example_name from metadata to top level for frontend
         # This ensures the API response matches the TypeScript CodeExample interface
@@ -589,7 +625,7 @@ async def get_knowledge_item_code_examples(
             # Note: summary field is already at top level from database
 
         safe_logfire_info(
-            f"Fetched {len(code_examples)} code examples for {source_id} | total={total}"
+            f"Fetched {len(code_examples)} code examples for {source_id} | total={total} | total_exact={total_exact}"
         )
 
         return {
@@ -597,11 +633,15 @@ async def get_knowledge_item_code_examples(
             "source_id": source_id,
             "code_examples": code_examples,
             "total": total,
+            "total_estimated": not total_exact,
             "limit": limit,
             "offset": offset,
-            "has_more": offset + limit < total,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         safe_logfire_error(
             f"Failed to fetch code examples | error={str(e)} | source_id={source_id}"
@@ -804,6 +844,78 @@ async def crawl_knowledge_item(request: KnowledgeItemRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/knowledge-items/crawl/{progress_id}/resume")
+async def resume_crawl(progress_id: str):
+    """Resume an interrupted crawl (restart, deploy or failure) from its last checkpoint."""
+    # Claim the progress ID before awaiting anything so concurrent resumes can't both start
+    existing_task = active_crawl_tasks.get(progress_id)
+    if progress_id in _resuming_crawls or (existing_task and not existing_task.done()):
+        raise HTTPException(status_code=409, detail={"error": "Crawl is still running"})
+    _resuming_crawls.add(progress_id)
+
+    try:
+        from ..services.crawling import get_active_orchestration
+
+        if await get_active_orchestration(progress_id):
+            raise HTTPException(status_code=409, detail={"error": "Crawl is still running"})
+
+        if not CrawlCheckpoint.exists(progress_id):
+            raise HTTPException(
+                status_code=404, detail={"error": f"No crawl checkpoint found for ID: {progress_id}"}
+            )
+
+        # Validate API key before resuming expensive operation
+        provider_config = await credential_service.get_active_provider("embedding")
+        provider = provider_config.get("provider", "openai")
+        await _validate_provider_api_key(provider)
+
+        checkpoint = CrawlCheckpoint(progress_id)
+        try:
+            request_dict = checkpoint.get_meta("request")
+            checkpoint_summary = checkpoint.summary()
+        finally:
+            checkpoint.close()
+
+        try:
+            request = KnowledgeItemRequest.model_validate(request_dict)
+        except ValidationError:
+            raise HTTPException(
+                status_code=422, detail={"error": "Crawl checkpoint has no valid original request"}
+            ) from None
+        safe_logfire_info(f"Resuming crawl | progress_id={progress_id} | checkpoint={checkpoint_summary}")
+
+        # Reuse the progress ID so pollers pick the crawl back up
+        from ..utils.progress.progress_tracker import ProgressTracker
+        tracker = ProgressTracker(progress_id, operation_type="crawl")
+        await tracker.start({
+            "url": request.url,
+            "current_url": request.url,
+            "crawl_type": checkpoint_summary.get("crawl_type") or "normal",
+            "progress": 0,
+            "log": f"Resuming crawl for {request.url} from checkpoint "
+            f"({checkpoint_summary['pages']} pages saved)",
+        })
+
+        # Registered until the orchestration takes over, so a repeated resume gets a 409
+        active_crawl_tasks[progress_id] = asyncio.create_task(
+            _perform_crawl_with_progress(progress_id, request, tracker)
+        )
+
+        return {
+            "success": True,
+            "progressId": progress_id,
+            "message": "Crawl resumed from checkpoint",
+            "checkpoint": checkpoint_summary,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        safe_logfire_error(f"Failed to resume crawl | error={str(e)} | progress_id={progress_id}")
+        raise HTTPException(status_code=500, detail={"error": str(e)})
+    finally:
+        _resuming_crawls.discard(progress_id)
+
+
 async def _perform_crawl_with_progress(
     progress_id: str, request: KnowledgeItemRequest, tracker
 ):
@@ -1218,6 +1330,7 @@ async def delete_source(source_id: str):
         success, result_data = source_service.delete_source(source_id)
 
         if success:
+            knowledge_count_cache.invalidate(source_id)
             safe_logfire_info(f"Source deleted successfully | source_id={source_id}")
 
             return {
@@ -1312,6 +1425,11 @@ async def stop_crawl_task(progress_id: str):
         # Step 3: Remove from active orchestrations registry
         await unregister_orchestration(progress_id)
 
+        # A stopped crawl won't be resumed; the orchestration removes its own checkpoint
+        # on cancel, this covers crawls that were already interrupted
+        if not orchestration and CrawlCheckpoint.remove(progress_id):
+            found = True
+
         # Step 4: Update progress tracker to reflect cancellation (only if we found and cancelled something)
         if found:
             try:
@@ -8,7 +8,6 @@ Handles:
 - HTTP polling for progress updates
 """
 
-import json
 from datetime import datetime, timezone
 from email.utils import format_datetime
 from typing import Any
@@ -21,7 +20,7 @@ from pydantic import BaseModel
 # Set up standard logger for background tasks
 from ..config.logfire_config import get_logger, logfire
 from ..utils import get_supabase_client
-from ..utils.etag_utils import check_etag, generate_etag
+from ..utils.etag_utils import check_etag
 
 logger = get_logger(__name__)
 
@@ -31,6 +30,7 @@ from ..services.projects import (
     ProjectService,
     SourceLinkingService,
     TaskService,
+    change_journal,
 )
 from ..services.projects.document_service import DocumentService
 from ..services.projects.versioning_service import VersioningService
@@ -91,6 +91,14 @@ async def list_projects(
     try:
         logfire.debug(f"Listing all projects | include_content={include_content}")
 
+        # ETag comes from the change journal, so unchanged polls return 304 without loading projects
+        current_etag = change_journal.etag("projects", include_content=include_content)
+        if check_etag(if_none_match, current_etag):
+            response.status_code = http_status.HTTP_304_NOT_MODIFIED
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            return None
+
         # Use ProjectService to get projects with include_content parameter
         project_service = ProjectService()
         success, result = project_service.list_projects(include_content=include_content)
@@ -107,30 +115,11 @@ async def list_projects(
             # Lightweight response doesn't need source formatting
             formatted_projects = result["projects"]
 
-        # Monitor response size for optimization validation
-        response_json = json.dumps(formatted_projects)
-        response_size = len(response_json)
-
-        # Log response metrics
         logfire.debug(
             f"Projects listed successfully | count={len(formatted_projects)} | "
-            f"size_bytes={response_size} | include_content={include_content}"
+            f"include_content={include_content} | etag={current_etag}"
         )
 
-        # Log large responses at debug level (>100KB is worth noting, but normal for project data)
-        if response_size > 100000:
-            logfire.debug(
-                f"Large response size | size_bytes={response_size} | "
-                f"include_content={include_content} | project_count={len(formatted_projects)}"
-            )
-
-        # Generate ETag from stable data (excluding timestamp)
-        etag_data = {
-            "projects": formatted_projects,
-            "count": len(formatted_projects)
-        }
-        current_etag = generate_etag(etag_data)
-
         # Generate response with timestamp for polling
         response_data = {
             "projects": formatted_projects,
@@ -138,13 +127,6 @@ async def list_projects(
             "count": len(formatted_projects)
         }
 
-        # Check if client's ETag matches
-        if check_etag(if_none_match, current_etag):
-            response.status_code = http_status.HTTP_304_NOT_MODIFIED
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            return None
-
         # Set headers
         response.headers["ETag"] = current_etag
         response.headers["Last-Modified"] = datetime.utcnow().isoformat()
@@ -292,6 +274,15 @@ async def get_all_task_counts(
 
         logfire.debug(f"Getting task counts for all projects | etag={if_none_match}")
 
+        # Counts only change on task writes, which bump the change journal
+        current_etag = change_journal.etag("task_counts")
+        if check_etag(if_none_match, current_etag):
+            response.status_code = 304
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            logfire.debug(f"Task counts unchanged, returning 304 | etag={current_etag}")
+            return None
+
         # Use TaskService to get batch task counts
         # Get client explicitly to ensure mocking works in tests
         supabase_client = get_supabase_client()
@@ -302,21 +293,6 @@ async def get_all_task_counts(
             logfire.error(f"Failed to get task counts | error={result.get('error')}")
             raise HTTPException(status_code=500, detail=result)
 
-        # Generate ETag from counts data
-        etag_data = {
-            "counts": result,
-            "count": len(result)
-        }
-        current_etag = generate_etag(etag_data)
-
-        # Check if client's ETag matches (304 Not Modified)
-        if check_etag(if_none_match, current_etag):
-            response.status_code = 304
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            logfire.debug(f"Task counts unchanged, returning 304 | etag={current_etag}")
-            return None
-
         # Set ETag headers for successful response
         response.headers["ETag"] = current_etag
         response.headers["Cache-Control"] = "no-cache, must-revalidate"
@@ -565,6 +541,20 @@ async def list_project_tasks(
             f"Listing project tasks | project_id={project_id} | include_archived={include_archived} | exclude_large_fields={exclude_large_fields} | etag={if_none_match}"
         )
 
+        # ETag comes from the project's version in the change journal, checked before loading tasks
+        current_etag = change_journal.etag(
+            "project_tasks",
+            project_id=project_id,
+            include_archived=include_archived,
+            exclude_large_fields=exclude_large_fields,
+        )
+        if check_etag(if_none_match, current_etag):
+            response.status_code = 304
+            response.headers["ETag"] = current_etag
+            response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            logfire.debug(f"Tasks unchanged, returning 304 | project_id={project_id} | etag={current_etag}")
+            return None
+
         # Use TaskService to list tasks
         task_service = TaskService()
         success, result = task_service.list_tasks(
@@ -579,10 +569,8 @@ async def list_project_tasks(
 
         tasks = result.get("tasks", [])
 
-        # Generate ETag from task data (includes description and updated_at to drive polling invalidation)
-        etag_tasks: list[dict[str, object]] = []
+        # Last-Modified is the most recent task update
         last_modified_dt: datetime | None = None
-
         for task in tasks:
             raw_updated = task.get("updated_at")
             parsed_updated: datetime | None = None
@@ -599,38 +587,6 @@ async def list_project_tasks(
                 if last_modified_dt is None or parsed_updated > last_modified_dt:
                     last_modified_dt = parsed_updated
 
-            etag_tasks.append(
-                {
-                    "id": task.get("id") or "",
-                    "title": task.get("title") or "",
-                    "status": task.get("status") or "",
-                    "task_order": task.get("task_order") or 0,
-                    "assignee": task.get("assignee") or "",
-                    "priority": task.get("priority") or "",
-                    "feature": task.get("feature") or "",
-                    "description": task.get("description") or "",
-                    "updated_at": (
-                        parsed_updated.isoformat()
-                        if parsed_updated is not None
-                        else (str(raw_updated) if raw_updated else "")
-                    ),
-                }
-            )
-
-        etag_data = {"tasks": etag_tasks, "project_id": project_id, "count": len(tasks)}
-        current_etag = generate_etag(etag_data)
-
-        # Check if client's ETag matches (304 Not Modified)
-        if check_etag(if_none_match, current_etag):
-            response.status_code = 304
-            response.headers["ETag"] = current_etag
-            response.headers["Cache-Control"] = "no-cache, must-revalidate"
-            response.headers["Last-Modified"] = format_datetime(
-                last_modified_dt or datetime.now(timezone.utc)
-            )
-            logfire.debug(f"Tasks unchanged, returning 304 | project_id={project_id} | etag={current_etag}")
-            return None
-
         # Set ETag headers for successful response
         response.headers["ETag"] = current_etag
         response.headers["Cache-Control"] = "no-cache, must-revalidate"
@@ -690,6 +646,7 @@ async def create_task(request: CreateTaskRequest):
 
 @router.get("/tasks")
 async def list_tasks(
+    http_response: Response,
     status: str | None = None,
     project_id: str | None = None,
     include_closed: bool = True,
@@ -697,6 +654,7 @@ async def list_tasks(
     per_page: int = 10,
     exclude_large_fields: bool = False,
     q: str | None = None,  # Search query parameter
+    if_none_match: str | None = Header(None),
 ):
     """List tasks with optional filters including status, project, and keyword search."""
     try:
@@ -704,6 +662,23 @@ async def list_tasks(
             f"Listing tasks | status={status} | project_id={project_id} | include_closed={include_closed} | page={page} | per_page={per_page} | q={q}"
         )
 
+        # ETag comes from the change journal, checked before loading tasks
+        current_etag = change_journal.etag(
+            "tasks",
+            project_id=project_id,
+            status=status,
+            include_closed=include_closed,
+            page=page,
+            per_page=per_page,
+            exclude_large_fields=exclude_large_fields,
+            q=q,
+        )
+        if check_etag(if_none_match, current_etag):
+            http_response.status_code = 304
+            http_response.headers["ETag"] = current_etag
+            http_response.headers["Cache-Control"] = "no-cache, must-revalidate"
+            return None
+
         # Use TaskService to list tasks
         task_service = TaskService()
         success, result = task_service.list_tasks(
@@ -743,22 +718,13 @@ async def list_tasks(
             },
         }
 
-        # Monitor response size for optimization validation
-        response_json = json.dumps(response)
-        response_size = len(response_json)
-
-        # Log response metrics
         logfire.info(
             f"Tasks listed successfully | count={len(paginated_tasks)} | "
-            f"size_bytes={response_size} | exclude_large_fields={exclude_large_fields}"
+            f"total={len(tasks)} | exclude_large_fields={exclude_large_fields}"
         )
 
-        # Warning for large responses (>10KB)
-        if response_size > 10000:
-            logfire.warning(
-                f"Large task response size | size_bytes={response_size} | "
-                f"exclude_large_fields={exclude_large_fields} | task_count={len(paginated_tasks)}"
-            )
+        http_response.headers["ETag"] = current_etag
+        http_response.headers["Cache-Control"] = "no-cache, must-revalidate"
 
         return response
 
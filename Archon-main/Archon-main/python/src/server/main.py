@@ -40,7 +40,7 @@ from .config.logfire_config import api_logger, setup_logfire
 from .services.crawler_manager import cleanup_crawler, initialize_crawler
 
 # Import utilities and core classes
-from .services.credential_service import initialize_credentials
+from .services.credential_service import credential_service, initialize_credentials
 
 # Import missing dependencies that the modular APIs need
 try:
@@ -91,6 +91,9 @@ async def lifespan(app: FastAPI):
         logger.info("✅ Credentials initialized")
         api_logger.info("🔥 Logfire initialized for backend")
 
+        # Pick up settings changed outside this process (e.g. directly in the database)
+        credential_service.start_settings_watch()
+
         # Initialize crawling context
         try:
             await initialize_crawler()
@@ -132,6 +135,8 @@ async def lifespan(app: FastAPI):
     try:
         # MCP Client cleanup not needed
 
+        await credential_service.stop_settings_watch()
+
         # Cleanup crawling context
         try:
             await cleanup_crawler()
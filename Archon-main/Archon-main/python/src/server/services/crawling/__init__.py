@@ -13,6 +13,7 @@ from .crawling_service import (
     unregister_orchestration,
 )
 from .document_storage_operations import DocumentStorageOperations
+from .helpers.crawl_checkpoint import CrawlCheckpoint
 from .helpers.site_config import SiteConfig
 
 # Export helpers
@@ -36,6 +37,7 @@ __all__ = [
     "SitemapCrawlStrategy",
     "URLHandler",
     "SiteConfig",
+    "CrawlCheckpoint",
     "get_active_orchestration",
     "register_orchestration",
     "unregister_orchestration"
@@ -0,0 +1,535 @@
+"""
+Code Classifier
+
+Table-driven heuristics used by CodeExtractionService to decide whether an
+extracted block is real code, which language it is written in, and how to
+clean up artifacts left by HTML extraction.
+
+Every pattern is compiled once at import time, and the checks are arranged so
+the common case does as little regex work as possible:
+
+- The slowest patterns are replaced by forms that match under exactly the
+  same conditions but don't backtrack through every word (see _FAST_FORMS).
+- Patterns that start with a keyword are skipped with a substring test when
+  the keyword does not occur in the text at all.
+- check_code_quality runs the cheap line-based rules first, and stops
+  looking for code indicators once enough have been found.
+- The prose indicators are counted in one scan, which is exact because the
+  word lists are disjoint and the sentence pattern only consumes punctuation.
+
+extract_features collects every feature of a block without early exits, as
+plain counts that can be tabulated or compared across many blocks.
+"""
+
+import re
+from dataclasses import dataclass
+
+# Language-specific patterns for better extraction
+LANGUAGE_PATTERNS = {
+    "typescript": {
+        "block_start": r"^\s*(export\s+)?(class|interface|function|const|type|enum)\s+\w+",
+        "block_end": r"^\}(\s*;)?$",
+        "min_indicators": [":", "{", "}", "=>", "function", "class", "interface", "type"],
+    },
+    "javascript": {
+        "block_start": r"^\s*(export\s+)?(class|function|const|let|var)\s+\w+",
+        "block_end": r"^\}(\s*;)?$",
+        "min_indicators": ["function", "{", "}", "=>", "const", "let", "var"],
+    },
+    "python": {
+        "block_start": r"^\s*(class|def|async\s+def)\s+\w+",
+        "block_end": r"^\S",  # Unindented line
+        "min_indicators": ["def", ":", "return", "self", "import", "class"],
+    },
+    "java": {
+        "block_start": r"^\s*(public|private|protected)?\s*(class|interface|enum)\s+\w+",
+        "block_end": r"^\}$",
+        "min_indicators": ["class", "public", "private", "{", "}", ";"],
+    },
+    "rust": {
+        "block_start": r"^\s*(pub\s+)?(fn|struct|impl|trait|enum)\s+\w+",
+        "block_end": r"^\}$",
+        "min_indicators": ["fn", "let", "mut", "impl", "struct", "->"],
+    },
+    "go": {
+        "block_start": r"^\s*(func|type|struct)\s+\w+",
+        "block_end": r"^\}$",
+        "min_indicators": ["func", "type", "struct", "{", "}", ":="],
+    },
+}
+
+DIAGRAM_LANGUAGES = frozenset({"mermaid", "plantuml", "graphviz", "dot", "diagram"})
+
+# Formatting problems that indicate poor extraction; any match rejects the block
+BAD_PATTERNS = {
+    # Concatenated keywords without spaces (but allow camelCase)
+    "concatenated_keyword": r"\b(from|import|def|class|if|for|while|return)(?=[a-z])",
+    # HTML entities that weren't decoded
+    "html_entity": r"&[lg]t;|&amp;|&quot;|&#\d+;",
+    # Very long HTML tags
+    "long_html_tag": r"<[^>]{50,}>",
+    # Multiple spans in a row
+    "span_run": r"(<span[^>]*>){5,}",
+    # Very long unbroken strings
+    "unbroken_string": r"[^\s]{200,}",
+}
+
+# Indicators of code complexity; a block needs a minimum number of distinct ones
+CODE_INDICATORS = {
+    "function_calls": r"\w+\s*\([^)]*\)",
+    "assignments": r"\w+\s*=\s*.+",
+    "control_flow": r"\b(if|for|while|switch|case|try|catch|except)\b",
+    "declarations": r"\b(var|let|const|def|class|function|interface|type|struct|enum)\b",
+    "imports": r"\b(import|from|require|include|using|use)\b",
+    "brackets": r"[\{\}\[\]]",
+    "operators": r"[\+\-\*\/\%\&\|\^<>=!]",
+    "method_chains": r"\.\w+",
+    "arrows": r"(=>|->)",
+    "keywords": r"\b(return|break|continue|yield|await|async)\b",
+}
+
+# Line prefixes (after stripping) that mark comment and docstring lines
+COMMENT_PREFIXES = ("//", "#", "/*", "*", "<!--", '"""', "'''")
+
+_PROSE_WORDS = "the|this|that|these|those|is|are|was|were|will|would|should|could|have|has|had"
+_TRANSITION_WORDS = "however|therefore|furthermore|moreover|nevertheless"
+
+# Language detection patterns (a language scores one point per pattern present)
+LANGUAGE_DETECTION_PATTERNS = {
+    "python": [
+        r"\bdef\s+\w+\s*\(",
+        r"\bclass\s+\w+",
+        r"\bimport\s+\w+",
+        r"\bfrom\s+\w+\s+import",
+    ],
+    "javascript": [
+        r"\bfunction\s+\w+\s*\(",
+        r"\bconst\s+\w+\s*=",
+        r"\blet\s+\w+\s*=",
+        r"\bvar\s+\w+\s*=",
+    ],
+    "typescript": [
+        r"\binterface\s+\w+",
+        r":\s*\w+\[\]",
+        r"\btype\s+\w+\s*=",
+        r"\bclass\s+\w+.*\{",
+    ],
+    "java": [
+        r"\bpublic\s+class\s+\w+",
+        r"\bprivate\s+\w+\s+\w+",
+        r"\bpublic\s+static\s+void\s+main",
+    ],
+    "rust": [r"\bfn\s+\w+\s*\(", r"\blet\s+mut\s+\w+", r"\bimpl\s+\w+", r"\bstruct\s+\w+"],
+    "go": [r"\bfunc\s+\w+\s*\(", r"\bpackage\s+\w+", r"\btype\s+\w+\s+struct"],
+}
+
+# PDF section scoring: (pattern, weight) for code and prose indicators
+PDF_CODE_PATTERNS = [
+    (r"\bfrom \w+(?:\.\w+)* import\b", 3),  # Python imports (strong)
+    (r"\bdef \w+\s*\(", 3),  # Function definitions (strong)
+    (r"\bclass \w+\s*[\(:]", 3),  # Class definitions (strong)
+    (r"\w+\s*=\s*\w+\(", 2),  # Function calls assigned (medium)
+    (r"\w+\s*=\s*\[.*\]", 2),  # List assignments (medium)
+    (r"\w+\.\w+\(", 2),  # Method calls (medium)
+    (r"^\s*#[^#]", 1),  # Single-line comments (weak)
+    (r"\bpip install\b", 2),  # Package management (medium)
+    (r"\bpytest\b", 2),  # Testing commands (medium)
+    (r"\bgit clone\b", 2),  # Git commands (medium)
+    (r":\s*\n\s+\w+:", 2),  # YAML structure (medium)
+    (r"\blambda\s+\w+:", 2),  # Lambda functions (medium)
+]
+
+PDF_PROSE_PATTERNS = [
+    (r"\b(the|this|that|these|those|are|is|was|were|will|would|should|could|have|has|had)\b", 1),
+    (r"[.!?]\s+[A-Z]", 2),  # Sentence endings
+    (r"\b(however|therefore|furthermore|moreover|additionally|specifically)\b", 2),
+    (r"\bTable of Contents\b", 3),
+    (r"\bAPI Reference\b", 2),
+]
+
+# Forms of the slowest patterns that match under exactly the same conditions.
+# A text contains a match of \w+X exactly when it contains one of \wX, and
+# [^\s]{200,} exactly when \S{200}; the short forms avoid retrying \w+ from
+# every character of every word. Only valid where presence is all that counts.
+_FAST_FORMS = {
+    r"[^\s]{200,}": r"\S{200}",
+    r"\w+\s*\([^)]*\)": r"\w\s*\([^)]*\)",
+    r"\w+\s*=\s*.+": r"\w\s*=\s*.",
+}
+
+# Where matches are counted, patterns starting with \w+ get a leading \b
+# instead: a match can always be extended back to the start of its word, so
+# every counted match starts there and the count is unchanged.
+_WORD_START_PREFIX = r"\w+"
+
+# Keyword a pattern requires, e.g. "def" for \bdef\s+\w+; "" if none
+_KEYWORD_PREFIX = re.compile(r"(?:\\b)?((?:\w+ )*\w+|:)")
+
+
+def _compile_presence(pattern: str, flags: int = 0) -> re.Pattern:
+    return re.compile(_FAST_FORMS.get(pattern, pattern), flags)
+
+
+def _compile_count(pattern: str, flags: int = 0) -> re.Pattern:
+    if pattern.startswith(_WORD_START_PREFIX):
+        pattern = r"\b" + pattern
+    return re.compile(pattern, flags)
+
+
+def _keyword(pattern: str) -> str:
+    match = _KEYWORD_PREFIX.match(pattern)
+    return match.group(1) if match else ""
+
+
+_BAD_PATTERN_RES = {name: _compile_presence(p) for name, p in BAD_PATTERNS.items()}
+# Checked cheapest first, so check_code_quality can stop as soon as it has enough
+_INDICATOR_ORDER = (
+    "brackets",
+    "operators",
+    "method_chains",
+    "arrows",
+    "declarations",
+    "imports",
+    "keywords",
+    "control_flow",
+    "function_calls",
+    "assignments",
+)
+_INDICATOR_RES = {name: _compile_presence(CODE_INDICATORS[name]) for name in _INDICATOR_ORDER}
+_PROSE_RE = re.compile(
+    rf"\b(?:{_PROSE_WORDS}|{_TRANSITION_WORDS})\b|[.!?](?=\s+[A-Z])", re.IGNORECASE
+)
+_LANGUAGE_DETECTION_RES = {
+    lang: [(_keyword(p), re.compile(p, re.MULTILINE)) for p in patterns]
+    for lang, patterns in LANGUAGE_DETECTION_PATTERNS.items()
+}
+_LANGUAGE_INDICATORS = {
+    lang: tuple(info.get("min_indicators", [])) for lang, info in LANGUAGE_PATTERNS.items()
+}
+_PDF_CODE_RES = [
+    (_keyword(p).lower(), _compile_count(p, re.IGNORECASE | re.MULTILINE), w)
+    for p, w in PDF_CODE_PATTERNS
+]
+_PDF_PROSE_RES = [(re.compile(p, re.IGNORECASE | re.MULTILINE), w) for p, w in PDF_PROSE_PATTERNS]
+
+# Cleaning: missing spaces around operators left by stripping syntax-highlighting
+# spans (but be careful with negative numbers). Keyword fixes of the form
+# (\bkeyword\b)([A-Za-z]) are deliberately absent: a word boundary is never
+# followed by a letter, so they could not match anything.
+_OPERATOR_SPACING_FIXES = [
+    (re.compile(r"([A-Za-z_)])(\+|-|\*|/|=|<|>|%)"), r"\1 \2"),
+    (re.compile(r"(\+|-|\*|/|=|<|>|%)([A-Za-z_(])"), r"\1 \2"),
+]
+_PYTHON_COLON_FIX = re.compile(
+    r"(\b(?:def|class|if|elif|else|for|while|try|except|finally|with)\b[^:]+)$", re.MULTILINE
+)
+_MULTI_SPACE = re.compile(r" {2,}")
+_SPACE_RUN = re.compile(r" +")
+_CLOSING_SPAN = re.compile(r"</span>")
+_CLOSING_SPAN_BEFORE_WORD = re.compile(r"</span>(?=[A-Za-z0-9])")
+_OPENING_SPAN = re.compile(r"<span[^>]*>")
+_ANY_TAG = re.compile(r"</?[^>]+>")
+
+HTML_ENTITIES = {
+    "&lt;": "<",
+    "&gt;": ">",
+    "&amp;": "&",
+    "&quot;": '"',
+    "&#39;": "'",
+    "&nbsp;": " ",
+    "&#x27;": "'",
+    "&#x2F;": "/",
+    "&#60;": "<",
+    "&#62;": ">",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BlockFeatures:
+    """Everything check_code_quality decides on, as plain values."""
+
+    stripped_length: int
+    bad_pattern: str | None  # Name of the first formatting problem found
+    indicators: tuple[str, ...]  # Code indicators present
+    lines: int
+    non_empty_lines: int
+    comment_lines: int
+    very_long_lines: int
+    prose_score: int
+    word_count: int
+    language_indicators: int | None  # Language-specific indicators found (None if no table)
+
+
+def _line_stats(lines: list[str]) -> tuple[int, int, int]:
+    """Count non-empty, comment and very long (>300 chars) lines."""
+    non_empty_lines = 0
+    comment_lines = 0
+    very_long_lines = 0
+    for line in lines:
+        stripped = line.strip()
+        if stripped:
+            non_empty_lines += 1
+            if stripped.startswith(COMMENT_PREFIXES):
+                comment_lines += 1
+        if len(line) > 300:
+            very_long_lines += 1
+    return non_empty_lines, comment_lines, very_long_lines
+
+
+def _find_bad_pattern(code: str) -> str | None:
+    for name, pattern in _BAD_PATTERN_RES.items():
+        if pattern.search(code):
+            return name
+    return None
+
+
+def _find_indicators(code: str, enough: int | None = None) -> list[str]:
+    """Names of the code indicators present in code, stopping once `enough` are found."""
+    found = []
+    for name, pattern in _INDICATOR_RES.items():
+        if pattern.search(code):
+            found.append(name)
+            if enough is not None and len(found) >= enough:
+                break
+    return found
+
+
+def _count_language_indicators(code: str, language: str) -> int | None:
+    indicators = _LANGUAGE_INDICATORS.get(language.lower())
+    if indicators is None:
+        return None
+    lowered = code.lower()
+    return sum(1 for indicator in indicators if indicator in lowered)
+
+
+def _prose_score(code: str) -> int:
+    return len(_PROSE_RE.findall(code))
+
+
+def extract_features(code: str, language: str = "") -> BlockFeatures:
+    """
+    Collect every feature check_code_quality decides on.
+
+    Args:
+        code: The code content
+        language: The detected language (optional)
+
+    Returns:
+        BlockFeatures for the block
+    """
+    lines = code.split("\n")
+    non_empty_lines, comment_lines, very_long_lines = _line_stats(lines)
+    return BlockFeatures(
+        stripped_length=len(code.strip()),
+        bad_pattern=_find_bad_pattern(code),
+        indicators=tuple(_find_indicators(code)),
+        lines=len(lines),
+        non_empty_lines=non_empty_lines,
+        comment_lines=comment_lines,
+        very_long_lines=very_long_lines,
+        prose_score=_prose_score(code),
+        word_count=len(code.split()),
+        language_indicators=_count_language_indicators(code, language),
+    )
+
+
+def check_code_quality(
+    code: str,
+    language: str = "",
+    *,
+    min_indicators: int = 3,
+    filter_diagrams: bool = True,
+    filter_prose: bool = True,
+    max_prose_ratio: float = 0.15,
+) -> tuple[bool, str]:
+    """
+    Decide whether extracted content is actual code.
+
+    A block must pass every rule, so the rules run cheapest first and the
+    first failure decides.
+
+    Args:
+        code: The code content to validate
+        language: The detected language (optional)
+        min_indicators: Minimum number of distinct code indicators
+        filter_diagrams: Reject diagram languages (mermaid, plantuml, ...)
+        filter_prose: Reject blocks whose prose score exceeds max_prose_ratio
+        max_prose_ratio: Maximum prose indicators per word
+
+    Returns:
+        Tuple of (passed, reason) where reason explains the decision
+    """
+    if not code or len(code.strip()) < 20:
+        return False, ""
+
+    if filter_diagrams and language.lower() in DIAGRAM_LANGUAGES:
+        return False, f"Skipping diagram language: {language}"
+
+    lines = code.split("\n")
+    non_empty_lines, comment_lines, very_long_lines = _line_stats(lines)
+    if not non_empty_lines:
+        return False, ""
+
+    # Allow up to 70% comments (documentation is important)
+    if comment_lines / non_empty_lines > 0.7:
+        return False, f"Code is mostly comments: {comment_lines}/{non_empty_lines} lines"
+
+    if non_empty_lines < 3:
+        return False, f"Code has too few non-empty lines: {non_empty_lines}"
+
+    if very_long_lines > len(lines) * 0.5:
+        return False, "Code has too many very long lines"
+
+    # Need at least 2 language-specific indicators
+    language_indicators = _count_language_indicators(code, language)
+    if language_indicators is not None and language_indicators < 2:
+        return False, f"Code lacks {language} indicators: only {language_indicators} found"
+
+    bad_pattern = _find_bad_pattern(code)
+    if bad_pattern:
+        return False, f"Code failed quality check: pattern '{BAD_PATTERNS[bad_pattern]}' found"
+
+    indicators = _find_indicators(code, enough=min_indicators)
+    if len(indicators) < min_indicators:
+        return False, (
+            f"Code has insufficient indicators: {len(indicators)} found ({', '.join(indicators)})"
+        )
+
+    if filter_prose:
+        word_count = len(code.split())
+        prose_score = _prose_score(code)
+        if word_count > 0 and prose_score / word_count > max_prose_ratio:
+            return False, f"Code appears to be prose: prose_score={prose_score}, word_count={word_count}"
+
+    return True, f"Code passed validation: language={language}, lines={non_empty_lines}"
+
+
+def detect_language(code: str) -> str:
+    """
+    Try to detect programming language from code content.
+    This is a simple heuristic approach.
+    """
+    scores = {}
+    for lang, patterns in _LANGUAGE_DETECTION_RES.items():
+        score = sum(1 for keyword, pattern in patterns if keyword in code and pattern.search(code))
+        if score > 0:
+            scores[lang] = score
+
+    # Return language with highest score
+    if scores:
+        return max(scores, key=scores.get)
+
+    return ""
+
+
+def score_pdf_section(section: str) -> tuple[int, int]:
+    """
+    Score a PDF section for code-likeness.
+
+    Returns:
+        Tuple of (code_score, prose_score)
+    """
+    # Patterns are case-insensitive; a keyword test on lowercased text is only
+    # exact for ASCII (re also folds e.g. U+017F to "s")
+    lowered = section.lower() if section.isascii() else None
+    code_score = 0
+    for keyword, pattern, weight in _PDF_CODE_RES:
+        if lowered is not None and keyword not in lowered:
+            continue
+        code_score += len(pattern.findall(section)) * weight
+
+    prose_score = 0
+    for pattern, weight in _PDF_PROSE_RES:
+        prose_score += len(pattern.findall(section)) * weight
+
+    non_empty_lines = [line.strip() for line in section.split("\n") if line.strip()]
+    if not non_empty_lines:
+        return code_score, prose_score
+
+    # If section is mostly single words or very short lines, probably not code
+    short_lines = sum(1 for line in non_empty_lines if len(line.split()) < 3)
+    if short_lines / len(non_empty_lines) > 0.7:
+        prose_score += 3
+
+    # If section has common code structure indicators
+    if any("(" in line and ")" in line for line in non_empty_lines[:5]):
+        code_score += 2
+
+    return code_score, prose_score
+
+
+def is_pdf_section_code_like(section: str) -> bool:
+    """Determine if a PDF section contains code rather than prose."""
+    if not section.strip():
+        return False
+    code_score, prose_score = score_pdf_section(section)
+    # Code-like if code score significantly higher than prose score
+    return code_score > prose_score and code_score > 2
+
+
+def decode_html_entities(text: str) -> str:
+    """Decode common HTML entities and clean HTML tags from code."""
+    # First, handle span tags that wrap individual tokens
+    # Check if spans are being used for syntax highlighting (no spaces between tags)
+    if "</span><span" in text:
+        # This indicates syntax highlighting - preserve the structure
+        text = _CLOSING_SPAN.sub("", text)
+        text = _OPENING_SPAN.sub("", text)
+    else:
+        # Normal span usage - only add space if there isn't already whitespace
+        text = _CLOSING_SPAN_BEFORE_WORD.sub(" ", text)
+        text = _OPENING_SPAN.sub("", text)
+
+    # Remove any other HTML tags but preserve their content
+    text = _ANY_TAG.sub("", text)
+
+    for entity, char in HTML_ENTITIES.items():
+        text = text.replace(entity, char)
+
+    # Replace escaped newlines with actual newlines
+    text = text.replace("\\n", "\n")
+
+    # Replace multiple spaces with single space (runs never span lines) and
+    # trim trailing spaces, preserving newlines and leading indentation
+    return "\n".join(line.rstrip() for line in _SPACE_RUN.sub(" ", text).split("\n"))
+
+
+def clean_code_content(code: str, language: str = "") -> str:
+    """
+    Clean and fix common issues in extracted code content.
+
+    Args:
+        code: The code content to clean
+        language: The detected language (optional)
+
+    Returns:
+        Cleaned code content
+    """
+    # First apply HTML entity decoding and tag cleaning
+    code = decode_html_entities(code)
+
+    # Fix common concatenation issues from span removal
+    for pattern, replacement in _OPERATOR_SPACING_FIXES:
+        code = pattern.sub(replacement, code)
+
+    if language.lower() in ["python", "py"]:
+        # Fix missing colons
+        code = _PYTHON_COLON_FIX.sub(r"\1:", code)
+
+    # Remove backticks that might have been included
+    if code.startswith("```") and code.endswith("```"):
+        lines = code.split("\n")
+        if len(lines) > 2:
+            # Remove first and last line
+            code = "\n".join(lines[1:-1])
+    elif code.startswith("`") and code.endswith("`"):
+        code = code[1:-1]
+
+    # Remove any remaining excessive spaces while preserving indentation
+    cleaned_lines = []
+    for line in code.split("\n"):
+        stripped = line.lstrip()
+        indent = line[: len(line) - len(stripped)]
+        cleaned_lines.append(indent + _MULTI_SPACE.sub(" ", stripped))
+
+    return "\n".join(cleaned_lines).strip()
@@ -6,7 +6,7 @@ Handles extraction, processing, and storage of code examples from documents.
 
 import asyncio
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from ...config.logfire_config import safe_logfire_error, safe_logfire_info
@@ -15,6 +15,7 @@ from ..storage.code_storage_service import (
     add_code_examples_to_supabase,
     generate_code_summaries_batch,
 )
+from . import code_classifier
 
 
 class CodeExtractionService:
@@ -23,38 +24,7 @@ class CodeExtractionService:
     """
 
     # Language-specific patterns for better extraction
-    LANGUAGE_PATTERNS = {
-        "typescript": {
-            "block_start": r"^\s*(export\s+)?(class|interface|function|const|type|enum)\s+\w+",
-            "block_end": r"^\}(\s*;)?$",
-            "min_indicators": [":", "{", "}", "=>", "function", "class", "interface", "type"],
-        },
-        "javascript": {
-            "block_start": r"^\s*(export\s+)?(class|function|const|let|var)\s+\w+",
-            "block_end": r"^\}(\s*;)?$",
-            "min_indicators": ["function", "{", "}", "=>", "const", "let", "var"],
-        },
-        "python": {
-            "block_start": r"^\s*(class|def|async\s+def)\s+\w+",
-            "block_end": r"^\S",  # Unindented line
-            "min_indicators": ["def", ":", "return", "self", "import", "class"],
-        },
-        "java": {
-            "block_start": r"^\s*(public|private|protected)?\s*(class|interface|enum)\s+\w+",
-            "block_end": r"^\}$",
-            "min_indicators": ["class", "public", "private", "{", "}", ";"],
-        },
-        "rust": {
-            "block_start": r"^\s*(pub\s+)?(fn|struct|impl|trait|enum)\s+\w+",
-            "block_end": r"^\}$",
-            "min_indicators": ["fn", "let", "mut", "impl", "struct", "->"],
-        },
-        "go": {
-            "block_start": r"^\s*(func|type|struct)\s+\w+",
-            "block_end": r"^\}$",
-            "min_indicators": ["func", "type", "struct", "{", "}", ":="],
-        },
-    }
+    LANGUAGE_PATTERNS = code_classifier.LANGUAGE_PATTERNS
 
     def __init__(self, supabase_client):
         """
@@ -134,7 +104,7 @@ class CodeExtractionService:
 
     async def extract_and_store_code_examples(
         self,
-        crawl_results: list[dict[str, Any]],
+        crawl_results: Sequence[dict[str, Any]],
         url_to_full_document: dict[str, str],
         source_id: str,
         progress_callback: Callable | None = None,
@@ -257,7 +227,7 @@ class CodeExtractionService:
 
     async def _extract_code_blocks_from_documents(
         self,
-        crawl_results: list[dict[str, Any]],
+        crawl_results: Sequence[dict[str, Any]],
         source_id: str,
         progress_callback: Callable | None = None,
         cancellation_check: Callable[[], None] | None = None,
@@ -1036,118 +1006,14 @@ class CodeExtractionService:
         """
         Determine if a PDF section contains code rather than prose.
         """
-        import re
-        
-        # Count code indicators vs prose indicators
-        code_score = 0
-        prose_score = 0
-        
-        # Code indicators (higher weight for stronger indicators)
-        code_patterns = [
-            (r'\bfrom \w+(?:\.\w+)* import\b', 3),  # Python imports (strong)
-            (r'\bdef \w+\s*\(', 3),  # Function definitions (strong)
-            (r'\bclass \w+\s*[\(:]', 3),  # Class definitions (strong)
-            (r'\w+\s*=\s*\w+\(', 2),  # Function calls assigned (medium)
-            (r'\w+\s*=\s*\[.*\]', 2),  # List assignments (medium)
-            (r'\w+\.\w+\(', 2),  # Method calls (medium)
-            (r'^\s*#[^#]', 1),  # Single-line comments (weak)
-            (r'\bpip install\b', 2),  # Package management (medium)
-            (r'\bpytest\b', 2),  # Testing commands (medium)
-            (r'\bgit clone\b', 2),  # Git commands (medium)
-            (r':\s*\n\s+\w+:', 2),  # YAML structure (medium)
-            (r'\blambda\s+\w+:', 2),  # Lambda functions (medium)
-        ]
-        
-        # Prose indicators  
-        prose_patterns = [
-            (r'\b(the|this|that|these|those|are|is|was|were|will|would|should|could|have|has|had)\b', 1),
-            (r'[.!?]\s+[A-Z]', 2),  # Sentence endings
-            (r'\b(however|therefore|furthermore|moreover|additionally|specifically)\b', 2),
-            (r'\bTable of Contents\b', 3),
-            (r'\bAPI Reference\b', 2),
-        ]
-        
-        # Count patterns
-        for pattern, weight in code_patterns:
-            matches = len(re.findall(pattern, section, re.IGNORECASE | re.MULTILINE))
-            code_score += matches * weight
-            
-        for pattern, weight in prose_patterns:
-            matches = len(re.findall(pattern, section, re.IGNORECASE | re.MULTILINE))
-            prose_score += matches * weight
-        
-        # Additional checks
-        lines = section.split('\n')
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
-        
-        if not non_empty_lines:
-            return False
-            
-        # If section is mostly single words or very short lines, probably not code
-        short_lines = sum(1 for line in non_empty_lines if len(line.split()) < 3)
-        if len(non_empty_lines) > 0 and short_lines / len(non_empty_lines) > 0.7:
-            prose_score += 3
-            
-        # If section has common code structure indicators
-        if any('(' in line and ')' in line for line in non_empty_lines[:5]):
-            code_score += 2
-            
-        safe_logfire_info(f"📊 Section scoring: code_score={code_score}, prose_score={prose_score}")
-        
-        # Code-like if code score significantly higher than prose score
-        return code_score > prose_score and code_score > 2
+        return code_classifier.is_pdf_section_code_like(section)
 
     def _detect_language_from_content(self, code: str) -> str:
         """
         Try to detect programming language from code content.
         This is a simple heuristic approach.
         """
-        import re
-
-        # Language detection patterns
-        patterns = {
-            "python": [
-                r"\bdef\s+\w+\s*\(",
-                r"\bclass\s+\w+",
-                r"\bimport\s+\w+",
-                r"\bfrom\s+\w+\s+import",
-            ],
-            "javascript": [
-                r"\bfunction\s+\w+\s*\(",
-                r"\bconst\s+\w+\s*=",
-                r"\blet\s+\w+\s*=",
-                r"\bvar\s+\w+\s*=",
-            ],
-            "typescript": [
-                r"\binterface\s+\w+",
-                r":\s*\w+\[\]",
-                r"\btype\s+\w+\s*=",
-                r"\bclass\s+\w+.*\{",
-            ],
-            "java": [
-                r"\bpublic\s+class\s+\w+",
-                r"\bprivate\s+\w+\s+\w+",
-                r"\bpublic\s+static\s+void\s+main",
-            ],
-            "rust": [r"\bfn\s+\w+\s*\(", r"\blet\s+mut\s+\w+", r"\bimpl\s+\w+", r"\bstruct\s+\w+"],
-            "go": [r"\bfunc\s+\w+\s*\(", r"\bpackage\s+\w+", r"\btype\s+\w+\s+struct"],
-        }
-
-        # Count matches for each language
-        scores = {}
-        for lang, lang_patterns in patterns.items():
-            score = 0
-            for pattern in lang_patterns:
-                if re.search(pattern, code, re.MULTILINE):
-                    score += 1
-            if score > 0:
-                scores[lang] = score
-
-        # Return language with highest score
-        if scores:
-            return max(scores, key=scores.get)
-
-        return ""
+        return code_classifier.detect_language(code)
 
     async def _find_complete_code_block(
         self,
@@ -1275,57 +1141,7 @@ class CodeExtractionService:
 
     def _decode_html_entities(self, text: str) -> str:
         """Decode common HTML entities and clean HTML tags from code."""
-        import re
-
-        # First, handle span tags that wrap individual tokens
-        # Check if spans are being used for syntax highlighting (no spaces between tags)
-        if "</span><span" in text:
-            # This indicates syntax highlighting - preserve the structure
-            text = re.sub(r"</span>", "", text)
-            text = re.sub(r"<span[^>]*>", "", text)
-        else:
-            # Normal span usage - might need spacing
-            # Only add space if there isn't already whitespace
-            text = re.sub(r"</span>(?=[A-Za-z0-9])", " ", text)
-            text = re.sub(r"<span[^>]*>", "", text)
-
-        # Remove any other HTML tags but preserve their content
-        text = re.sub(r"</?[^>]+>", "", text)
-
-        # Decode HTML entities
-        replacements = {
-            "&lt;": "<",
-            "&gt;": ">",
-            "&amp;": "&",
-            "&quot;": '"',
-            "&#39;": "'",
-            "&nbsp;": " ",
-            "&#x27;": "'",
-            "&#x2F;": "/",
-            "&#60;": "<",
-            "&#62;": ">",
-        }
-
-        for entity, char in replacements.items():
-            text = text.replace(entity, char)
-
-        # Replace escaped newlines with actual newlines
-        text = text.replace("\\n", "\n")
-
-        # Clean up excessive whitespace while preserving intentional spacing
-        # Replace multiple spaces with single space, but preserve newlines
-        lines = text.split("\n")
-        cleaned_lines = []
-        for line in lines:
-            # Replace multiple spaces with single space
-            line = re.sub(r" +", " ", line)
-            # Trim trailing spaces but preserve leading spaces (indentation)
-            line = line.rstrip()
-            cleaned_lines.append(line)
-
-        text = "\n".join(cleaned_lines)
-
-        return text
+        return code_classifier.decode_html_entities(text)
 
     def _clean_code_content(self, code: str, language: str = "") -> str:
         """
@@ -1338,69 +1154,7 @@ class CodeExtractionService:
         Returns:
             Cleaned code content
         """
-        import re
-
-        # First apply HTML entity decoding and tag cleaning
-        code = self._decode_html_entities(code)
-
-        # Fix common concatenation issues from span removal
-        # Common patterns where spaces are missing between keywords
-        spacing_fixes = [
-            # Import statements
-            (r"(\b(?:from|import|as)\b)([A-Za-z])", r"\1 \2"),
-            # Function/class definitions
-            (r"(\b(?:def|class|async|await|return|raise|yield)\b)([A-Za-z])", r"\1 \2"),
-            # Control flow
-            (r"(\b(?:if|elif|else|for|while|try|except|finally|with)\b)([A-Za-z])", r"\1 \2"),
-            # Type hints and declarations
-            (
-                r"(\b(?:int|str|float|bool|list|dict|tuple|set|None|True|False)\b)([A-Za-z])",
-                r"\1 \2",
-            ),
-            # Common Python keywords
-            (r"(\b(?:and|or|not|in|is|lambda)\b)([A-Za-z])", r"\1 \2"),
-            # Fix missing spaces around operators (but be careful with negative numbers)
-            (r"([A-Za-z_)])(\+|-|\*|/|=|<|>|%)", r"\1 \2"),
-            (r"(\+|-|\*|/|=|<|>|%)([A-Za-z_(])", r"\1 \2"),
-        ]
-
-        for pattern, replacement in spacing_fixes:
-            code = re.sub(pattern, replacement, code)
-
-        # Fix specific patterns for different languages
-        if language.lower() in ["python", "py"]:
-            # Fix Python-specific issues
-            code = re.sub(r"(\b(?:from|import)\b)(\w+)(\b(?:import)\b)", r"\1 \2 \3", code)
-            # Fix missing colons
-            code = re.sub(
-                r"(\b(?:def|class|if|elif|else|for|while|try|except|finally|with)\b[^:]+)$",
-                r"\1:",
-                code,
-                flags=re.MULTILINE,
-            )
-
-        # Remove backticks that might have been included
-        if code.startswith("```") and code.endswith("```"):
-            lines = code.split("\n")
-            if len(lines) > 2:
-                # Remove first and last line
-                code = "\n".join(lines[1:-1])
-        elif code.startswith("`") and code.endswith("`"):
-            code = code[1:-1]
-
-        # Final cleanup
-        # Remove any remaining excessive spaces while preserving indentation
-        lines = code.split("\n")
-        cleaned_lines = []
-        for line in lines:
-            # Don't touch leading whitespace (indentation)
-            stripped = line.lstrip()
-            indent = line[: len(line) - len(stripped)]
-            # Clean the rest of the line
-            cleaned = re.sub(r" {2,}", " ", stripped)
-            cleaned_lines.append(indent + cleaned)
-
-        return "\n".join(cleaned_lines).strip()
+        return code_classifier.clean_code_content(code, language)
 
     async def _validate_code_quality(self, code: str, language: str = "") -> bool:
         """
@@ -1413,150 +1167,17 @@ class CodeExtractionService:
         Returns:
             True if code passes quality checks, False otherwise
         """
-        import re
-
-        # Basic checks
-        if not code or len(code.strip()) < 20:
-            return False
-
-        # Skip diagram languages if filtering is enabled
-        if await self._is_diagram_filtering_enabled():
-            if language.lower() in ["mermaid", "plantuml", "graphviz", "dot", "diagram"]:
-                safe_logfire_info(f"Skipping diagram language: {language}")
-                return False
-
-        # Check for common formatting issues that indicate poor extraction
-        bad_patterns = [
-            # Concatenated keywords without spaces (but allow camelCase)
-            r"\b(from|import|def|class|if|for|while|return)(?=[a-z])",
-            # HTML entities that weren't decoded
-            r"&[lg]t;|&amp;|&quot;|&#\d+;",
-            # Excessive HTML tags
-            r"<[^>]{50,}>",  # Very long HTML tags
-            # Multiple spans in a row (indicates poor extraction)
-            r"(<span[^>]*>){5,}",
-            # Suspicious character sequences
-            r"[^\s]{200,}",  # Very long unbroken strings (increased threshold)
-        ]
-
-        for pattern in bad_patterns:
-            if re.search(pattern, code):
-                safe_logfire_info(f"Code failed quality check: pattern '{pattern}' found")
-                return False
-
-        # Check for minimum code complexity using various indicators
-        code_indicators = {
-            "function_calls": r"\w+\s*\([^)]*\)",
-            "assignments": r"\w+\s*=\s*.+",
-            "control_flow": r"\b(if|for|while|switch|case|try|catch|except)\b",
-            "declarations": r"\b(var|let|const|def|class|function|interface|type|struct|enum)\b",
-            "imports": r"\b(import|from|require|include|using|use)\b",
-            "brackets": r"[\{\}\[\]]",
-            "operators": r"[\+\-\*\/\%\&\|\^<>=!]",
-            "method_chains": r"\.\w+",
-            "arrows": r"(=>|->)",
-            "keywords": r"\b(return|break|continue|yield|await|async)\b",
-        }
-
-        indicator_count = 0
-        indicator_details = []
-        for name, pattern in code_indicators.items():
-            if re.search(pattern, code):
-                indicator_count += 1
-                indicator_details.append(name)
-
-        # Require minimum code indicators
-        min_indicators = await self._get_min_code_indicators()
-        if indicator_count < min_indicators:
-            safe_logfire_info(
-                f"Code has insufficient indicators: {indicator_count} found ({', '.join(indicator_details)})"
-            )
-            return False
-
-        # Check code-to-comment ratio
-        lines = code.split("\n")
-        non_empty_lines = [line for line in lines if line.strip()]
-
-        if not non_empty_lines:
-            return False
-
-        # Count comment lines (various comment styles)
-        comment_patterns = [
-            r"^\s*(//|#|/\*|\*|<!--)",  # Single line comments
-            r'^\s*"""',  # Python docstrings
-            r"^\s*'''",  # Python docstrings alt
-            r"^\s*\*\s",  # JSDoc style
-        ]
-
-        comment_lines = 0
-        for line in lines:
-            for pattern in comment_patterns:
-                if re.match(pattern, line.strip()):
-                    comment_lines += 1
-                    break
-
-        # Allow up to 70% comments (documentation is important)
-        if non_empty_lines and comment_lines / len(non_empty_lines) > 0.7:
-            safe_logfire_info(
-                f"Code is mostly comments: {comment_lines}/{len(non_empty_lines)} lines"
-            )
-            return False
-
-        # Language-specific validation
-        if language.lower() in self.LANGUAGE_PATTERNS:
-            lang_info = self.LANGUAGE_PATTERNS[language.lower()]
-            min_indicators = lang_info.get("min_indicators", [])
-
-            # Check for language-specific indicators
-            found_lang_indicators = sum(
-                1 for indicator in min_indicators if indicator in code.lower()
-            )
-
-            if found_lang_indicators < 2:  # Need at least 2 language-specific indicators
-                safe_logfire_info(
-                    f"Code lacks {language} indicators: only {found_lang_indicators} found"
-                )
-                return False
-
-        # Check for reasonable structure
-        # Too few meaningful lines
-        if len(non_empty_lines) < 3:
-            safe_logfire_info(f"Code has too few non-empty lines: {len(non_empty_lines)}")
-            return False
-
-        # Check for reasonable line lengths
-        very_long_lines = sum(1 for line in lines if len(line) > 300)
-        if len(lines) > 0 and very_long_lines > len(lines) * 0.5:
-            safe_logfire_info("Code has too many very long lines")
-            return False
-
-        # Check if it's mostly prose/documentation
-        prose_indicators = [
-            r"\b(the|this|that|these|those|is|are|was|were|will|would|should|could|have|has|had)\b",
-            r"[.!?]\s+[A-Z]",  # Sentence endings followed by capital letter
-            r"\b(however|therefore|furthermore|moreover|nevertheless)\b",
-        ]
-
-        prose_score = 0
-        word_count = len(code.split())
-        for pattern in prose_indicators:
-            matches = len(re.findall(pattern, code, re.IGNORECASE))
-            prose_score += matches
-
-        # Check prose filtering
-        if await self._is_prose_filtering_enabled():
-            max_prose_ratio = await self._get_max_prose_ratio()
-            if word_count > 0 and prose_score / word_count > max_prose_ratio:
-                safe_logfire_info(
-                    f"Code appears to be prose: prose_score={prose_score}, word_count={word_count}"
-                )
-                return False
-
-        # Passed all checks
-        safe_logfire_info(
-            f"Code passed validation: indicators={indicator_count}, language={language}, lines={len(non_empty_lines)}"
+        passed, reason = code_classifier.check_code_quality(
+            code,
+            language,
+            min_indicators=await self._get_min_code_indicators(),
+            filter_diagrams=await self._is_diagram_filtering_enabled(),
+            filter_prose=await self._is_prose_filtering_enabled(),
+            max_prose_ratio=await self._get_max_prose_ratio(),
         )
-        return True
+        if reason:
+            safe_logfire_info(reason)
+        return passed
 
     async def _generate_code_summaries(
         self,
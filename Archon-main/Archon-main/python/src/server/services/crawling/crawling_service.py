@@ -8,7 +8,7 @@ batch crawling, recursive crawling, and overall orchestration with progress trac
 
 import asyncio
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, Optional
 
 import tldextract
@@ -22,6 +22,16 @@ from ..credential_service import credential_service
 # Import operations
 from .discovery_service import DiscoveryService
 from .document_storage_operations import DocumentStorageOperations
+from .helpers.crawl_checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_CHECKPOINT_MAX_AGE,
+    PAGE_STORED,
+    STAGE_CRAWLED,
+    STAGE_CRAWLING,
+    STAGE_STORED,
+    CrawlCheckpoint,
+)
+from .helpers.crawl_result_store import CrawlResultStore
 from .helpers.site_config import SiteConfig
 
 # Import helpers
@@ -139,6 +149,8 @@ class CrawlingService:
         self.progress_mapper = ProgressMapper()
         # Cancellation support
         self._cancelled = False
+        # Durable crawl state for resuming (opened by the orchestration when progress_id is set)
+        self.checkpoint: CrawlCheckpoint | None = None
 
     def set_progress_id(self, progress_id: str):
         """Set the progress ID for HTTP polling updates."""
@@ -250,7 +262,7 @@ class CrawlingService:
         max_concurrent: int | None = None,
         progress_callback: Callable[[str, int, str], Awaitable[None]] | None = None,
         link_text_fallbacks: dict[str, str] | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> Sequence[dict[str, Any]]:
         """Batch crawl multiple URLs in parallel."""
         return await self.batch_strategy.crawl_batch_with_progress(
             urls,
@@ -260,6 +272,7 @@ class CrawlingService:
             progress_callback,
             self._check_cancellation,  # Pass cancellation check
             link_text_fallbacks,  # Pass link text fallbacks
+            self.checkpoint,
         )
 
     async def crawl_recursive_with_progress(
@@ -268,7 +281,7 @@ class CrawlingService:
         max_depth: int = 3,
         max_concurrent: int | None = None,
         progress_callback: Callable[[str, int, str], Awaitable[None]] | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> Sequence[dict[str, Any]]:
         """Recursively crawl internal links from start URLs."""
         return await self.recursive_strategy.crawl_recursive_with_progress(
             start_urls,
@@ -278,8 +291,77 @@ class CrawlingService:
             max_concurrent,
             progress_callback,
             self._check_cancellation,  # Pass cancellation check
+            self.checkpoint,
         )
 
+    async def _open_checkpoint(self, request: dict[str, Any]) -> CrawlCheckpoint | None:
+        """
+        Open the checkpoint for this crawl, creating it for a new crawl.
+
+        Checkpointing is best-effort: if the checkpoint can't be opened the crawl
+        runs without one and just isn't resumable.
+        """
+        if not self.progress_id:
+            return None
+        try:
+            try:
+                interval = float(
+                    await credential_service.get_credential(
+                        "CRAWL_CHECKPOINT_INTERVAL", str(DEFAULT_CHECKPOINT_INTERVAL)
+                    )
+                )
+            except (TypeError, ValueError):
+                interval = DEFAULT_CHECKPOINT_INTERVAL
+            await self._sweep_expired_checkpoints()
+            checkpoint = CrawlCheckpoint(self.progress_id, interval=max(1.0, interval))
+            if checkpoint.stage is None:
+                checkpoint.set_meta("request", request)
+                checkpoint.stage = STAGE_CRAWLING
+            else:
+                safe_logfire_info(f"Resuming crawl from checkpoint | {checkpoint.summary()}")
+            return checkpoint
+        except Exception as e:
+            logger.warning(f"Crawl checkpointing disabled for {self.progress_id}: {e}", exc_info=True)
+            return None
+
+    async def _sweep_expired_checkpoints(self) -> None:
+        """Remove checkpoints of abandoned crawls older than CRAWL_CHECKPOINT_MAX_AGE_HOURS."""
+        try:
+            max_age = float(
+                await credential_service.get_credential(
+                    "CRAWL_CHECKPOINT_MAX_AGE_HOURS", str(DEFAULT_CHECKPOINT_MAX_AGE / 3600)
+                )
+            ) * 3600
+        except (TypeError, ValueError):
+            max_age = DEFAULT_CHECKPOINT_MAX_AGE
+        lock = _ensure_orchestration_lock()
+        async with lock:
+            running = set(_active_orchestrations)
+        running.add(self.progress_id)
+        try:
+            CrawlCheckpoint.sweep_expired(max_age, keep=running)
+        except OSError as e:
+            logger.warning(f"Failed to sweep expired crawl checkpoints: {e}")
+
+    def _checkpoint_crawl_results(self, crawl_results: Sequence[dict[str, Any]], crawl_type: str | None):
+        """Save every crawled page (including single-file results) and mark the crawl stage done."""
+        checkpoint = self.checkpoint
+        if checkpoint is None or checkpoint.stage != STAGE_CRAWLING:
+            return
+        saved = checkpoint.visited()
+        for position in range(len(crawl_results)):
+            # Strategies already saved most pages; only add the rest
+            url = (
+                crawl_results.url_at(position)
+                if isinstance(crawl_results, CrawlResultStore)
+                else crawl_results[position].get("url")
+            )
+            if url not in saved:
+                checkpoint.record_page(crawl_results[position])
+        checkpoint.save()
+        checkpoint.set_meta("crawl_type", crawl_type)
+        checkpoint.stage = STAGE_CRAWLED
+
     # Orchestration methods
     async def orchestrate_crawl(self, request: dict[str, Any]) -> dict[str, Any]:
         """
@@ -342,6 +424,7 @@ class CrawlingService:
                 )
                 last_heartbeat = current_time
 
+        crawl_results = None
         try:
             url = str(request.get("url", ""))
             safe_logfire_info(f"Starting async crawl orchestration | url={url} | task_id={task_id}")
@@ -355,6 +438,10 @@ class CrawlingService:
                     "log": f"Starting crawl of {url}"
                 })
 
+            # Open (or resume from) the durable checkpoint for this crawl
+            self.checkpoint = await self._open_checkpoint(request)
+            resume_stage = self.checkpoint.stage if self.checkpoint else None
+
             # Generate unique source_id and display name from the original URL
             original_source_id = self.url_handler.generate_unique_source_id(url)
             source_display_name = self.url_handler.extract_display_name(url)
@@ -388,6 +475,8 @@ class CrawlingService:
 
             # Discovery phase - find the single best related file
             discovered_urls = []
+            # Resuming after the crawl stage finished: skip discovery and crawling
+            crawl_done = resume_stage in (STAGE_CRAWLED, STAGE_STORED)
             # Skip discovery if the URL itself is already a discovery target (sitemap, llms file, etc.)
             is_already_discovery_target = (
                 self.url_handler.is_sitemap(url) or
@@ -400,13 +489,20 @@ class CrawlingService:
             if is_already_discovery_target:
                 safe_logfire_info(f"Skipping discovery - URL is already a discovery target file: {url}")
 
-            if request.get("auto_discovery", True) and not is_already_discovery_target:  # Default enabled, but skip if already a discovery file
+            if request.get("auto_discovery", True) and not is_already_discovery_target and not crawl_done:  # Default enabled, but skip if already a discovery file
                 await update_mapped_progress(
                     "discovery", 25, f"Discovering best related file for {url}", current_url=url
                 )
                 try:
-                    # Offload potential sync I/O to avoid blocking the event loop
-                    discovered_file = await asyncio.to_thread(self.discovery_service.discover_files, url)
+                    if self.checkpoint and self.checkpoint.get_meta("discovery_done"):
+                        # Resuming: follow the same discovered file as the interrupted crawl
+                        discovered_file = self.checkpoint.get_meta("discovered_file")
+                    else:
+                        # Probes all candidate locations concurrently with async httpx
+                        discovered_file = await self.discovery_service.discover_files_async(url)
+                        if self.checkpoint:
+                            self.checkpoint.set_meta("discovered_file", discovered_file)
+                            self.checkpoint.set_meta("discovery_done", True)
 
                     # Add the single best discovered file to crawl list
                     if discovered_file:
@@ -450,7 +546,15 @@ class CrawlingService:
                     )
 
             # Analyzing stage - determine what to crawl
-            if discovered_urls:
+            if crawl_done:
+                checkpoint = self.checkpoint
+                assert checkpoint is not None
+                crawl_results = CrawlResultStore(checkpoint.pages())
+                crawl_type = checkpoint.get_meta("crawl_type")
+                safe_logfire_info(
+                    f"Loaded {len(crawl_results)} crawled pages from checkpoint | progress_id={self.progress_id}"
+                )
+            elif discovered_urls:
                 # Discovery found a file - crawl ONLY the discovered file, not the main URL
                 total_urls_to_crawl = len(discovered_urls)
                 await update_mapped_progress(
@@ -497,12 +601,21 @@ class CrawlingService:
             # Check for cancellation after crawling
             self._check_cancellation()
 
+            if crawl_results:
+                self._checkpoint_crawl_results(crawl_results, crawl_type)
+
             # Send heartbeat after potentially long crawl operation
             await send_heartbeat_if_needed()
 
             if not crawl_results:
                 raise ValueError("No content was crawled from the provided URL")
 
+            if isinstance(crawl_results, CrawlResultStore):
+                safe_logfire_info(
+                    f"Crawl results spilled to disk | pages={len(crawl_results)} | "
+                    f"raw_bytes={crawl_results.raw_bytes} | stored_bytes={crawl_results.stored_bytes}"
+                )
+
             # Processing stage
             await update_mapped_progress("processing", 50, "Processing crawled content")
 
@@ -548,17 +661,38 @@ class CrawlingService:
                         **kwargs
                     )
 
-            storage_results = await self.doc_storage_ops.process_and_store_documents(
-                crawl_results,
-                request,
-                crawl_type,
-                original_source_id,
-                doc_storage_callback,
-                self._check_cancellation,
-                source_url=url,
-                source_display_name=source_display_name,
-                url_to_page_id=None,  # Will be populated after page storage
-            )
+            if resume_stage == STAGE_STORED:
+                # Pages were chunked, embedded and stored before the interruption
+                checkpoint = self.checkpoint
+                assert checkpoint is not None
+                storage_results = {
+                    **checkpoint.get_meta("storage_results", {}),
+                    "url_to_full_document": {
+                        page["url"]: page.get("markdown", "") for page in crawl_results if page.get("url")
+                    },
+                }
+                await update_mapped_progress(
+                    "document_storage", 100, "Documents already stored before resume, skipping storage"
+                )
+            else:
+                storage_results = await self.doc_storage_ops.process_and_store_documents(
+                    crawl_results,
+                    request,
+                    crawl_type,
+                    original_source_id,
+                    doc_storage_callback,
+                    self._check_cancellation,
+                    source_url=url,
+                    source_display_name=source_display_name,
+                    url_to_page_id=None,  # Will be populated after page storage
+                )
+                if self.checkpoint:
+                    self.checkpoint.mark_pages(PAGE_STORED)
+                    self.checkpoint.set_meta(
+                        "storage_results",
+                        {k: v for k, v in storage_results.items() if k != "url_to_full_document"},
+                    )
+                    self.checkpoint.stage = STAGE_STORED
 
             # Update progress tracker with source_id now that it's created
             if self.progress_tracker and storage_results.get("source_id"):
@@ -700,6 +834,11 @@ class CrawlingService:
                     "log": "Crawl completed successfully!",
                 })
 
+            # Nothing left to resume
+            if self.checkpoint:
+                self.checkpoint.delete()
+                self.checkpoint = None
+
             # Unregister after successful completion
             if self.progress_id:
                 await unregister_orchestration(self.progress_id)
@@ -709,6 +848,10 @@ class CrawlingService:
 
         except asyncio.CancelledError:
             safe_logfire_info(f"Crawl operation cancelled | progress_id={self.progress_id}")
+            # A crawl the user stopped isn't coming back; one interrupted by shutdown may be resumed
+            if self._cancelled and self.checkpoint:
+                self.checkpoint.delete()
+                self.checkpoint = None
             # Use ProgressMapper to get proper progress value for cancelled state
             cancelled_progress = self.progress_mapper.map_progress("cancelled", 0)
             await self._handle_progress_update(
@@ -749,6 +892,15 @@ class CrawlingService:
                 safe_logfire_info(
                     f"Unregistered orchestration service on error | progress_id={self.progress_id}"
                 )
+        finally:
+            # Release the spilled crawl results
+            if isinstance(crawl_results, CrawlResultStore):
+                crawl_results.close()
+            # An interrupted or failed crawl keeps its checkpoint file so it can be resumed
+            if self.checkpoint:
+                safe_logfire_info(f"Crawl checkpoint kept for resume | {self.checkpoint.summary()}")
+                self.checkpoint.close()
+                self.checkpoint = None
 
     def _is_same_domain(self, url: str, base_domain: str) -> bool:
         """
@@ -851,7 +1003,7 @@ class CrawlingService:
         Returns:
             Tuple of (crawl_results, crawl_type)
         """
-        crawl_results = []
+        crawl_results: Sequence[dict[str, Any]] = []
         crawl_type = None
 
         # Helper to update progress with mapper
@@ -928,6 +1080,7 @@ class CrawlingService:
                                 )
 
                                 # Combine original llms.txt with linked pages
+                                crawl_results = CrawlResultStore(crawl_results)
                                 crawl_results.extend(batch_results)
                                 crawl_type = "llms_txt_with_linked_pages"
                                 logger.info(f"llms.txt crawling completed: {len(crawl_results)} total pages (1 llms.txt + {len(batch_results)} linked pages)")
@@ -1002,6 +1155,7 @@ class CrawlingService:
                             )
 
                         # Combine original text file results with batch results
+                        crawl_results = CrawlResultStore(crawl_results)
                         crawl_results.extend(batch_results)
                         crawl_type = "link_collection_with_crawled_links"
 
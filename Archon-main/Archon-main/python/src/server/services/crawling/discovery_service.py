@@ -5,11 +5,13 @@ Handles automatic discovery and parsing of llms.txt, sitemap.xml, and related fi
 to enhance crawling capabilities with priority-based discovery methods.
 """
 
+import asyncio
 import ipaddress
 import socket
 from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 
+import httpx
 import requests
 
 from ...config.logfire_config import get_logger
@@ -69,12 +71,21 @@ class DiscoveryService:
         ".well-known/sitemap.xml"
     ]
 
+    # Probe limits for discover_files_async
+    MAX_CONCURRENT_PROBES = 10
+    PROBE_TIMEOUT = 5.0
+    USER_AGENT = 'Archon-Discovery/1.0 (SSRF-Protected)'
+
     # Known file extensions for path detection
     FILE_EXTENSIONS = {
         '.html', '.htm', '.xml', '.json', '.txt', '.md', '.csv',
         '.rss', '.yaml', '.yml', '.pdf', '.zip'
     }
 
+    def __init__(self):
+        # hostname -> task resolving to whether all of its IPs are safe; shared by concurrent probes
+        self._host_checks: dict[str, asyncio.Task] = {}
+
     def discover_files(self, base_url: str) -> str | None:
         """
         Main discovery orchestrator - selects ONE best file across all categories.
@@ -113,6 +124,193 @@ class DiscoveryService:
             logger.exception(f"Unexpected error during discovery for {base_url}")
             return None
 
+    async def discover_files_async(self, base_url: str) -> str | None:
+        """
+        Async variant of discover_files that probes all candidate locations concurrently.
+
+        Candidates are probed with httpx, at most MAX_CONCURRENT_PROBES at a time and
+        started in priority order. DNS resolution and SSRF validation run once per host.
+        The highest-priority hit is returned as soon as every candidate ahead of it has
+        been ruled out, and the remaining probes are cancelled. The result is the same
+        file discover_files would pick.
+
+        Args:
+            base_url: Base URL to discover files for
+
+        Returns:
+            Single best URL found, or None if no files discovered
+        """
+        try:
+            logger.info(f"Starting concurrent single-file discovery for {base_url}")
+
+            candidates = self._candidate_urls(base_url)
+            discovered_url = await self._first_existing_url(candidates)
+            if discovered_url:
+                logger.info(f"Discovery found best file: {discovered_url}")
+                return discovered_url
+
+            # Fallback: Check HTML meta tags for sitemap references
+            html_sitemaps = await asyncio.to_thread(self._parse_html_meta_tags, base_url)
+            if html_sitemaps:
+                best_file = html_sitemaps[0]
+                logger.info(f"Discovery found best file from HTML meta tags: {best_file}")
+                return best_file
+
+            logger.info(f"Discovery completed for {base_url}: no files found")
+            return None
+
+        except Exception:
+            logger.exception(f"Unexpected error during discovery for {base_url}")
+            return None
+
+    def _candidate_urls(self, base_url: str) -> list[str]:
+        """
+        List every location discover_files would check, in the order it checks them.
+
+        Args:
+            base_url: Base URL to discover files for
+
+        Returns:
+            Candidate URLs, highest priority first, without duplicates
+        """
+        base_dir = self._extract_directory(base_url)
+        candidates: list[str] = []
+        for filename in self.DISCOVERY_PRIORITY:
+            candidates.extend(self._candidate_locations(base_url, base_dir, filename))
+        return list(dict.fromkeys(candidates))
+
+    async def _first_existing_url(self, candidates: list[str]) -> str | None:
+        """
+        Probe candidates concurrently and return the first one (in list order) that exists.
+
+        Args:
+            candidates: URLs in priority order
+
+        Returns:
+            Highest-priority existing URL, or None
+        """
+        if not candidates:
+            return None
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PROBES)
+
+        async def validate_request(request: httpx.Request):
+            # Runs for the initial request and every redirect hop
+            if request.url.scheme not in ('http', 'https'):
+                raise httpx.UnsupportedProtocol(f"Blocked non-HTTP(S) scheme: {request.url.scheme}")
+            if not await self._is_host_allowed(request.url.host):
+                raise httpx.RequestError(f"Blocked unsafe hostname: {request.url.host}", request=request)
+
+        async with httpx.AsyncClient(
+            timeout=self.PROBE_TIMEOUT,
+            follow_redirects=True,
+            max_redirects=3,
+            verify=True,
+            headers={'User-Agent': self.USER_AGENT},
+            event_hooks={'request': [validate_request]},
+        ) as client:
+
+            async def probe(url: str) -> bool:
+                # Semaphore waiters are served FIFO, so probes start in priority order
+                async with semaphore:
+                    return await self._check_url_exists_async(client, url)
+
+            tasks = [asyncio.create_task(probe(url)) for url in candidates]
+            try:
+                for url, task in zip(candidates, tasks, strict=True):
+                    if await task:
+                        return url
+                return None
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _check_url_exists_async(self, client: httpx.AsyncClient, url: str) -> bool:
+        """
+        Check if a URL exists and returns a successful response, without reading the body.
+        SSRF protection is applied to every hop by the client's request hook.
+
+        Args:
+            client: httpx client configured by _first_existing_url
+            url: URL to check
+
+        Returns:
+            True if URL returns 200, False otherwise
+        """
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            logger.warning(f"Invalid URL format: {url}")
+            return False
+
+        try:
+            async with client.stream('GET', url) as resp:
+                success = resp.status_code == 200
+                logger.debug(f"URL check: {url} -> {resp.status_code} ({'exists' if success else 'not found'})")
+                return success
+        except httpx.TooManyRedirects:
+            logger.warning(f"Too many redirects for URL: {url}")
+            return False
+        except httpx.TimeoutException:
+            logger.debug(f"Timeout checking URL: {url}")
+            return False
+        except httpx.HTTPError as e:
+            logger.debug(f"Request error checking URL {url}: {e}")
+            return False
+        except Exception as e:
+            logger.warning(f"Unexpected error checking URL {url}: {e}", exc_info=True)
+            return False
+
+    async def _is_host_allowed(self, hostname: str) -> bool:
+        """
+        Resolve and validate a hostname once per service instance.
+
+        Concurrent probes for the same host share one lookup.
+
+        Args:
+            hostname: Hostname to resolve and validate
+
+        Returns:
+            True if hostname resolves to safe IPs only, False otherwise
+        """
+        task = self._host_checks.get(hostname)
+        if task is None:
+            task = asyncio.create_task(self._resolve_and_validate_hostname_async(hostname))
+            self._host_checks[hostname] = task
+        # Shield so a cancelled probe doesn't cancel the lookup other probes are waiting on
+        return await asyncio.shield(task)
+
+    async def _resolve_and_validate_hostname_async(self, hostname: str) -> bool:
+        """
+        Async version of _resolve_and_validate_hostname using the event loop's resolver.
+
+        Args:
+            hostname: Hostname to resolve and validate
+
+        Returns:
+            True if hostname resolves to safe IPs only, False otherwise
+        """
+        try:
+            addr_info = await asyncio.get_running_loop().getaddrinfo(
+                hostname, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+            )
+
+            # Check all resolved IPs
+            for info in addr_info:
+                ip_str = info[4][0]
+                if not self._is_safe_ip(ip_str):
+                    logger.warning(f"Hostname {hostname} resolves to unsafe IP {ip_str}")
+                    return False
+
+            return True
+
+        except socket.gaierror as e:
+            logger.warning(f"DNS resolution failed for {hostname}: {e}")
+            return False
+        except Exception as e:
+            logger.warning(f"Error resolving hostname {hostname}: {e}")
+            return False
+
     def _extract_directory(self, base_url: str) -> str:
         """
         Extract directory path from URL, handling both file URLs and directory URLs.
@@ -154,27 +352,39 @@ class DiscoveryService:
         Returns:
             URL if file found, None otherwise
         """
+        for url in self._candidate_locations(base_url, base_dir, filename):
+            if self._check_url_exists(url):
+                return url
+
+        return None
+
+    def _candidate_locations(self, base_url: str, base_dir: str, filename: str) -> list[str]:
+        """
+        List the locations to check for a filename, in priority order.
+
+        Args:
+            base_url: Original base URL
+            base_dir: Extracted directory path
+            filename: Filename to search for
+
+        Returns:
+            Candidate URLs for the file
+        """
         parsed = urlparse(base_url)
+        locations = []
 
         # Priority 1: Check same directory (if not root)
         if base_dir and base_dir != '/':
-            same_dir_url = f"{parsed.scheme}://{parsed.netloc}{base_dir}/{filename}"
-            if self._check_url_exists(same_dir_url):
-                return same_dir_url
+            locations.append(f"{parsed.scheme}://{parsed.netloc}{base_dir}/{filename}")
 
         # Priority 2: Check root level
-        root_url = urljoin(base_url, filename)
-        if self._check_url_exists(root_url):
-            return root_url
+        locations.append(urljoin(base_url, filename))
 
         # Priority 3: Check common subdirectories
-        subdirs = self._get_subdirs_for_file(base_dir, filename)
-        for subdir in subdirs:
-            subdir_url = urljoin(base_url, f"{subdir}/{filename}")
-            if self._check_url_exists(subdir_url):
-                return subdir_url
+        for subdir in self._get_subdirs_for_file(base_dir, filename):
+            locations.append(urljoin(base_url, f"{subdir}/{filename}"))
 
-        return None
+        return locations
 
     def _get_subdirs_for_file(self, base_dir: str, filename: str) -> list[str]:
         """
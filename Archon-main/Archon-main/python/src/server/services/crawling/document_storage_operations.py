@@ -6,7 +6,7 @@ Extracted from crawl_orchestration_service.py for better modularity.
 """
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from ...config.logfire_config import get_logger, safe_logfire_error, safe_logfire_info
@@ -36,7 +36,7 @@ class DocumentStorageOperations:
 
     async def process_and_store_documents(
         self,
-        crawl_results: list[dict],
+        crawl_results: Sequence[dict[str, Any]],
         request: dict[str, Any],
         crawl_type: str,
         original_source_id: str,
@@ -50,7 +50,9 @@ class DocumentStorageOperations:
         Process crawled documents and store them in the database.
 
         Args:
-            crawl_results: List of crawled documents
+            crawl_results: Crawled documents. A CrawlResultStore keeps raw HTML on disk, but the
+                markdown of every page is still collected in url_to_full_document for contextual
+                embeddings and code extraction
             request: The original crawl request
             crawl_type: Type of crawl performed
             original_source_id: The source ID for all documents
@@ -437,7 +439,7 @@ class DocumentStorageOperations:
 
     async def extract_and_store_code_examples(
         self,
-        crawl_results: list[dict],
+        crawl_results: Sequence[dict[str, Any]],
         url_to_full_document: dict[str, str],
         source_id: str,
         progress_callback: Callable | None = None,
@@ -4,10 +4,14 @@ Crawling Helpers
 This module contains helper utilities for crawling operations.
 """
 
+from .crawl_checkpoint import CrawlCheckpoint
+from .crawl_result_store import CrawlResultStore
 from .site_config import SiteConfig
 from .url_handler import URLHandler
 
 __all__ = [
     'URLHandler',
-    'SiteConfig'
+    'SiteConfig',
+    'CrawlResultStore',
+    'CrawlCheckpoint'
 ]
@@ -0,0 +1,338 @@
+"""
+Crawl Checkpoint
+
+Durable per-crawl state so an interrupted crawl (server restart, deploy,
+failure) can be resumed instead of restarted from zero.
+
+Crawling is checkpointed page by page. Storage is checkpointed per stage:
+pages are marked stored only once the whole storage stage has finished, so
+a crawl interrupted mid-storage re-runs storage for every page on resume.
+Pages are upserted and chunks are deleted by URL before insert, so the rerun is safe.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from ....config.logfire_config import get_logger
+from .crawl_result_store import COMPRESSION_LEVEL
+
+logger = get_logger(__name__)
+
+DEFAULT_CHECKPOINT_INTERVAL = 30.0  # Seconds between checkpoint writes
+DEFAULT_CHECKPOINT_MAX_AGE = 7 * 24 * 3600.0  # Seconds before an abandoned checkpoint is swept
+
+# Page statuses
+PAGE_CRAWLED = "crawled"
+PAGE_STORED = "stored"  # Storage stage finished for the whole crawl
+
+# Orchestration stages, in order
+STAGE_CRAWLING = "crawling"
+STAGE_CRAWLED = "crawled"
+STAGE_STORED = "stored"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS pages (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS visited (url TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS frontier (position INTEGER PRIMARY KEY, depth INTEGER NOT NULL, url TEXT NOT NULL);
+"""
+
+
+def get_checkpoint_dir(directory: str | None = None) -> str:
+    """Directory holding checkpoint files (CRAWL_CHECKPOINT_DIR or the system temp dir)."""
+    return (
+        directory
+        or os.getenv("CRAWL_CHECKPOINT_DIR")
+        or os.path.join(tempfile.gettempdir(), "archon-crawl-checkpoints")
+    )
+
+
+def _remove_database_files(path: str) -> bool:
+    """Remove a SQLite database and its journal files; True if the database existed."""
+    removed = False
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+            removed = removed or not suffix
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+class CrawlCheckpoint:
+    """
+    SQLite-backed checkpoint for one crawl, keyed by its progress ID.
+
+    Holds the original request and orchestration stage, the crawled pages
+    (zlib-compressed, with a crawled/stored status each), the set of visited
+    URLs and a snapshot of the crawl frontier. Strategies record pages and
+    visited URLs as they go; the records are buffered in memory and written
+    together with the frontier snapshot when `due()`, so checkpointing costs
+    one transaction per interval rather than one per page.
+
+    The file lives in CRAWL_CHECKPOINT_DIR (mount it on a volume so it
+    survives container restarts) and is deleted once the crawl completes or
+    is cancelled by the user. Checkpoints of crawls that are never resumed are
+    removed by `sweep_expired` once they are older than the max age.
+    """
+
+    def __init__(
+        self,
+        progress_id: str,
+        directory: str | None = None,
+        interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        """
+        Open (or create) the checkpoint for a crawl.
+
+        Args:
+            progress_id: Progress ID of the crawl
+            directory: Checkpoint directory (default: CRAWL_CHECKPOINT_DIR or the system temp dir)
+            interval: Minimum seconds between frontier/page writes
+        """
+        self.progress_id = progress_id
+        self.interval = interval
+        self.path = self.path_for(progress_id, directory)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._pending_pages: list[tuple[str, bytes]] = []
+        self._pending_visited: list[str] = []
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def path_for(progress_id: str, directory: str | None = None) -> str:
+        """Path of the checkpoint file for a progress ID."""
+        safe_id = "".join(c for c in progress_id if c.isalnum() or c in "-_")
+        if not safe_id:
+            raise ValueError(f"Invalid progress ID for checkpoint: {progress_id!r}")
+        return os.path.join(get_checkpoint_dir(directory), f"{safe_id}.sqlite")
+
+    @classmethod
+    def exists(cls, progress_id: str, directory: str | None = None) -> bool:
+        """Whether a checkpoint file exists for a progress ID."""
+        try:
+            return os.path.exists(cls.path_for(progress_id, directory))
+        except ValueError:
+            return False
+
+    @classmethod
+    def remove(cls, progress_id: str, directory: str | None = None) -> bool:
+        """
+        Remove the checkpoint file for a progress ID without opening it.
+
+        Returns:
+            True if a checkpoint file was removed
+        """
+        try:
+            path = cls.path_for(progress_id, directory)
+        except ValueError:
+            return False
+        removed = _remove_database_files(path)
+        if removed:
+            logger.debug(f"Deleted crawl checkpoint | progress_id={progress_id}")
+        return removed
+
+    @classmethod
+    def sweep_expired(
+        cls,
+        max_age: float = DEFAULT_CHECKPOINT_MAX_AGE,
+        directory: str | None = None,
+        keep: Iterable[str] = (),
+    ) -> list[str]:
+        """
+        Remove checkpoints not written to for longer than max_age seconds.
+
+        Failed and interrupted crawls keep their checkpoint for resuming; this
+        bounds how long an abandoned one holds its crawled pages on disk.
+
+        Args:
+            max_age: Age in seconds (since the last write) after which a checkpoint is removed
+            directory: Checkpoint directory (default: CRAWL_CHECKPOINT_DIR or the system temp dir)
+            keep: Progress IDs to leave alone (e.g. crawls that are running)
+
+        Returns:
+            Progress IDs whose checkpoints were removed
+        """
+        checkpoint_dir = get_checkpoint_dir(directory)
+        try:
+            entries = os.listdir(checkpoint_dir)
+        except FileNotFoundError:
+            return []
+
+        keep_ids = set(keep)
+        cutoff = time.time() - max_age
+        removed = []
+        for name in entries:
+            progress_id, ext = os.path.splitext(name)
+            if ext != ".sqlite" or progress_id in keep_ids:
+                continue
+            try:
+                if os.path.getmtime(os.path.join(checkpoint_dir, name)) >= cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            if cls.remove(progress_id, directory):
+                removed.append(progress_id)
+        if removed:
+            logger.info(f"Swept {len(removed)} expired crawl checkpoints from {checkpoint_dir}")
+        return removed
+
+    # Metadata
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """Read a metadata value."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set_meta(self, key: str, value: Any) -> None:
+        """Write a metadata value immediately."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+        self._conn.commit()
+
+    @property
+    def stage(self) -> str | None:
+        """Last orchestration stage reached."""
+        return self.get_meta("stage")
+
+    @stage.setter
+    def stage(self, value: str) -> None:
+        self.set_meta("stage", value)
+
+    # Crawl state
+
+    def record_page(self, page: dict[str, Any]) -> None:
+        """Buffer a crawled page (and mark its URL visited) for the next save."""
+        url = page.get("url")
+        if not url:
+            return
+        data = zlib.compress(json.dumps(page, ensure_ascii=False).encode("utf-8"), COMPRESSION_LEVEL)
+        self._pending_pages.append((url, data))
+        self._pending_visited.append(url)
+
+    def record_visited(self, url: str) -> None:
+        """Buffer a processed URL (crawled or failed) for the next save."""
+        self._pending_visited.append(url)
+
+    def due(self) -> bool:
+        """Whether the checkpoint interval has elapsed since the last save."""
+        return time.monotonic() - self._last_save >= self.interval
+
+    def save(self, frontier: Iterable[tuple[int, str]] | None = None) -> None:
+        """
+        Write buffered pages and visited URLs, and replace the frontier snapshot.
+
+        Args:
+            frontier: (depth, url) pairs still to crawl, in crawl order; None keeps the previous snapshot
+        """
+        pages, self._pending_pages = self._pending_pages, []
+        visited, self._pending_visited = self._pending_visited, []
+        snapshot = None if frontier is None else list(frontier)
+        self._write(pages, visited, snapshot)
+        self._last_save = time.monotonic()
+        logger.debug(
+            f"Saved crawl checkpoint | progress_id={self.progress_id} | pages={len(pages)} | "
+            f"visited={len(visited)} | frontier={'unchanged' if snapshot is None else len(snapshot)}"
+        )
+
+    def _write(
+        self,
+        pages: list[tuple[str, bytes]],
+        visited: list[str],
+        frontier: list[tuple[int, str]] | None,
+    ) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO pages (url, status, data) VALUES (?, ?, ?)",
+                [(url, PAGE_CRAWLED, data) for url, data in pages],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO visited (url) VALUES (?)", [(url,) for url in visited]
+            )
+            if frontier is not None:
+                self._conn.execute("DELETE FROM frontier")
+                self._conn.executemany(
+                    "INSERT INTO frontier (position, depth, url) VALUES (?, ?, ?)",
+                    [(position, depth, url) for position, (depth, url) in enumerate(frontier)],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('frontier_saved', 'true')"
+                )
+
+    @property
+    def has_frontier(self) -> bool:
+        """Whether a frontier snapshot has been saved (i.e. a recursive crawl can resume)."""
+        return bool(self.get_meta("frontier_saved", False))
+
+    def frontier(self) -> list[tuple[int, str]]:
+        """Saved (depth, url) pairs still to crawl, in crawl order."""
+        return list(self._conn.execute("SELECT depth, url FROM frontier ORDER BY position"))
+
+    def visited(self) -> set[str]:
+        """URLs already processed, successfully or not."""
+        return {row[0] for row in self._conn.execute("SELECT url FROM visited")}
+
+    def pages(self) -> Iterator[dict[str, Any]]:
+        """Saved pages in crawl order, decompressed one at a time."""
+        for (data,) in self._conn.execute("SELECT data FROM pages ORDER BY position"):
+            yield json.loads(zlib.decompress(data))
+
+    @property
+    def page_count(self) -> int:
+        """Number of saved pages."""
+        return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def page_status_counts(self) -> dict[str, int]:
+        """Number of saved pages per status."""
+        return dict(self._conn.execute("SELECT status, COUNT(*) FROM pages GROUP BY status"))
+
+    def mark_pages(self, status: str, urls: Iterable[str] | None = None) -> None:
+        """Set the status of the given pages (all pages if urls is None)."""
+        with self._conn:
+            if urls is None:
+                self._conn.execute("UPDATE pages SET status = ?", (status,))
+            else:
+                self._conn.executemany(
+                    "UPDATE pages SET status = ? WHERE url = ?", [(status, url) for url in urls]
+                )
+
+    def summary(self) -> dict[str, Any]:
+        """Checkpoint state for API responses and logs."""
+        return {
+            "progress_id": self.progress_id,
+            "stage": self.stage,
+            "crawl_type": self.get_meta("crawl_type"),
+            "pages": self.page_count,
+            "page_status": self.page_status_counts(),
+            "frontier": self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0],
+            "updated_at": os.path.getmtime(self.path),
+        }
+
+    # Lifecycle
+
+    def close(self) -> None:
+        """Close the database; unsaved buffered records are dropped."""
+        self._conn.close()
+
+    def delete(self) -> None:
+        """Close and remove the checkpoint file."""
+        self.close()
+        _remove_database_files(self.path)
+        logger.debug(f"Deleted crawl checkpoint | progress_id={self.progress_id}")
+
+    def __repr__(self) -> str:
+        return f"CrawlCheckpoint(progress_id={self.progress_id!r}, stage={self.stage!r})"
@@ -0,0 +1,138 @@
+"""
+Crawl Result Store
+
+Spills crawled pages to disk so a crawl does not keep every page's raw HTML
+and markdown in the server process.
+"""
+
+import json
+import os
+import tempfile
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from ....config.logfire_config import get_logger
+
+logger = get_logger(__name__)
+
+# zlib level 3 compresses HTML roughly 5-8x at a fraction of level 9's CPU cost
+COMPRESSION_LEVEL = 3
+
+
+class CrawlResultStore(Sequence):
+    """
+    Append-only, disk-backed list of crawl result dicts.
+
+    Each page is serialized to JSON, zlib-compressed and appended to an anonymous
+    temporary file (in CRAWL_RESULT_STORE_DIR if set). Only the (offset, length)
+    of each blob and a URL -> position index stay in memory. Pages are read back
+    one at a time, so downstream stages that iterate the store only hold the page
+    they are working on.
+
+    The store behaves like the list of dicts the crawl strategies used to return
+    (len, indexing, iteration, truthiness), so callers don't need to change.
+    Call close() (or use it as a context manager) to release the file early;
+    it is also removed when the store is garbage collected.
+    """
+
+    def __init__(self, results: Iterable[dict[str, Any]] | None = None, directory: str | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            results: Optional initial results to append
+            directory: Directory for the spill file (default: CRAWL_RESULT_STORE_DIR or the system temp dir)
+        """
+        self._file = tempfile.TemporaryFile(
+            prefix="archon-crawl-", dir=directory or os.getenv("CRAWL_RESULT_STORE_DIR") or None
+        )
+        self._index: list[tuple[int, int]] = []  # (offset, length) per page
+        self._urls: list[str | None] = []  # url per page
+        self._url_index: dict[str, int] = {}  # url -> position of its latest page
+        self._size = 0
+        self.raw_bytes = 0  # Uncompressed bytes written, for logging
+        if results is not None:
+            self.extend(results)
+
+    def append(self, result: dict[str, Any]) -> None:
+        """Compress a crawl result and append it to the spill file."""
+        data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        self.raw_bytes += len(data)
+        self._write_blob(zlib.compress(data, COMPRESSION_LEVEL), result.get("url"))
+
+    def extend(self, results: Iterable[dict[str, Any]]) -> None:
+        """Append results; pages from another store are copied without recompressing."""
+        if isinstance(results, CrawlResultStore):
+            for position in range(len(results)):
+                self._write_blob(results._read_blob(position), results.url_at(position))
+            self.raw_bytes += results.raw_bytes
+            return
+        for result in results:
+            self.append(result)
+
+    def get_by_url(self, url: str) -> dict[str, Any] | None:
+        """Return the most recent page stored for a URL, or None."""
+        position = self._url_index.get(url)
+        return None if position is None else self[position]
+
+    def url_at(self, position: int) -> str | None:
+        """Return the URL of the page at a position without decompressing it."""
+        return self._urls[position]
+
+    @property
+    def urls(self) -> list[str]:
+        """URLs of all stored pages, in crawl order."""
+        return [url for url in self._urls if url is not None]
+
+    @property
+    def stored_bytes(self) -> int:
+        """Compressed bytes on disk."""
+        return self._size
+
+    def close(self) -> None:
+        """Delete the spill file."""
+        if not self._file.closed:
+            self._file.close()
+            logger.debug(f"Released {self!r}")
+
+    def __enter__(self) -> "CrawlResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        return json.loads(zlib.decompress(self._read_blob(position)))
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        # Index-based so pages appended during iteration are still visited
+        position = 0
+        while position < len(self._index):
+            yield self[position]
+            position += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"CrawlResultStore(pages={len(self)}, raw_bytes={self.raw_bytes}, "
+            f"stored_bytes={self._size})"
+        )
+
+    def _write_blob(self, blob: bytes, url: str | None) -> None:
+        self._file.seek(self._size)
+        self._file.write(blob)
+        self._index.append((self._size, len(blob)))
+        self._urls.append(url)
+        if url is not None:
+            self._url_index[url] = len(self._index) - 1
+        self._size += len(blob)
+
+    def _read_blob(self, position: int) -> bytes:
+        offset, length = self._index[position]
+        self._file.seek(offset)
+        return self._file.read(length)
@@ -5,13 +5,15 @@ Handles batch crawling of multiple URLs in parallel.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
 
 from crawl4ai import CacheMode, CrawlerRunConfig, MemoryAdaptiveDispatcher
 
 from ....config.logfire_config import get_logger
 from ...credential_service import credential_service
+from ..helpers.crawl_checkpoint import CrawlCheckpoint
+from ..helpers.crawl_result_store import CrawlResultStore
 
 logger = get_logger(__name__)
 
@@ -39,7 +41,8 @@ class BatchCrawlStrategy:
         progress_callback: Callable[..., Awaitable[None]] | None = None,
         cancellation_check: Callable[[], None] | None = None,
         link_text_fallbacks: dict[str, str] | None = None,
-    ) -> list[dict[str, Any]]:
+        checkpoint: CrawlCheckpoint | None = None,
+    ) -> Sequence[dict[str, Any]]:
         """
         Batch crawl multiple URLs in parallel with progress reporting.
 
@@ -51,9 +54,11 @@ class BatchCrawlStrategy:
             progress_callback: Optional callback for progress updates
             cancellation_check: Optional function to check for cancellation
             link_text_fallbacks: Optional dict mapping URLs to link text for title fallback
+            checkpoint: Optional checkpoint; crawled pages and visited URLs are saved to it,
+                and URLs it has already visited are skipped with their saved pages reused
 
         Returns:
-            List of crawl results
+            Crawl results, spilled to disk in a CrawlResultStore
         """
         if not self.crawler:
             logger.error("No crawler instance available for batch crawling")
@@ -151,6 +156,18 @@ class BatchCrawlStrategy:
                     **kwargs
                 )
 
+        successful_results = CrawlResultStore()  # Pages spill to disk instead of accumulating in memory
+        if checkpoint is not None:
+            visited = checkpoint.visited()
+            if visited:
+                # Resume: reuse the saved pages and only crawl what is left
+                successful_results.extend(checkpoint.pages())
+                urls = [url for url in urls if url not in visited]
+                logger.info(
+                    f"Resuming batch crawl from checkpoint | pages={len(successful_results)} | "
+                    f"visited={len(visited)} | remaining={len(urls)}"
+                )
+
         total_urls = len(urls)
         await report_progress(
             0,  # Start at 0% progress
@@ -160,7 +177,6 @@ class BatchCrawlStrategy:
         )
 
         # Use configured batch size
-        successful_results = []
         processed = 0
         cancelled = False
 
@@ -255,16 +271,24 @@ class BatchCrawlStrategy:
                         if fallback_text:
                             title = fallback_text
 
-                    successful_results.append({
+                    page = {
                         "url": original_url,
                         "markdown": result.markdown.fit_markdown,
                         "html": result.html,  # Use raw HTML
                         "title": title,
-                    })
+                    }
+                    successful_results.append(page)
+                    if checkpoint is not None:
+                        checkpoint.record_page(page)
                 else:
                     logger.warning(
                         f"Failed to crawl {result.url}: {getattr(result, 'error_message', 'Unknown error')}"
                     )
+                    if checkpoint is not None:
+                        checkpoint.record_visited(url_mapping.get(result.url, result.url))
+
+                if checkpoint is not None and checkpoint.due():
+                    checkpoint.save()
 
                 # Report individual URL progress with smooth increments
                 # Calculate progress as percentage of total URLs processed
@@ -283,6 +307,9 @@ class BatchCrawlStrategy:
             if cancelled:
                 break
 
+        if checkpoint is not None:
+            checkpoint.save()
+
         if cancelled:
             return successful_results
         await report_progress(
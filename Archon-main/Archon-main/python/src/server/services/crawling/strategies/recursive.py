@@ -2,21 +2,128 @@
 Recursive Crawling Strategy
 
 Handles recursive crawling of websites by following internal links.
+
+Two frontier modes are available (rag_strategy setting CRAWL_FRONTIER_MODE):
+
+- "continuous" (default): a priority frontier ordered by (depth, discovery order)
+  feeds a fixed pool of crawl slots. Each finished page immediately frees its slot
+  and pushes its links onto the frontier, so there is no barrier between batches
+  or depth levels. CRAWL_MAX_PER_HOST caps concurrent pages per host. When a
+  CrawlCheckpoint is passed, crawled pages, visited URLs and the frontier are
+  saved periodically, and a crawl with a saved frontier resumes from it.
+- "depth": the original level-by-level crawl in CRAWL_BATCH_SIZE batches of arun_many.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import heapq
+import itertools
+import re
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
-from urllib.parse import urldefrag
+from urllib.parse import urldefrag, urlparse
 
+import psutil
 from crawl4ai import CacheMode, CrawlerRunConfig, MemoryAdaptiveDispatcher
 
 from ....config.logfire_config import get_logger
 from ...credential_service import credential_service
+from ..helpers.crawl_checkpoint import CrawlCheckpoint
+from ..helpers.crawl_result_store import CrawlResultStore
 from ..helpers.url_handler import URLHandler
 
 logger = get_logger(__name__)
 
+TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+FRONTIER_MODES = ("continuous", "depth")
+
+
+def extract_title(html: str | None) -> str:
+    """Extract the <title> text from HTML, or "Untitled"."""
+    if html:
+        title_match = TITLE_PATTERN.search(html)
+        if title_match:
+            extracted_title = title_match.group(1).strip()
+            # Clean up HTML entities
+            extracted_title = extracted_title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
+            if extracted_title:
+                return extracted_title
+    return "Untitled"
+
+
+FrontierItem = tuple[int, int, str]  # (depth, discovery order, url)
+
+
+class HostFrontier:
+    """
+    Crawl frontier partitioned by host, for the continuous mode.
+
+    Each host has its own heap of (depth, discovery order, url), and a heap of
+    host heads orders the hosts that are below their in-flight cap. Taking
+    the next URL never touches the queues of capped hosts, so a site whose
+    single host is at CRAWL_MAX_PER_HOST costs O(log n) per page instead of a
+    pass over the whole frontier.
+    """
+
+    def __init__(self, max_per_host: int):
+        self.max_per_host = max_per_host
+        self.active: dict[str, int] = defaultdict(int)  # In-flight pages per host
+        self._queues: dict[str, list[FrontierItem]] = {}
+        # (head item, host) for hosts below their cap; entries go stale when a
+        # host's head changes or it reaches the cap, and are skipped on pop
+        self._heads: list[tuple[FrontierItem, str]] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, item: FrontierItem) -> None:
+        """Queue a URL."""
+        host = urlparse(item[2]).netloc
+        queue = self._queues.setdefault(host, [])
+        heapq.heappush(queue, item)
+        self._size += 1
+        if queue[0] is item and self.active[host] < self.max_per_host:
+            heapq.heappush(self._heads, (item, host))
+
+    def pop(self) -> tuple[FrontierItem, str] | None:
+        """
+        Take the first queued URL whose host is below its cap and count it in flight.
+
+        Returns:
+            (item, host), or None if every queued URL's host is at its cap
+        """
+        while self._heads:
+            item, host = heapq.heappop(self._heads)
+            queue = self._queues.get(host)
+            if not queue or queue[0] != item or self.active[host] >= self.max_per_host:
+                continue
+            heapq.heappop(queue)
+            if not queue:
+                del self._queues[host]
+            self._size -= 1
+            self.active[host] += 1
+            if queue and self.active[host] < self.max_per_host:
+                heapq.heappush(self._heads, (queue[0], host))
+            return item, host
+        return None
+
+    def release(self, host: str) -> None:
+        """Mark one of a host's pages finished."""
+        self.active[host] -= 1
+        queue = self._queues.get(host)
+        if queue and self.active[host] == self.max_per_host - 1:
+            # The host just dropped below its cap
+            heapq.heappush(self._heads, (queue[0], host))
+
+    def min_depth(self) -> int | None:
+        """Shallowest queued depth, or None if the frontier is empty."""
+        return min((queue[0][0] for queue in self._queues.values()), default=None)
+
+    def items(self) -> list[FrontierItem]:
+        """All queued items in crawl order."""
+        return sorted(itertools.chain.from_iterable(self._queues.values()))
+
 
 class RecursiveCrawlStrategy:
     """Strategy for recursive crawling of websites."""
@@ -42,7 +149,8 @@ class RecursiveCrawlStrategy:
         max_concurrent: int | None = None,
         progress_callback: Callable[..., Awaitable[None]] | None = None,
         cancellation_check: Callable[[], None] | None = None,
-    ) -> list[dict[str, Any]]:
+        checkpoint: CrawlCheckpoint | None = None,
+    ) -> Sequence[dict[str, Any]]:
         """
         Recursively crawl internal links from start URLs up to a maximum depth with progress reporting.
 
@@ -54,9 +162,10 @@ class RecursiveCrawlStrategy:
             max_concurrent: Maximum concurrent crawls
             progress_callback: Optional callback for progress updates
             cancellation_check: Optional function to check for cancellation
+            checkpoint: Optional checkpoint to save progress to and resume from (continuous mode only)
 
         Returns:
-            List of crawl results
+            Crawl results, spilled to disk in a CrawlResultStore
         """
         if not self.crawler:
             logger.error("No crawler instance available for recursive crawling")
@@ -88,6 +197,17 @@ class RecursiveCrawlStrategy:
             if memory_threshold != raw_memory_threshold:
                 logger.warning(f"Invalid MEMORY_THRESHOLD_PERCENT={raw_memory_threshold}, clamped to {memory_threshold}")
             check_interval = float(settings.get("DISPATCHER_CHECK_INTERVAL", "0.5"))
+
+            frontier_mode = str(settings.get("CRAWL_FRONTIER_MODE", "continuous")).strip().lower()
+            if frontier_mode not in FRONTIER_MODES:
+                logger.warning(f"Invalid CRAWL_FRONTIER_MODE={frontier_mode}, using continuous")
+                frontier_mode = "continuous"
+
+            # CRAWL_MAX_PER_HOST: cap on pages in flight per host (defaults to no cap beyond max_concurrent)
+            raw_max_per_host = int(settings.get("CRAWL_MAX_PER_HOST", str(max_concurrent)))
+            max_per_host = min(max_concurrent, max(1, raw_max_per_host))
+            if max_per_host != raw_max_per_host:
+                logger.warning(f"Invalid CRAWL_MAX_PER_HOST={raw_max_per_host}, clamped to {max_per_host}")
         except (ValueError, KeyError, TypeError) as e:
             # Critical configuration errors should fail fast
             logger.error(f"Invalid crawl settings format: {e}", exc_info=True)
@@ -102,6 +222,8 @@ class RecursiveCrawlStrategy:
                 max_concurrent = 10  # Safe default to prevent memory issues
             memory_threshold = 80.0
             check_interval = 0.5
+            frontier_mode = "continuous"
+            max_per_host = max_concurrent
             settings = {}  # Empty dict for defaults
 
         # Check if start URLs include documentation sites
@@ -136,12 +258,6 @@ class RecursiveCrawlStrategy:
                 scan_full_page=True,
             )
 
-        dispatcher = MemoryAdaptiveDispatcher(
-            memory_threshold_percent=memory_threshold,
-            check_interval=check_interval,
-            max_session_permit=max_concurrent,
-        )
-
         async def report_progress(progress_val: int, message: str, status: str = "crawling", **kwargs):
             """Helper to report progress if callback is available"""
             if progress_callback:
@@ -155,13 +271,38 @@ class RecursiveCrawlStrategy:
                     **kwargs
                 )
 
+        if frontier_mode == "continuous":
+            return await self._crawl_frontier(
+                start_urls,
+                transform_url_func,
+                run_config,
+                max_depth=max_depth,
+                max_concurrent=max_concurrent,
+                max_per_host=max_per_host,
+                memory_threshold=memory_threshold,
+                check_interval=check_interval,
+                report_every=batch_size,
+                report_progress=report_progress,
+                cancellation_check=cancellation_check,
+                checkpoint=checkpoint,
+            )
+
+        if checkpoint is not None:
+            logger.warning("Crawl checkpoints require CRAWL_FRONTIER_MODE=continuous; depth mode will not be resumable")
+
+        dispatcher = MemoryAdaptiveDispatcher(
+            memory_threshold_percent=memory_threshold,
+            check_interval=check_interval,
+            max_session_permit=max_concurrent,
+        )
+
         visited = set()
 
         def normalize_url(url):
             return urldefrag(url)[0]
 
         current_urls = {normalize_url(u) for u in start_urls}
-        results_all = []
+        results_all = CrawlResultStore()  # Pages spill to disk instead of accumulating in memory
         total_processed = 0
         total_discovered = len(current_urls)  # Track total URLs discovered (normalized & de-duped)
         cancelled = False
@@ -277,23 +418,11 @@ class RecursiveCrawlStrategy:
                     total_processed += 1
 
                     if result.success and result.markdown and result.markdown.fit_markdown:
-                        # Extract title from HTML <title> tag
-                        title = "Untitled"
-                        if result.html:
-                            import re
-                            title_match = re.search(r'<title[^>]*>(.*?)</title>', result.html, re.IGNORECASE | re.DOTALL)
-                            if title_match:
-                                extracted_title = title_match.group(1).strip()
-                                # Clean up HTML entities
-                                extracted_title = extracted_title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
-                                if extracted_title:
-                                    title = extracted_title
-
                         results_all.append({
                             "url": original_url,
                             "markdown": result.markdown.fit_markdown,
                             "html": result.html,  # Always use raw HTML for code extraction
-                            "title": title,
+                            "title": extract_title(result.html),
                         })
                         depth_successful += 1
 
@@ -342,3 +471,249 @@ class RecursiveCrawlStrategy:
             processed_pages=total_processed,
         )
         return results_all
+
+    async def _crawl_frontier(
+        self,
+        start_urls: list[str],
+        transform_url_func: Callable[[str], str],
+        run_config: CrawlerRunConfig,
+        max_depth: int,
+        max_concurrent: int,
+        max_per_host: int,
+        memory_threshold: float,
+        check_interval: float,
+        report_every: int,
+        report_progress: Callable[..., Awaitable[None]],
+        cancellation_check: Callable[[], None] | None = None,
+        checkpoint: CrawlCheckpoint | None = None,
+    ) -> CrawlResultStore:
+        """
+        Crawl from a priority frontier with a fixed pool of always-busy slots.
+
+        URLs are popped in (depth, discovery order), so the crawl is still
+        breadth-first, but a slot is refilled as soon as any page finishes and
+        that page's links are queued right away. Depth levels overlap instead of
+        waiting for the slowest page of the previous level.
+
+        With a checkpoint, each processed page is recorded and the frontier
+        (queued plus in-flight URLs) is saved every checkpoint interval and when
+        the loop exits. If the checkpoint already holds a frontier, the crawl
+        continues from it: saved pages are reloaded and visited URLs are skipped.
+
+        Args:
+            start_urls: List of starting URLs
+            transform_url_func: Function to transform URLs (e.g., GitHub URLs)
+            run_config: Crawl configuration for each page
+            max_depth: Maximum crawl depth
+            max_concurrent: Number of crawl slots
+            max_per_host: Maximum pages in flight per host
+            memory_threshold: Don't start new pages above this system memory percent
+            check_interval: Seconds between memory checks while throttled
+            report_every: Report progress every N processed pages
+            report_progress: Progress reporting helper
+            cancellation_check: Optional function to check for cancellation
+            checkpoint: Optional checkpoint to save progress to and resume from
+
+        Returns:
+            Crawl results, spilled to disk in a CrawlResultStore
+        """
+        page_config = run_config.clone(stream=False)
+
+        def normalize_url(url):
+            return urldefrag(url)[0]
+
+        # Queued (depth, discovery order, url) per host; order keeps pages of one depth FIFO
+        frontier = HostFrontier(max_per_host)
+        discovery_order = itertools.count()
+        seen: set[str] = set()
+        results_all = CrawlResultStore()  # Pages spill to disk instead of accumulating in memory
+        total_processed = 0
+
+        if checkpoint is not None and checkpoint.has_frontier:
+            # Resume: reload saved pages and continue from the saved frontier
+            results_all.extend(checkpoint.pages())
+            seen = checkpoint.visited()
+            total_processed = len(seen)
+            start_items = checkpoint.frontier()
+            logger.info(
+                f"Resuming recursive crawl from checkpoint | pages={len(results_all)} | "
+                f"visited={total_processed} | frontier={len(start_items)}"
+            )
+        else:
+            start_items = [(0, url) for url in start_urls]
+
+        pending_by_depth: dict[int, int] = defaultdict(int)  # Queued + in-flight pages per depth
+        for depth, url in start_items:
+            norm_url = normalize_url(url)
+            if norm_url not in seen:
+                seen.add(norm_url)
+                frontier.push((depth, next(discovery_order), norm_url))
+                pending_by_depth[depth] += 1
+
+        successful_by_depth: dict[int, int] = defaultdict(int)
+        in_flight: dict[asyncio.Task, tuple[str, int, str]] = {}
+
+        total_discovered = total_processed + len(frontier)
+        # Depths above the shallowest queued page finished before the checkpoint
+        min_depth = frontier.min_depth()
+        completed_depth = (min_depth - 1) if min_depth is not None else -1
+        cancelled = False
+
+        def check_cancelled() -> bool:
+            if not cancellation_check:
+                return False
+            try:
+                cancellation_check()
+            except asyncio.CancelledError:
+                return True
+            except Exception:
+                logger.exception("Unexpected error from cancellation_check()")
+                raise
+            return False
+
+        def overall_progress() -> int:
+            # Never show 100% until actually complete
+            return min(int((total_processed / max(total_discovered, 1)) * 100), 99)
+
+        def memory_pressure() -> bool:
+            return psutil.virtual_memory().percent >= memory_threshold
+
+        def frontier_snapshot() -> list[tuple[int, str]]:
+            # In-flight pages haven't been recorded yet, so they go back on the frontier
+            in_flight_items = [(depth, url) for url, depth, _ in in_flight.values()]
+            return in_flight_items + [(depth, url) for depth, _, url in frontier.items()]
+
+        await report_progress(
+            overall_progress(),
+            f"Crawling depth {completed_depth + 2}/{max_depth}: {len(frontier)} URLs to process",
+            total_pages=total_discovered,
+            processed_pages=total_processed,
+        )
+
+        try:
+            while frontier or in_flight:
+                if check_cancelled():
+                    cancelled = True
+                    await report_progress(
+                        overall_progress(),
+                        "Crawl cancelled during batch processing",
+                        status="cancelled",
+                        total_pages=total_discovered,
+                        processed_pages=total_processed,
+                    )
+                    break
+
+                # Fill free slots, skipping hosts at their cap and pausing under memory pressure
+                throttled = False
+                while frontier and len(in_flight) < max_concurrent:
+                    if in_flight and memory_pressure():
+                        throttled = True
+                        break
+                    next_item = frontier.pop()
+                    if next_item is None:
+                        break  # Every queued URL's host is at its cap
+                    item, host = next_item
+                    task = asyncio.create_task(
+                        self.crawler.arun(url=transform_url_func(item[2]), config=page_config)
+                    )
+                    in_flight[task] = (item[2], item[0], host)
+
+                done, _ = await asyncio.wait(
+                    in_flight,
+                    timeout=check_interval if throttled else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    url, depth, host = in_flight.pop(task)
+                    frontier.release(host)
+                    pending_by_depth[depth] -= 1
+                    total_processed += 1
+
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to crawl {url}: {e}")
+                        result = None
+
+                    if result is not None and result.success and result.markdown and result.markdown.fit_markdown:
+                        page = {
+                            "url": url,
+                            "markdown": result.markdown.fit_markdown,
+                            "html": result.html,  # Always use raw HTML for code extraction
+                            "title": extract_title(result.html),
+                        }
+                        results_all.append(page)
+                        successful_by_depth[depth] += 1
+                        # Don't re-crawl the page under the URL it redirected to
+                        final_url = normalize_url(result.url or url)
+                        seen.add(final_url)
+                        if checkpoint is not None:
+                            checkpoint.record_page(page)
+                            if final_url != url:
+                                checkpoint.record_visited(final_url)
+
+                        # Queue internal links for the next depth as soon as the page arrives
+                        if depth + 1 < max_depth:
+                            links = getattr(result, "links", {}) or {}
+                            for link in links.get("internal", []):
+                                next_url = normalize_url(link["href"])
+                                if next_url in seen:
+                                    continue
+                                if self.url_handler.is_binary_file(next_url):
+                                    logger.debug(f"Skipping binary file from crawl queue: {next_url}")
+                                    continue
+                                seen.add(next_url)
+                                frontier.push((depth + 1, next(discovery_order), next_url))
+                                pending_by_depth[depth + 1] += 1
+                                total_discovered += 1  # Increment when we discover a new URL
+                    else:
+                        if result is not None:
+                            logger.warning(
+                                f"Failed to crawl {url}: {getattr(result, 'error_message', 'Unknown error')}"
+                            )
+                        if checkpoint is not None:
+                            checkpoint.record_visited(url)
+
+                    if total_processed % report_every == 0:
+                        await report_progress(
+                            overall_progress(),
+                            f"Crawled {total_processed} of {total_discovered} URLs "
+                            f"({len(in_flight)} in flight, up to depth {min(depth + 1, max_depth)}/{max_depth})",
+                            total_pages=total_discovered,
+                            processed_pages=total_processed,
+                        )
+
+                # Report each depth once every page at or above it has finished
+                while completed_depth + 1 < max_depth and pending_by_depth[completed_depth + 1] == 0:
+                    completed_depth += 1
+                    await report_progress(
+                        overall_progress(),
+                        f"Depth {completed_depth + 1} completed: {successful_by_depth[completed_depth]} pages crawled, "
+                        f"{pending_by_depth[completed_depth + 1]} URLs found for next depth",
+                        total_pages=total_discovered,
+                        processed_pages=total_processed,
+                    )
+                    if pending_by_depth[completed_depth + 1] == 0 and not frontier and not in_flight:
+                        break
+
+                if checkpoint is not None and checkpoint.due():
+                    checkpoint.save(frontier_snapshot())
+
+            if checkpoint is not None:
+                checkpoint.save(frontier_snapshot())
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if cancelled:
+            return results_all
+        await report_progress(
+            100,
+            f"Recursive crawling completed: {len(results_all)} total pages crawled across {max_depth} depth levels",
+            total_pages=total_discovered,
+            processed_pages=total_processed,
+        )
+        return results_all
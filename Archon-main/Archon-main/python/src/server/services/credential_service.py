@@ -5,11 +5,12 @@ Handles loading, storing, and accessing credentials with encryption for sensitiv
 Credentials include API keys, service credentials, and application configuration.
 """
 
+import asyncio
 import base64
 import os
 import re
-import time
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Removed direct logging import - using unified config
 from typing import Any
@@ -23,6 +24,20 @@ from ..config.logfire_config import get_logger
 
 logger = get_logger(__name__)
 
+SETTINGS_REFRESH_INTERVAL = 30.0  # Seconds between checks for settings changed outside this process
+
+
+@lru_cache(maxsize=4)
+def _derive_encryption_key(service_key: str) -> bytes:
+    """Derive the Fernet key from the service key (PBKDF2 is deliberately slow, so derive once)."""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"static_salt_for_credentials",  # In production, consider using a configurable salt
+        iterations=100000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(service_key.encode()))
+
 
 @dataclass
 class CredentialItem:
@@ -39,15 +54,30 @@ class CredentialItem:
 
 
 class CredentialService:
-    """Service for managing application credentials and configuration."""
+    """
+    Service for managing application credentials and configuration.
+
+    All settings are held in one in-memory snapshot loaded from archon_settings.
+    The snapshot version is bumped on every change (set, delete or reload), and
+    per-category views are memoized per version, so configuration reads on hot
+    paths never query the database. Decrypted values are memoized by ciphertext.
+    Changes made outside this process are picked up by a background watch that
+    polls a cheap (row count, latest updated_at) signature and reloads the
+    snapshot only when it changes.
+    """
 
     def __init__(self):
         self._supabase: Client | None = None
         self._cache: dict[str, Any] = {}
         self._cache_initialized = False
-        self._rag_settings_cache: dict[str, Any] | None = None
-        self._rag_cache_timestamp: float | None = None
-        self._rag_cache_ttl = 300  # 5 minutes TTL for RAG settings cache
+        # Category, description and encryption flag per key
+        self._metadata: dict[str, dict[str, Any]] = {}
+        self._version = 0
+        self._category_views: dict[str, dict[str, Any]] = {}
+        self._category_views_version = -1
+        self._decrypted: dict[str, str] = {}  # ciphertext -> plaintext
+        self._snapshot_signature: tuple[int, str] | None = None
+        self._watch_task: asyncio.Task | None = None
 
     def _get_supabase_client(self) -> Client:
         """
@@ -85,16 +115,7 @@ class CredentialService:
         """Generate encryption key from environment variables."""
         # Use Supabase service key as the basis for encryption key
         service_key = os.getenv("SUPABASE_SERVICE_KEY", "default-key-for-development")
-
-        # Generate a proper encryption key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"static_salt_for_credentials",  # In production, consider using a configurable salt
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(service_key.encode()))
-        return key
+        return _derive_encryption_key(service_key)
 
     def _encrypt_value(self, value: str) -> str:
         """Encrypt a sensitive value using Fernet encryption."""
@@ -110,19 +131,96 @@ class CredentialService:
             raise
 
     def _decrypt_value(self, encrypted_value: str) -> str:
-        """Decrypt a sensitive value using Fernet encryption."""
+        """Decrypt a sensitive value using Fernet encryption (memoized by ciphertext)."""
         if not encrypted_value:
             return ""
 
+        cached = self._decrypted.get(encrypted_value)
+        if cached is not None:
+            return cached
+
         try:
             fernet = Fernet(self._get_encryption_key())
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_value.encode("utf-8"))
             decrypted_bytes = fernet.decrypt(encrypted_bytes)
-            return decrypted_bytes.decode("utf-8")
+            decrypted = decrypted_bytes.decode("utf-8")
         except Exception as e:
             logger.error(f"Error decrypting value: {e}")
             raise
 
+        self._decrypted[encrypted_value] = decrypted
+        return decrypted
+
+    @property
+    def version(self) -> int:
+        """Version of the settings snapshot; increases on every change."""
+        return self._version
+
+    def _bump_version(self) -> None:
+        self._version += 1
+
+    @staticmethod
+    def _signature(row_count: int, latest_updated_at: Any) -> tuple[int, str]:
+        """Change signature of archon_settings: inserts/deletes change the count, updates the latest updated_at."""
+        return row_count, str(latest_updated_at or "")
+
+    def _fetch_signature(self, supabase: Client) -> tuple[int, str]:
+        """Current change signature of archon_settings (one single-row query)."""
+        result = (
+            supabase.table("archon_settings")
+            .select("updated_at", count="exact")
+            .order("updated_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        latest = result.data[0].get("updated_at") if result.data else None
+        return self._signature(result.count or 0, latest)
+
+    def _snapshot_is_current(self, supabase: Client) -> bool:
+        """True if the settings table hasn't changed since the snapshot was loaded."""
+        try:
+            return self._snapshot_signature is not None and self._fetch_signature(supabase) == self._snapshot_signature
+        except Exception as e:
+            logger.warning(f"Failed to read settings signature: {e}")
+            return False
+
+    def _record_own_write(self, supabase: Client, snapshot_was_current: bool) -> None:
+        """
+        Move the snapshot signature past a write this process made.
+
+        The cache already reflects the write, so the next poll must not reload it.
+        If the table had other changes before the write, the signature is left
+        stale so the poll still picks them up.
+        """
+        if not snapshot_was_current:
+            return
+        try:
+            self._snapshot_signature = self._fetch_signature(supabase)
+        except Exception as e:
+            logger.warning(f"Failed to refresh settings signature after write: {e}")
+
+    def _invalidate_provider_caches(self) -> None:
+        """Clear LLM provider caches derived from rag_strategy settings."""
+        try:
+            from .llm_provider_service import clear_provider_cache
+            clear_provider_cache()
+            logger.debug("Also cleared LLM provider service cache")
+        except Exception as e:
+            logger.warning(f"Failed to clear provider service cache: {e}")
+
+        try:
+            from . import llm_provider_service
+            # Clear the provider config caches that depend on RAG settings
+            cache_keys_to_clear = ["provider_config_llm", "provider_config_embedding", "rag_strategy_settings"]
+            for cache_key in cache_keys_to_clear:
+                if cache_key in llm_provider_service._settings_cache:
+                    del llm_provider_service._settings_cache[cache_key]
+                    logger.debug(f"Invalidated LLM provider service cache key: {cache_key}")
+        except ImportError:
+            logger.warning("Could not import llm_provider_service to invalidate cache")
+        except Exception as e:
+            logger.error(f"Error invalidating LLM provider service cache: {e}")
+
     async def load_all_credentials(self) -> dict[str, Any]:
         """Load all credentials from database and cache them."""
         try:
@@ -132,8 +230,14 @@ class CredentialService:
             result = supabase.table("archon_settings").select("*").execute()
 
             credentials = {}
+            metadata = {}
             for item in result.data:
                 key = item["key"]
+                metadata[key] = {
+                    "category": item.get("category"),
+                    "description": item.get("description"),
+                    "is_encrypted": bool(item.get("is_encrypted")),
+                }
                 if item["is_encrypted"] and item["encrypted_value"]:
                     # For encrypted values, we store the encrypted version
                     # Decryption happens when the value is actually needed
@@ -148,7 +252,17 @@ class CredentialService:
                     credentials[key] = item["value"]
 
             self._cache = credentials
+            self._metadata = metadata
             self._cache_initialized = True
+            self._snapshot_signature = self._signature(
+                len(result.data), max((item.get("updated_at") or "" for item in result.data), default="")
+            )
+            # Drop memoized plaintexts of values that are no longer stored
+            current = {
+                value["encrypted_value"] for value in credentials.values() if isinstance(value, dict)
+            }
+            self._decrypted = {k: v for k, v in self._decrypted.items() if k in current}
+            self._bump_version()
             logger.info(f"Loaded {len(credentials)} credentials from database")
 
             return credentials
@@ -228,40 +342,26 @@ class CredentialService:
                 # Update cache with plain value
                 self._cache[key] = value
 
+            self._metadata[key] = {
+                "category": category,
+                "description": description,
+                "is_encrypted": is_encrypted,
+            }
+            self._bump_version()
+
             # Upsert to database with proper conflict handling
             # Since we validate service key at startup, permission errors here indicate actual database issues
+            snapshot_was_current = self._snapshot_is_current(supabase)
             supabase.table("archon_settings").upsert(
                 data,
                 on_conflict="key",  # Specify the unique column for conflict resolution
             ).execute()
+            self._record_own_write(supabase, snapshot_was_current)
 
-            # Invalidate RAG settings cache if this is a rag_strategy setting
+            # Invalidate provider caches if this is a rag_strategy setting
             if category == "rag_strategy":
-                self._rag_settings_cache = None
-                self._rag_cache_timestamp = None
-                logger.debug(f"Invalidated RAG settings cache due to update of {key}")
-
-                # Also invalidate provider service cache to ensure immediate effect
-                try:
-                    from .llm_provider_service import clear_provider_cache
-                    clear_provider_cache()
-                    logger.debug("Also cleared LLM provider service cache")
-                except Exception as e:
-                    logger.warning(f"Failed to clear provider service cache: {e}")
-
-                # Also invalidate LLM provider service cache for provider config
-                try:
-                    from . import llm_provider_service
-                    # Clear the provider config caches that depend on RAG settings
-                    cache_keys_to_clear = ["provider_config_llm", "provider_config_embedding", "rag_strategy_settings"]
-                    for cache_key in cache_keys_to_clear:
-                        if cache_key in llm_provider_service._settings_cache:
-                            del llm_provider_service._settings_cache[cache_key]
-                            logger.debug(f"Invalidated LLM provider service cache key: {cache_key}")
-                except ImportError:
-                    logger.warning("Could not import llm_provider_service to invalidate cache")
-                except Exception as e:
-                    logger.error(f"Error invalidating LLM provider service cache: {e}")
+                logger.debug(f"RAG settings changed due to update of {key}")
+                self._invalidate_provider_caches()
 
             logger.info(
                 f"Successfully {'encrypted and ' if is_encrypted else ''}stored credential: {key}"
@@ -278,40 +378,20 @@ class CredentialService:
             supabase = self._get_supabase_client()
 
             # Since we validate service key at startup, we can directly execute
+            snapshot_was_current = self._snapshot_is_current(supabase)
             supabase.table("archon_settings").delete().eq("key", key).execute()
+            self._record_own_write(supabase, snapshot_was_current)
 
             # Remove from cache
             if key in self._cache:
                 del self._cache[key]
+            metadata = self._metadata.pop(key, {})
+            self._bump_version()
 
-            # Invalidate RAG settings cache if this was a rag_strategy setting
-            # We check the cache to see if the deleted key was in rag_strategy category
-            if self._rag_settings_cache is not None and key in self._rag_settings_cache:
-                self._rag_settings_cache = None
-                self._rag_cache_timestamp = None
-                logger.debug(f"Invalidated RAG settings cache due to deletion of {key}")
-
-                # Also invalidate provider service cache to ensure immediate effect
-                try:
-                    from .llm_provider_service import clear_provider_cache
-                    clear_provider_cache()
-                    logger.debug("Also cleared LLM provider service cache")
-                except Exception as e:
-                    logger.warning(f"Failed to clear provider service cache: {e}")
-
-                # Also invalidate LLM provider service cache for provider config
-                try:
-                    from . import llm_provider_service
-                    # Clear the provider config caches that depend on RAG settings
-                    cache_keys_to_clear = ["provider_config_llm", "provider_config_embedding", "rag_strategy_settings"]
-                    for cache_key in cache_keys_to_clear:
-                        if cache_key in llm_provider_service._settings_cache:
-                            del llm_provider_service._settings_cache[cache_key]
-                            logger.debug(f"Invalidated LLM provider service cache key: {cache_key}")
-                except ImportError:
-                    logger.warning("Could not import llm_provider_service to invalidate cache")
-                except Exception as e:
-                    logger.error(f"Error invalidating LLM provider service cache: {e}")
+            # Invalidate provider caches if this was a rag_strategy setting
+            if metadata.get("category") == "rag_strategy":
+                logger.debug(f"RAG settings changed due to deletion of {key}")
+                self._invalidate_provider_caches()
 
             logger.info(f"Successfully deleted credential: {key}")
             return True
@@ -321,52 +401,80 @@ class CredentialService:
             return False
 
     async def get_credentials_by_category(self, category: str) -> dict[str, Any]:
-        """Get all credentials for a specific category."""
+        """Get all credentials for a specific category (served from the settings snapshot)."""
         if not self._cache_initialized:
             await self.load_all_credentials()
 
-        # Special caching for rag_strategy category to reduce database calls
-        if category == "rag_strategy":
-            current_time = time.time()
-
-            # Check if we have valid cached data
-            if (
-                self._rag_settings_cache is not None
-                and self._rag_cache_timestamp is not None
-                and current_time - self._rag_cache_timestamp < self._rag_cache_ttl
-            ):
-                logger.debug("Using cached RAG settings")
-                return self._rag_settings_cache
-
-        try:
-            supabase = self._get_supabase_client()
-            result = (
-                supabase.table("archon_settings").select("*").eq("category", category).execute()
-            )
-
-            credentials = {}
-            for item in result.data:
-                key = item["key"]
-                if item["is_encrypted"]:
-                    credentials[key] = {
+        if self._category_views_version != self._version:
+            self._category_views = {}
+            self._category_views_version = self._version
+
+        view = self._category_views.get(category)
+        if view is None:
+            view = {}
+            for key, value in self._cache.items():
+                metadata = self._metadata.get(key, {})
+                if metadata.get("category") != category:
+                    continue
+                if metadata.get("is_encrypted"):
+                    view[key] = {
                         "value": "[ENCRYPTED]",
                         "is_encrypted": True,
-                        "description": item["description"],
+                        "description": metadata.get("description"),
                     }
                 else:
-                    credentials[key] = item["value"]
+                    view[key] = value
+            self._category_views[category] = view
+            logger.debug(f"Built {category} settings view with {len(view)} items | version={self._version}")
 
-            # Cache rag_strategy results
-            if category == "rag_strategy":
-                self._rag_settings_cache = credentials
-                self._rag_cache_timestamp = time.time()
-                logger.debug(f"Cached RAG settings with {len(credentials)} items")
+        # Copy so callers can't modify the snapshot
+        return dict(view)
 
-            return credentials
+    async def refresh_if_changed(self) -> bool:
+        """
+        Reload the settings snapshot if archon_settings changed since it was loaded.
 
-        except Exception as e:
-            logger.error(f"Error getting credentials for category {category}: {e}")
-            return {}
+        Costs one single-row query when nothing changed.
+
+        Returns:
+            True if the snapshot was reloaded
+        """
+        if not self._cache_initialized:
+            await self.load_all_credentials()
+            return True
+
+        if self._fetch_signature(self._get_supabase_client()) == self._snapshot_signature:
+            return False
+
+        await self.load_all_credentials()
+        self._invalidate_provider_caches()
+        logger.info(f"Settings changed outside this process, reloaded snapshot | version={self._version}")
+        return True
+
+    def start_settings_watch(self, interval: float = SETTINGS_REFRESH_INTERVAL) -> None:
+        """Start polling for settings changed outside this process (no-op if already running)."""
+        if self._watch_task is not None and not self._watch_task.done():
+            return
+        self._watch_task = asyncio.create_task(self._watch_settings(interval))
+
+    async def stop_settings_watch(self) -> None:
+        """Stop the settings watch."""
+        task, self._watch_task = self._watch_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _watch_settings(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_if_changed()
+            except Exception as e:
+                logger.warning(f"Failed to check for settings changes: {e}")
 
     async def list_all_credentials(self) -> list[CredentialItem]:
         """Get all credentials as a list of CredentialItem objects (for Settings UI)."""
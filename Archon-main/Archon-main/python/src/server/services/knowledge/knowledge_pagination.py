@@ -0,0 +1,143 @@
+"""
+Knowledge Pagination
+
+Keyset (cursor) pagination and cached totals for browsing the chunks and
+code examples of a knowledge item. A cursor encodes the sort key of the last
+row on a page, so every page is an index range scan from that key instead of
+an OFFSET that reads and discards all earlier rows.
+"""
+
+import asyncio
+import base64
+import json
+import time
+from typing import Any
+
+from ...config.logfire_config import get_logger
+
+logger = get_logger(__name__)
+
+COUNT_CACHE_TTL = 60.0  # Seconds before a cached total is refreshed in the background
+
+
+def encode_cursor(*key: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor token."""
+    payload = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list[Any]:
+    """
+    Decode a cursor token back into its sort key.
+
+    Args:
+        token: Cursor from a previous page's next_cursor
+        size: Number of sort key columns expected
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {token!r}") from e
+    if not isinstance(key, list) or len(key) != size:
+        raise ValueError(f"Invalid cursor: {token!r}")
+    return key
+
+
+def quote_filter_value(value: Any) -> str:
+    """Quote a value for a PostgREST logical filter (or/and), escaping quotes and backslashes."""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def after_url_id_filter(url: str, row_id: Any) -> str:
+    """PostgREST or-filter selecting rows after (url, id) in ORDER BY url, id."""
+    quoted_url = quote_filter_value(url)
+    return f"url.gt.{quoted_url},and(url.eq.{quoted_url},id.gt.{int(row_id)})"
+
+
+class KnowledgeCountCache:
+    """
+    In-process cache of row totals per knowledge item listing.
+
+    The first request for a listing gets the planner's estimate (count="estimated",
+    which PostgREST answers without scanning large results) and schedules an exact
+    count in the background. Later requests are answered from the cache; once an
+    entry is older than the TTL the stale total is returned while a background
+    refresh replaces it. Totals are therefore approximate for at most one TTL
+    after a crawl or deletion changes them.
+    """
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL):
+        self.ttl = ttl
+        # key -> (total, fetched_at, exact)
+        self._entries: dict[tuple[str, str, str | None], tuple[int, float, bool]] = {}
+        self._refreshing: set[tuple[str, str, str | None]] = set()
+
+    async def get_total(
+        self, supabase, table: str, source_id: str, domain_filter: str | None = None
+    ) -> tuple[int, bool]:
+        """
+        Get the number of rows of a source in a table.
+
+        Args:
+            supabase: Supabase client
+            table: archon_crawled_pages or archon_code_examples
+            source_id: The source ID
+            domain_filter: Optional URL substring filter (chunks only)
+
+        Returns:
+            Tuple of (total, exact) where exact is False for planner estimates
+        """
+        key = (table, source_id, domain_filter)
+        entry = self._entries.get(key)
+        if entry is None:
+            total = await asyncio.to_thread(
+                self._count, supabase, table, source_id, domain_filter, "estimated"
+            )
+            self._entries[key] = (total, time.monotonic(), False)
+            self._schedule_refresh(supabase, key)
+            return total, False
+
+        total, fetched_at, exact = entry
+        if not exact or time.monotonic() - fetched_at >= self.ttl:
+            self._schedule_refresh(supabase, key)
+        return total, exact
+
+    def invalidate(self, source_id: str | None = None) -> None:
+        """Drop cached totals for a source (all sources if None)."""
+        if source_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[1] == source_id]:
+            del self._entries[key]
+
+    def _schedule_refresh(self, supabase, key: tuple[str, str, str | None]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        asyncio.create_task(self._refresh(supabase, key))
+
+    async def _refresh(self, supabase, key: tuple[str, str, str | None]) -> None:
+        try:
+            total = await asyncio.to_thread(self._count, supabase, *key, "exact")
+            self._entries[key] = (total, time.monotonic(), True)
+        except Exception as e:
+            logger.warning(f"Failed to refresh count for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    @staticmethod
+    def _count(supabase, table: str, source_id: str, domain_filter: str | None, count: str) -> int:
+        query = supabase.from_(table).select("id", count=count, head=True).eq("source_id", source_id)
+        if domain_filter:
+            query = query.ilike("url", f"%{domain_filter}%")
+        result = query.execute()
+        return result.count or 0
+
+
+# Global cache shared by the knowledge item browsing endpoints
+knowledge_count_cache = KnowledgeCountCache()
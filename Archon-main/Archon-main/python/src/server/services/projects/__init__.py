@@ -6,6 +6,7 @@ including project CRUD operations, task management, document management,
 versioning, progress tracking, source linking, and AI-assisted project creation.
 """
 
+from .change_journal import ProjectChangeJournal, change_journal
 from .document_service import DocumentService
 from .project_creation_service import ProjectCreationService
 from .project_service import ProjectService
@@ -20,4 +21,6 @@ __all__ = [
     "VersioningService",
     "ProjectCreationService",
     "SourceLinkingService",
+    "ProjectChangeJournal",
+    "change_journal",
 ]
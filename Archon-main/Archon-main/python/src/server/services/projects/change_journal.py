@@ -0,0 +1,92 @@
+"""
+Project Change Journal
+
+Version counters for projects and their tasks, documents and versions. The
+project services bump a project's counter on every write, so the polling
+endpoints can build ETags from the counters and answer unchanged polls with
+304 without loading, formatting or hashing any rows.
+"""
+
+import threading
+import uuid
+from typing import Any
+
+from ...utils.etag_utils import generate_etag
+
+
+class ProjectChangeJournal:
+    """
+    In-process change journal for projects.
+
+    Each project has a version that increases on every write to the project,
+    its tasks, its documents or its version history; a global version increases
+    on every write to any project. ETags combine the relevant version with a
+    random epoch chosen at startup, so counters that restart from zero after a
+    server restart never match an ETag issued before it.
+
+    All project writes go through ProjectService, TaskService, DocumentService,
+    VersioningService, SourceLinkingService and ProjectCreationService in the
+    API server process (MCP tools call the API over HTTP), which is what makes
+    in-process counters sufficient. The server runs a single worker.
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._global_version = 0
+        self._project_versions: dict[str, int] = {}
+        # Bumped for writes whose project is unknown; counted in every project's version
+        self._unscoped_version = 0
+
+    def bump(self, project_id: str | None = None) -> int:
+        """
+        Record a write to a project.
+
+        Args:
+            project_id: The project written to, or None if unknown (invalidates every project)
+
+        Returns:
+            The new global version
+        """
+        with self._lock:
+            self._global_version += 1
+            if project_id:
+                self._project_versions[project_id] = self._project_versions.get(project_id, 0) + 1
+            else:
+                self._unscoped_version += 1
+            return self._global_version
+
+    @property
+    def global_version(self) -> int:
+        """Version covering every project."""
+        return self._global_version
+
+    def project_version(self, project_id: str) -> int:
+        """Version of one project (only ever increases)."""
+        with self._lock:
+            return self._project_versions.get(project_id, 0) + self._unscoped_version
+
+    def etag(self, scope: str, project_id: str | None = None, **params: Any) -> str:
+        """
+        ETag for a listing, computed from versions only.
+
+        Args:
+            scope: Name of the listing (e.g. "projects", "project_tasks")
+            project_id: Scope the ETag to one project's version instead of the global version
+            **params: Query parameters that change the response body
+
+        Returns:
+            Quoted ETag string
+        """
+        version = self.global_version if project_id is None else self.project_version(project_id)
+        return generate_etag({
+            "epoch": self.epoch,
+            "scope": scope,
+            "project_id": project_id,
+            "version": version,
+            "params": params,
+        })
+
+
+# Global journal shared by the project services and the projects API
+change_journal = ProjectChangeJournal()
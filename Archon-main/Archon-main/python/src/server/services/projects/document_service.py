@@ -14,6 +14,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from .change_journal import change_journal
 
 logger = get_logger(__name__)
 
@@ -77,6 +78,7 @@ class DocumentService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_journal.bump(project_id)
 
             if response.data:
                 return True, {
@@ -277,6 +279,7 @@ class DocumentService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_journal.bump(project_id)
 
             if response.data:
                 # Find the updated document to return
@@ -330,6 +333,7 @@ class DocumentService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_journal.bump(project_id)
 
             if response.data:
                 return True, {"project_id": project_id, "doc_id": doc_id}
@@ -12,6 +12,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from .change_journal import change_journal
 
 logger = get_logger(__name__)
 
@@ -75,6 +76,7 @@ class ProjectCreationService:
                 raise RuntimeError(f"Insert returned no data for project '{title}'")
 
             project_id = response.data[0]["id"]
+            change_journal.bump(project_id)
             logger.info(f"Created project {project_id} in database")
 
             # AI processing step
@@ -83,6 +85,7 @@ class ProjectCreationService:
             ai_success = await self._generate_ai_documentation(
                 progress_id, project_id, title, description, github_repo
             )
+            change_journal.bump(project_id)
 
             # Final success - fetch complete project data
             final_project_response = (
@@ -13,6 +13,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from .change_journal import change_journal
 
 logger = get_logger(__name__)
 
@@ -58,6 +59,7 @@ class ProjectService:
 
             project = response.data[0]
             project_id = project["id"]
+            change_journal.bump(project_id)
             logger.info(f"Project created successfully with ID: {project_id}")
 
             return True, {
@@ -258,6 +260,7 @@ class ProjectService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_journal.bump(project_id)
 
             # For DELETE operations, success is indicated by no error, not by response.data content
             # response.data will be empty list [] even on successful deletion
@@ -363,6 +366,7 @@ class ProjectService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_journal.bump(project_id)
 
             if response.data and len(response.data) > 0:
                 project = response.data[0]
@@ -11,6 +11,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from .change_journal import change_journal
 
 logger = get_logger(__name__)
 
@@ -120,6 +121,7 @@ class SourceLinkingService:
 
             # Overall success if no critical failures
             total_failed = result["technical_failed"] + result["business_failed"]
+            change_journal.bump(project_id)
 
             return True, result
 
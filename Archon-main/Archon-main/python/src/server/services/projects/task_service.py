@@ -12,6 +12,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from .change_journal import change_journal
 
 logger = get_logger(__name__)
 
@@ -23,6 +24,9 @@ class TaskService:
 
     VALID_STATUSES = ["todo", "doing", "review", "done"]
 
+    # (change journal version, counts by project), shared by all instances
+    _task_counts_cache: tuple[int, dict[str, dict[str, int]]] | None = None
+
     def __init__(self, supabase_client=None):
         """Initialize with optional supabase client"""
         self.supabase_client = supabase_client or get_supabase_client()
@@ -112,6 +116,7 @@ class TaskService:
                             "task_order": new_order,
                             "updated_at": datetime.now().isoformat(),
                         }).eq("id", existing_task["id"]).execute()
+                    change_journal.bump(project_id)
 
             task_data = {
                 "project_id": project_id,
@@ -134,7 +139,7 @@ class TaskService:
 
             if response.data:
                 task = response.data[0]
-
+                change_journal.bump(task["project_id"])
 
                 return True, {
                     "task": {
@@ -412,7 +417,7 @@ class TaskService:
 
             if response.data:
                 task = response.data[0]
-
+                change_journal.bump(task.get("project_id"))
 
                 return True, {"task": task, "message": "Task updated successfully"}
             else:
@@ -460,6 +465,7 @@ class TaskService:
             )
 
             if response.data:
+                change_journal.bump(task.get("project_id"))
 
                 return True, {"task_id": task_id, "message": "Task archived successfully"}
             else:
@@ -472,55 +478,107 @@ class TaskService:
     def get_all_project_task_counts(self) -> tuple[bool, dict[str, dict[str, int]]]:
         """
         Get task counts for all projects in a single optimized query.
-        
-        Returns task counts grouped by project_id and status.
-        
+
+        Returns task counts grouped by project_id and status. Counts are
+        aggregated in the database and cached in-process until the next
+        task write (tracked by the change journal).
+
         Returns:
             Tuple of (success, counts_dict) where counts_dict is:
             {"project-id": {"todo": 5, "doing": 2, "review": 3, "done": 10}}
         """
         try:
-            logger.debug("Fetching task counts for all projects in batch")
-
-            # Query all non-archived tasks grouped by project_id and status
-            response = (
-                self.supabase_client.table("archon_tasks")
-                .select("project_id, status")
-                .or_("archived.is.null,archived.is.false")
-                .execute()
-            )
+            # Capture the version before querying so a concurrent write invalidates this result
+            version = change_journal.global_version
+            cached = TaskService._task_counts_cache
+            if cached is not None and cached[0] == version:
+                logger.debug("Task counts served from cache")
+                return True, {project_id: dict(counts) for project_id, counts in cached[1].items()}
 
-            if not response.data:
-                logger.debug("No tasks found")
-                return True, {}
-
-            # Process results into counts by project and status
-            counts_by_project = {}
-
-            for task in response.data:
-                project_id = task.get("project_id")
-                status = task.get("status")
-
-                if not project_id or not status:
-                    continue
-
-                # Initialize project counts if not exists
-                if project_id not in counts_by_project:
-                    counts_by_project[project_id] = {
-                        "todo": 0,
-                        "doing": 0,
-                        "review": 0,
-                        "done": 0
-                    }
+            logger.debug("Fetching task counts for all projects in batch")
 
-                # Count all statuses separately
-                if status in ["todo", "doing", "review", "done"]:
-                    counts_by_project[project_id][status] += 1
+            counts_by_project = self._fetch_grouped_task_counts()
+            if counts_by_project is None:
+                counts_by_project = self._count_tasks_by_project()
 
+            TaskService._task_counts_cache = (version, counts_by_project)
             logger.debug(f"Task counts fetched for {len(counts_by_project)} projects")
 
-            return True, counts_by_project
+            return True, {project_id: dict(counts) for project_id, counts in counts_by_project.items()}
 
         except Exception as e:
             logger.error(f"Error fetching task counts: {e}")
             return False, {"error": f"Error fetching task counts: {str(e)}"}
+
+    def _fetch_grouped_task_counts(self) -> dict[str, dict[str, int]] | None:
+        """
+        Get task counts from the get_project_task_counts function (GROUP BY project_id, status).
+
+        Returns:
+            Counts by project, or None if the function is unavailable (migration 012 not applied)
+        """
+        try:
+            response = self.supabase_client.rpc("get_project_task_counts", {}).execute()
+        except Exception as e:
+            logger.warning(f"Grouped task counts unavailable, counting task rows instead: {e}")
+            return None
+
+        if not isinstance(response.data, list):
+            return None
+
+        counts_by_project: dict[str, dict[str, int]] = {}
+        for row in response.data:
+            project_id = row.get("project_id")
+            status = row.get("status")
+            if not project_id or status not in self.VALID_STATUSES:
+                continue
+            counts = counts_by_project.setdefault(
+                project_id, {"todo": 0, "doing": 0, "review": 0, "done": 0}
+            )
+            counts[status] += int(row.get("task_count") or 0)
+
+        return counts_by_project
+
+    def _count_tasks_by_project(self) -> dict[str, dict[str, int]]:
+        """Count non-archived tasks per project and status from the task rows."""
+        # Query all non-archived tasks grouped by project_id and status
+        response = (
+            self.supabase_client.table("archon_tasks")
+            .select("project_id, status")
+            .or_("archived.is.null,archived.is.false")
+            .execute()
+        )
+
+        if not response.data:
+            logger.debug("No tasks found")
+            return {}
+
+        # Process results into counts by project and status
+        counts_by_project = {}
+
+        for task in response.data:
+            project_id = task.get("project_id")
+            status = task.get("status")
+
+            if not project_id or not status:
+                continue
+
+            # Initialize project counts if not exists
+            if project_id not in counts_by_project:
+                counts_by_project[project_id] = {
+                    "todo": 0,
+                    "doing": 0,
+                    "review": 0,
+                    "done": 0
+                }
+
+            # Count all statuses separately
+            if status in ["todo", "doing", "review", "done"]:
+                counts_by_project[project_id][status] += 1
+
+        return counts_by_project
+
+    @classmethod
+    def clear_task_counts_cache(cls) -> None:
+        """Drop the cached task counts (the next call queries the database)."""
+        cls._task_counts_cache = None
@@ -12,6 +12,7 @@ from typing import Any
 from src.server.utils import get_supabase_client
 
 from ...config.logfire_config import get_logger
+from .change_journal import change_journal
 
 logger = get_logger(__name__)
 
@@ -75,6 +76,7 @@ class VersioningService:
             )
 
             if result.data:
+                change_journal.bump(project_id)
                 return True, {
                     "version": result.data[0],
                     "project_id": project_id,
@@ -218,6 +220,7 @@ class VersioningService:
                 .eq("id", project_id)
                 .execute()
             )
+            change_journal.bump(project_id)
 
             if restore_result.data:
                 # Create restore version record
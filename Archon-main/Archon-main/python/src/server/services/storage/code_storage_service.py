@@ -5,11 +5,12 @@ Handles extraction and storage of code examples from documents.
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import re
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from collections.abc import Callable
 from difflib import SequenceMatcher
 from typing import Any
@@ -122,6 +123,28 @@ async def _get_model_choice() -> str:
         return "gpt-4o-mini"
 
 
+async def _get_summary_provider(provider: str | None) -> str:
+    """Resolve the LLM provider for code summaries (explicit override or active provider)."""
+    if provider is not None:
+        return provider
+    try:
+        provider_config = await credential_service.get_active_provider("llm")
+        provider = provider_config.get("provider", "openai")
+        search_logger.debug(f"Auto-detected provider from credential service: {provider}")
+        return provider
+    except Exception as e:
+        search_logger.warning(f"Failed to get provider from credential service: {e}, defaulting to openai")
+        return "openai"
+
+
+def _supports_json_response_format(provider: str, model_choice: str) -> bool:
+    """Whether the provider accepts response_format={"type": "json_object"} for this model."""
+    provider_lower = provider.lower()
+    return provider_lower in {"openai", "google", "anthropic"} or (
+        provider_lower == "openrouter" and model_choice.startswith("openai/")
+    )
+
+
 def _get_max_workers() -> int:
     """Get max workers from environment, defaulting to 3."""
     return int(os.getenv("CONTEXTUAL_EMBEDDINGS_MAX_WORKERS", "3"))
@@ -600,8 +623,8 @@ async def _generate_code_example_summary_async(
     context_before: str,
     context_after: str,
     language: str = "",
-    provider: str = None,
-    client = None
+    provider: str | None = None,
+    client: Any | None = None,
 ) -> dict[str, str]:
     """
     Async version of generate_code_example_summary using unified LLM provider service.
@@ -614,19 +637,31 @@ async def _generate_code_example_summary_async(
         provider: LLM provider to use (optional)
         client: Pre-initialized LLM client for reuse (optional, improves performance)
     """
+    summary, _ = await _summarize_code_example(code, context_before, context_after, language, provider, client)
+    return summary
+
+
+async def _summarize_code_example(
+    code: str,
+    context_before: str,
+    context_after: str,
+    language: str = "",
+    provider: str | None = None,
+    client: Any | None = None,
+) -> tuple[dict[str, str], bool]:
+    """
+    Generate a summary for a code example and report where it came from.
+
+    Returns:
+        The summary, and whether the LLM produced it (False for summaries
+        synthesized from the code or generic fallbacks, which aren't cached)
+    """
 
     # Get model choice from credential service (RAG setting)
     model_choice = await _get_model_choice()
 
     # If provider is not specified, get it from credential service
-    if provider is None:
-        try:
-            provider_config = await credential_service.get_active_provider("llm")
-            provider = provider_config.get("provider", "openai")
-            search_logger.debug(f"Auto-detected provider from credential service: {provider}")
-        except Exception as e:
-            search_logger.warning(f"Failed to get provider from credential service: {e}, defaulting to openai")
-            provider = "openai"
+    provider = await _get_summary_provider(provider)
 
     # Create the prompt variants: base prompt, guarded prompt (JSON reminder), and strict prompt for retries
     base_prompt = f"""<context_before>
@@ -680,12 +715,19 @@ Format your response as JSON:
             )
 
 
+def _is_llm_summary(result: dict[str, Any], response_content: str) -> bool:
+    """Whether a parsed summary is the model's own complete answer rather than one synthesized from reasoning text."""
+    return bool(result.get("example_name") and result.get("summary")) and not _is_reasoning_text_response(
+        response_content
+    )
+
+
 async def _generate_summary_with_client(
     llm_client, code: str, context_before: str, context_after: str,
     language: str, provider: str, model_choice: str,
     guard_prompt: str, strict_prompt: str
-) -> dict[str, str]:
-    """Helper function that generates summary using a provided client."""
+) -> tuple[dict[str, str], bool]:
+    """Helper function that generates summary using a provided client; see _summarize_code_example."""
     search_logger.info(
         f"Generating summary for {hash(code) & 0xffffff:06x} using model: {model_choice}"
     )
@@ -694,10 +736,7 @@ async def _generate_summary_with_client(
     is_grok_model = (provider_lower == "grok") or ("grok" in model_choice.lower())
     is_ollama = provider_lower == "ollama"
 
-    supports_response_format_base = (
-        provider_lower in {"openai", "google", "anthropic"}
-        or (provider_lower == "openrouter" and model_choice.startswith("openai/"))
-    )
+    supports_response_format_base = _supports_json_response_format(provider, model_choice)
 
     last_response_obj = None
     last_elapsed_time = None
@@ -800,7 +839,7 @@ async def _generate_summary_with_client(
                                         "summary": result.get("summary", "Code example for demonstration purposes."),
                                     }
                                     search_logger.info(f"Generated fallback summary from context - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}")
-                                    return final_result
+                                    return final_result, False
                                 except json.JSONDecodeError:
                                     pass  # Continue to normal error handling
                             else:
@@ -810,7 +849,7 @@ async def _generate_summary_with_client(
                                     "summary": "Code example extracted from development context.",
                                 }
                                 search_logger.info(f"Used hardcoded fallback for minimal response - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}")
-                                return final_result
+                                return final_result, False
 
                         payload = _extract_json_payload(last_response_content, code, language)
                         if payload != last_response_content:
@@ -834,7 +873,7 @@ async def _generate_summary_with_client(
                             search_logger.info(
                                 f"Generated code example summary - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}"
                             )
-                            return final_result
+                            return final_result, _is_llm_summary(result, last_response_content)
 
                         except json.JSONDecodeError as json_error:
                             last_json_error = json_error
@@ -969,7 +1008,7 @@ async def _generate_summary_with_client(
         search_logger.info(
             f"Generated code example summary - Name: '{final_result['example_name']}', Summary length: {len(final_result['summary'])}"
         )
-        return final_result
+        return final_result, _is_llm_summary(result, response_content)
 
     except json.JSONDecodeError as e:
         search_logger.error(
@@ -984,14 +1023,14 @@ async def _generate_summary_with_client(
                 return {
                     "example_name": fallback_result.get("example_name", f"Code Example{f' ({language})' if language else ''}"),
                     "summary": fallback_result.get("summary", "Code example for demonstration purposes."),
-                }
+                }, False
         except Exception:
             pass  # Fall through to generic fallback
 
         return {
             "example_name": f"Code Example{f' ({language})' if language else ''}",
             "summary": "Code example for demonstration purposes.",
-        }
+        }, False
     except Exception as e:
         search_logger.error(f"Error generating code summary using unified LLM provider: {e}")
         # Try to generate context-aware fallback
@@ -1003,22 +1042,239 @@ async def _generate_summary_with_client(
                 return {
                     "example_name": fallback_result.get("example_name", f"Code Example{f' ({language})' if language else ''}"),
                     "summary": fallback_result.get("summary", "Code example for demonstration purposes."),
-                }
+                }, False
         except Exception:
             pass  # Fall through to generic fallback
 
         return {
             "example_name": f"Code Example{f' ({language})' if language else ''}",
             "summary": "Code example for demonstration purposes.",
-        }
+        }, False
+
+
+CODE_SUMMARY_BATCH_SIZE = 5  # Default number of code blocks summarized per LLM request
+SUMMARY_REQUEST_DELAY = 0.5  # Seconds to wait before each summary request (rate limiting)
+
+def _fallback_summary(language: str) -> dict[str, str]:
+    return {
+        "example_name": f"Code Example{f' ({language})' if language else ''}",
+        "summary": "Code example for demonstration purposes.",
+    }
+
+
+class CodeSummaryCache:
+    """
+    In-process LRU cache of code example summaries.
+
+    Keyed by (model, hash of the whitespace-normalized code, language), so
+    blocks repeated across the pages of a documentation site (install
+    commands, shared setup code) are summarized once per model instead of
+    once per page. Callers only put summaries the LLM produced; synthesized
+    and generic fallbacks are left out so a later crawl retries them.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], dict[str, str]] = OrderedDict()
+
+    @staticmethod
+    def key(model: str, code: str, language: str = "") -> tuple[str, str, str]:
+        normalized = " ".join(code.split())
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return model, digest, (language or "").lower()
+
+    def get(self, key: tuple[str, str, str]) -> dict[str, str] | None:
+        summary = self._entries.get(key)
+        if summary is None:
+            return None
+        self._entries.move_to_end(key)
+        return dict(summary)
+
+    def put(self, key: tuple[str, str, str], summary: dict[str, str]) -> None:
+        if not summary.get("example_name") or not summary.get("summary"):
+            return
+        self._entries[key] = dict(summary)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache shared by all crawls in this process
+code_summary_cache = CodeSummaryCache()
+
+
+def _get_summary_setting(key: str, default: int) -> int:
+    """Read an integer code summary setting from the credential cache or environment."""
+    try:
+        if credential_service._cache_initialized and credential_service._cache.get(key) is not None:
+            return int(credential_service._cache[key])
+        return int(os.getenv(key, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _with_fallback_summaries(
+    results: list[dict[str, str] | None], code_blocks: list[dict[str, Any]]
+) -> list[dict[str, str]]:
+    """Fill blocks that got no summary with the generic fallback summary."""
+    return [
+        result if result is not None else _fallback_summary(block.get("language", ""))
+        for result, block in zip(results, code_blocks, strict=True)
+    ]
+
+
+def _build_multi_block_prompt(blocks: list[dict[str, Any]]) -> str:
+    """Prompt asking for the names and summaries of several code blocks at once."""
+    examples = []
+    for i, block in enumerate(blocks):
+        context_before = block.get("context_before", "")[-500:]
+        context_after = block.get("context_after", "")[:500]
+        examples.append(
+            f"""<example id="{i}" language="{block.get("language", "")}">
+<context_before>
+{context_before}
+</context_before>
+<code>
+{block["code"][:1500]}
+</code>
+<context_after>
+{context_after}
+</context_after>
+</example>"""
+        )
+
+    return (
+        f"Below are {len(blocks)} code examples, each with the documentation around it.\n\n"
+        + "\n\n".join(examples)
+        + """
+
+For each example, based on the code and its surrounding context, provide:
+1. A concise, action-oriented name (1-4 words) that describes what the code DOES, not what it is.
+   Good examples: "Parse JSON Response", "Validate Email Format", "Connect PostgreSQL", "Fetch User Data"
+   Bad examples: "Function Example", "Code Snippet", "JavaScript Code", "API Code"
+2. A summary (2-3 sentences) that describes what the code demonstrates and its purpose
+
+Respond with a JSON object only, with one entry per example id, in exactly this shape:
+{"summaries": [{"id": 0, "example_name": "Action-oriented name", "summary": "2-3 sentence description"}]}
+"""
+    )
+
+
+def _parse_multi_block_response(raw_response: str, count: int) -> dict[int, dict[str, str]]:
+    """
+    Parse a multi-block summary response.
+
+    Accepts {"summaries": [...]} or a bare array, optionally wrapped in a
+    markdown fence or surrounding text. Entries with an unknown id or without
+    both fields are skipped.
+
+    Returns:
+        Mapping of example id to {"example_name", "summary"}
+    """
+    cleaned = (raw_response or "").strip()
+    if cleaned.startswith("```"):
+        lines = cleaned.splitlines()[1:]
+        if lines and lines[-1].strip().startswith("```"):
+            lines = lines[:-1]
+        cleaned = "\n".join(lines).strip()
+
+    data = None
+    candidates = [cleaned]
+    for open_char, close_char in (("{", "}"), ("[", "]")):
+        start, end = cleaned.find(open_char), cleaned.rfind(close_char)
+        if start != -1 and end > start:
+            candidates.append(cleaned[start : end + 1])
+    for candidate in candidates:
+        try:
+            data = json.loads(candidate)
+            break
+        except json.JSONDecodeError:
+            continue
+
+    if isinstance(data, dict):
+        data = data.get("summaries")
+    if not isinstance(data, list):
+        return {}
+
+    summaries = {}
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        raw_id = entry.get("id")
+        if raw_id is None:
+            continue
+        try:
+            block_id = int(raw_id)
+        except (TypeError, ValueError):
+            continue
+        name, summary = entry.get("example_name"), entry.get("summary")
+        if 0 <= block_id < count and isinstance(name, str) and isinstance(summary, str) and name and summary:
+            summaries[block_id] = {"example_name": name.strip(), "summary": summary.strip()}
+    return summaries
+
+
+async def _generate_multi_block_summaries(
+    llm_client, blocks: list[dict[str, Any]], provider: str, model_choice: str
+) -> dict[int, dict[str, str]]:
+    """
+    Summarize several code blocks with one chat completion.
+
+    Returns:
+        Mapping of block position to summary for the blocks the model answered
+        for; callers summarize the rest individually.
+    """
+    request_params = {
+        "model": model_choice,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a helpful assistant that analyzes code examples and provides JSON responses with example names and summaries.",
+            },
+            {"role": "user", "content": _build_multi_block_prompt(blocks)},
+        ],
+        "max_tokens": 2000 + 300 * len(blocks),
+        "temperature": 0.3,
+    }
+    if _supports_json_response_format(provider, model_choice):
+        request_params["response_format"] = {"type": "json_object"}
+
+    response = await llm_client.chat.completions.create(
+        **prepare_chat_completion_params(model_choice, request_params)
+    )
+    choice = response.choices[0] if response.choices else None
+    content, reasoning_text, _ = extract_message_text(choice)
+
+    summaries = _parse_multi_block_response(content, len(blocks))
+    if not summaries and reasoning_text:
+        # Some reasoning models put the answer in the reasoning channel
+        summaries = _parse_multi_block_response(reasoning_text, len(blocks))
+
+    search_logger.info(
+        f"Generated {len(summaries)}/{len(blocks)} code summaries in one request using model: {model_choice}"
+    )
+    return summaries
 
 
 async def generate_code_summaries_batch(
-    code_blocks: list[dict[str, Any]], max_workers: int = None, progress_callback=None, provider: str = None
+    code_blocks: list[dict[str, Any]],
+    max_workers: int | None = None,
+    progress_callback=None,
+    provider: str | None = None,
 ) -> list[dict[str, str]]:
     """
     Generate summaries for multiple code blocks with rate limiting and proper worker management.
 
+    Summaries are looked up in code_summary_cache first, and identical blocks
+    within the batch are summarized once. The remaining blocks are sent
+    CODE_SUMMARY_BATCH_SIZE at a time in multi-block requests; any block the
+    model does not answer for is summarized with its own request.
+
     Args:
         code_blocks: List of code block dictionaries
         max_workers: Maximum number of concurrent API requests
@@ -1033,99 +1289,118 @@ async def generate_code_summaries_batch(
 
     # Get max_workers from settings if not provided
     if max_workers is None:
-        try:
-            if (
-                credential_service._cache_initialized
-                and "CODE_SUMMARY_MAX_WORKERS" in credential_service._cache
-            ):
-                max_workers = int(credential_service._cache["CODE_SUMMARY_MAX_WORKERS"])
-            else:
-                max_workers = int(os.getenv("CODE_SUMMARY_MAX_WORKERS", "3"))
-        except:
-            max_workers = 3  # Default fallback
+        max_workers = _get_summary_setting("CODE_SUMMARY_MAX_WORKERS", 3)
+    batch_size = max(1, _get_summary_setting("CODE_SUMMARY_BATCH_SIZE", CODE_SUMMARY_BATCH_SIZE))
 
     search_logger.info(
-        f"Generating summaries for {len(code_blocks)} code blocks with max_workers={max_workers}"
+        f"Generating summaries for {len(code_blocks)} code blocks with max_workers={max_workers}, batch_size={batch_size}"
     )
 
+    model_choice = await _get_model_choice()
+    summary_provider = await _get_summary_provider(provider)
+
+    # Serve repeated blocks from the cache and group identical ones within the batch
+    results: list[dict[str, str] | None] = [None] * len(code_blocks)
+    pending: dict[tuple[str, str, str], list[int]] = {}
+    for i, block in enumerate(code_blocks):
+        key = code_summary_cache.key(model_choice, block["code"], block.get("language", ""))
+        cached = code_summary_cache.get(key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(key, []).append(i)
+
+    cached_count = sum(1 for result in results if result is not None)
+    if cached_count:
+        search_logger.info(f"Reused {cached_count}/{len(code_blocks)} code summaries from cache")
+    if not pending:
+        return _with_fallback_summaries(results, code_blocks)
+
     # Create a shared LLM client for all summaries (performance optimization)
     async with get_llm_client(provider=provider) as shared_client:
         search_logger.debug("Created shared LLM client for batch summary generation")
 
         # Semaphore to limit concurrent requests
         semaphore = asyncio.Semaphore(max_workers)
-        completed_count = 0
+        completed_count = cached_count
         lock = asyncio.Lock()
 
-        async def generate_single_summary_with_limit(block: dict[str, Any]) -> dict[str, str]:
+        async def report_progress(key: tuple[str, str, str], summary: dict[str, str], from_llm: bool) -> None:
             nonlocal completed_count
+            if from_llm:
+                code_summary_cache.put(key, summary)
+            for i in pending[key]:
+                results[i] = summary
+            async with lock:
+                completed_count += len(pending[key])
+                if progress_callback:
+                    # Simple progress based on summaries completed
+                    progress_percentage = int((completed_count / len(code_blocks)) * 100)
+                    await progress_callback({
+                        "status": "code_extraction",
+                        "percentage": progress_percentage,
+                        "log": f"Generated {completed_count}/{len(code_blocks)} code summaries",
+                        "completed_summaries": completed_count,
+                        "total_summaries": len(code_blocks),
+                    })
+
+        async def generate_single_summary_with_limit(key: tuple[str, str, str]) -> None:
+            block = code_blocks[pending[key][0]]
             async with semaphore:
                 # Add delay between requests to avoid rate limiting
-                await asyncio.sleep(0.5)  # 500ms delay between requests
+                await asyncio.sleep(SUMMARY_REQUEST_DELAY)
 
                 # Call async version directly with shared client (no event loop overhead)
-                result = await _generate_code_example_summary_async(
-                    block["code"],
-                    block["context_before"],
-                    block["context_after"],
-                    block.get("language", ""),
-                    provider,
-                    shared_client  # Pass shared client for reuse
-                )
+                try:
+                    summary, from_llm = await _summarize_code_example(
+                        block["code"],
+                        block["context_before"],
+                        block["context_after"],
+                        block.get("language", ""),
+                        provider,
+                        shared_client  # Pass shared client for reuse
+                    )
+                except Exception as e:
+                    search_logger.error(f"Error generating summary for code block {pending[key][0]}: {e}")
+                    summary, from_llm = _fallback_summary(block.get("language", "")), False
 
-                # Update progress
-                async with lock:
-                    completed_count += 1
-                    if progress_callback:
-                        # Simple progress based on summaries completed
-                        progress_percentage = int((completed_count / len(code_blocks)) * 100)
-                        await progress_callback({
-                            "status": "code_extraction",
-                            "percentage": progress_percentage,
-                            "log": f"Generated {completed_count}/{len(code_blocks)} code summaries",
-                            "completed_summaries": completed_count,
-                            "total_summaries": len(code_blocks),
-                        })
-
-                return result
-
-        # Process all blocks concurrently but with rate limiting
-        try:
-            summaries = await asyncio.gather(
-                *[generate_single_summary_with_limit(block) for block in code_blocks],
-                return_exceptions=True,
-            )
+            await report_progress(key, summary, from_llm)
 
-            # Handle any exceptions in the results
-            final_summaries = []
-            for i, summary in enumerate(summaries):
-                if isinstance(summary, Exception):
-                    search_logger.error(f"Error generating summary for code block {i}: {summary}")
-                    # Use fallback summary
-                    language = code_blocks[i].get("language", "")
-                    fallback = {
-                        "example_name": f"Code Example{f' ({language})' if language else ''}",
-                        "summary": "Code example for demonstration purposes.",
-                    }
-                    final_summaries.append(fallback)
-                else:
-                    final_summaries.append(summary)
+        async def generate_group_with_limit(keys: list[tuple[str, str, str]]) -> None:
+            summaries = {}
+            async with semaphore:
+                await asyncio.sleep(SUMMARY_REQUEST_DELAY)
+                try:
+                    summaries = await _generate_multi_block_summaries(
+                        shared_client,
+                        [code_blocks[pending[key][0]] for key in keys],
+                        summary_provider,
+                        model_choice,
+                    )
+                except Exception as e:
+                    search_logger.warning(
+                        f"Multi-block summary request failed, summarizing {len(keys)} blocks individually: {e}"
+                    )
 
-            search_logger.info(f"Successfully generated {len(final_summaries)} code summaries")
-            return final_summaries
+            for position, key in enumerate(keys):
+                if position in summaries:
+                    await report_progress(key, summaries[position], True)
+            missing = [key for position, key in enumerate(keys) if position not in summaries]
+            await asyncio.gather(*[generate_single_summary_with_limit(key) for key in missing])
 
+        keys = list(pending)
+        groups = [keys[start : start + batch_size] for start in range(0, len(keys), batch_size)]
+        try:
+            await asyncio.gather(*[
+                generate_group_with_limit(group) if len(group) > 1 else generate_single_summary_with_limit(group[0])
+                for group in groups
+            ])
         except Exception as e:
+            # Blocks still without a summary get the fallback below
             search_logger.error(f"Error in batch summary generation: {e}")
-            # Return fallback summaries for all blocks
-            fallback_summaries = []
-            for block in code_blocks:
-                language = block.get("language", "")
-                fallback = {
-                    "example_name": f"Code Example{f' ({language})' if language else ''}",
-                    "summary": "Code example for demonstration purposes.",
-                }
-                fallback_summaries.append(fallback)
-            return fallback_summaries
+
+    search_logger.info(f"Successfully generated {len(code_blocks)} code summaries")
+    return _with_fallback_summaries(results, code_blocks)
 
 
 async def add_code_examples_to_supabase(
@@ -1,6 +1,7 @@
 """Simple test configuration for Archon - Essential tests only."""
 
 import os
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -86,6 +87,15 @@ def prevent_real_db_calls():
                 yield
 
 
+@pytest.fixture(autouse=True)
+def clear_task_counts_cache():
+    """Task counts are cached across TaskService instances; start each test without them."""
+    task_service = sys.modules.get("src.server.services.projects.task_service")
+    if task_service is not None:
+        task_service.TaskService.clear_task_counts_cache()
+    yield
+
+
 @pytest.fixture
 def mock_supabase_client():
     """Mock Supabase client for testing."""
@@ -94,8 +94,9 @@ class TestProjectsListPolling:
 
     @pytest.mark.asyncio
     async def test_list_projects_etag_changes_with_data(self):
-        """Test that ETag changes when project data changes."""
+        """Test that ETag changes when a project write is recorded."""
         from src.server.api_routes.projects_api import list_projects
+        from src.server.services.projects.change_journal import change_journal
         
         with patch("src.server.api_routes.projects_api.ProjectService") as mock_proj_class, \
              patch("src.server.api_routes.projects_api.SourceLinkingService") as mock_source_class:
@@ -114,10 +115,11 @@ class TestProjectsListPolling:
             await list_projects(response=response1, if_none_match=None)
             etag1 = response1.headers["ETag"]
             
-            # Modified data
+            # Modified data (services bump the change journal on every write)
             projects2 = [{"id": "proj-1", "name": "Project 1 Updated"}]
             mock_proj_service.list_projects.return_value = (True, {"projects": projects2})
             mock_source_service.format_projects_with_sources.return_value = projects2
+            change_journal.bump("proj-1")
             
             response2 = Response()
             await list_projects(response=response2, if_none_match=etag1)
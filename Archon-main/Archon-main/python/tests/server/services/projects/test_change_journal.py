@@ -0,0 +1,60 @@
+"""Tests for the project change journal."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.projects.change_journal import ProjectChangeJournal
+from src.server.services.projects.task_service import TaskService
+
+
+class TestProjectChangeJournal:
+    """Test ProjectChangeJournal versions and ETags."""
+
+    def test_bump_changes_project_and_global_etags(self):
+        journal = ProjectChangeJournal()
+        projects_etag = journal.etag("projects")
+        tasks_etag = journal.etag("project_tasks", project_id="proj-1")
+        other_etag = journal.etag("project_tasks", project_id="proj-2")
+
+        journal.bump("proj-1")
+
+        assert journal.etag("projects") != projects_etag
+        assert journal.etag("project_tasks", project_id="proj-1") != tasks_etag
+        # Writes to another project don't invalidate this one
+        assert journal.etag("project_tasks", project_id="proj-2") == other_etag
+
+    def test_etag_is_stable_without_writes(self):
+        journal = ProjectChangeJournal()
+        etag = journal.etag("projects", include_content=True)
+
+        assert journal.etag("projects", include_content=True) == etag
+        assert journal.etag("projects", include_content=False) != etag
+        assert journal.etag("task_counts") != etag
+
+    def test_unscoped_bump_invalidates_every_project(self):
+        journal = ProjectChangeJournal()
+        etag = journal.etag("project_tasks", project_id="proj-1")
+
+        journal.bump(None)
+
+        assert journal.etag("project_tasks", project_id="proj-1") != etag
+
+    def test_etags_differ_across_restarts(self):
+        # Counters restart at zero; the epoch keeps old ETags from matching
+        assert ProjectChangeJournal().etag("projects") != ProjectChangeJournal().etag("projects")
+
+    @pytest.mark.asyncio
+    async def test_task_update_bumps_project(self, monkeypatch):
+        journal = ProjectChangeJournal()
+        monkeypatch.setattr("src.server.services.projects.task_service.change_journal", journal)
+        client = MagicMock()
+        client.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [
+            {"id": "task-1", "project_id": "proj-1", "status": "doing"}
+        ]
+        etag = journal.etag("project_tasks", project_id="proj-1")
+
+        success, _ = await TaskService(client).update_task("task-1", {"status": "doing"})
+
+        assert success
+        assert journal.etag("project_tasks", project_id="proj-1") != etag
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import src.server.services.credential_service as credential_service_module
 from src.server.services.credential_service import (
     credential_service,
     get_credential,
@@ -27,10 +28,14 @@ class TestAsyncCredentialService:
         """Setup clean credential service for each test"""
         # Clear cache and reset state
         credential_service._cache.clear()
+        credential_service._metadata.clear()
+        credential_service._decrypted.clear()
         credential_service._cache_initialized = False
         yield
         # Cleanup after test
         credential_service._cache.clear()
+        credential_service._metadata.clear()
+        credential_service._decrypted.clear()
         credential_service._cache_initialized = False
 
     @pytest.fixture
@@ -336,3 +341,94 @@ class TestAsyncCredentialService:
         result2 = await get_credential("PERSISTENT_KEY", "default")
         assert result2 == "persistent_value"
         assert result1 == result2
+
+    def test_decrypt_value_is_memoized(self):
+        """Test that each ciphertext is decrypted only once"""
+        encrypted = credential_service._encrypt_value("sk-test")
+
+        with patch(
+            "src.server.services.credential_service.Fernet",
+            wraps=credential_service_module.Fernet,
+        ) as fernet:
+            assert credential_service._decrypt_value(encrypted) == "sk-test"
+            assert credential_service._decrypt_value(encrypted) == "sk-test"
+            assert fernet.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_category_view_follows_set_and_delete(
+        self, mock_supabase_client, sample_credentials_data
+    ):
+        """Test that category views are served from the snapshot and refreshed on writes"""
+        mock_client, mock_table = mock_supabase_client
+        mock_table.select().execute.return_value = MagicMock(data=sample_credentials_data)
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            await credential_service.load_all_credentials()
+            api_keys = await credential_service.get_credentials_by_category("api_keys")
+            assert api_keys["OPENAI_API_KEY"]["value"] == "[ENCRYPTED]"
+
+            mock_table.select.reset_mock()
+            rag = await credential_service.get_credentials_by_category("rag_strategy")
+            assert "NEW_SETTING" not in rag
+            # Served from the snapshot without querying the database
+            mock_table.select.assert_not_called()
+
+            await set_credential("NEW_SETTING", "on", category="rag_strategy")
+            rag = await credential_service.get_credentials_by_category("rag_strategy")
+            assert rag["NEW_SETTING"] == "on"
+
+            await credential_service.delete_credential("NEW_SETTING")
+            rag = await credential_service.get_credentials_by_category("rag_strategy")
+            assert "NEW_SETTING" not in rag
+
+    @pytest.mark.asyncio
+    async def test_refresh_if_changed(self, mock_supabase_client, sample_credentials_data):
+        """Test that the snapshot is reloaded only when the settings table changed"""
+        mock_client, mock_table = mock_supabase_client
+        rows = [dict(row, updated_at="2025-01-01T00:00:00") for row in sample_credentials_data]
+        mock_table.select().execute.return_value = MagicMock(data=rows)
+        signature_query = mock_table.select().order().limit()
+        signature_query.execute.return_value = MagicMock(
+            data=[{"updated_at": "2025-01-01T00:00:00"}], count=len(rows)
+        )
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            await credential_service.load_all_credentials()
+            version = credential_service.version
+
+            assert await credential_service.refresh_if_changed() is False
+            assert credential_service.version == version
+
+            signature_query.execute.return_value = MagicMock(
+                data=[{"updated_at": "2025-01-02T00:00:00"}], count=len(rows)
+            )
+            assert await credential_service.refresh_if_changed() is True
+            assert credential_service.version > version
+
+    @pytest.mark.asyncio
+    async def test_own_writes_do_not_trigger_reload(self, mock_supabase_client, sample_credentials_data):
+        """Test that a poll after this process's own write keeps the snapshot"""
+        mock_client, mock_table = mock_supabase_client
+        rows = [dict(row, updated_at="2025-01-01T00:00:00") for row in sample_credentials_data]
+        mock_table.select().execute.return_value = MagicMock(data=rows)
+        signature_query = mock_table.select().order().limit()
+
+        def set_signature(count, updated_at):
+            signature_query.execute.return_value = MagicMock(data=[{"updated_at": updated_at}], count=count)
+
+        set_signature(len(rows), "2025-01-01T00:00:00")
+        mock_table.upsert().execute.side_effect = lambda: set_signature(len(rows) + 1, "2025-01-02T00:00:00")
+
+        with patch.object(credential_service, "_get_supabase_client", return_value=mock_client):
+            await credential_service.load_all_credentials()
+
+            await set_credential("NEW_SETTING", "on", category="rag_strategy")
+            version = credential_service.version
+            assert await credential_service.refresh_if_changed() is False
+            assert credential_service.version == version
+
+            # A change made elsewhere before our write is still picked up
+            set_signature(len(rows) + 1, "2025-01-03T00:00:00")
+            mock_table.delete().eq().execute.side_effect = lambda: set_signature(len(rows), "2025-01-03T00:00:00")
+            await credential_service.delete_credential("NEW_SETTING")
+            assert await credential_service.refresh_if_changed() is True
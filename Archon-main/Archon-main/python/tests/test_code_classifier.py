@@ -0,0 +1,75 @@
+"""
+Tests for the precompiled code classifier used by code extraction.
+
+The benchmark's reference implementations are the original per-call regex
+versions, so parity over the fixture corpus guards the decisions.
+"""
+
+import pytest
+
+from benchmarks.code_classifier_benchmark import (
+    check_parity,
+    legacy_validate_code_quality,
+    load_blocks,
+    run_benchmark,
+)
+from src.server.services.crawling import code_classifier
+
+
+def test_fixture_corpus_matches_reference_implementation():
+    assert check_parity(load_blocks()) == []
+
+
+def test_corpus_covers_accepted_and_rejected_blocks():
+    blocks = load_blocks()
+    decisions = {
+        code_classifier.check_code_quality(
+            code_classifier.clean_code_content(b["code"], b["language"]), b["language"]
+        )[0]
+        for b in blocks
+    }
+    assert decisions == {True, False}
+
+
+@pytest.mark.parametrize(
+    "code, language, reason",
+    [
+        ("flowchart TD\n    A --> B\n    B --> C\n", "mermaid", "diagram"),
+        ("x = 1\n" + "a" * 250 + "\ny = 2\n", "", "failed quality check"),
+        ("# one\n# two\n# three\nimport os\n", "python", "mostly comments"),
+        (
+            "This is the result. It is what the client should see when a request has failed.\n"
+            "The value = client.get(url) is what we get back.\n"
+            "These are the values that were tested {a, b}.\n",
+            "",
+            "prose",
+        ),
+    ],
+)
+def test_rejections_match_reference(code, language, reason):
+    passed, message = code_classifier.check_code_quality(code, language)
+
+    assert passed is False
+    assert reason in message
+    assert legacy_validate_code_quality(code, language) is False
+
+
+def test_indicator_search_stops_once_enough_found():
+    code = "items = [x.value for x in data]\nif items:\n    return items\n"
+
+    assert len(code_classifier._find_indicators(code, enough=3)) == 3
+    assert len(code_classifier.extract_features(code).indicators) > 3
+
+
+def test_pdf_keyword_prefilter_is_skipped_for_non_ascii():
+    # re.IGNORECASE folds U+017F (long s) to "s", which str.lower() does not
+    section = "pip inſtall requests\npip inſtall httpx\nclient = httpx.Client()\n"
+
+    assert code_classifier.score_pdf_section(section)[0] >= 4
+
+
+def test_run_benchmark_reports_every_stage():
+    results = run_benchmark(load_blocks()[:3], iterations=1)
+
+    assert [r.stage for r in results] == ["clean", "validate", "detect_language", "pdf_section"]
+    assert all(r.legacy_us_per_block > 0 and r.compiled_us_per_block > 0 for r in results)
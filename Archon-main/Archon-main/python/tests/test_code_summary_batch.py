@@ -0,0 +1,200 @@
+"""
+Tests for batched code summary generation and the code summary cache.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.server.services.storage import code_storage_service
+from src.server.services.storage.code_storage_service import (
+    CodeSummaryCache,
+    _parse_multi_block_response,
+    code_summary_cache,
+    generate_code_summaries_batch,
+)
+
+
+def make_block(code: str, language: str = "python") -> dict:
+    return {"code": code, "language": language, "context_before": "Example:", "context_after": ""}
+
+
+def completion(content: str):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeClient:
+    """Answers multi-block prompts for the ids listed in answer_ids (all ids if None)."""
+
+    def __init__(self, answer_ids: set[int] | None = None):
+        self.answer_ids = answer_ids
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **params):
+        self.requests.append(params)
+        prompt = params["messages"][-1]["content"]
+        count = prompt.count("<example id=")
+        summaries = [
+            {"id": i, "example_name": f"Example {i}", "summary": f"Summary of example {i}."}
+            for i in range(count)
+            if self.answer_ids is None or i in self.answer_ids
+        ]
+        return completion(json.dumps({"summaries": summaries}))
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    client = FakeClient()
+
+    @asynccontextmanager
+    async def fake_get_llm_client(provider=None):
+        yield client
+
+    code_summary_cache.clear()
+    monkeypatch.setattr(code_storage_service, "SUMMARY_REQUEST_DELAY", 0)
+    monkeypatch.setattr(code_storage_service, "get_llm_client", fake_get_llm_client)
+    monkeypatch.setattr(code_storage_service, "_get_model_choice", AsyncMock(return_value="gpt-4o-mini"))
+    monkeypatch.setattr(code_storage_service, "_get_summary_provider", AsyncMock(return_value="openai"))
+    monkeypatch.setenv("CODE_SUMMARY_BATCH_SIZE", "5")
+    yield client
+    code_summary_cache.clear()
+
+
+def test_cache_key_ignores_whitespace_but_not_model_or_language():
+    key = CodeSummaryCache.key("gpt-4o-mini", "x = 1\nprint(x)\n", "Python")
+
+    assert key == CodeSummaryCache.key("gpt-4o-mini", "  x = 1\n\n    print(x)", "python")
+    assert key != CodeSummaryCache.key("gpt-4o", "x = 1\nprint(x)\n", "python")
+    assert key != CodeSummaryCache.key("gpt-4o-mini", "x = 1\nprint(x)\n", "javascript")
+
+
+def test_cache_skips_incomplete_summaries_and_evicts_oldest():
+    cache = CodeSummaryCache(max_entries=2)
+    cache.put(("m", "a", ""), {"example_name": "Name only", "summary": ""})
+    assert len(cache) == 0
+
+    for name in "abc":
+        cache.put(("m", name, ""), {"example_name": name, "summary": f"Summary {name}."})
+
+    assert cache.get(("m", "a", "")) is None
+    assert cache.get(("m", "c", ""))["example_name"] == "c"
+
+
+def test_parse_multi_block_response_accepts_fences_and_bare_arrays():
+    fenced = '```json\n{"summaries": [{"id": 1, "example_name": "B", "summary": "Does B."}]}\n```'
+    assert _parse_multi_block_response(fenced, 2) == {1: {"example_name": "B", "summary": "Does B."}}
+
+    bare = 'Here you go: [{"id": "0", "example_name": "A", "summary": "Does A."}, {"id": 7}]'
+    assert _parse_multi_block_response(bare, 2) == {0: {"example_name": "A", "summary": "Does A."}}
+
+    assert _parse_multi_block_response("not json", 2) == {}
+
+
+@pytest.mark.asyncio
+async def test_blocks_are_summarized_in_one_request_and_cached(fake_llm):
+    blocks = [make_block(f"def f{i}():\n    return {i}\n") for i in range(3)]
+
+    summaries = await generate_code_summaries_batch(blocks, max_workers=2)
+
+    assert len(fake_llm.requests) == 1
+    assert [s["example_name"] for s in summaries] == ["Example 0", "Example 1", "Example 2"]
+
+    # Repeated blocks (e.g. on another page of the same site) come from the cache
+    again = await generate_code_summaries_batch(blocks, max_workers=2)
+
+    assert len(fake_llm.requests) == 1
+    assert again == summaries
+
+
+@pytest.mark.asyncio
+async def test_fully_cached_batch_still_returns_a_summary_per_block(fake_llm):
+    blocks = [make_block("print('a')\n"), make_block("print('b')\n")]
+    await generate_code_summaries_batch(blocks, max_workers=1)
+
+    summaries = await generate_code_summaries_batch(blocks + blocks[:1], max_workers=1)
+
+    assert len(fake_llm.requests) == 1
+    assert [s["example_name"] for s in summaries] == ["Example 0", "Example 1", "Example 0"]
+
+
+@pytest.mark.asyncio
+async def test_identical_blocks_in_a_batch_are_summarized_once(fake_llm):
+    blocks = [make_block("pip install archon\n", "bash")] * 3 + [make_block("import archon\n")]
+
+    summaries = await generate_code_summaries_batch(blocks, max_workers=2)
+
+    assert fake_llm.requests[0]["messages"][-1]["content"].count("<example id=") == 2
+    assert summaries[0] == summaries[1] == summaries[2]
+
+
+@pytest.mark.asyncio
+async def test_unanswered_blocks_fall_back_to_single_requests(fake_llm):
+    fake_llm.answer_ids = {0}
+    single = AsyncMock(return_value=({"example_name": "Single", "summary": "Summarized alone."}, True))
+    blocks = [make_block(f"value_{i} = compute({i})\n") for i in range(3)]
+
+    with patch.object(code_storage_service, "_summarize_code_example", single):
+        summaries = await generate_code_summaries_batch(blocks, max_workers=2)
+
+    assert summaries[0]["example_name"] == "Example 0"
+    assert [s["example_name"] for s in summaries[1:]] == ["Single", "Single"]
+    assert single.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_size_one_uses_single_requests(fake_llm, monkeypatch):
+    monkeypatch.setenv("CODE_SUMMARY_BATCH_SIZE", "1")
+    single = AsyncMock(return_value=({"example_name": "Single", "summary": "Summarized alone."}, True))
+    blocks = [make_block(f"value_{i} = compute({i})\n") for i in range(2)]
+
+    with patch.object(code_storage_service, "_summarize_code_example", single):
+        await generate_code_summaries_batch(blocks, max_workers=2)
+
+    assert fake_llm.requests == []
+    assert single.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_synthesized_fallbacks_are_not_cached(fake_llm, monkeypatch):
+    monkeypatch.setenv("CODE_SUMMARY_BATCH_SIZE", "1")
+    synthesized = {
+        "example_name": "Handle Json",
+        "summary": "Code example demonstrating handle json functionality for python development.",
+    }
+    single = AsyncMock(return_value=(synthesized, False))
+    blocks = [make_block("data = json.loads(raw)\n")]
+
+    with patch.object(code_storage_service, "_summarize_code_example", single):
+        assert await generate_code_summaries_batch(blocks, max_workers=1) == [synthesized]
+        await generate_code_summaries_batch(blocks, max_workers=1)
+
+    assert single.await_count == 2
+    assert len(code_summary_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_block_path_reports_whether_the_model_answered(fake_llm):
+    def client_returning(content: str):
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+            create=AsyncMock(return_value=completion(content))
+        )))
+
+    answered = client_returning(
+        '{"example_name": "Parse Config", "summary": "Loads the YAML config and validates required keys."}'
+    )
+    summary, from_llm = await code_storage_service._summarize_code_example(
+        "config = yaml.safe_load(f)\n", "", "", "python", "openai", answered
+    )
+    assert from_llm is True
+    assert summary["example_name"] == "Parse Config"
+
+    # A minimal answer gets a summary synthesized from the code, which must not be cached
+    _, from_llm = await code_storage_service._summarize_code_example(
+        "config = yaml.safe_load(f)\n", "", "", "python", "openai", client_returning("Okay\nOkay")
+    )
+    assert from_llm is False
@@ -0,0 +1,143 @@
+"""Tests for durable crawl checkpoints."""
+
+import os
+import time
+
+import pytest
+
+from src.server.services.crawling.helpers.crawl_checkpoint import (
+    PAGE_CRAWLED,
+    PAGE_STORED,
+    STAGE_CRAWLING,
+    CrawlCheckpoint,
+)
+
+
+def make_page(i: int) -> dict:
+    return {
+        "url": f"https://docs.example.com/page-{i}",
+        "markdown": f"# Page {i}\n\n" + "Some documentation text. " * 20,
+        "html": f"<html><title>Page {i}</title></html>",
+        "title": f"Page {i}",
+    }
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("CRAWL_CHECKPOINT_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestCrawlCheckpoint:
+    """Test CrawlCheckpoint persists crawl state across instances."""
+
+    def test_state_survives_reopen(self, checkpoint_dir):
+        checkpoint = CrawlCheckpoint("progress-1")
+        checkpoint.set_meta("request", {"url": "https://docs.example.com", "max_depth": 3})
+        checkpoint.stage = STAGE_CRAWLING
+        checkpoint.record_page(make_page(0))
+        checkpoint.record_page(make_page(1))
+        checkpoint.record_visited("https://docs.example.com/broken")
+        checkpoint.save([(1, "https://docs.example.com/page-2"), (2, "https://docs.example.com/page-3")])
+        checkpoint.close()
+
+        assert CrawlCheckpoint.exists("progress-1")
+        reopened = CrawlCheckpoint("progress-1")
+        assert reopened.get_meta("request") == {"url": "https://docs.example.com", "max_depth": 3}
+        assert reopened.stage == STAGE_CRAWLING
+        assert reopened.has_frontier
+        assert list(reopened.pages()) == [make_page(0), make_page(1)]
+        assert reopened.visited() == {
+            "https://docs.example.com/page-0",
+            "https://docs.example.com/page-1",
+            "https://docs.example.com/broken",
+        }
+        assert reopened.frontier() == [
+            (1, "https://docs.example.com/page-2"),
+            (2, "https://docs.example.com/page-3"),
+        ]
+        reopened.close()
+
+    def test_unsaved_records_are_not_persisted(self, checkpoint_dir):
+        checkpoint = CrawlCheckpoint("progress-2")
+        checkpoint.record_page(make_page(0))
+        checkpoint.close()
+
+        reopened = CrawlCheckpoint("progress-2")
+        assert reopened.page_count == 0
+        assert not reopened.has_frontier
+        reopened.close()
+
+    def test_save_replaces_frontier_and_ignores_duplicate_pages(self, checkpoint_dir):
+        checkpoint = CrawlCheckpoint("progress-3")
+        checkpoint.record_page(make_page(0))
+        checkpoint.save([(0, "https://docs.example.com/a"), (1, "https://docs.example.com/b")])
+        checkpoint.record_page(make_page(0))
+        checkpoint.save([])
+
+        assert checkpoint.page_count == 1
+        assert checkpoint.frontier() == []
+        assert checkpoint.has_frontier
+        checkpoint.close()
+
+    def test_page_status(self, checkpoint_dir):
+        checkpoint = CrawlCheckpoint("progress-4")
+        for i in range(3):
+            checkpoint.record_page(make_page(i))
+        checkpoint.save()
+        assert checkpoint.page_status_counts() == {PAGE_CRAWLED: 3}
+
+        checkpoint.mark_pages(PAGE_STORED, ["https://docs.example.com/page-0"])
+        assert checkpoint.page_status_counts() == {PAGE_CRAWLED: 2, PAGE_STORED: 1}
+
+        checkpoint.mark_pages(PAGE_STORED)
+        assert checkpoint.summary()["page_status"] == {PAGE_STORED: 3}
+        checkpoint.close()
+
+    def test_due_respects_interval(self, checkpoint_dir):
+        checkpoint = CrawlCheckpoint("progress-5", interval=3600)
+        assert not checkpoint.due()
+        checkpoint.interval = 0
+        assert checkpoint.due()
+        checkpoint.close()
+
+    def test_delete_removes_file(self, checkpoint_dir):
+        checkpoint = CrawlCheckpoint("progress-6")
+        checkpoint.save()
+        checkpoint.delete()
+
+        assert not CrawlCheckpoint.exists("progress-6")
+        assert list(checkpoint_dir.iterdir()) == []
+
+    def test_remove_by_progress_id(self, checkpoint_dir):
+        CrawlCheckpoint("progress-7").close()
+
+        assert CrawlCheckpoint.remove("progress-7")
+        assert not CrawlCheckpoint.exists("progress-7")
+        assert not CrawlCheckpoint.remove("progress-7")
+
+    def test_sweep_removes_only_expired_checkpoints(self, checkpoint_dir):
+        for progress_id in ("stale", "fresh", "running"):
+            CrawlCheckpoint(progress_id).close()
+        week_ago = time.time() - 7 * 24 * 3600
+        for progress_id in ("stale", "running"):
+            os.utime(CrawlCheckpoint.path_for(progress_id), (week_ago, week_ago))
+        (checkpoint_dir / "notes.txt").write_text("not a checkpoint")
+        os.utime(checkpoint_dir / "notes.txt", (week_ago, week_ago))
+
+        removed = CrawlCheckpoint.sweep_expired(max_age=24 * 3600, keep={"running"})
+
+        assert removed == ["stale"]
+        assert not CrawlCheckpoint.exists("stale")
+        assert CrawlCheckpoint.exists("fresh")
+        assert CrawlCheckpoint.exists("running")
+        assert (checkpoint_dir / "notes.txt").exists()
+
+    def test_sweep_without_directory(self, tmp_path):
+        assert CrawlCheckpoint.sweep_expired(directory=str(tmp_path / "missing")) == []
+
+    def test_rejects_unsafe_progress_ids(self, checkpoint_dir):
+        assert CrawlCheckpoint.path_for("../../etc/passwd").startswith(str(checkpoint_dir))
+        assert not CrawlCheckpoint.exists("../")
+        with pytest.raises(ValueError):
+            CrawlCheckpoint("/")
@@ -0,0 +1,64 @@
+"""Tests for the disk-backed crawl result store."""
+
+from src.server.services.crawling.helpers.crawl_result_store import CrawlResultStore
+
+
+def make_page(i: int) -> dict:
+    return {
+        "url": f"https://docs.example.com/page-{i}",
+        "markdown": f"# Page {i}\n\n" + "Some documentation text. " * 50,
+        "html": f"<html><title>Page {i}</title><body>{'<p>text</p>' * 200}</body></html>",
+        "title": f"Page {i}",
+    }
+
+
+class TestCrawlResultStore:
+    """Test CrawlResultStore behaves like the list it replaces."""
+
+    def test_round_trips_pages_in_order(self):
+        pages = [make_page(i) for i in range(5)]
+        with CrawlResultStore(pages) as store:
+            assert len(store) == 5
+            assert bool(store)
+            assert list(store) == pages
+            assert store[0] == pages[0]
+            assert store[-1] == pages[-1]
+            assert store[1:3] == pages[1:3]
+
+    def test_empty_store_is_falsy(self):
+        with CrawlResultStore() as store:
+            assert not store
+            assert list(store) == []
+
+    def test_compresses_on_disk(self):
+        with CrawlResultStore([make_page(i) for i in range(10)]) as store:
+            assert store.stored_bytes < store.raw_bytes / 3
+
+    def test_lookup_by_url(self):
+        with CrawlResultStore([make_page(i) for i in range(3)]) as store:
+            assert store.get_by_url("https://docs.example.com/page-1")["title"] == "Page 1"
+            assert store.get_by_url("https://docs.example.com/missing") is None
+            assert store.urls == [f"https://docs.example.com/page-{i}" for i in range(3)]
+
+    def test_extend_from_store_and_list(self):
+        first = [{"url": "https://docs.example.com/llms.txt", "markdown": "- [A](a)"}]
+        with CrawlResultStore([make_page(i) for i in range(2)]) as linked:
+            combined = CrawlResultStore(first)
+            combined.extend(linked)
+
+        assert [page["url"] for page in combined] == [
+            "https://docs.example.com/llms.txt",
+            "https://docs.example.com/page-0",
+            "https://docs.example.com/page-1",
+        ]
+        assert combined.raw_bytes > 0
+        combined.close()
+
+    def test_iteration_sees_pages_appended_during_iteration(self):
+        with CrawlResultStore([make_page(0)]) as store:
+            seen = []
+            for page in store:
+                seen.append(page["url"])
+                if len(store) < 3:
+                    store.append(make_page(len(store)))
+            assert len(seen) == 3
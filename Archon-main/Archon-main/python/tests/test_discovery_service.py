@@ -1,7 +1,12 @@
 """Unit tests for DiscoveryService class."""
+import asyncio
 import socket
+from functools import partial
 from unittest.mock import Mock, patch
 
+import httpx
+import pytest
+
 from src.server.services.crawling.discovery_service import DiscoveryService
 
 
@@ -351,3 +356,85 @@ Allow: /public/"""
 
         result = service._parse_html_meta_tags("https://example.com")
         assert result == []
+
+
+class TestAsyncDiscovery:
+    """Test suite for the concurrent discover_files_async engine."""
+
+    def test_candidate_urls_follow_sync_priority_order(self):
+        """Candidates are listed in the order discover_files checks them."""
+        service = DiscoveryService()
+        candidates = service._candidate_urls("https://example.com/docs")
+
+        assert candidates[0] == "https://example.com/docs/llms.txt"
+        assert candidates[1] == "https://example.com/llms.txt"
+        assert candidates.index("https://example.com/static/llms.txt") < candidates.index(
+            "https://example.com/docs/llms-full.txt"
+        )
+        assert candidates.index("https://example.com/sitemap.xml") < candidates.index(
+            "https://example.com/robots.txt"
+        )
+        assert len(candidates) == len(set(candidates))
+
+    @pytest.mark.asyncio
+    async def test_returns_highest_priority_hit_and_cancels_rest(self):
+        """A slower high-priority hit wins over faster lower-priority hits."""
+        service = DiscoveryService()
+        cancelled = []
+
+        async def fake_check(client, url):
+            try:
+                if url == "https://example.com/llms.txt":
+                    await asyncio.sleep(0.05)
+                    return True
+                if url.endswith("sitemap.xml"):
+                    return True
+                await asyncio.sleep(1)
+                return False
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+
+        with patch.object(service, "_check_url_exists_async", side_effect=fake_check):
+            result = await service.discover_files_async("https://example.com")
+
+        assert result == "https://example.com/llms.txt"
+        assert cancelled
+        assert all(url != "https://example.com/llms.txt" for url in cancelled)
+
+    @pytest.mark.asyncio
+    async def test_host_validation_is_cached_per_host(self):
+        """Concurrent probes for one host share a single DNS lookup."""
+        service = DiscoveryService()
+
+        with patch("socket.getaddrinfo", return_value=create_mock_dns_response()) as mock_dns:
+            results = await asyncio.gather(*[service._is_host_allowed("example.com") for _ in range(5)])
+            assert await service._is_host_allowed("example.com") is True
+
+        assert results == [True] * 5
+        assert mock_dns.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_blocks_private_hosts_and_redirects(self):
+        """Requests and redirect hops to unsafe hosts are rejected."""
+        service = DiscoveryService()
+
+        def fake_dns(host, *args, **kwargs):
+            ip = "127.0.0.1" if host == "internal.example" else "93.184.216.34"
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0))]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/llms.txt":
+                return httpx.Response(302, headers={"Location": "http://internal.example/llms.txt"})
+            if request.url.path == "/sitemap.xml":
+                return httpx.Response(200, text="<urlset/>")
+            return httpx.Response(404)
+
+        client_factory = partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+        with patch("socket.getaddrinfo", side_effect=fake_dns), patch(
+            "src.server.services.crawling.discovery_service.httpx.AsyncClient", client_factory
+        ):
+            result = await service.discover_files_async("https://example.com")
+
+        assert result == "https://example.com/sitemap.xml"
+        assert await service._is_host_allowed("internal.example") is False
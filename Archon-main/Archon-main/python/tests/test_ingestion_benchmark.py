@@ -0,0 +1,74 @@
+"""
+Tests for the ingestion benchmark harness.
+
+Runs a tiny zero-latency configuration through the real pipeline to make
+sure the harness stays wired to the functions it patches.
+"""
+
+import pytest
+
+from benchmarks.ingestion_benchmark import (
+    STAGES,
+    BenchmarkConfig,
+    FakeEmbeddingAdapter,
+    InMemorySupabase,
+    fake_embedding,
+    run_ingestion,
+    synthetic_pages,
+)
+from src.server.services.embeddings.embedding_exceptions import EmbeddingRateLimitError
+
+
+def test_fake_embedding_is_deterministic_and_normalized():
+    first = fake_embedding("hello", 64)
+    assert first == fake_embedding("hello", 64)
+    assert first != fake_embedding("world", 64)
+    assert sum(v * v for v in first) == pytest.approx(1.0)
+
+
+def test_synthetic_pages_are_reproducible():
+    pages = synthetic_pages(3, page_kb=2, seed=7)
+    assert pages == synthetic_pages(3, page_kb=2, seed=7)
+    assert all(len(page["markdown"]) >= 2048 for page in pages)
+
+
+@pytest.mark.asyncio
+async def test_fake_adapter_injects_rate_limits():
+    adapter = FakeEmbeddingAdapter(rate_limit_rate=1.0)
+    with pytest.raises(EmbeddingRateLimitError):
+        await adapter.create_embeddings(["text"], "model", dimensions=8)
+    assert adapter.rate_limited == 1
+
+
+def test_in_memory_supabase_supports_pipeline_queries():
+    client = InMemorySupabase()
+    client.table("archon_sources").upsert({"source_id": "s1", "title": "a"}).execute()
+    client.table("archon_sources").upsert({"source_id": "s1", "title": "b"}).execute()
+    assert [row["title"] for row in client.rows("archon_sources")] == ["b"]
+
+    client.table("archon_crawled_pages").insert([{"url": "u1"}, {"url": "u2"}]).execute()
+    client.table("archon_crawled_pages").delete().in_("url", ["u1"]).execute()
+    remaining = client.table("archon_crawled_pages").select("*").eq("url", "u2").execute()
+    assert len(remaining.data) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_ingestion_stores_every_chunk():
+    config = BenchmarkConfig(
+        pages=4,
+        page_kb=8,
+        embedding_batch_size=3,
+        embedding_dimensions=768,
+        embed_latency_ms=0,
+        embed_per_item_ms=0,
+        db_latency_ms=0,
+    )
+
+    result = await run_ingestion(config)
+
+    assert result.pages == 4
+    assert result.chunks > result.pages
+    assert result.chunks_stored == result.chunks
+    assert result.embedding_requests >= result.chunks // 3
+    assert set(STAGES) <= set(result.stage_seconds)
+    assert result.pages_per_second > 0
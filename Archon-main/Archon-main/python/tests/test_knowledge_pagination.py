@@ -0,0 +1,82 @@
+"""Tests for keyset pagination helpers and cached totals used by knowledge item browsing."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server.services.knowledge.knowledge_pagination import (
+    KnowledgeCountCache,
+    after_url_id_filter,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    """Test that cursors decode back to the encoded sort key."""
+    url = "https://docs.example.com/guide?a=1,b=(2)"
+    token = encode_cursor(url, 4217)
+
+    assert "=" not in token
+    assert decode_cursor(token, 2) == [url, 4217]
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", encode_cursor(1, 2, 3), encode_cursor("x")])
+def test_invalid_cursor_rejected(token):
+    """Test that malformed cursors and cursors of the wrong size raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(token, 2)
+
+
+def test_after_url_id_filter_quotes_url():
+    """Test that URLs with filter syntax characters are quoted for PostgREST."""
+    assert after_url_id_filter('https://x.com/a,b("q")', 7) == (
+        'url.gt."https://x.com/a,b(\\"q\\")",and(url.eq."https://x.com/a,b(\\"q\\")",id.gt.7)'
+    )
+
+
+def make_client(estimated: int, exact: int) -> MagicMock:
+    client = MagicMock()
+
+    def select(columns, count=None, head=False):
+        query = MagicMock()
+        query.eq.return_value = query
+        query.ilike.return_value = query
+        query.execute.return_value.count = estimated if count == "estimated" else exact
+        return query
+
+    client.from_.return_value.select.side_effect = select
+    return client
+
+
+@pytest.mark.asyncio
+async def test_count_cache_estimates_then_refreshes_exact():
+    """Test that the first total is an estimate and later requests get the exact count."""
+    cache = KnowledgeCountCache(ttl=60)
+    client = make_client(estimated=1000, exact=987)
+
+    assert await cache.get_total(client, "archon_crawled_pages", "source-1") == (1000, False)
+
+    # Let the background exact count finish
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+
+    assert await cache.get_total(client, "archon_crawled_pages", "source-1") == (987, True)
+    calls_before = client.from_.call_count
+    assert await cache.get_total(client, "archon_crawled_pages", "source-1") == (987, True)
+    assert client.from_.call_count == calls_before
+
+
+@pytest.mark.asyncio
+async def test_count_cache_invalidate():
+    """Test that invalidating a source drops only its cached totals."""
+    cache = KnowledgeCountCache(ttl=60)
+    client = make_client(estimated=10, exact=10)
+    await cache.get_total(client, "archon_crawled_pages", "source-1")
+    await cache.get_total(client, "archon_code_examples", "source-2")
+
+    cache.invalidate("source-1")
+
+    assert ("archon_crawled_pages", "source-1", None) not in cache._entries
+    assert ("archon_code_examples", "source-2", None) in cache._entries
@@ -0,0 +1,227 @@
+"""Tests for the continuous-frontier mode of RecursiveCrawlStrategy."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.server.services.crawling.helpers.crawl_checkpoint import CrawlCheckpoint
+from src.server.services.crawling.strategies.recursive import HostFrontier, RecursiveCrawlStrategy, extract_title
+
+SITE = {
+    "https://docs.example.com/": ["/a", "/b"],
+    "https://docs.example.com/a": ["/a1", "/a2", "/"],
+    "https://docs.example.com/b": ["/b1", "/guide.pdf"],
+    "https://docs.example.com/a1": ["/deep"],
+    "https://docs.example.com/a2": [],
+    "https://docs.example.com/b1": [],
+    "https://docs.example.com/deep": [],
+}
+
+
+class FakeCrawler:
+    """Crawler stub serving SITE, tracking concurrency per host."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.crawled = []
+        self.active = 0
+        self.max_active = 0
+
+    async def arun(self, url, config=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.001))
+            self.crawled.append(url)
+            links = [{"href": f"https://docs.example.com{path}"} for path in SITE.get(url, [])]
+            return SimpleNamespace(
+                url=url,
+                success=url in SITE,
+                markdown=SimpleNamespace(fit_markdown=f"content of {url}"),
+                html=f"<html><title>{url}</title></html>",
+                links={"internal": links},
+                error_message="not found",
+            )
+        finally:
+            self.active -= 1
+
+
+def make_strategy(crawler):
+    strategy = RecursiveCrawlStrategy(crawler, markdown_generator=MagicMock())
+    strategy.url_handler = MagicMock()
+    strategy.url_handler.is_binary_file.side_effect = lambda url: url.endswith(".pdf")
+    return strategy
+
+
+@pytest.fixture
+def settings():
+    values = {"CRAWL_FRONTIER_MODE": "continuous", "CRAWL_BATCH_SIZE": "2"}
+    with patch(
+        "src.server.services.crawling.strategies.recursive.credential_service.get_credentials_by_category",
+        new=AsyncMock(return_value=values),
+    ), patch(
+        "src.server.services.crawling.strategies.recursive.psutil.virtual_memory",
+        return_value=SimpleNamespace(percent=10.0),
+    ):
+        yield values
+
+
+async def crawl(
+    strategy, max_depth=3, max_concurrent=4, progress_callback=None, cancellation_check=None, checkpoint=None
+):
+    return await strategy.crawl_recursive_with_progress(
+        ["https://docs.example.com/#intro"],
+        transform_url_func=lambda url: url,
+        is_documentation_site_func=lambda url: True,
+        max_depth=max_depth,
+        max_concurrent=max_concurrent,
+        progress_callback=progress_callback,
+        cancellation_check=cancellation_check,
+        checkpoint=checkpoint,
+    )
+
+
+def test_extract_title():
+    assert extract_title("<html><TITLE> A &amp; B </TITLE></html>") == "A & B"
+    assert extract_title("<html></html>") == "Untitled"
+    assert extract_title(None) == "Untitled"
+
+
+@pytest.mark.asyncio
+async def test_crawls_each_page_once_up_to_max_depth(settings):
+    crawler = FakeCrawler()
+    results = await crawl(make_strategy(crawler), max_depth=3)
+
+    urls = {r["url"] for r in results}
+    assert urls == {
+        "https://docs.example.com/",
+        "https://docs.example.com/a",
+        "https://docs.example.com/b",
+        "https://docs.example.com/a1",
+        "https://docs.example.com/a2",
+        "https://docs.example.com/b1",
+    }
+    assert len(crawler.crawled) == len(set(crawler.crawled))
+    assert results[0]["title"] == "https://docs.example.com/"
+
+
+@pytest.mark.asyncio
+async def test_slow_page_does_not_block_next_depth(settings):
+    # /b is slow; /a's children should be crawled while it is still in flight
+    crawler = FakeCrawler(delays={"https://docs.example.com/b": 0.2})
+    await crawl(make_strategy(crawler), max_depth=3)
+
+    order = crawler.crawled
+    assert order.index("https://docs.example.com/a1") < order.index("https://docs.example.com/b")
+
+
+@pytest.mark.asyncio
+async def test_respects_per_host_cap(settings):
+    settings["CRAWL_MAX_PER_HOST"] = "1"
+    crawler = FakeCrawler()
+    results = await crawl(make_strategy(crawler), max_depth=3, max_concurrent=4)
+
+    assert crawler.max_active == 1
+    assert len(results) == 6
+
+
+def test_host_frontier_skips_capped_hosts_in_crawl_order():
+    frontier = HostFrontier(max_per_host=1)
+    for order, (depth, url) in enumerate([
+        (0, "https://a.example.com/1"),
+        (0, "https://a.example.com/2"),
+        (1, "https://b.example.com/1"),
+        (0, "https://c.example.com/1"),
+    ]):
+        frontier.push((depth, order, url))
+
+    assert frontier.pop() == ((0, 0, "https://a.example.com/1"), "a.example.com")
+    # a.example.com is at its cap, so its depth-0 page waits behind other hosts
+    assert frontier.pop() == ((0, 3, "https://c.example.com/1"), "c.example.com")
+    assert frontier.pop() == ((1, 2, "https://b.example.com/1"), "b.example.com")
+    assert frontier.pop() is None
+    assert len(frontier) == 1
+
+    frontier.release("a.example.com")
+    assert frontier.pop() == ((0, 1, "https://a.example.com/2"), "a.example.com")
+    assert len(frontier) == 0
+
+
+def test_host_frontier_new_head_jumps_the_queue():
+    frontier = HostFrontier(max_per_host=2)
+    frontier.push((2, 0, "https://a.example.com/deep"))
+    frontier.push((1, 1, "https://a.example.com/shallow"))
+
+    assert frontier.min_depth() == 1
+    assert [url for _, _, url in frontier.items()] == ["https://a.example.com/shallow", "https://a.example.com/deep"]
+    assert frontier.pop()[0][2] == "https://a.example.com/shallow"
+    assert frontier.pop()[0][2] == "https://a.example.com/deep"
+    assert frontier.pop() is None
+
+
+@pytest.mark.asyncio
+async def test_reports_progress_and_completion(settings):
+    progress_callback = AsyncMock()
+    await crawl(make_strategy(FakeCrawler()), max_depth=2, progress_callback=progress_callback)
+
+    messages = [call.args[2] for call in progress_callback.await_args_list]
+    assert any(m.startswith("Depth 1 completed: 1 pages crawled, 2 URLs found") for m in messages)
+    assert progress_callback.await_args_list[-1].args[:2] == ("crawling", 100)
+
+
+@pytest.mark.asyncio
+async def test_cancellation_stops_crawl(settings):
+    progress_callback = AsyncMock()
+    crawler = FakeCrawler()
+    calls = 0
+
+    def cancellation_check():
+        nonlocal calls
+        calls += 1
+        if calls > 2:
+            raise asyncio.CancelledError()
+
+    results = await crawl(
+        make_strategy(crawler),
+        progress_callback=progress_callback,
+        cancellation_check=cancellation_check,
+    )
+
+    assert len(results) < 6
+    assert progress_callback.await_args_list[-1].args[0] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_checkpoint_without_recrawling(settings, tmp_path):
+    interrupted = FakeCrawler()
+    calls = 0
+
+    def cancellation_check():
+        nonlocal calls
+        calls += 1
+        if calls > 2:
+            raise asyncio.CancelledError()
+
+    checkpoint = CrawlCheckpoint("resume-test", directory=str(tmp_path))
+    partial = await crawl(make_strategy(interrupted), cancellation_check=cancellation_check, checkpoint=checkpoint)
+    checkpoint.close()
+    assert 0 < len(partial) < 6
+
+    resumed_crawler = FakeCrawler()
+    checkpoint = CrawlCheckpoint("resume-test", directory=str(tmp_path))
+    results = await crawl(make_strategy(resumed_crawler), checkpoint=checkpoint)
+
+    assert {r["url"] for r in results} == {
+        "https://docs.example.com/",
+        "https://docs.example.com/a",
+        "https://docs.example.com/b",
+        "https://docs.example.com/a1",
+        "https://docs.example.com/a2",
+        "https://docs.example.com/b1",
+    }
+    assert not set(resumed_crawler.crawled) & set(interrupted.crawled)
+    assert checkpoint.frontier() == []
+    assert checkpoint.page_count == 6
+    checkpoint.close()
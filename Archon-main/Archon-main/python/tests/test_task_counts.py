@@ -111,4 +111,70 @@ def test_batch_task_counts_etag_caching(client, mock_supabase_client):
             assert response2.headers.get("ETag") == etag
             
             # Verify no body is returned on 304
-            assert response2.content == b''
\ No newline at end of file
+            assert response2.content == b''
+
+def test_task_counts_use_grouped_rpc():
+    """Test that task counts come from the grouped database function when available."""
+    from src.server.services.projects.task_service import TaskService
+
+    mock_client = MagicMock()
+    mock_client.rpc.return_value.execute.return_value.data = [
+        {"project_id": "project-1", "status": "todo", "task_count": 2},
+        {"project_id": "project-1", "status": "review", "task_count": 1},
+        {"project_id": "project-2", "status": "done", "task_count": 4},
+    ]
+
+    success, counts = TaskService(mock_client).get_all_project_task_counts()
+
+    assert success
+    assert counts == {
+        "project-1": {"todo": 2, "doing": 0, "review": 1, "done": 0},
+        "project-2": {"todo": 0, "doing": 0, "review": 0, "done": 4},
+    }
+    mock_client.rpc.assert_called_once_with("get_project_task_counts", {})
+    mock_client.table.assert_not_called()
+
+
+def test_task_counts_fall_back_to_rows_without_rpc():
+    """Test that task rows are counted when the grouped function is missing."""
+    from src.server.services.projects.task_service import TaskService
+
+    mock_client = MagicMock()
+    mock_client.rpc.side_effect = Exception("function get_project_task_counts() does not exist")
+    mock_client.table.return_value.select.return_value.or_.return_value.execute.return_value.data = [
+        {"project_id": "project-1", "status": "todo"},
+        {"project_id": "project-1", "status": "doing"},
+    ]
+
+    success, counts = TaskService(mock_client).get_all_project_task_counts()
+
+    assert success
+    assert counts == {"project-1": {"todo": 1, "doing": 1, "review": 0, "done": 0}}
+
+
+def test_task_counts_cached_until_task_write():
+    """Test that task counts are cached across instances and invalidated by task writes."""
+    from src.server.services.projects.change_journal import change_journal
+    from src.server.services.projects.task_service import TaskService
+
+    mock_client = MagicMock()
+    mock_client.rpc.return_value.execute.return_value.data = [
+        {"project_id": "project-1", "status": "todo", "task_count": 1},
+    ]
+
+    _, first = TaskService(mock_client).get_all_project_task_counts()
+    _, second = TaskService(mock_client).get_all_project_task_counts()
+    assert first == second
+    assert mock_client.rpc.call_count == 1
+
+    # Returned counts are copies; callers can't corrupt the cache
+    second["project-1"]["todo"] = 99
+
+    change_journal.bump("project-1")
+    mock_client.rpc.return_value.execute.return_value.data = [
+        {"project_id": "project-1", "status": "todo", "task_count": 2},
+    ]
+    _, third = TaskService(mock_client).get_all_project_task_counts()
+
+    assert mock_client.rpc.call_count == 2
+    assert third["project-1"]["todo"] == 2
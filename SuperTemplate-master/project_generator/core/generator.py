@@ -10,13 +10,12 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import re
 
 from .validator import ProjectValidator
 from .industry_config import IndustryConfig
 from ..templates.template_engine import TemplateEngine
 from ..templates.registry import TemplateRegistry
+from ..templates.materializer import TemplateMaterializer
 
 
 class ProjectGenerator:
@@ -80,9 +79,11 @@ class ProjectGenerator:
         # Determine workers
         auto_workers = max(2, (os.cpu_count() or 2) * 2)
         self.workers = getattr(self.args, 'workers', 0) or auto_workers
-        # Precompile placeholder regexes
-        self._placeholder_map = None
-        self._placeholder_regex = None
+        # Single-pass copy+render of template packs (reflinks untouched files where supported)
+        self.materializer = TemplateMaterializer(
+            link_mode=getattr(self.args, 'template_link_mode', None) or 'reflink',
+            workers=self.workers,
+        )
         # Rules manifest/telemetry containers
         self._rules_included_from_manifest: list[str] = []
         self._rules_selected_includes: list[str] = []
@@ -387,14 +388,11 @@ class ProjectGenerator:
         variant = 'enterprise' if self.args.industry in ['healthcare', 'finance', 'enterprise'] else 'base'
         variant_path = template_root / variant
         if variant_path.exists():
-            shutil.copytree(variant_path, frontend_dir, dirs_exist_ok=True)
+            self._materialize_pack(variant_path, frontend_dir)
         else:
             base_path = template_root / 'base'
             if base_path.exists():
-                shutil.copytree(base_path, frontend_dir, dirs_exist_ok=True)
-        
-        # Process templates with project-specific values
-        self._process_templates(frontend_dir)
+                self._materialize_pack(base_path, frontend_dir)
         
         # Add industry-specific components
         self._add_industry_components(frontend_dir, 'frontend')
@@ -412,12 +410,12 @@ class ProjectGenerator:
             if self.args.backend == 'nestjs' and getattr(self.args, 'nestjs_orm', 'typeorm') == 'prisma':
                 prisma_path = template_path / 'prisma'
                 if prisma_path.exists():
-                    shutil.copytree(prisma_path, backend_dir, dirs_exist_ok=True)
+                    self._materialize_pack(prisma_path, backend_dir)
                 else:
                     # Fallback to base if prisma variant missing
                     base_path = template_path / 'base'
                     if base_path.exists():
-                        shutil.copytree(base_path, backend_dir, dirs_exist_ok=True)
+                        self._materialize_pack(base_path, backend_dir)
             else:
                 # Use the appropriate template variant for other backends
                 variant = 'microservice' if self.args.project_type == 'microservices' else 'base'
@@ -425,15 +423,12 @@ class ProjectGenerator:
                 
                 variant_path = template_path / variant
                 if variant_path.exists():
-                    shutil.copytree(variant_path, backend_dir, dirs_exist_ok=True)
+                    self._materialize_pack(variant_path, backend_dir)
                 else:
                     # Fallback to base template
                     base_path = template_path / 'base'
                     if base_path.exists():
-                        shutil.copytree(base_path, backend_dir, dirs_exist_ok=True)
-        
-        # Process templates
-        self._process_templates(backend_dir)
+                        self._materialize_pack(base_path, backend_dir)
         
         # Add industry-specific APIs
         self._add_industry_components(backend_dir, 'backend')
@@ -447,18 +442,15 @@ class ProjectGenerator:
         template_path = Path(__file__).parent.parent.parent / 'template-packs' / 'database' / self.args.database
         
         if template_path.exists():
-            shutil.copytree(template_path, db_dir, dirs_exist_ok=True)
-        
-        # Process templates with project-specific values
-        self._process_templates(db_dir)
+            self._materialize_pack(template_path, db_dir)
         
         # Create docker-compose for database
         if self.args.database in ['postgres', 'mongodb']:
             self._add_database_to_docker_compose()
 
-    def _process_templates(self, root: Path):
-        """Process text templates by replacing simple placeholders with project values using a thread pool."""
-        mapping = {
+    def _placeholder_values(self) -> Dict[str, str]:
+        """Placeholder token -> project value mapping shared by template rendering paths."""
+        return {
             '{{PROJECT_NAME}}': self.args.name,
             '{{INDUSTRY}}': self.args.industry,
             '{{PROJECT_TYPE}}': self.args.project_type,
@@ -468,29 +460,10 @@ class ProjectGenerator:
             '{{AUTH}}': self.args.auth,
             '{{DEPLOY}}': self.args.deploy,
         }
-        # cache compiled regex
-        if self._placeholder_map is None:
-            self._placeholder_map = mapping
-            pattern = re.compile('|'.join(map(re.escape, mapping.keys())))
-            self._placeholder_regex = pattern
-        text_exts = {
-            '.md', '.mdc', '.txt', '.json', '.yml', '.yaml', '.toml', '.ini', '.env',
-            '.js', '.jsx', '.ts', '.tsx', '.py', '.go', '.html', '.css', '.scss', '.sh',
-            '.sql', '.example'
-        }
-        files: list[Path] = [p for p in root.rglob('*') if p.is_file() and p.suffix.lower() in text_exts]
-
-        def _process_one(p: Path):
-            try:
-                content = p.read_text()
-                content = self._placeholder_regex.sub(lambda m: str(self._placeholder_map[m.group(0)]), content)
-                p.write_text(content)
-                return True
-            except Exception:
-                return False
 
-        with ThreadPoolExecutor(max_workers=self.workers) as ex:
-            list(as_completed(ex.submit(_process_one, f) for f in files))
+    def _materialize_pack(self, source: Path, target: Path):
+        """Copy a template pack into target, rendering placeholders in the same pass."""
+        self.materializer.materialize(source, target, self._placeholder_values())
 
     def _add_industry_components(self, target_dir: Path, component_type: str):
         """Add industry-specific components (placeholder no-op)."""
@@ -4,5 +4,6 @@ Templates module for project generator
 """
 
 from .template_engine import TemplateEngine
+from .materializer import TemplateMaterializer
 
-__all__ = ['TemplateEngine']
\ No newline at end of file
+__all__ = ['TemplateEngine', 'TemplateMaterializer']
\ No newline at end of file
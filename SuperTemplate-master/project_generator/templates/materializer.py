@@ -0,0 +1,258 @@
+"""
+Single-pass template pack materialization.
+
+Copying a pack with ``shutil.copytree`` and then re-reading every text file to
+substitute placeholders writes each byte twice and walks the tree twice.  The
+:class:`TemplateMaterializer` instead visits each source file once: files that
+contain placeholders are rendered straight into the destination, everything
+else is reflinked, hard-linked (opt-in) or copied with the kernel fast path.
+
+Which files contain placeholders is recorded in a per-pack manifest keyed on
+file size and mtime, kept in memory and persisted as JSON so unchanged packs
+are never re-scanned.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+# Extensions that ProjectGenerator has always treated as renderable text
+TEXT_EXTENSIONS = frozenset({
+    '.md', '.mdc', '.txt', '.json', '.yml', '.yaml', '.toml', '.ini', '.env',
+    '.js', '.jsx', '.ts', '.tsx', '.py', '.go', '.html', '.css', '.scss', '.sh',
+    '.sql', '.example'
+})
+
+PLACEHOLDER_PATTERN = re.compile(rb'\{\{[A-Z][A-Z0-9_]*\}\}')
+MANIFEST_VERSION = 1
+LINK_MODES = ('copy', 'reflink', 'hardlink')
+
+# Linux FICLONE ioctl: share extents copy-on-write (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+
+@dataclass
+class PackEntry:
+    """Manifest record for a single file inside a template pack."""
+
+    size: int
+    mtime_ns: int
+    placeholders: List[str] = field(default_factory=list)
+
+
+@dataclass
+class MaterializeStats:
+    """Counters describing one materialization run."""
+
+    rendered: int = 0
+    linked: int = 0
+    copied: int = 0
+    bytes_written: int = 0
+
+
+def default_cache_dir() -> Path:
+    """Location of persisted pack manifests (``SUPERTEMPLATE_CACHE_DIR`` overrides)."""
+    override = os.environ.get('SUPERTEMPLATE_CACHE_DIR')
+    if override:
+        return Path(override) / 'pack-manifests'
+    return Path.home() / '.cache' / 'supertemplate' / 'pack-manifests'
+
+
+class TemplateMaterializer:
+    """Render template packs into a destination in a single pass"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, link_mode: str = 'reflink',
+                 workers: int = 4):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode: {link_mode} (expected one of {LINK_MODES})")
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+        self.link_mode = link_mode
+        self.workers = max(1, workers)
+        self._manifests: Dict[str, Dict[str, PackEntry]] = {}
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+    def _manifest_path(self, source: Path) -> Path:
+        key = hashlib.sha1(str(source).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{source.name}-{key}.json"
+
+    def _load_persisted(self, source: Path) -> Dict[str, PackEntry]:
+        path = self._manifest_path(source)
+        try:
+            payload = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if payload.get('version') != MANIFEST_VERSION or payload.get('source') != str(source):
+            return {}
+        return {rel: PackEntry(**entry) for rel, entry in payload.get('files', {}).items()}
+
+    def _persist(self, source: Path, entries: Dict[str, PackEntry]) -> None:
+        payload = {
+            'version': MANIFEST_VERSION,
+            'source': str(source),
+            'files': {rel: entry.__dict__ for rel, entry in entries.items()},
+        }
+        try:
+            path = self._manifest_path(source)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(payload), encoding='utf-8')
+            os.replace(tmp, path)
+        except OSError:
+            # The manifest is an optimisation only; an unwritable cache is not fatal
+            pass
+
+    @staticmethod
+    def _scan_placeholders(path: Path) -> List[str]:
+        if path.suffix.lower() not in TEXT_EXTENSIONS:
+            return []
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return []
+        return sorted({m.decode('ascii') for m in PLACEHOLDER_PATTERN.findall(data)})
+
+    def manifest(self, source: Path) -> Dict[str, PackEntry]:
+        """Return the placeholder manifest for ``source``, re-scanning only changed files."""
+        source = Path(source).resolve()
+        known = self._manifests.get(str(source))
+        if known is None:
+            known = self._load_persisted(source)
+
+        entries: Dict[str, PackEntry] = {}
+        changed = False
+        for rel, stat in _walk_files(source):
+            previous = known.get(rel)
+            if previous and previous.size == stat.st_size and previous.mtime_ns == stat.st_mtime_ns:
+                entries[rel] = previous
+                continue
+            entries[rel] = PackEntry(
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                placeholders=self._scan_placeholders(source / rel),
+            )
+            changed = True
+        if changed or len(entries) != len(known):
+            self._persist(source, entries)
+        self._manifests[str(source)] = entries
+        return entries
+
+    # ------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------
+    def materialize(self, source: Path, destination: Path, variables: Mapping[str, object],
+                    ignore: Optional[Callable[[str], bool]] = None) -> MaterializeStats:
+        """Write ``source`` into ``destination`` with ``{{KEY}}`` placeholders rendered.
+
+        ``variables`` maps full placeholder tokens (``'{{PROJECT_NAME}}'``) to
+        values.  Existing destination files are overwritten, matching
+        ``shutil.copytree(..., dirs_exist_ok=True)``.
+        """
+        source = Path(source).resolve()
+        destination = Path(destination)
+        entries = self.manifest(source)
+        replacements = {k.encode('utf-8'): str(v).encode('utf-8') for k, v in variables.items()}
+
+        stats = MaterializeStats()
+        tasks = []
+        for rel, entry in entries.items():
+            if ignore is not None and ignore(rel):
+                continue
+            target = destination / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tasks.append((source / rel, target, entry))
+
+        def _one(task):
+            src, dst, entry = task
+            if any(token.encode('utf-8') in replacements for token in entry.placeholders):
+                written = self._render(src, dst, replacements)
+                if written is not None:
+                    return 'rendered', written
+            return self._transfer(src, dst), entry.size
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for kind, size in pool.map(_one, tasks):
+                setattr(stats, kind, getattr(stats, kind) + 1)
+                if kind != 'linked':
+                    stats.bytes_written += size
+        return stats
+
+    @staticmethod
+    def _render(src: Path, dst: Path, replacements: Dict[bytes, bytes]) -> Optional[int]:
+        data = src.read_bytes()
+        try:
+            data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Not valid text; leave it byte-identical like the old read_text() failure path
+            return None
+        rendered = PLACEHOLDER_PATTERN.sub(lambda m: replacements.get(m.group(0), m.group(0)), data)
+        _unlink_existing(dst)
+        dst.write_bytes(rendered)
+        shutil.copymode(src, dst)
+        return len(rendered)
+
+    def _transfer(self, src: Path, dst: Path) -> str:
+        _unlink_existing(dst)
+        if self.link_mode == 'hardlink':
+            try:
+                os.link(src, dst)
+                return 'linked'
+            except OSError:
+                pass
+        elif self.link_mode == 'reflink' and _reflink(src, dst):
+            shutil.copymode(src, dst)
+            return 'linked'
+        shutil.copy2(src, dst)
+        return 'copied'
+
+
+def _walk_files(root: Path) -> Iterable:
+    """Yield ``(relative_posix_path, stat)`` for every regular file under ``root``."""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        stack.append(Path(entry.path))
+                    elif entry.is_file():
+                        rel = Path(entry.path).relative_to(root).as_posix()
+                        yield rel, entry.stat()
+        except FileNotFoundError:
+            continue
+
+
+def _unlink_existing(path: Path) -> None:
+    # Never write through a hard link that may point back into a template pack
+    if path.is_symlink() or path.exists():
+        path.unlink()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        try:
+            dst.unlink()
+        except OSError:
+            pass
+        return False
@@ -0,0 +1,57 @@
+"""
+Unit tests for single-pass template materialization
+"""
+
+from pathlib import Path
+
+from project_generator.templates.materializer import TemplateMaterializer
+
+
+def _make_pack(root: Path) -> Path:
+    pack = root / 'pack'
+    (pack / 'src').mkdir(parents=True)
+    (pack / 'README.md').write_text('# {{PROJECT_NAME}} ({{INDUSTRY}}) uses {{UNKNOWN}}\n')
+    (pack / 'src' / 'main.py').write_text('print("hello")\n')
+    (pack / 'logo.png').write_bytes(b'\x89PNG{{PROJECT_NAME}}\x00\xff')
+    return pack
+
+
+def test_materialize_renders_placeholders_and_copies_the_rest(tmp_path):
+    pack = _make_pack(tmp_path)
+    out = tmp_path / 'out'
+    materializer = TemplateMaterializer(cache_dir=tmp_path / 'cache', link_mode='copy')
+
+    stats = materializer.materialize(pack, out, {'{{PROJECT_NAME}}': 'demo', '{{INDUSTRY}}': 'finance'})
+
+    assert (out / 'README.md').read_text() == '# demo (finance) uses {{UNKNOWN}}\n'
+    assert (out / 'src' / 'main.py').read_text() == 'print("hello")\n'
+    # Binary extensions are never rendered, matching the previous text-extension filter
+    assert (out / 'logo.png').read_bytes() == (pack / 'logo.png').read_bytes()
+    assert stats.rendered == 1
+    assert stats.copied == 2
+
+
+def test_manifest_is_persisted_and_only_changed_files_rescanned(tmp_path):
+    pack = _make_pack(tmp_path)
+    cache = tmp_path / 'cache'
+    first = TemplateMaterializer(cache_dir=cache).manifest(pack)
+    assert first['README.md'].placeholders == ['{{INDUSTRY}}', '{{PROJECT_NAME}}', '{{UNKNOWN}}']
+    assert first['src/main.py'].placeholders == []
+
+    (pack / 'src' / 'main.py').write_text('name = "{{PROJECT_NAME}}"\n')
+    second = TemplateMaterializer(cache_dir=cache).manifest(pack)
+    assert second['src/main.py'].placeholders == ['{{PROJECT_NAME}}']
+    assert second['README.md'] == first['README.md']
+
+
+def test_hardlink_mode_never_writes_through_to_pack(tmp_path):
+    pack = _make_pack(tmp_path)
+    out = tmp_path / 'out'
+    materializer = TemplateMaterializer(cache_dir=tmp_path / 'cache', link_mode='hardlink')
+
+    materializer.materialize(pack, out, {'{{PROJECT_NAME}}': 'demo'})
+    # Re-materializing over linked outputs must replace, not modify, the shared inode
+    materializer.materialize(pack, out, {'{{PROJECT_NAME}}': 'other'})
+
+    assert (pack / 'README.md').read_text().startswith('# {{PROJECT_NAME}}')
+    assert (out / 'README.md').read_text().startswith('# other')
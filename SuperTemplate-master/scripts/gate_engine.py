@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""In-process gate execution engine for protocol gate configs.
+
+``run_protocol_gates.py`` used to spawn one ``python3 scripts/validate_*.py``
+subprocess per gate.  This engine keeps a small pool of long-lived worker
+processes instead: each worker imports a validator module the first time it
+sees it and then calls its ``main(argv)`` directly, so interpreter start-up
+and imports are paid once per worker rather than once per gate.
+
+Gates marked ``prerequisite: true`` run first; the remaining gates are
+independent and run concurrently.  Results are cached on disk keyed by the
+validator source, its command line, and the content hashes of its input
+artifacts, so unchanged gates are skipped on the next run.
+
+Commands that are not ``python``/``python3`` invocations of a ``.py`` file
+fall back to ``subprocess.run(shell=True)`` exactly as before.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import shlex
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+CACHE_FILENAME = "gate-cache.json"
+CACHE_VERSION = 1
+PYTHON_EXECUTABLES = {"python", "python3", Path(sys.executable).name}
+
+_MODULE_CACHE: Dict[str, ModuleType] = {}
+
+
+@dataclass
+class GateSpec:
+    """A single validator entry from ``config/protocol_gates/<id>.yaml``."""
+
+    name: str
+    command: str
+    prerequisite: bool = False
+    inputs: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_config(cls, validator: dict, default_inputs: Iterable[str]) -> "GateSpec":
+        command = validator["command"]
+        inputs = validator.get("inputs")
+        return cls(
+            name=validator.get("name", command),
+            command=command,
+            prerequisite=bool(validator.get("prerequisite", False)),
+            inputs=list(inputs if inputs is not None else default_inputs),
+        )
+
+
+def _split_python_command(command: str) -> Optional[List[str]]:
+    """Return ``[script, *args]`` when ``command`` runs a Python file, else ``None``."""
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if len(argv) < 2 or Path(argv[0]).name not in PYTHON_EXECUTABLES:
+        return None
+    if not argv[1].endswith(".py") or any(token in command for token in ("|", "&&", ";", ">")):
+        return None
+    return argv[1:]
+
+
+def _load_validator(script: str) -> ModuleType:
+    resolved = str(Path(script).resolve())
+    module = _MODULE_CACHE.get(resolved)
+    if module is None:
+        script_dir = str(Path(resolved).parent)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        module_name = f"_gate_{Path(resolved).stem}"
+        spec = importlib.util.spec_from_file_location(module_name, resolved)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load validator: {script}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _MODULE_CACHE[resolved] = module
+    return module
+
+
+def _run_subprocess(command: str) -> Dict[str, str]:
+    try:
+        completed = subprocess.run(
+            command,
+            shell=True,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        status = "pass"
+        notes = completed.stdout.strip()
+    except subprocess.CalledProcessError as exc:
+        status = "fail"
+        notes = (exc.stdout or "") + (exc.stderr or "")
+    return {"command": command, "status": status, "notes": notes.strip()}
+
+
+def _accepts_argv(entry: Callable[..., Any]) -> bool:
+    """True if ``entry`` can be called as ``main(argv)``."""
+    try:
+        inspect.signature(entry).bind(None)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _run_in_process(script: str, args: List[str], command: str) -> Tuple[Dict[str, str], bool]:
+    """Run a validator's ``main(argv)``; the flag is False when it crashed instead of reporting."""
+    module = _load_validator(script)
+    entry = getattr(module, "main", None)
+    if entry is None or not _accepts_argv(entry):
+        # Validators whose main() reads sys.argv itself keep running as subprocesses
+        return _run_subprocess(command), True
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    crashed = False
+    saved_argv = sys.argv
+    sys.argv = [script, *args]
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                code = entry(args)
+            except SystemExit as exc:
+                code = exc.code
+            except Exception as exc:  # validator crashed; report like a failing subprocess
+                print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
+                code = 1
+                crashed = True
+    finally:
+        sys.argv = saved_argv
+
+    if code is None or code == 0:
+        return {"command": command, "status": "pass", "notes": stdout.getvalue().strip()}, True
+    if isinstance(code, str):
+        stderr.write(code)
+    result = {
+        "command": command,
+        "status": "fail",
+        "notes": (stdout.getvalue() + stderr.getvalue()).strip(),
+    }
+    return result, not crashed
+
+
+def _execute_gate(command: str) -> Tuple[Dict[str, str], bool]:
+    """Run one gate command and report whether its result may be cached."""
+    python_argv = _split_python_command(command)
+    if python_argv is None or not Path(python_argv[0]).exists():
+        return _run_subprocess(command), True
+    return _run_in_process(python_argv[0], python_argv[1:], command)
+
+
+def run_gate_command(command: str) -> Dict[str, str]:
+    """Execute one gate command, in-process when it is a Python validator."""
+    return _execute_gate(command)[0]
+
+
+def _hash_file(path: Path) -> str:
+    if not path.is_file():
+        return "missing"
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def gate_cache_key(spec: GateSpec) -> str:
+    """Hash of everything that can change a gate's outcome."""
+    digest = hashlib.sha256()
+    digest.update(spec.command.encode("utf-8"))
+    python_argv = _split_python_command(spec.command)
+    if python_argv is not None:
+        digest.update(_hash_file(Path(python_argv[0])).encode("ascii"))
+    for entry in sorted(spec.inputs):
+        digest.update(b"\0" + entry.encode("utf-8") + b"=")
+        digest.update(_hash_file(Path(entry)).encode("ascii"))
+    return digest.hexdigest()
+
+
+class GateResultCache:
+    """JSON-backed map of gate name -> last result and its input hash."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = path
+        self._entries: Dict[str, dict] = {}
+        if path is not None and path.exists():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                payload = {}
+            if payload.get("version") == CACHE_VERSION:
+                self._entries = payload.get("gates", {})
+
+    def get(self, spec: GateSpec, key: str) -> Optional[Dict[str, str]]:
+        entry = self._entries.get(spec.name)
+        if entry and entry.get("key") == key and entry.get("command") == spec.command:
+            return entry["result"]
+        return None
+
+    def put(self, spec: GateSpec, key: str, result: Dict[str, str]) -> None:
+        self._entries[spec.name] = {"key": key, "command": spec.command, "result": result}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": CACHE_VERSION, "gates": self._entries}
+        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+class GateEngine:
+    """Run gate specs across a reusable worker pool with result caching."""
+
+    def __init__(self, jobs: Optional[int] = None, cache_path: Optional[Path] = None) -> None:
+        self.jobs = max(1, jobs or min(8, os.cpu_count() or 1))
+        self.cache = GateResultCache(cache_path)
+        self.cache_hits: List[str] = []
+
+    def run(self, specs: List[GateSpec]) -> List[Dict[str, str]]:
+        """Return one result per spec, in the order the specs were given."""
+        results: Dict[int, Dict[str, str]] = {}
+        cacheable: Dict[int, bool] = {}
+        keys = {index: gate_cache_key(spec) for index, spec in enumerate(specs)}
+        pending: List[int] = []
+        for index, spec in enumerate(specs):
+            cached = self.cache.get(spec, keys[index])
+            if cached is not None:
+                results[index] = cached
+                self.cache_hits.append(spec.name)
+            else:
+                pending.append(index)
+
+        prerequisites = [i for i in pending if specs[i].prerequisite]
+        independent = [i for i in pending if not specs[i].prerequisite]
+
+        if self.jobs == 1 or len(pending) <= 1:
+            for index in prerequisites + independent:
+                results[index], cacheable[index] = _execute_gate(specs[index].command)
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(pending))) as pool:
+                for index in prerequisites:
+                    results[index], cacheable[index] = pool.submit(_execute_gate, specs[index].command).result()
+                futures = {
+                    index: pool.submit(_execute_gate, specs[index].command)
+                    for index in independent
+                }
+                for index, future in futures.items():
+                    results[index], cacheable[index] = future.result()
+
+        # Crashed validators are re-run next time rather than replayed from the cache
+        for index in pending:
+            if cacheable[index]:
+                self.cache.put(specs[index], keys[index], results[index])
+        self.cache.save()
+        return [results[index] for index in range(len(specs))]
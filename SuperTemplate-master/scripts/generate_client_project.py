@@ -152,6 +152,10 @@ Examples:
     # Performance tuning
     parser.add_argument('--workers', type=int, default=0,
                         help='Number of worker threads for template processing (0=auto)')
+    parser.add_argument('--template-link-mode', dest='template_link_mode',
+                        choices=['copy', 'reflink', 'hardlink'], default='reflink',
+                        help='How unrendered template files are placed: reflink (copy-on-write, falls back to copy), '
+                             'hardlink (shares inodes with the template pack), or copy')
 
     # System checks relaxation for CI/local environments
     parser.add_argument('--skip-system-checks', action='store_true',
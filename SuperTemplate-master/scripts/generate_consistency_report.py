@@ -7,6 +7,11 @@ Generates comprehensive consistency report across all protocols:
 - Directive consistency matrix
 - AI persona transitions
 - Instruction conflict report
+
+Per-protocol extraction results are cached on disk keyed by protocol content
+hash (see ``protocol_analysis_cache.py``); only changed protocols are
+re-scanned, across a process pool, and the cross-protocol sections are reused
+when no protocol changed.
 """
 
 import argparse
@@ -18,13 +23,43 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from protocol_analysis_cache import (  # noqa: E402
+    DEFAULT_CACHE_DIR,
+    ProtocolAnalysisCache,
+    analyze_with_cache,
+    sha256_text,
+    source_fingerprint,
+)
+
+CACHE_FILENAME = "consistency-report-cache.json"
+REPORT_SECTIONS = (
+    "protocol_flow_map",
+    "directive_consistency_matrix",
+    "ai_persona_transitions",
+    "instruction_conflict_report",
+    "handoff_alignment",
+    "execution_simulation",
+)
+
+
+def _analyze_protocol_worker(workspace_root: str, protocol_id: str, content: str) -> Dict[str, Any]:
+    """Process-pool entry point for a single protocol analysis."""
+    return ConsistencyReportGenerator(workspace_root, use_cache=False)._analyze_protocol(protocol_id, content)
+
 
 class ConsistencyReportGenerator:
     """Generates comprehensive consistency reports."""
     
-    def __init__(self, workspace_root: str = "."):
+    def __init__(self, workspace_root: str = ".", use_cache: bool = True, jobs: Optional[int] = None):
         self.workspace_root = Path(workspace_root)
         self.ai_driven_workflow_dir = self.workspace_root / ".cursor" / "ai-driven-workflow"
+        self.dev_workflow_dir = self.ai_driven_workflow_dir
+        self.jobs = jobs
+        self.cache = ProtocolAnalysisCache(
+            self.workspace_root / DEFAULT_CACHE_DIR / CACHE_FILENAME if use_cache else None,
+            source_fingerprint(Path(__file__)),
+        )
         
         # Protocol files
         self.protocols = {
@@ -112,8 +147,8 @@ class ConsistencyReportGenerator:
             "issues": []
         }
         
-        # Analyze each protocol
-        protocol_data = {}
+        # Analyze each protocol (cached by content hash, misses run in a process pool)
+        jobs = []
         for protocol_id, protocol_file in self.protocols.items():
             protocol_path = self.dev_workflow_dir / protocol_file
             
@@ -128,10 +163,6 @@ class ConsistencyReportGenerator:
             
             try:
                 content = protocol_path.read_text(encoding='utf-8')
-                protocol_analysis = self._analyze_protocol(protocol_id, content)
-                protocol_data[protocol_id] = protocol_analysis
-                report["summary"]["analyzed"] += 1
-                
             except Exception as e:
                 report["issues"].append({
                     "severity": "critical",
@@ -139,14 +170,30 @@ class ConsistencyReportGenerator:
                     "message": f"Cannot analyze protocol: {str(e)}",
                     "fix": "Check file permissions and encoding"
                 })
-        
-        # Generate report sections
-        report["protocol_flow_map"] = self._generate_protocol_flow_map(protocol_data)
-        report["directive_consistency_matrix"] = self._generate_directive_matrix(protocol_data)
-        report["ai_persona_transitions"] = self._generate_persona_transitions(protocol_data)
-        report["instruction_conflict_report"] = self._generate_conflict_report(protocol_data)
-        report["handoff_alignment"] = self._generate_handoff_alignment(protocol_data)
-        report["execution_simulation"] = self._generate_execution_simulation(protocol_data)
+                continue
+            key = "protocol:" + sha256_text(protocol_id, content)
+            jobs.append((protocol_id, key, (str(self.workspace_root), protocol_id, content)))
+
+        protocol_data = analyze_with_cache(self.cache, jobs, _analyze_protocol_worker, self.jobs)
+        report["summary"]["analyzed"] = len(protocol_data)
+        
+        # Generate report sections; reuse them when no protocol changed
+        sections_key = "sections:" + sha256_text(*(key for _, key, _ in jobs))
+        sections = self.cache.get(sections_key)
+        if sections is None:
+            sections = {
+                "protocol_flow_map": self._generate_protocol_flow_map(protocol_data),
+                "directive_consistency_matrix": self._generate_directive_matrix(protocol_data),
+                "ai_persona_transitions": self._generate_persona_transitions(protocol_data),
+                "instruction_conflict_report": self._generate_conflict_report(protocol_data),
+                "handoff_alignment": self._generate_handoff_alignment(protocol_data),
+                "execution_simulation": self._generate_execution_simulation(protocol_data),
+            }
+            self.cache.put(sections_key, sections)
+        for name in REPORT_SECTIONS:
+            report[name] = sections[name]
+        self.cache.prune([key for _, key, _ in jobs] + [sections_key])
+        self.cache.save()
         
         # Calculate overall consistency score
         report["summary"]["consistency_score"] = self._calculate_consistency_score(report)
@@ -748,10 +795,12 @@ def main():
     parser.add_argument("--output", "-o", help="Output file for report (JSON)")
     parser.add_argument("--markdown", "-m", help="Output file for markdown report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyze every protocol, ignoring the cache")
+    parser.add_argument("--jobs", "-j", type=int, help="Worker processes for protocol analysis (default: CPU count)")
     
     args = parser.parse_args()
     
-    generator = ConsistencyReportGenerator(args.workspace)
+    generator = ConsistencyReportGenerator(args.workspace, use_cache=not args.no_cache, jobs=args.jobs)
     report = generator.generate_consistency_report()
     
     # Output results
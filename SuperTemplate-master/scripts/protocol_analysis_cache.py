@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Content-hash keyed cache for per-protocol analysis results.
+
+``generate_consistency_report.py`` and ``validate_protocol_identity.py`` both
+regex-scan every protocol markdown file on each run.  This module persists the
+extracted per-protocol structures on disk, keyed by the SHA-256 of everything
+that feeds the analysis (protocol content plus any extra inputs) and by a
+fingerprint of the analyzer source, so only changed protocols are re-analyzed.
+Cache misses are analyzed across a process pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path(".artifacts") / "cache"
+
+
+def sha256_text(*parts: str) -> str:
+    """Hash text parts with separators so ``("ab", "c") != ("a", "bc")``."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def source_fingerprint(*paths: Path) -> str:
+    """Hash analyzer source files; editing an analyzer invalidates its entries."""
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(str(path).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class ProtocolAnalysisCache:
+    """JSON-backed ``key -> result`` store scoped to one analyzer fingerprint."""
+
+    def __init__(self, path: Optional[Path], fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if payload.get("version") == CACHE_VERSION and payload.get("fingerprint") == fingerprint:
+                self.entries = payload.get("entries", {})
+
+    def get(self, key: str) -> Optional[Any]:
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        self.entries[key] = value
+        self._dirty = True
+
+    def prune(self, live_keys: Sequence[str]) -> None:
+        """Drop entries for protocol versions that no longer exist."""
+        live = set(live_keys)
+        stale = [key for key in self.entries if key not in live]
+        for key in stale:
+            del self.entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": CACHE_VERSION, "fingerprint": self.fingerprint, "entries": self.entries}
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def analyze_with_cache(
+    cache: ProtocolAnalysisCache,
+    jobs: List[Tuple[str, str, tuple]],
+    worker: Callable[..., Any],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return ``{name: result}`` for ``(name, cache_key, worker_args)`` jobs.
+
+    Cached keys are served from ``cache``; the rest are computed by calling
+    ``worker(*worker_args)`` in a process pool (``worker`` must be a
+    module-level function) and stored back.  Results keep ``jobs`` order.
+    """
+    results: Dict[str, Any] = {}
+    pending: List[Tuple[str, str, tuple]] = []
+    for name, key, args in jobs:
+        cached = cache.get(key)
+        if cached is not None:
+            results[name] = cached
+        else:
+            pending.append((name, key, args))
+
+    workers = max(1, max_workers or min(len(pending), os.cpu_count() or 1))
+    if len(pending) <= 1 or workers == 1:
+        computed = [worker(*args) for _, _, args in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            computed = list(pool.map(_call, [(worker, args) for _, _, args in pending]))
+
+    for (name, key, _), value in zip(pending, computed):
+        cache.put(key, value)
+        results[name] = value
+    return {name: results[name] for name, _, _ in jobs}
+
+
+def _call(item: Tuple[Callable[..., Any], tuple]) -> Any:
+    worker, args = item
+    return worker(*args)
@@ -4,18 +4,22 @@
 This prototype loads a YAML descriptor mapping validation steps for a protocol,
 executes available scripts, captures results, and writes an evidence manifest
 following ``documentation/evidence-manifest.schema.json``.
+
+Validators are executed by :mod:`gate_engine`, which imports Python validators
+once per worker process, runs independent gates concurrently, and skips gates
+whose inputs are unchanged since the last run.
 """
 
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import yaml
 
+from gate_engine import CACHE_FILENAME, GateEngine, GateSpec, run_gate_command
 from gate_utils import load_manifest_data, write_manifest
 
 CONFIG_DIR = Path("config/protocol_gates")
@@ -23,24 +27,7 @@ MANIFEST_ROOT = Path(".artifacts")
 
 
 def _run_command(command: str) -> Dict[str, str]:
-    try:
-        completed = subprocess.run(
-            command,
-            shell=True,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        status = "pass"
-        notes = completed.stdout.strip()
-    except subprocess.CalledProcessError as exc:
-        status = "fail"
-        notes = (exc.stdout or "") + (exc.stderr or "")
-    return {
-        "command": command,
-        "status": status,
-        "notes": notes.strip(),
-    }
+    return run_gate_command(command)
 
 
 def _load_protocol_config(protocol_id: str, config_dir: Path) -> Dict[str, object]:
@@ -50,22 +37,31 @@ def _load_protocol_config(protocol_id: str, config_dir: Path) -> Dict[str, objec
     return yaml.safe_load(config_path.read_text(encoding="utf-8"))
 
 
-def _execute_protocol(protocol_id: str, config: Dict[str, object]) -> None:
+def _execute_protocol(
+    protocol_id: str,
+    config: Dict[str, object],
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+) -> None:
     data = load_manifest_data(protocol_id)
     validators: List[dict] = []
     artifacts: List[dict] = []
+    manifest_dir = MANIFEST_ROOT / f"protocol-{protocol_id}"
 
-    for validator in config.get("validators", []):
-        command = validator["command"]
-        result = _run_command(command)
+    artifact_paths = [a["path"] for a in config.get("artifacts", []) if a.get("path")]
+    specs = [GateSpec.from_config(v, artifact_paths) for v in config.get("validators", [])]
+    engine = GateEngine(jobs=jobs, cache_path=manifest_dir / CACHE_FILENAME if use_cache else None)
+    for spec, result in zip(specs, engine.run(specs)):
         validators.append(
             {
-                "name": validator.get("name", command),
-                "command": command,
+                "name": spec.name,
+                "command": spec.command,
                 "status": result["status"],
                 "notes": result["notes"],
             }
         )
+    if engine.cache_hits:
+        print(f"Reused cached results for: {', '.join(engine.cache_hits)}")
 
     for artifact in config.get("artifacts", []):
         artifacts.append(
@@ -76,7 +72,6 @@ def _execute_protocol(protocol_id: str, config: Dict[str, object]) -> None:
             }
         )
 
-    manifest_dir = MANIFEST_ROOT / f"protocol-{protocol_id}"
     manifest_path = manifest_dir / "gate-manifest.json"
     write_manifest(manifest_path, data, artifacts, validators, notes=config.get("notes", ""))
     print(f"Manifest written to {manifest_path}")
@@ -91,13 +86,24 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         default=CONFIG_DIR,
         help=f"Directory containing protocol gate configs (default: {CONFIG_DIR})",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes for independent gates (default: min(8, CPUs))",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every gate even if its inputs are unchanged",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: List[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
     config = _load_protocol_config(args.protocol, args.config_dir)
-    _execute_protocol(args.protocol, config)
+    _execute_protocol(args.protocol, config, jobs=args.jobs, use_cache=not args.no_cache)
     return 0
 
 
@@ -6,10 +6,17 @@ import json
 import os
 import re
 import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from unified_workflow.core.template_index import PackRecord, TemplateIndex  # noqa: E402
+
 
 # -----------------------------
 # Utility: markdown summarization
@@ -94,10 +101,17 @@ def _extract_features(text: str, limit: int = 3) -> List[str]:
 
 
 def _summarize_template(base: Path, replacements: Dict[str, str]) -> str:
-    readme = _find_readme(base)
-    if not readme:
-        return f"No README found for template at {base}."
-    raw = _read_text(readme)
+    record = _pack_record(base.parent)
+    if record is not None and base.name in record.subdirs:
+        # Served from the template index; no README lookups on disk
+        raw = record.readme_for(base.name)
+        if raw is None:
+            return f"No README found for template at {base}."
+    else:
+        readme = _find_readme(base)
+        if not readme:
+            return f"No README found for template at {base}."
+        raw = _read_text(readme)
     if not raw:
         return f"Unable to read README for template at {base}."
     text = _replace_tokens(raw, replacements)
@@ -199,35 +213,42 @@ def _max_requirement(a: str, b: str) -> str:
 # Discovery & selection
 # -----------------------------
 
-ROOT = Path(__file__).resolve().parent.parent
 TPL_ROOT = ROOT / "template-packs"
+_INDEX: Optional[TemplateIndex] = None
+
 
+def _template_index() -> TemplateIndex:
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = TemplateIndex.load_or_build(TPL_ROOT)
+    return _INDEX
 
-def _read_json(p: Path) -> Dict:
+
+def _pack_record(pack_dir: Path) -> Optional[PackRecord]:
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+        kind = pack_dir.parent.relative_to(TPL_ROOT).as_posix()
+    except ValueError:
+        return None
+    return _template_index().get(kind, pack_dir.name)
+
+
+def _pack_has(kind: str, tech: str, variant: Optional[str] = None) -> bool:
+    record = _template_index().get(kind, tech)
+    if record is None:
+        return False
+    return variant is None or variant in record.subdirs
 
 
 def _manifest_for(kind: str, tech: str) -> Dict:
-    mp = TPL_ROOT / kind / tech / "template.manifest.json"
-    return _read_json(mp) if mp.exists() else {}
+    record = _template_index().get(kind, tech)
+    return dict(record.manifest) if record is not None else {}
 
 
 def _pkg_engines_node_for_frontend(tech: str) -> Optional[str]:
-    pkg = TPL_ROOT / "frontend" / tech / "base" / "package.json"
-    if not pkg.exists():
+    record = _template_index().get("frontend", tech)
+    if record is None:
         return None
-    try:
-        data = json.loads(pkg.read_text(encoding="utf-8"))
-        engines = data.get("engines", {})
-        node_req = engines.get("node")
-        if isinstance(node_req, str):
-            return node_req
-    except Exception:
-        return None
-    return None
+    return record.package_engines.get("base", {}).get("node")
 
 
 def _collect_engine_substitutions(
@@ -400,7 +421,7 @@ def main() -> int:
     # Validate requested tech exists
     missing: List[str] = []
     for kind, tech in [("frontend", args.frontend), ("backend", args.backend), ("database", args.database)]:
-        if not (TPL_ROOT / kind / tech).exists():
+        if not _pack_has(kind, tech):
             missing.append(f"template-packs/{kind}/{tech}")
     if missing:
         print("[SELECTION] Missing template technologies:\n - " + "\n - ".join(missing))
@@ -423,8 +444,8 @@ def main() -> int:
     # Frontend
     fe_dir = TPL_ROOT / "frontend" / args.frontend
     fe_variant = fe_variant_req
-    if not (fe_dir / fe_variant).exists():
-        if (fe_dir / "base").exists():
+    if not _pack_has("frontend", args.frontend, fe_variant):
+        if _pack_has("frontend", args.frontend, "base"):
             warnings.append(f"Downgraded frontend {args.frontend} {fe_variant_req} → base")
             fe_variant = "base"
         else:
@@ -435,16 +456,16 @@ def main() -> int:
     be_dir = TPL_ROOT / "backend" / args.backend
     be_variant = be_variant_req
     if args.backend == "nestjs" and args.nestjs_orm == "prisma":
-        if not (be_dir / "prisma").exists():
-            if (be_dir / "base").exists():
+        if not _pack_has("backend", args.backend, "prisma"):
+            if _pack_has("backend", args.backend, "base"):
                 warnings.append("Downgraded backend nestjs prisma → base")
                 be_variant = "base"
             else:
                 print(f"[SELECTION] Backend pack missing base folder: {be_dir}/base")
                 return 2
     else:
-        if not (be_dir / be_variant).exists():
-            if (be_dir / "base").exists():
+        if not _pack_has("backend", args.backend, be_variant):
+            if _pack_has("backend", args.backend, "base"):
                 warnings.append(f"Downgraded backend {args.backend} {be_variant_req} → base")
                 be_variant = "base"
             else:
@@ -453,7 +474,7 @@ def main() -> int:
 
     # Database
     db_dir = TPL_ROOT / "database" / args.database
-    if not (db_dir / "base").exists():
+    if not _pack_has("database", args.database, "base"):
         print(f"[SELECTION] Database pack missing base folder: {db_dir}/base")
         return 2
 
@@ -14,6 +14,10 @@ from pathlib import Path
 
 import pytest
 
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
 
 class TestProtocol01Validators:
     """Test Protocol 01 gate validators."""
@@ -373,5 +377,83 @@ class TestGateRunner:
             assert len(manifest["validators"]) == 1
 
 
+class TestGateEngine:
+    """Test in-process gate execution and result caching."""
+
+    def test_in_process_result_matches_subprocess(self):
+        """Test in-process execution reports the same status and notes as a subprocess."""
+        from gate_engine import _run_subprocess, run_gate_command
+
+        command = "python3 scripts/validate_gate_01_jobpost.py --input /nonexistent/file.json"
+        assert run_gate_command(command) == _run_subprocess(command)
+
+    def test_non_python_command_falls_back_to_shell(self):
+        """Test shell commands still run through subprocess."""
+        from gate_engine import run_gate_command
+
+        result = run_gate_command("echo gate-ok")
+        assert result == {"command": "echo gate-ok", "status": "pass", "notes": "gate-ok"}
+
+    def test_cache_skips_unchanged_inputs(self):
+        """Test cached results are reused until an input artifact changes."""
+        from gate_engine import GateEngine, GateSpec
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact = Path(tmpdir) / "input.json"
+            artifact.write_text("{}")
+            cache_path = Path(tmpdir) / "gate-cache.json"
+            specs = [
+                GateSpec(name="a", command="echo a", inputs=[str(artifact)]),
+                GateSpec(name="b", command="echo b", inputs=[str(artifact)]),
+            ]
+
+            first = GateEngine(jobs=2, cache_path=cache_path)
+            assert [r["notes"] for r in first.run(specs)] == ["a", "b"]
+            assert first.cache_hits == []
+
+            second = GateEngine(jobs=2, cache_path=cache_path)
+            second.run(specs)
+            assert second.cache_hits == ["a", "b"]
+
+            artifact.write_text('{"changed": true}')
+            third = GateEngine(jobs=2, cache_path=cache_path)
+            third.run(specs)
+            assert third.cache_hits == []
+
+    def test_argless_main_runs_as_subprocess(self):
+        """Test validators whose main() takes no argv are not called in-process."""
+        from gate_engine import run_gate_command
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = Path(tmpdir) / "validate_argless.py"
+            script.write_text(
+                "import sys\n"
+                "def main():\n"
+                "    print(sys.argv[1:])\n"
+                "if __name__ == '__main__':\n"
+                "    main()\n"
+            )
+            result = run_gate_command(f"python3 {script} --flag")
+            assert result["status"] == "pass"
+            assert result["notes"] == "['--flag']"
+
+    def test_crashed_validator_is_not_cached(self):
+        """Test a validator that raises is re-run instead of replayed from the cache."""
+        from gate_engine import GateEngine, GateSpec
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = Path(tmpdir) / "validate_crash.py"
+            script.write_text("def main(argv):\n    raise RuntimeError('boom')\n")
+            cache_path = Path(tmpdir) / "gate-cache.json"
+            specs = [GateSpec(name="crash", command=f"python3 {script}")]
+
+            first = GateEngine(jobs=1, cache_path=cache_path)
+            assert first.run(specs)[0]["status"] == "fail"
+
+            second = GateEngine(jobs=1, cache_path=cache_path)
+            assert second.run(specs)[0]["notes"] == "RuntimeError: boom"
+            assert second.cache_hits == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
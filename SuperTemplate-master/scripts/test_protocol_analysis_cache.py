@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for the content-hash keyed protocol analysis cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from protocol_analysis_cache import ProtocolAnalysisCache, analyze_with_cache, sha256_text  # noqa: E402
+from validate_protocol_identity import ProtocolIdentityValidator  # noqa: E402
+
+
+def _count_words(text: str) -> dict:
+    return {"words": len(text.split())}
+
+
+def test_only_changed_entries_are_recomputed(tmp_path):
+    """Second run hits the cache; a changed protocol is the only miss."""
+    cache_path = tmp_path / "cache.json"
+    texts = {"01": "alpha beta", "02": "gamma"}
+
+    def jobs():
+        return [(pid, sha256_text(pid, text), (text,)) for pid, text in texts.items()]
+
+    first = ProtocolAnalysisCache(cache_path, "fp")
+    assert analyze_with_cache(first, jobs(), _count_words, max_workers=2) == {
+        "01": {"words": 2},
+        "02": {"words": 1},
+    }
+    first.save()
+
+    texts["02"] = "gamma delta epsilon"
+    second = ProtocolAnalysisCache(cache_path, "fp")
+    result = analyze_with_cache(second, jobs(), _count_words)
+    assert result["02"] == {"words": 3}
+    assert (second.hits, second.misses) == (1, 1)
+
+
+def test_fingerprint_change_discards_entries(tmp_path):
+    """Entries written by a different analyzer version are ignored."""
+    cache_path = tmp_path / "cache.json"
+    cache = ProtocolAnalysisCache(cache_path, "v1")
+    cache.put("k", {"value": 1})
+    cache.save()
+
+    assert ProtocolAnalysisCache(cache_path, "v1").get("k") == {"value": 1}
+    assert ProtocolAnalysisCache(cache_path, "v2").get("k") is None
+
+
+def test_identity_validator_reuses_cached_results(tmp_path):
+    """Cached identity results match a fresh validation apart from the timestamp."""
+    protocols = tmp_path / ".cursor" / "ai-driven-workflow"
+    protocols.mkdir(parents=True)
+    (protocols / "01-sample.md").write_text(
+        "# PROTOCOL 01: Sample Protocol\n\n## PREREQUISITES\n- Required Artifacts\n",
+        encoding="utf-8",
+    )
+
+    fresh = ProtocolIdentityValidator(tmp_path).validate_protocol("01")
+    validator = ProtocolIdentityValidator(tmp_path)
+    cached = validator.validate_protocol("01")
+
+    assert validator.cache.hits == 1
+    fresh.pop("validation_timestamp")
+    cached.pop("validation_timestamp")
+    assert cached == fresh
@@ -3,6 +3,11 @@
 Protocol Identity Validator
 Validates protocol identity metadata, prerequisites, integration points, compliance, and documentation quality.
 Specification: documentation/validator-01-complete-spec.md
+
+Per-protocol results are cached on disk keyed by the protocol content, the
+AGENTS.md phase tables and the gate config's presence (see
+``protocol_analysis_cache.py``); ``--all`` re-validates only changed protocols,
+across a process pool.
 """
 
 import os
@@ -13,7 +18,25 @@ import re
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from protocol_analysis_cache import (  # noqa: E402
+    DEFAULT_CACHE_DIR,
+    ProtocolAnalysisCache,
+    analyze_with_cache,
+    sha256_text,
+    source_fingerprint,
+)
+
+CACHE_FILENAME = "protocol-identity-cache.json"
+
+
+def _validate_protocol_worker(workspace_root: str, protocol_id: str, content: str) -> Dict[str, Any]:
+    """Process-pool entry point for validating one protocol's content."""
+    validator = ProtocolIdentityValidator(Path(workspace_root), use_cache=False)
+    return validator._validate_content(protocol_id, content)
+
 
 class ProtocolIdentityValidator:
     """Validates protocol identity and documentation quality"""
@@ -33,17 +56,80 @@ class ProtocolIdentityValidator:
     
     VALID_PHASES = ["Phase 0", "Phase 1-2", "Phase 3", "Phase 4", "Phase 5", "Phase 6"]
     
-    def __init__(self, workspace_root: Path):
+    def __init__(self, workspace_root: Path, use_cache: bool = True, jobs: Optional[int] = None):
         self.workspace_root = workspace_root
         self.protocols_dir = workspace_root / ".cursor" / "ai-driven-workflow"
         self.agents_file = workspace_root / "AGENTS.md"
         self.gates_dir = workspace_root / "config" / "protocol_gates"
         self.output_dir = workspace_root / ".artifacts" / "validation"
-        
+        self.jobs = jobs
+        self.cache = self._open_cache(workspace_root, use_cache)
+        self._agents_content: Optional[str] = None
+
+    @staticmethod
+    def _open_cache(workspace_root: Path, use_cache: bool) -> ProtocolAnalysisCache:
+        path = workspace_root / DEFAULT_CACHE_DIR / CACHE_FILENAME if use_cache else None
+        return ProtocolAnalysisCache(path, source_fingerprint(Path(__file__)))
+
+    def _read_agents(self) -> str:
+        """Read AGENTS.md once per validator instance"""
+        if self._agents_content is None:
+            try:
+                self._agents_content = self.agents_file.read_text(encoding='utf-8')
+            except Exception:
+                self._agents_content = ""
+        return self._agents_content
+
+    def _cache_key(self, protocol_id: str, content: str) -> str:
+        gate_present = (self.gates_dir / f"{protocol_id}.yaml").exists()
+        return "identity:" + sha256_text(protocol_id, content, self._read_agents(), str(gate_present))
+
+    def _read_protocol(self, protocol_id: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return protocol content, or a failed result when it cannot be read"""
+        protocol_file = self._find_protocol_file(protocol_id)
+        if not protocol_file:
+            failure = self._empty_result(protocol_id)
+            failure["issues"].append(f"Protocol file not found for ID {protocol_id}")
+            return None, failure
+        try:
+            with open(protocol_file, 'r', encoding='utf-8') as f:
+                return f.read(), None
+        except Exception as e:
+            failure = self._empty_result(protocol_id)
+            failure["issues"].append(f"Failed to read protocol file: {str(e)}")
+            return None, failure
+
+    @staticmethod
+    def _stamp(result: Dict[str, Any]) -> Dict[str, Any]:
+        stamped = dict(result)
+        stamped["validation_timestamp"] = datetime.utcnow().isoformat() + "Z"
+        return stamped
+
     def validate_protocol(self, protocol_id: str) -> Dict[str, Any]:
         """Validate a single protocol across all dimensions"""
-        
-        result = {
+        return self.validate_protocols([protocol_id])[0]
+
+    def validate_protocols(self, protocol_ids: List[str]) -> List[Dict[str, Any]]:
+        """Validate several protocols, reusing cached results for unchanged content"""
+        failures: Dict[str, Dict[str, Any]] = {}
+        jobs = []
+        for protocol_id in protocol_ids:
+            content, failure = self._read_protocol(protocol_id)
+            if failure is not None:
+                failures[protocol_id] = failure
+                continue
+            jobs.append((protocol_id, self._cache_key(protocol_id, content),
+                         (str(self.workspace_root), protocol_id, content)))
+
+        validated = analyze_with_cache(self.cache, jobs, _validate_protocol_worker, self.jobs)
+        self.cache.save()
+        return [
+            self._stamp(failures[pid] if pid in failures else validated[pid])
+            for pid in protocol_ids
+        ]
+
+    def _empty_result(self, protocol_id: str) -> Dict[str, Any]:
+        return {
             "validator": "protocol_identity",
             "protocol_id": protocol_id,
             "validation_timestamp": datetime.utcnow().isoformat() + "Z",
@@ -57,23 +143,11 @@ class ProtocolIdentityValidator:
             "issues": [],
             "recommendations": []
         }
-        
-        # Find protocol file
-        protocol_file = self._find_protocol_file(protocol_id)
-        if not protocol_file:
-            result["issues"].append(f"Protocol file not found for ID {protocol_id}")
-            result["validation_status"] = "fail"
-            return result
-            
-        # Read protocol content
-        try:
-            with open(protocol_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            result["issues"].append(f"Failed to read protocol file: {str(e)}")
-            result["validation_status"] = "fail"
-            return result
-        
+
+    def _validate_content(self, protocol_id: str, content: str) -> Dict[str, Any]:
+        """Run all validation dimensions over already-read protocol content"""
+        result = self._empty_result(protocol_id)
+
         # Run all validation dimensions
         result["basic_information"] = self._validate_basic_information(protocol_id, content)
         result["prerequisites"] = self._validate_prerequisites(content)
@@ -442,13 +516,11 @@ class ProtocolIdentityValidator:
     
     def _get_phase_from_agents(self, protocol_id: str) -> str:
         """Get phase assignment from AGENTS.md"""
-        if not self.agents_file.exists():
+        agents_content = self._read_agents()
+        if not agents_content:
             return ""
         
         try:
-            with open(self.agents_file, 'r', encoding='utf-8') as f:
-                agents_content = f.read()
-            
             # Look for protocol in phase tables
             for phase in self.VALID_PHASES:
                 phase_section = self._extract_section(agents_content, phase)
@@ -612,11 +684,21 @@ def main():
         default=".",
         help="Workspace root directory"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate every protocol, ignoring cached results"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for validating changed protocols (default: CPU count)"
+    )
     
     args = parser.parse_args()
     
     workspace_root = Path(args.workspace).resolve()
-    validator = ProtocolIdentityValidator(workspace_root)
+    validator = ProtocolIdentityValidator(workspace_root, use_cache=not args.no_cache, jobs=args.jobs)
     
     all_results = []
     
@@ -640,8 +722,7 @@ def main():
         # Validate all protocols (01-27, excluding 00 and 28+)
         protocol_ids = [f"{i:02d}" for i in range(1, 28)]
         
-        for protocol_id in protocol_ids:
-            result = validator.validate_protocol(protocol_id)
+        for protocol_id, result in zip(protocol_ids, validator.validate_protocols(protocol_ids)):
             all_results.append(result)
             
             # Save individual result
@@ -0,0 +1,292 @@
+"""Prebuilt, versioned index of template packs.
+
+Template discovery used to walk every ``template-packs`` directory and re-read
+manifests, ``package.json`` engines and READMEs on every run of the registry,
+``scripts/select_stacks.py`` and the project generator.  This module compiles
+that information once into ``<search path>/.template-index.json`` and loads it
+back with a single read.
+
+Freshness is checked by comparing the recorded ``mtime_ns`` of every directory
+inside the indexed packs plus every metadata file the index captured.  Adding,
+removing or renaming any file changes its parent directory's mtime, and editing
+a manifest or README changes that file's mtime, so a stale index is detected
+without reading any file contents.
+
+Run ``python -m unified_workflow.core.template_index <search path>`` to prebuild
+the index (for example in a CI image).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".template-index.json"
+INDEX_VERSION = 1
+MANIFEST_FILENAME = "template.manifest.json"
+README_CANDIDATES = ("README.summary.md", "README.md")
+DEFAULT_TYPE_NAMES = ("backend", "frontend", "database", "devex", "cicd", "policy-dsl")
+
+
+@dataclass
+class PackRecord:
+    """Everything discovery needs to know about one template pack.
+
+    All paths are POSIX strings relative to the pack directory unless noted.
+    """
+
+    type: str
+    dir_name: str
+    relpath: str  # relative to the indexed search path
+    manifest: Dict[str, Any] = field(default_factory=dict)
+    subdirs: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    package_engines: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    readmes: Dict[str, str] = field(default_factory=dict)
+    texts: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.manifest.get("name", self.dir_name)
+
+    def readme_for(self, variant: str) -> Optional[str]:
+        """Return README text using ``select_stacks`` lookup order for ``variant``."""
+        relpath = self.readmes.get(variant)
+        return self.texts.get(relpath) if relpath else None
+
+
+class TemplateIndex:
+    """Loaded template-pack index for a single search path."""
+
+    def __init__(
+        self,
+        base_path: Path,
+        packs: List[PackRecord],
+        stamps: Dict[str, int],
+        type_names: Sequence[str],
+    ) -> None:
+        self.base_path = base_path
+        self.packs = packs
+        self.stamps = stamps
+        self.type_names = list(type_names)
+        self._by_key = {(p.type, p.dir_name): p for p in packs}
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def get(self, template_type: str, dir_name: str) -> Optional[PackRecord]:
+        """Return the pack stored at ``<template_type>/<dir_name>``."""
+        return self._by_key.get((template_type, dir_name))
+
+    def pack_path(self, record: PackRecord) -> Path:
+        return self.base_path / record.relpath
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    @property
+    def index_path(self) -> Path:
+        return self.base_path / INDEX_FILENAME
+
+    def is_fresh(self) -> bool:
+        """Return True when no recorded directory or metadata file changed."""
+        for relpath, mtime_ns in self.stamps.items():
+            try:
+                if os.stat(self.base_path / relpath).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def save(self) -> bool:
+        try:
+            # Create the file first so its directory entry does not invalidate
+            # the "." stamp, then write the payload in place.
+            self.index_path.touch(exist_ok=True)
+            self.stamps["."] = _mtime(self.base_path)
+            payload = {
+                "version": INDEX_VERSION,
+                "type_names": self.type_names,
+                "stamps": self.stamps,
+                "packs": [asdict(pack) for pack in self.packs],
+            }
+            self.index_path.write_text(json.dumps(payload), encoding="utf-8")
+        except OSError as exc:
+            # Read-only checkouts still work; they just rebuild in memory each run
+            logger.debug("Unable to write template index %s: %s", self.index_path, exc)
+            return False
+        return True
+
+    @classmethod
+    def load(cls, base_path: Path, type_names: Sequence[str] = DEFAULT_TYPE_NAMES) -> Optional["TemplateIndex"]:
+        """Load a persisted index, returning None if missing, foreign or stale."""
+        try:
+            payload = json.loads((base_path / INDEX_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("version") != INDEX_VERSION or payload.get("type_names") != list(type_names):
+            return None
+        packs = [PackRecord(**pack) for pack in payload.get("packs", [])]
+        index = cls(base_path, packs, payload.get("stamps", {}), type_names)
+        return index if index.is_fresh() else None
+
+    @classmethod
+    def build(cls, base_path: Path, type_names: Sequence[str] = DEFAULT_TYPE_NAMES) -> "TemplateIndex":
+        """Scan ``base_path`` the same way :class:`UnifiedTemplateRegistry` does."""
+        packs: List[PackRecord] = []
+        stamps: Dict[str, int] = {".": _mtime(base_path)}
+
+        for type_name in type_names:
+            type_dir = base_path / type_name
+            if not type_dir.is_dir():
+                continue
+            stamps[type_name] = _mtime(type_dir)
+            for pack_dir in type_dir.iterdir():
+                if pack_dir.is_dir():
+                    packs.append(_scan_pack(base_path, pack_dir, type_name, stamps))
+
+        # Top-level pack directories identified by a manifest
+        for item in base_path.iterdir():
+            if not item.is_dir() or item.name in type_names:
+                continue
+            manifest_path = item / MANIFEST_FILENAME
+            if not manifest_path.exists():
+                continue
+            stamps[_rel(base_path, item)] = _mtime(item)
+            manifest = _read_manifest(manifest_path)
+            type_name = _infer_type(manifest, item, type_names)
+            if type_name is None:
+                logger.warning(f"Could not determine type for template: {item}")
+                continue
+            packs.append(_scan_pack(base_path, item, type_name, stamps))
+
+        return cls(base_path, packs, stamps, type_names)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        base_path: Path,
+        type_names: Sequence[str] = DEFAULT_TYPE_NAMES,
+        persist: bool = True,
+    ) -> "TemplateIndex":
+        """Return a fresh index for ``base_path``, rebuilding and saving it if needed."""
+        base_path = Path(base_path)
+        index = cls.load(base_path, type_names)
+        if index is not None:
+            return index
+        index = cls.build(base_path, type_names)
+        if persist:
+            index.save()
+        return index
+
+
+def _mtime(path: Path) -> int:
+    return os.stat(path).st_mtime_ns
+
+
+def _rel(base: Path, path: Path) -> str:
+    return path.relative_to(base).as_posix()
+
+
+def _read_manifest(manifest_path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"Failed to read manifest at {manifest_path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _infer_type(manifest: Dict[str, Any], path: Path, type_names: Sequence[str]) -> Optional[str]:
+    declared = manifest.get("type")
+    if declared in type_names:
+        return declared
+    for part in path.parts:
+        if part in type_names:
+            return part
+    return None
+
+
+def _scan_pack(base_path: Path, pack_dir: Path, type_name: str, stamps: Dict[str, int]) -> PackRecord:
+    record = PackRecord(type=type_name, dir_name=pack_dir.name, relpath=_rel(base_path, pack_dir))
+
+    for root, dirs, files in os.walk(pack_dir):
+        root_path = Path(root)
+        stamps[_rel(base_path, root_path)] = _mtime(root_path)
+        dirs.sort()
+        for filename in sorted(files):
+            record.files.append(_rel(pack_dir, root_path / filename))
+
+    record.subdirs = sorted(
+        item.name for item in pack_dir.iterdir() if item.is_dir() and not item.name.startswith(".")
+    )
+
+    def capture(path: Path) -> Optional[str]:
+        if not path.is_file():
+            return None
+        relpath = _rel(pack_dir, path)
+        if relpath not in record.texts:
+            try:
+                record.texts[relpath] = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                return None
+            stamps[_rel(base_path, path)] = _mtime(path)
+        return relpath
+
+    manifest_path = pack_dir / MANIFEST_FILENAME
+    if manifest_path.exists():
+        record.manifest = _read_manifest(manifest_path)
+        stamps[_rel(base_path, manifest_path)] = _mtime(manifest_path)
+
+    # README lookup per variant mirrors select_stacks: variant first, then pack root
+    for variant in record.subdirs:
+        variant_dir = pack_dir / variant
+        for candidate in [variant_dir / name for name in README_CANDIDATES] + [
+            pack_dir / name for name in README_CANDIDATES
+        ]:
+            if candidate.exists():
+                relpath = capture(candidate)
+                if relpath:
+                    record.readmes[variant] = relpath
+                break
+
+        package_json = variant_dir / "package.json"
+        if package_json.is_file():
+            try:
+                engines = json.loads(package_json.read_text(encoding="utf-8")).get("engines", {})
+            except Exception:
+                engines = {}
+            stamps[_rel(base_path, package_json)] = _mtime(package_json)
+            if isinstance(engines, dict):
+                record.package_engines[variant] = {
+                    k: v for k, v in engines.items() if isinstance(v, str)
+                }
+
+    return record
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the template-pack index")
+    parser.add_argument("search_paths", nargs="+", type=Path, help="Template search paths to index")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the index is fresh")
+    args = parser.parse_args(argv)
+
+    for base_path in args.search_paths:
+        index = None if args.force else TemplateIndex.load(base_path)
+        state = "fresh"
+        if index is None:
+            index = TemplateIndex.build(base_path)
+            state = "written" if index.save() else "built (not writable)"
+        print(f"{index.index_path}: {len(index.packs)} packs, {state}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
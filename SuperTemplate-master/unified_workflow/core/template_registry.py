@@ -14,6 +14,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+from .template_index import TemplateIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,76 +130,29 @@ class UnifiedTemplateRegistry:
             priority: Priority index for the base path.
         """
         # Handle both the expected structure (template-packs/type/name/)
-        # and the actual structure (template-packs/type/name/ or template-packs/name/)
-        for type_enum in TemplateType:
-            type_dir = base_path / type_enum.value
-            if type_dir.exists() and type_dir.is_dir():
-                for template_dir in type_dir.iterdir():
-                    if template_dir.is_dir():
-                        self._register_template(template_dir, type_enum, priority)
-
-        # Also scan the base path for any template directories that contain manifests
-        # This handles the case where templates are directly in template-packs/
-        if base_path.exists() and base_path.is_dir():
-            for item in base_path.iterdir():
-                if item.is_dir() and item.name not in [t.value for t in TemplateType]:
-                    # This might be a template directory, check for manifest
-                    manifest_path = item / "template.manifest.json"
-                    if manifest_path.exists():
-                        # Try to infer type from path or manifest
-                        self._register_template_from_path(item, priority)
-
-    def _register_template_from_path(self, template_path: Path, priority: int) -> None:
-        """Register a template by inferring its type from path or manifest.
-
-        Args:
-            template_path: Path to the template directory.
-            priority: Priority index for the template.
-        """
-        try:
-            manifest_path = template_path / "template.manifest.json"
-            if not manifest_path.exists():
-                return
-
-            # Read manifest to get template info
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest_data = json.load(f)
-
-            template_name = manifest_data.get('name', template_path.name)
-            template_type_str = manifest_data.get('type', 'unknown')
-
-            # Try to match to a known template type
-            template_type = None
-            for type_enum in TemplateType:
-                if type_enum.value == template_type_str:
-                    template_type = type_enum
-                    break
-
-            if template_type is None:
-                # Try to infer from path
-                path_parts = template_path.parts
-                for part in path_parts:
-                    for type_enum in TemplateType:
-                        if type_enum.value == part:
-                            template_type = type_enum
-                            break
-                    if template_type:
-                        break
-
-                if template_type is None:
-                    logger.warning(f"Could not determine type for template: {template_path}")
-                    return
-
-            self._register_template(template_path, template_type, priority)
-
-        except Exception as e:
-            logger.warning(f"Failed to register template from path {template_path}: {e}")
+        # and the actual structure (template-packs/type/name/ or template-packs/name/).
+        # Discovery results are served from the prebuilt template index, which is
+        # rebuilt only when a pack directory or metadata file changes.
+        if not base_path.is_dir():
+            return
+        type_names = [t.value for t in TemplateType]
+        index = TemplateIndex.load_or_build(base_path, type_names)
+        for record in index.packs:
+            self._register_template(
+                index.pack_path(record),
+                TemplateType(record.type),
+                priority,
+                manifest_data=record.manifest,
+                subdirs=record.subdirs,
+            )
 
     def _register_template(
         self,
         template_path: Path,
         template_type: TemplateType,
         priority: int,
+        manifest_data: Optional[Dict[str, Any]] = None,
+        subdirs: Optional[List[str]] = None,
     ) -> None:
         """Register a single template.
 
@@ -205,22 +160,30 @@ class UnifiedTemplateRegistry:
             template_path: Path to the template directory.
             template_type: Type of the template.
             priority: Priority index for this template path.
+            manifest_data: Pre-loaded manifest (from the template index).
+                Read from disk when omitted.
+            subdirs: Pre-listed variant directories (from the template index).
+                Listed from disk when omitted.
         """
-        # Check for manifest file
-        manifest_path = template_path / "template.manifest.json"
-        manifest_data = {}
-        
-        if manifest_path.exists():
-            try:
-                manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            except Exception as e:
-                logger.warning(f"Failed to read manifest at {manifest_path}: {e}")
-        
+        if manifest_data is None:
+            # Check for manifest file
+            manifest_path = template_path / "template.manifest.json"
+            manifest_data = {}
+
+            if manifest_path.exists():
+                try:
+                    manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
+                except Exception as e:
+                    logger.warning(f"Failed to read manifest at {manifest_path}: {e}")
+
         # Detect variants (subdirectories)
-        variants = []
-        for item in template_path.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                variants.append(item.name)
+        if subdirs is None:
+            subdirs = [
+                item.name
+                for item in template_path.iterdir()
+                if item.is_dir() and not item.name.startswith(".")
+            ]
+        variants = list(subdirs)
         
         if not variants:
             variants = ["base"]
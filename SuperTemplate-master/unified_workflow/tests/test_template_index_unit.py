@@ -0,0 +1,62 @@
+"""Focused unit tests for the prebuilt template-pack index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from unified_workflow.core.template_index import INDEX_FILENAME, TemplateIndex
+
+
+def _make_pack(base: Path) -> Path:
+    pack = base / "frontend" / "react_app"
+    (pack / "base").mkdir(parents=True)
+    (pack / "template.manifest.json").write_text(
+        json.dumps({"name": "react", "engines": {"node": ">=18"}}), encoding="utf-8"
+    )
+    (pack / "README.md").write_text("# React\n\nPack level summary.\n", encoding="utf-8")
+    (pack / "base" / "package.json").write_text(
+        json.dumps({"engines": {"node": ">=20"}}), encoding="utf-8"
+    )
+    (pack / "base" / "index.ts").write_text("export {};\n", encoding="utf-8")
+    return pack
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_captures_pack_metadata(tmp_path: Path) -> None:
+    """Manifest, engines, README fallbacks and file lists are recorded."""
+
+    _make_pack(tmp_path)
+    index = TemplateIndex.load_or_build(tmp_path)
+    record = index.get("frontend", "react_app")
+
+    assert record is not None
+    assert record.name == "react"
+    assert record.subdirs == ["base"]
+    assert record.package_engines == {"base": {"node": ">=20"}}
+    assert record.readme_for("base").startswith("# React")
+    assert "base/index.ts" in record.files
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_index_reused_until_pack_changes(tmp_path: Path) -> None:
+    """A saved index loads fresh until a directory or metadata file changes."""
+
+    pack = _make_pack(tmp_path)
+    TemplateIndex.load_or_build(tmp_path)
+    assert TemplateIndex.load(tmp_path) is not None
+
+    (pack / "base" / "extra.ts").write_text("", encoding="utf-8")
+    _bump_mtime(pack / "base")
+    assert TemplateIndex.load(tmp_path) is None
+
+    rebuilt = TemplateIndex.load_or_build(tmp_path)
+    assert "base/extra.ts" in rebuilt.get("frontend", "react_app").files
+
+    _bump_mtime(pack / "template.manifest.json")
+    assert TemplateIndex.load(tmp_path) is None
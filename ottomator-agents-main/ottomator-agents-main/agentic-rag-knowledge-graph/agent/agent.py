@@ -16,6 +16,7 @@ from .tools import (
     vector_search_tool,
     graph_search_tool,
     hybrid_search_tool,
+    combined_search_tool,
     get_document_tool,
     list_documents_tool,
     get_entity_relationships_tool,
@@ -23,6 +24,7 @@ from .tools import (
     VectorSearchInput,
     GraphSearchInput,
     HybridSearchInput,
+    CombinedSearchInput,
     DocumentInput,
     DocumentListInput,
     EntityRelationshipInput,
@@ -178,6 +180,52 @@ async def hybrid_search(
     ]
 
 
+@rag_agent.tool
+async def combined_search(
+    ctx: RunContext[AgentDependencies],
+    query: str,
+    limit: int = 10,
+    text_weight: float = 0.3
+) -> List[Dict[str, Any]]:
+    """
+    Search document chunks and the knowledge graph together in one call.
+    
+    This tool runs the chunk search and the knowledge graph search
+    concurrently and merges them into a single ranking with reciprocal rank
+    fusion. Best when a question needs both supporting passages and facts or
+    relationships, instead of calling vector and graph search separately.
+    
+    Args:
+        query: Search query
+        limit: Maximum number of fused results to return (1-50)
+        text_weight: Weight for text similarity vs vector similarity (0.0-1.0)
+    
+    Returns:
+        Chunks and facts ranked by fused relevance score
+    """
+    input_data = CombinedSearchInput(
+        query=query,
+        limit=limit,
+        text_weight=text_weight
+    )
+    
+    _, _, fused_results = await combined_search_tool(input_data)
+    
+    # Convert results to dict for agent
+    return [
+        {
+            "type": r.result_type,
+            "content": r.content,
+            "score": r.score,
+            "document_title": r.document_title,
+            "document_source": r.document_source,
+            "valid_at": r.valid_at,
+            "invalid_at": r.invalid_at
+        }
+        for r in fused_results
+    ]
+
+
 @rag_agent.tool
 async def get_document(
     ctx: RunContext[AgentDependencies],
@@ -43,10 +43,12 @@ from .tools import (
     vector_search_tool,
     graph_search_tool,
     hybrid_search_tool,
+    combined_search_tool,
     list_documents_tool,
     VectorSearchInput,
     GraphSearchInput,
     HybridSearchInput,
+    CombinedSearchInput,
     DocumentListInput
 )
 
@@ -602,6 +604,36 @@ async def search_hybrid(request: SearchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/search/combined")
+async def search_combined(request: SearchRequest):
+    """Combined search endpoint: Postgres and knowledge graph in parallel, fused with RRF."""
+    try:
+        input_data = CombinedSearchInput(
+            query=request.query,
+            limit=request.limit,
+            use_hybrid=request.search_type != "vector"
+        )
+        
+        start_time = datetime.now()
+        results, graph_results, fused_results = await combined_search_tool(input_data)
+        end_time = datetime.now()
+        
+        query_time = (end_time - start_time).total_seconds() * 1000
+        
+        return SearchResponse(
+            results=results,
+            graph_results=graph_results,
+            fused_results=fused_results,
+            total_results=len(fused_results),
+            search_type="combined",
+            query_time_ms=query_time
+        )
+        
+    except Exception as e:
+        logger.error(f"Combined search failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/documents")
 async def list_documents_endpoint(
     limit: int = 20,
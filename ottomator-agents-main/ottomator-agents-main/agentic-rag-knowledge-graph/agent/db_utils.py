@@ -4,6 +4,7 @@ Database utilities for PostgreSQL connection and operations.
 
 import os
 import json
+import struct
 import asyncio
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
@@ -21,6 +22,52 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def encode_vector(value) -> bytes:
+    """
+    Encode an embedding in pgvector's binary format.
+    
+    Layout: int16 dimensions, int16 unused, then float32 values (big-endian).
+    Text literals ('[1.0,2.0]') are accepted for existing callers.
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+    dim = len(value)
+    return struct.pack(f">HH{dim}f", dim, 0, *value)
+
+
+def decode_vector(data: bytes) -> List[float]:
+    """Decode pgvector's binary format into a list of floats."""
+    dim, _ = struct.unpack_from(">HH", data)
+    return list(struct.unpack_from(f">{dim}f", data, 4))
+
+
+async def register_vector_codec(conn: asyncpg.Connection):
+    """
+    Register the binary pgvector codec on a connection.
+    
+    Embeddings are then sent as lists of floats in binary form instead of
+    being formatted into (and parsed from) text literals on every query.
+    """
+    schema = await conn.fetchval(
+        """
+        SELECT n.nspname FROM pg_type t
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE t.typname = 'vector'
+        """
+    )
+    if schema is None:
+        logger.warning("pgvector type not found; vector codec not registered")
+        return
+    
+    await conn.set_type_codec(
+        "vector",
+        schema=schema,
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary"
+    )
+
+
 class DatabasePool:
     """Manages PostgreSQL connection pool."""
     
@@ -45,7 +92,8 @@ class DatabasePool:
                 min_size=5,
                 max_size=20,
                 max_inactive_connection_lifetime=300,
-                command_timeout=60
+                command_timeout=60,
+                init=register_vector_codec
             )
             logger.info("Database connection pool initialized")
     
@@ -381,13 +429,10 @@ async def vector_search(
         List of matching chunks ordered by similarity (best first)
     """
     async with db_pool.acquire() as conn:
-        # Convert embedding to PostgreSQL vector string format
-        # PostgreSQL vector format: '[1.0,2.0,3.0]' (no spaces after commas)
-        embedding_str = '[' + ','.join(map(str, embedding)) + ']'
-        
+        # Embedding is sent as-is through the binary vector codec
         results = await conn.fetch(
             "SELECT * FROM match_chunks($1::vector, $2)",
-            embedding_str,
+            embedding,
             limit
         )
         
@@ -424,13 +469,10 @@ async def hybrid_search(
         List of matching chunks ordered by combined score (best first)
     """
     async with db_pool.acquire() as conn:
-        # Convert embedding to PostgreSQL vector string format
-        # PostgreSQL vector format: '[1.0,2.0,3.0]' (no spaces after commas)
-        embedding_str = '[' + ','.join(map(str, embedding)) + ']'
-        
+        # Embedding is sent as-is through the binary vector codec
         results = await conn.fetch(
             "SELECT * FROM hybrid_search($1::vector, $2, $3, $4)",
-            embedding_str,
+            embedding,
             query_text,
             limit,
             text_weight
@@ -21,6 +21,7 @@ class SearchType(str, Enum):
     VECTOR = "vector"
     HYBRID = "hybrid"
     GRAPH = "graph"
+    COMBINED = "combined"
 
 
 # Request Models
@@ -83,6 +84,21 @@ class GraphSearchResult(BaseModel):
     source_node_uuid: Optional[str] = None
 
 
+class FusedSearchResult(BaseModel):
+    """Chunk or graph fact ranked by reciprocal rank fusion."""
+    result_type: Literal["chunk", "fact"]
+    id: str
+    content: str
+    score: float
+    vector_rank: Optional[int] = None
+    graph_rank: Optional[int] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    document_title: Optional[str] = None
+    document_source: Optional[str] = None
+    valid_at: Optional[str] = None
+    invalid_at: Optional[str] = None
+
+
 class EntityRelationship(BaseModel):
     """Entity relationship model."""
     from_entity: str
@@ -95,6 +111,7 @@ class SearchResponse(BaseModel):
     """Search response model."""
     results: List[ChunkResult] = Field(default_factory=list)
     graph_results: List[GraphSearchResult] = Field(default_factory=list)
+    fused_results: List[FusedSearchResult] = Field(default_factory=list)
     total_results: int = 0
     search_type: SearchType
     query_time_ms: float
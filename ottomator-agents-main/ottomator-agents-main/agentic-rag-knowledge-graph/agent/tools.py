@@ -4,7 +4,8 @@ Tools for the Pydantic AI agent.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import asyncio
 
@@ -23,7 +24,7 @@ from .graph_utils import (
     get_entity_relationships,
     graph_client
 )
-from .models import ChunkResult, GraphSearchResult, DocumentMetadata
+from .models import ChunkResult, GraphSearchResult, DocumentMetadata, FusedSearchResult
 from .providers import get_embedding_client, get_embedding_model
 
 # Load environment variables
@@ -36,10 +37,93 @@ embedding_client = get_embedding_client()
 EMBEDDING_MODEL = get_embedding_model()
 
 
+class QueryEmbeddingCache:
+    """LRU cache of query embeddings that also coalesces concurrent identical requests."""
+    
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum number of cached embeddings
+        """
+        self.max_size = max_size
+        self.cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self.in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    async def get_or_create(self, model: str, text: str, create) -> List[float]:
+        """
+        Return the cached embedding or await `create(text)` once for all callers.
+        
+        Args:
+            model: Embedding model (part of the cache key)
+            text: Text to embed
+            create: Coroutine function producing the embedding
+        
+        Returns:
+            Embedding vector
+        """
+        key = (model, text)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+        
+        if key in self.in_flight:
+            self.hits += 1
+            return await asyncio.shield(self.in_flight[key])
+        
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            embedding = await create(text)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters see the error; mark it retrieved in case there are none
+            future.exception()
+            raise
+        finally:
+            self.in_flight.pop(key, None)
+        
+        future.set_result(embedding)
+        if self.max_size > 0:
+            self.cache[key] = embedding
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+        return embedding
+    
+    def clear(self):
+        """Drop all cached embeddings."""
+        self.cache.clear()
+
+
+# Shared by every query embedding caller (vector, hybrid and combined search)
+query_embedding_cache = QueryEmbeddingCache(
+    max_size=int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+)
+
+
+async def _create_embedding(text: str) -> List[float]:
+    response = await embedding_client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=text
+    )
+    return response.data[0].embedding
+
+
 async def generate_embedding(text: str) -> List[float]:
     """
     Generate embedding for text using OpenAI.
     
+    Results are cached in `query_embedding_cache`, and concurrent calls for
+    the same text share one API request.
+    
     Args:
         text: Text to embed
     
@@ -47,16 +131,92 @@ async def generate_embedding(text: str) -> List[float]:
         Embedding vector
     """
     try:
-        response = await embedding_client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=text
-        )
-        return response.data[0].embedding
+        return await query_embedding_cache.get_or_create(EMBEDDING_MODEL, text, _create_embedding)
     except Exception as e:
         logger.error(f"Failed to generate embedding: {e}")
         raise
 
 
+# Reciprocal rank fusion constant (Cormack et al.)
+RRF_K = 60
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def reciprocal_rank_fusion(
+    chunk_results: List[ChunkResult],
+    graph_results: List[GraphSearchResult],
+    limit: int = 10,
+    k: int = RRF_K
+) -> List[FusedSearchResult]:
+    """
+    Merge chunk and graph results by reciprocal rank fusion.
+    
+    Each result scores 1 / (k + rank) per list it appears in. Duplicates
+    (same id, or same normalized text) are merged and their scores summed.
+    
+    Args:
+        chunk_results: Vector or hybrid search results, best first
+        graph_results: Knowledge graph facts, best first
+        limit: Maximum fused results
+        k: RRF constant
+    
+    Returns:
+        Fused results ordered by RRF score
+    """
+    fused: Dict[str, FusedSearchResult] = {}
+    by_text: Dict[str, str] = {}
+    
+    def add(key: str, text: str, rank: int, build):
+        normalized = _normalize_text(text)
+        key = by_text.get(normalized, key)
+        entry = fused.get(key)
+        if entry is None:
+            entry = fused[key] = build()
+            by_text[normalized] = key
+        entry.score += 1.0 / (k + rank)
+        return entry
+    
+    for rank, chunk in enumerate(chunk_results, 1):
+        entry = add(
+            f"chunk:{chunk.chunk_id}",
+            chunk.content,
+            rank,
+            lambda: FusedSearchResult(
+                result_type="chunk",
+                id=chunk.chunk_id,
+                content=chunk.content,
+                score=0.0,
+                metadata=chunk.metadata,
+                document_title=chunk.document_title,
+                document_source=chunk.document_source
+            )
+        )
+        if entry.vector_rank is None:
+            entry.vector_rank = rank
+    
+    for rank, fact in enumerate(graph_results, 1):
+        entry = add(
+            f"fact:{fact.uuid}",
+            fact.fact,
+            rank,
+            lambda: FusedSearchResult(
+                result_type="fact",
+                id=fact.uuid,
+                content=fact.fact,
+                score=0.0,
+                valid_at=fact.valid_at,
+                invalid_at=fact.invalid_at
+            )
+        )
+        if entry.graph_rank is None:
+            entry.graph_rank = rank
+    
+    return sorted(fused.values(), key=lambda r: r.score, reverse=True)[:limit]
+
+
 # Tool Input Models
 class VectorSearchInput(BaseModel):
     """Input for vector search tool."""
@@ -76,6 +236,14 @@ class HybridSearchInput(BaseModel):
     text_weight: float = Field(default=0.3, description="Weight for text similarity (0-1)")
 
 
+class CombinedSearchInput(BaseModel):
+    """Input for combined graph + vector search."""
+    query: str = Field(..., description="Search query")
+    limit: int = Field(default=10, description="Maximum number of fused results")
+    use_hybrid: bool = Field(default=True, description="Use hybrid (vector + keyword) instead of pure vector search")
+    text_weight: float = Field(default=0.3, description="Weight for text similarity (0-1)")
+
+
 class DocumentInput(BaseModel):
     """Input for document retrieval."""
     document_id: str = Field(..., description="Document ID to retrieve")
@@ -213,6 +381,40 @@ async def hybrid_search_tool(input_data: HybridSearchInput) -> List[ChunkResult]
         return []
 
 
+async def combined_search_tool(
+    input_data: CombinedSearchInput
+) -> Tuple[List[ChunkResult], List[GraphSearchResult], List[FusedSearchResult]]:
+    """
+    Search Postgres and the knowledge graph concurrently and fuse the results.
+    
+    Args:
+        input_data: Search parameters
+    
+    Returns:
+        Tuple of (chunk results, graph results, fused results)
+    """
+    if input_data.use_hybrid:
+        chunk_search = hybrid_search_tool(HybridSearchInput(
+            query=input_data.query,
+            limit=input_data.limit,
+            text_weight=input_data.text_weight
+        ))
+    else:
+        chunk_search = vector_search_tool(VectorSearchInput(
+            query=input_data.query,
+            limit=input_data.limit
+        ))
+    
+    # Both tools already log and swallow their own failures
+    chunk_results, graph_results = await asyncio.gather(
+        chunk_search,
+        graph_search_tool(GraphSearchInput(query=input_data.query))
+    )
+    
+    fused = reciprocal_rank_fusion(chunk_results, graph_results, limit=input_data.limit)
+    return chunk_results, graph_results, fused
+
+
 async def get_document_tool(input_data: DocumentInput) -> Optional[Dict[str, Any]]:
     """
     Retrieve a complete document.
@@ -5,6 +5,7 @@ Semantic chunking implementation for intelligent document splitting.
 import os
 import re
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import asyncio
@@ -40,6 +41,7 @@ class ChunkingConfig:
     min_chunk_size: int = 100
     use_semantic_splitting: bool = True
     preserve_structure: bool = True
+    max_concurrent_splits: int = 4
     
     def __post_init__(self):
         """Validate configuration."""
@@ -47,6 +49,8 @@ class ChunkingConfig:
             raise ValueError("Chunk overlap must be less than chunk size")
         if self.min_chunk_size <= 0:
             raise ValueError("Minimum chunk size must be positive")
+        if self.max_concurrent_splits <= 0:
+            raise ValueError("Maximum concurrent splits must be positive")
 
 
 @dataclass
@@ -66,6 +70,97 @@ class DocumentChunk:
             self.token_count = len(self.content) // 4
 
 
+# Structural boundaries, applied in order (markdown headers, paragraph breaks,
+# list items, numbered lists, code blocks, tables)
+STRUCTURE_PATTERNS = [
+    re.compile(pattern, re.MULTILINE | re.DOTALL)
+    for pattern in (
+        r'\n#{1,6}\s+.+?\n',
+        r'\n\n+',
+        r'\n[-*+]\s+',
+        r'\n\d+\.\s+',
+        r'\n```.*?```\n',
+        r'\n\|\s*.+?\|\s*\n',
+    )
+]
+
+# A planned chunk: (start, end, needs_llm_split)
+ChunkPlan = List[Tuple[int, int, bool]]
+
+
+def split_structure_spans(content: str) -> List[Tuple[int, int]]:
+    """
+    Split content on structural boundaries, as (start, end) offsets.
+    
+    Separators are kept as their own sections and whitespace-only pieces are
+    dropped, without materializing intermediate strings.
+    
+    Args:
+        content: Content to split
+    
+    Returns:
+        List of section offsets in document order
+    """
+    spans = [(0, len(content))]
+    
+    for pattern in STRUCTURE_PATTERNS:
+        new_spans = []
+        for start, end in spans:
+            pos = start
+            for match in pattern.finditer(content, start, end):
+                for piece in ((pos, match.start()), (match.start(), match.end())):
+                    if content[piece[0]:piece[1]].strip():
+                        new_spans.append(piece)
+                pos = match.end()
+            if content[pos:end].strip():
+                new_spans.append((pos, end))
+        spans = new_spans
+    
+    return spans
+
+
+def plan_semantic_chunks(content: str, config: ChunkingConfig) -> ChunkPlan:
+    """
+    Group structural sections into chunk offsets.
+    
+    Consecutive sections are merged while the span they cover fits in
+    `chunk_size`. Sections longer than `max_chunk_size` are marked for an LLM
+    split. Pure CPU work, so it can run in a worker process.
+    
+    Args:
+        content: Document content
+        config: Chunking configuration
+    
+    Returns:
+        Planned chunks as (start, end, needs_llm_split)
+    """
+    plan: ChunkPlan = []
+    current: Optional[Tuple[int, int]] = None
+    
+    for start, end in split_structure_spans(content):
+        if current and end - current[0] <= config.chunk_size:
+            current = (current[0], end)
+            continue
+        if current is None and end - start <= config.chunk_size:
+            current = (start, end)
+            continue
+        
+        # Current chunk is ready, decide if we should split the section
+        if current:
+            plan.append((current[0], current[1], False))
+            current = None
+        
+        if end - start > config.max_chunk_size:
+            plan.append((start, end, True))
+        else:
+            current = (start, end)
+    
+    if current:
+        plan.append((current[0], current[1], False))
+    
+    return plan
+
+
 class SemanticChunker:
     """Semantic document chunker using LLM for intelligent splitting."""
     
@@ -79,13 +174,15 @@ class SemanticChunker:
         self.config = config
         self.client = embedding_client
         self.model = ingestion_model
+        self._split_semaphore: Optional[asyncio.Semaphore] = None
     
     async def chunk_document(
         self,
         content: str,
         title: str,
         source: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        plan: Optional[ChunkPlan] = None
     ) -> List[DocumentChunk]:
         """
         Chunk a document into semantically coherent pieces.
@@ -95,6 +192,7 @@ class SemanticChunker:
             title: Document title
             source: Document source
             metadata: Additional metadata
+            plan: Precomputed plan from `plan_semantic_chunks` (e.g. from a worker process)
         
         Returns:
             List of document chunks
@@ -111,7 +209,7 @@ class SemanticChunker:
         # First, try semantic chunking if enabled
         if self.config.use_semantic_splitting and len(content) > self.config.chunk_size:
             try:
-                semantic_chunks = await self._semantic_chunk(content)
+                semantic_chunks = await self._semantic_chunk(content, plan)
                 if semantic_chunks:
                     return self._create_chunk_objects(
                         semantic_chunks,
@@ -124,46 +222,37 @@ class SemanticChunker:
         # Fallback to rule-based chunking
         return self._simple_chunk(content, base_metadata)
     
-    async def _semantic_chunk(self, content: str) -> List[str]:
+    async def _semantic_chunk(self, content: str, plan: Optional[ChunkPlan] = None) -> List[str]:
         """
         Perform semantic chunking using LLM.
         
+        Chunks are built from offsets into the original content, and all
+        oversized sections are split by the LLM concurrently.
+        
         Args:
             content: Content to chunk
+            plan: Precomputed chunk plan
         
         Returns:
-            List of chunk boundaries
+            List of chunk texts
         """
-        # First, split on natural boundaries
-        sections = self._split_on_structure(content)
+        if plan is None:
+            plan = plan_semantic_chunks(content, self.config)
         
-        # Group sections into semantic chunks
-        chunks = []
-        current_chunk = ""
+        # Split every oversized section at once, bounded by the shared semaphore
+        split_results = await asyncio.gather(*[
+            self._split_long_section_bounded(content[start:end])
+            for start, end, needs_split in plan
+            if needs_split
+        ])
         
-        for section in sections:
-            # Check if adding this section would exceed chunk size
-            potential_chunk = current_chunk + "\n\n" + section if current_chunk else section
-            
-            if len(potential_chunk) <= self.config.chunk_size:
-                current_chunk = potential_chunk
+        chunks = []
+        splits = iter(split_results)
+        for start, end, needs_split in plan:
+            if needs_split:
+                chunks.extend(next(splits))
             else:
-                # Current chunk is ready, decide if we should split the section
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
-                
-                # Handle oversized sections
-                if len(section) > self.config.max_chunk_size:
-                    # Split the section semantically
-                    sub_chunks = await self._split_long_section(section)
-                    chunks.extend(sub_chunks)
-                else:
-                    current_chunk = section
-        
-        # Add the last chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+                chunks.append(content[start:end].strip())
         
         return [chunk for chunk in chunks if len(chunk.strip()) >= self.config.min_chunk_size]
     
@@ -177,27 +266,15 @@ class SemanticChunker:
         Returns:
             List of sections
         """
-        # Split on markdown headers, paragraphs, and other structural elements
-        patterns = [
-            r'\n#{1,6}\s+.+?\n',  # Markdown headers
-            r'\n\n+',            # Multiple newlines (paragraph breaks)
-            r'\n[-*+]\s+',       # List items
-            r'\n\d+\.\s+',       # Numbered lists
-            r'\n```.*?```\n',    # Code blocks
-            r'\n\|\s*.+?\|\s*\n', # Tables
-        ]
-        
-        # Split by patterns but keep the separators
-        sections = [content]
-        
-        for pattern in patterns:
-            new_sections = []
-            for section in sections:
-                parts = re.split(f'({pattern})', section, flags=re.MULTILINE | re.DOTALL)
-                new_sections.extend([part for part in parts if part.strip()])
-            sections = new_sections
-        
-        return sections
+        return [content[start:end] for start, end in split_structure_spans(content)]
+    
+    async def _split_long_section_bounded(self, section: str) -> List[str]:
+        """Split a long section, limiting concurrent LLM calls across documents."""
+        # Created lazily so it binds to the running event loop
+        if self._split_semaphore is None:
+            self._split_semaphore = asyncio.Semaphore(self.config.max_concurrent_splits)
+        async with self._split_semaphore:
+            return await self._split_long_section(section)
     
     async def _split_long_section(self, section: str) -> List[str]:
         """
@@ -449,6 +526,87 @@ class SimpleChunker:
         )
 
 
+def _simple_chunk_in_worker(
+    config: ChunkingConfig,
+    content: str,
+    title: str,
+    source: str,
+    metadata: Optional[Dict[str, Any]]
+) -> List[DocumentChunk]:
+    """Run SimpleChunker in a worker process."""
+    return SimpleChunker(config).chunk_document(content, title, source, metadata)
+
+
+async def _chunk_one(chunker, document: Dict[str, Any], executor: Executor) -> List[DocumentChunk]:
+    loop = asyncio.get_running_loop()
+    content = document["content"]
+    
+    if isinstance(chunker, SemanticChunker):
+        # Structural planning runs in the pool; LLM splits run on the event loop
+        plan = None
+        if chunker.config.use_semantic_splitting and len(content) > chunker.config.chunk_size:
+            plan = await loop.run_in_executor(executor, plan_semantic_chunks, content, chunker.config)
+        return await chunker.chunk_document(
+            content=content,
+            title=document["title"],
+            source=document["source"],
+            metadata=document.get("metadata"),
+            plan=plan
+        )
+    
+    return await loop.run_in_executor(
+        executor,
+        _simple_chunk_in_worker,
+        chunker.config,
+        content,
+        document["title"],
+        document["source"],
+        document.get("metadata")
+    )
+
+
+def schedule_chunking(
+    chunker,
+    documents: List[Dict[str, Any]],
+    executor: Executor
+) -> List["asyncio.Task[List[DocumentChunk]]"]:
+    """
+    Start chunking every document concurrently.
+    
+    Returns one task per document, in order, so callers can start embedding
+    a document as soon as its own chunks are ready.
+    
+    Args:
+        chunker: SemanticChunker or SimpleChunker
+        documents: Dicts with content, title, source and optional metadata
+        executor: Process pool for the CPU-bound work
+    
+    Returns:
+        List of chunking tasks
+    """
+    return [asyncio.create_task(_chunk_one(chunker, document, executor)) for document in documents]
+
+
+async def chunk_documents(
+    chunker,
+    documents: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[List[DocumentChunk]]:
+    """
+    Chunk many documents in parallel using a process pool.
+    
+    Args:
+        chunker: SemanticChunker or SimpleChunker
+        documents: Dicts with content, title, source and optional metadata
+        max_workers: Worker processes (default: CPU count)
+    
+    Returns:
+        Chunks for each document, in order
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return await asyncio.gather(*schedule_chunking(chunker, documents, executor))
+
+
 # Factory function
 def create_chunker(config: ChunkingConfig):
     """
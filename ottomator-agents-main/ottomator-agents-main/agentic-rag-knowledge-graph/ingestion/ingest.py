@@ -11,11 +11,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 import asyncpg
 from dotenv import load_dotenv
 
-from .chunker import ChunkingConfig, create_chunker, DocumentChunk
+from .chunker import ChunkingConfig, create_chunker, schedule_chunking, DocumentChunk
 from .embedder import create_embedder
 from .graph_builder import create_graph_builder
 
@@ -128,27 +130,14 @@ class DocumentIngestionPipeline:
         
         results = []
         
-        for i, file_path in enumerate(markdown_files):
-            try:
-                logger.info(f"Processing file {i+1}/{len(markdown_files)}: {file_path}")
-                
-                result = await self._ingest_single_document(file_path)
-                results.append(result)
-                
-                if progress_callback:
-                    progress_callback(i + 1, len(markdown_files))
-                
-            except Exception as e:
-                logger.error(f"Failed to process {file_path}: {e}")
-                results.append(IngestionResult(
-                    document_id="",
-                    title=os.path.basename(file_path),
-                    chunks_created=0,
-                    entities_extracted=0,
-                    relationships_created=0,
-                    processing_time_ms=0,
-                    errors=[str(e)]
-                ))
+        # Chunk documents in a process pool a few ahead of the one being
+        # embedded and stored, so the stages overlap without holding the
+        # whole corpus in memory
+        executor = ProcessPoolExecutor()
+        try:
+            await self._ingest_documents(markdown_files, executor, results, progress_callback)
+        finally:
+            executor.shutdown(cancel_futures=True)
         
         # Log summary
         total_chunks = sum(r.chunks_created for r in results)
@@ -158,12 +147,84 @@ class DocumentIngestionPipeline:
         
         return results
     
-    async def _ingest_single_document(self, file_path: str) -> IngestionResult:
+    async def _ingest_documents(
+        self,
+        markdown_files: List[str],
+        executor: ProcessPoolExecutor,
+        results: List[IngestionResult],
+        progress_callback: Optional[callable] = None
+    ):
+        """Embed and store each document as its chunks become ready."""
+        lookahead = os.cpu_count() or 1
+        pending_files = iter(markdown_files)
+        scheduled: deque = deque()
+        
+        def schedule_next():
+            file_path = next(pending_files, None)
+            if file_path is None:
+                return
+            try:
+                document = self._load_document(file_path)
+                chunk_task = schedule_chunking(self.chunker, [document], executor)[0]
+                scheduled.append((file_path, document, chunk_task, None))
+            except Exception as e:
+                scheduled.append((file_path, None, None, e))
+        
+        try:
+            for i in range(len(markdown_files)):
+                while len(scheduled) <= lookahead and len(scheduled) < len(markdown_files) - i:
+                    schedule_next()
+                file_path, document, chunk_task, load_error = scheduled.popleft()
+                try:
+                    logger.info(f"Processing file {i+1}/{len(markdown_files)}: {file_path}")
+                    
+                    if load_error is not None:
+                        raise load_error
+                    result = await self._ingest_single_document(file_path, document, chunk_task)
+                    results.append(result)
+                    
+                    if progress_callback:
+                        progress_callback(i + 1, len(markdown_files))
+                    
+                except Exception as e:
+                    logger.error(f"Failed to process {file_path}: {e}")
+                    results.append(IngestionResult(
+                        document_id="",
+                        title=os.path.basename(file_path),
+                        chunks_created=0,
+                        entities_extracted=0,
+                        relationships_created=0,
+                        processing_time_ms=0,
+                        errors=[str(e)]
+                    ))
+        finally:
+            for _, _, chunk_task, _ in scheduled:
+                if chunk_task is not None:
+                    chunk_task.cancel()
+    
+    def _load_document(self, file_path: str) -> Dict[str, Any]:
+        """Read a document with its title, source and metadata."""
+        content = self._read_document(file_path)
+        return {
+            "content": content,
+            "title": self._extract_title(content, file_path),
+            "source": os.path.relpath(file_path, self.documents_folder),
+            "metadata": self._extract_document_metadata(content, file_path)
+        }
+    
+    async def _ingest_single_document(
+        self,
+        file_path: str,
+        document: Optional[Dict[str, Any]] = None,
+        chunk_task: Optional["asyncio.Future[List[DocumentChunk]]"] = None
+    ) -> IngestionResult:
         """
         Ingest a single document.
         
         Args:
             file_path: Path to the document file
+            document: Preloaded document from `_load_document`
+            chunk_task: Chunking already in progress for this document
         
         Returns:
             Ingestion result
@@ -171,22 +232,24 @@ class DocumentIngestionPipeline:
         start_time = datetime.now()
         
         # Read document
-        document_content = self._read_document(file_path)
-        document_title = self._extract_title(document_content, file_path)
-        document_source = os.path.relpath(file_path, self.documents_folder)
-        
-        # Extract metadata from content
-        document_metadata = self._extract_document_metadata(document_content, file_path)
+        document = document or self._load_document(file_path)
+        document_content = document["content"]
+        document_title = document["title"]
+        document_source = document["source"]
+        document_metadata = document["metadata"]
         
         logger.info(f"Processing document: {document_title}")
         
-        # Chunk the document
-        chunks = await self.chunker.chunk_document(
-            content=document_content,
-            title=document_title,
-            source=document_source,
-            metadata=document_metadata
-        )
+        # Chunk the document (or wait for the scheduled chunking)
+        if chunk_task is not None:
+            chunks = await chunk_task
+        else:
+            chunks = await self.chunker.chunk_document(
+                content=document_content,
+                title=document_title,
+                source=document_source,
+                metadata=document_metadata
+            )
         
         if not chunks:
             logger.warning(f"No chunks created for {document_title}")
@@ -362,11 +425,10 @@ class DocumentIngestionPipeline:
                 
                 # Insert chunks
                 for chunk in chunks:
-                    # Convert embedding to PostgreSQL vector string format
+                    # Sent through the pool's binary vector codec
                     embedding_data = None
                     if hasattr(chunk, 'embedding') and chunk.embedding:
-                        # PostgreSQL vector format: '[1.0,2.0,3.0]' (no spaces after commas)
-                        embedding_data = '[' + ','.join(map(str, chunk.embedding)) + ']'
+                        embedding_data = chunk.embedding
                     
                     await conn.execute(
                         """
@@ -10,6 +10,9 @@ from datetime import datetime, timezone, timedelta
 
 from agent.db_utils import (
     DatabasePool,
+    encode_vector,
+    decode_vector,
+    register_vector_codec,
     create_session,
     get_session,
     update_session,
@@ -56,7 +59,8 @@ class TestDatabasePool:
                 min_size=5,
                 max_size=20,
                 max_inactive_connection_lifetime=300,
-                command_timeout=60
+                command_timeout=60,
+                init=register_vector_codec
             )
     
     @pytest.mark.asyncio
@@ -94,6 +98,48 @@ class TestDatabasePool:
             assert conn == mock_connection
 
 
+class TestVectorCodec:
+    """Test binary pgvector codec."""
+    
+    def test_round_trip(self):
+        """Test encoding and decoding preserve float32 values."""
+        embedding = [0.5, -1.25, 3.0]
+        data = encode_vector(embedding)
+        
+        assert len(data) == 4 + 4 * len(embedding)
+        assert decode_vector(data) == embedding
+    
+    def test_encode_text_literal(self):
+        """Test text literals encode like lists."""
+        assert encode_vector("[1.0,2.0]") == encode_vector([1.0, 2.0])
+    
+    @pytest.mark.asyncio
+    async def test_register_codec(self):
+        """Test codec registration uses the schema pgvector is installed in."""
+        conn = AsyncMock()
+        conn.fetchval.return_value = "extensions"
+        
+        await register_vector_codec(conn)
+        
+        conn.set_type_codec.assert_called_once_with(
+            "vector",
+            schema="extensions",
+            encoder=encode_vector,
+            decoder=decode_vector,
+            format="binary"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_register_codec_without_extension(self):
+        """Test registration is skipped when pgvector is missing."""
+        conn = AsyncMock()
+        conn.fetchval.return_value = None
+        
+        await register_vector_codec(conn)
+        
+        conn.set_type_codec.assert_not_called()
+
+
 class TestSessionManagement:
     """Test session management functions."""
     
@@ -332,10 +378,11 @@ class TestVectorSearch:
             assert results[0]["chunk_id"] == "chunk-1"
             assert results[0]["similarity"] == 0.95
             
-            # Check that match_chunks function was called
+            # Check that match_chunks function was called with the raw embedding
             mock_conn.fetch.assert_called_once()
             call_args = mock_conn.fetch.call_args
             assert "match_chunks" in call_args[0][0]
+            assert call_args[0][1] == embedding
     
     @pytest.mark.asyncio
     async def test_hybrid_search(self):
@@ -0,0 +1,116 @@
+"""
+Tests for agent search tools.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+from agent.models import ChunkResult, GraphSearchResult
+from agent.tools import QueryEmbeddingCache, reciprocal_rank_fusion, RRF_K
+
+
+def make_chunk(chunk_id: str, content: str) -> ChunkResult:
+    return ChunkResult(
+        chunk_id=chunk_id,
+        document_id="doc-1",
+        content=content,
+        score=0.9,
+        document_title="Test Doc",
+        document_source="test.md"
+    )
+
+
+class TestQueryEmbeddingCache:
+    """Test query embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_caches_by_model_and_text(self):
+        """Test repeated queries reuse the embedding."""
+        cache = QueryEmbeddingCache(max_size=10)
+        create = AsyncMock(return_value=[0.1, 0.2])
+
+        assert await cache.get_or_create("model", "query", create) == [0.1, 0.2]
+        assert await cache.get_or_create("model", "query", create) == [0.1, 0.2]
+        await cache.get_or_create("other-model", "query", create)
+
+        assert create.await_count == 2
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_requests(self):
+        """Test concurrent identical queries share one request."""
+        cache = QueryEmbeddingCache(max_size=10)
+        calls = 0
+
+        async def create(text):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [1.0]
+
+        results = await asyncio.gather(
+            *[cache.get_or_create("model", "query", create) for _ in range(5)]
+        )
+
+        assert results == [[1.0]] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test LRU eviction."""
+        cache = QueryEmbeddingCache(max_size=2)
+        create = AsyncMock(return_value=[0.0])
+
+        await cache.get_or_create("model", "a", create)
+        await cache.get_or_create("model", "b", create)
+        await cache.get_or_create("model", "a", create)
+        await cache.get_or_create("model", "c", create)
+
+        assert ("model", "a") in cache.cache
+        assert ("model", "b") not in cache.cache
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test failed requests propagate and are retried."""
+        cache = QueryEmbeddingCache(max_size=10)
+        create = AsyncMock(side_effect=[RuntimeError("boom"), [0.5]])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_create("model", "query", create)
+
+        assert await cache.get_or_create("model", "query", create) == [0.5]
+
+
+class TestReciprocalRankFusion:
+    """Test reciprocal rank fusion."""
+
+    def test_interleaves_by_rank(self):
+        """Test results from both lists are scored by rank."""
+        chunks = [make_chunk("c1", "First chunk"), make_chunk("c2", "Second chunk")]
+        facts = [GraphSearchResult(fact="A fact", uuid="f1")]
+
+        fused = reciprocal_rank_fusion(chunks, facts, limit=10)
+
+        assert [r.id for r in fused][:2] in (["c1", "f1"], ["f1", "c1"])
+        assert fused[-1].id == "c2"
+        assert fused[0].score == pytest.approx(1.0 / (RRF_K + 1))
+        assert {r.result_type for r in fused} == {"chunk", "fact"}
+
+    def test_merges_duplicates(self):
+        """Test duplicate content is merged and scores summed."""
+        chunks = [make_chunk("c1", "Google acquired DeepMind"), make_chunk("c1", "Google acquired DeepMind")]
+        facts = [GraphSearchResult(fact="google  acquired deepmind", uuid="f1")]
+
+        fused = reciprocal_rank_fusion(chunks, facts, limit=10)
+
+        assert len(fused) == 1
+        assert fused[0].vector_rank == 1
+        assert fused[0].graph_rank == 1
+        assert fused[0].score == pytest.approx(2.0 / (RRF_K + 1) + 1.0 / (RRF_K + 2))
+
+    def test_respects_limit(self):
+        """Test limit is applied after fusion."""
+        chunks = [make_chunk(f"c{i}", f"Chunk {i}") for i in range(5)]
+
+        assert len(reciprocal_rank_fusion(chunks, [], limit=3)) == 3
@@ -3,6 +3,7 @@ Tests for document chunking functionality.
 """
 
 import pytest
+import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 
 from ingestion.chunker import (
@@ -10,7 +11,10 @@ from ingestion.chunker import (
     DocumentChunk,
     SemanticChunker,
     SimpleChunker,
-    create_chunker
+    create_chunker,
+    chunk_documents,
+    plan_semantic_chunks,
+    split_structure_spans
 )
 
 
@@ -250,6 +254,88 @@ This is content under the section.
             assert all(len(chunk) <= config.max_chunk_size for chunk in chunks)
 
 
+class TestChunkPlanning:
+    """Test offset-based chunk planning and concurrent LLM splits."""
+    
+    def test_split_structure_spans_are_offsets(self):
+        """Test spans index into the original content."""
+        content = "Intro line.\n## Setup\nFirst paragraph.\n\n- item one\n- item two\n1. step"
+        
+        spans = split_structure_spans(content)
+        
+        # Separators are kept as sections; the blank-line break is dropped
+        assert spans == [(0, 11), (11, 21), (21, 37), (39, 49), (49, 52), (52, 60), (60, 64), (64, 68)]
+        assert [content[start:end] for start, end in spans] == [
+            "Intro line.",
+            "\n## Setup\n",
+            "First paragraph.",
+            "- item one",
+            "\n- ",
+            "item two",
+            "\n1. ",
+            "step",
+        ]
+    
+    def test_plan_merges_sections_and_marks_oversized(self):
+        """Test small sections are merged and long ones flagged for splitting."""
+        config = ChunkingConfig(chunk_size=100, chunk_overlap=10, max_chunk_size=200)
+        content = "Short one.\n\nShort two.\n\n" + "x" * 300 + "\n\nTail paragraph."
+        
+        plan = plan_semantic_chunks(content, config)
+        
+        assert plan[0] == (0, len("Short one.\n\nShort two."), False)
+        assert [needs_split for _, _, needs_split in plan] == [False, True, False]
+        assert content[plan[1][0]:plan[1][1]] == "x" * 300
+    
+    @pytest.mark.asyncio
+    async def test_oversized_sections_split_concurrently(self):
+        """Test LLM splits run concurrently up to the configured limit."""
+        config = ChunkingConfig(
+            chunk_size=100,
+            chunk_overlap=10,
+            max_chunk_size=150,
+            min_chunk_size=5,
+            max_concurrent_splits=2
+        )
+        chunker = SemanticChunker(config)
+        content = "\n\n".join(["Intro paragraph."] + [f"{i}" * 200 for i in range(4)])
+        
+        running = 0
+        peak = 0
+        
+        async def fake_split(section):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [section[:100], section[100:]]
+        
+        with patch.object(chunker, '_split_long_section', side_effect=fake_split):
+            chunks = await chunker._semantic_chunk(content)
+        
+        assert peak == 2
+        assert chunks[0] == "Intro paragraph."
+        assert chunks[1:] == [c for i in range(4) for c in (f"{i}" * 100, f"{i}" * 100)]
+    
+    @pytest.mark.asyncio
+    async def test_chunk_documents_with_process_pool(self):
+        """Test chunking many documents in worker processes."""
+        config = ChunkingConfig(chunk_size=50, chunk_overlap=10, use_semantic_splitting=False)
+        chunker = SimpleChunker(config)
+        documents = [
+            {"content": f"Paragraph {i}.\n\n" * 20, "title": f"Doc {i}", "source": f"doc{i}.md"}
+            for i in range(3)
+        ]
+        
+        results = await chunk_documents(chunker, documents, max_workers=2)
+        
+        assert len(results) == 3
+        for i, chunks in enumerate(results):
+            assert chunks
+            assert all(chunk.metadata["title"] == f"Doc {i}" for chunk in chunks)
+
+
 class TestFactoryFunction:
     """Test chunker factory function."""
     
@@ -13,8 +13,12 @@ Benefits:
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import List, Optional
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence
 import os
 
 from openai import AsyncOpenAI
@@ -24,21 +28,116 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Characters of the document included in every prompt
+DOCUMENT_EXCERPT_CHARS = 4000
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "contextual_enrichment.sqlite")
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ContextCache:
+    """Persistent SQLite cache of generated contexts keyed by (model, doc hash, chunk hash)."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Initialize context cache.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS contexts (
+                model TEXT NOT NULL,
+                doc_hash TEXT NOT NULL,
+                chunk_hash TEXT NOT NULL,
+                context TEXT NOT NULL,
+                PRIMARY KEY (model, doc_hash, chunk_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, model: str, doc_hash: str, chunk_hashes: Sequence[str]) -> Dict[str, str]:
+        """Return cached contexts for the given chunk hashes."""
+        found: Dict[str, str] = {}
+        unique = list(dict.fromkeys(chunk_hashes))
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT chunk_hash, context FROM contexts "
+                    f"WHERE model = ? AND doc_hash = ? AND chunk_hash IN ({placeholders})",
+                    [model, doc_hash, *batch]
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, model: str, doc_hash: str, contexts: Dict[str, str]):
+        """Store contexts keyed by chunk hash."""
+        if not contexts:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO contexts (model, doc_hash, chunk_hash, context) VALUES (?, ?, ?, ?)",
+                [(model, doc_hash, chunk_hash, context) for chunk_hash, context in contexts.items()]
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
 
 class ContextualEnricher:
     """Adds contextual information to document chunks."""
 
-    def __init__(self, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        cache: Optional[ContextCache] = None,
+        chunks_per_request: int = 20
+    ):
         """
         Initialize contextual enricher.
 
         Args:
             model: LLM model to use for context generation
+            cache: Persistent context cache (None disables caching)
+            chunks_per_request: Chunks sent together in document-level mode
         """
         self.model = model
         self.client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.cache = cache
+        self.chunks_per_request = max(1, chunks_per_request)
 
-    async def enrich_chunk(
+    @staticmethod
+    def _document_header(document_content: str, document_title: str, document_source: str) -> str:
+        """Document block shared by every prompt for the same document.
+
+        Keeping it first and byte-identical lets the provider reuse the cached
+        prompt prefix across requests for the same document.
+        """
+        document_excerpt = document_content[:DOCUMENT_EXCERPT_CHARS]
+        return f"""<document>
+Title: {document_title}
+Source: {document_source}
+
+{document_excerpt}
+</document>"""
+
+    async def generate_context(
         self,
         chunk_content: str,
         document_content: str,
@@ -46,26 +145,12 @@ class ContextualEnricher:
         document_source: str
     ) -> str:
         """
-        Add contextual prefix to a chunk.
+        Generate the context sentence(s) for a single chunk.
 
-        Args:
-            chunk_content: The chunk text to enrich
-            document_content: Full document content (or large excerpt)
-            document_title: Document title
-            document_source: Document source/filename
-
-        Returns:
-            Enriched chunk with contextual prefix
+        Raises:
+            Exception: If the LLM call fails
         """
-        # Limit document content to avoid token limits
-        document_excerpt = document_content[:4000] if len(document_content) > 4000 else document_content
-
-        prompt = f"""<document>
-Title: {document_title}
-Source: {document_source}
-
-{document_excerpt}
-</document>
+        prompt = f"""{self._document_header(document_content, document_title, document_source)}
 
 <chunk>
 {chunk_content}
@@ -79,15 +164,91 @@ Format your response as:
 
 Be concise and specific. Do not include any preamble or explanation, just the context sentence(s)."""
 
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0,
+            max_tokens=150
+        )
+        return response.choices[0].message.content.strip()
+
+    async def generate_contexts_for_group(
+        self,
+        chunks: Sequence[str],
+        document_content: str,
+        document_title: str,
+        document_source: str
+    ) -> Dict[int, str]:
+        """
+        Generate contexts for several chunks of one document in a single call.
+
+        Returns:
+            Mapping of position in `chunks` to context. Positions missing from
+            the mapping could not be parsed from the response.
+
+        Raises:
+            Exception: If the LLM call fails
+        """
+        chunk_blocks = "\n\n".join(
+            f'<chunk index="{i}">\n{chunk}\n</chunk>' for i, chunk in enumerate(chunks)
+        )
+        prompt = f"""{self._document_header(document_content, document_title, document_source)}
+
+{chunk_blocks}
+
+For each chunk above, provide a brief, 1-2 sentence context explaining what the chunk discusses in relation to the overall document.
+Each context should help someone understand its chunk without seeing the full document, in the form
+"This chunk from [document title] discusses [brief explanation]."
+
+Respond with JSON only, in exactly this shape, with one entry per chunk index:
+{{"contexts": [{{"index": 0, "context": "..."}}]}}"""
+
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0,
+            max_tokens=min(16000, 150 * len(chunks) + 100),
+            response_format={"type": "json_object"}
+        )
+
+        contexts: Dict[int, str] = {}
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0,
-                max_tokens=150
-            )
+            payload = json.loads(response.choices[0].message.content)
+            for item in payload.get("contexts", []):
+                index = int(item["index"])
+                context = str(item["context"]).strip()
+                if 0 <= index < len(chunks) and context:
+                    contexts[index] = context
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Could not parse document-level enrichment response: {e}")
+        return contexts
+
+    async def enrich_chunk(
+        self,
+        chunk_content: str,
+        document_content: str,
+        document_title: str,
+        document_source: str
+    ) -> str:
+        """
+        Add contextual prefix to a chunk.
 
-            context = response.choices[0].message.content.strip()
+        Args:
+            chunk_content: The chunk text to enrich
+            document_content: Full document content (or large excerpt)
+            document_title: Document title
+            document_source: Document source/filename
+
+        Returns:
+            Enriched chunk with contextual prefix
+        """
+        try:
+            context = await self.generate_context(
+                chunk_content,
+                document_content,
+                document_title,
+                document_source
+            )
 
             # Combine context with chunk
             enriched_chunk = f"{context}\n\n{chunk_content}"
@@ -106,17 +267,24 @@ Be concise and specific. Do not include any preamble or explanation, just the co
         document_content: str,
         document_title: str,
         document_source: str,
-        max_concurrent: int = 5
+        max_concurrent: int = 5,
+        document_level: bool = True
     ) -> List[str]:
         """
         Enrich multiple chunks with contextual information (with concurrency control).
 
+        Cached contexts are reused. In document-level mode the remaining chunks
+        are sent `chunks_per_request` at a time, each request carrying the
+        document once; chunks whose context is missing from the structured
+        response fall back to one call per chunk.
+
         Args:
             chunks: List of chunk texts to enrich
             document_content: Full document content
             document_title: Document title
             document_source: Document source
             max_concurrent: Maximum concurrent API calls
+            document_level: Enrich many chunks per call instead of one
 
         Returns:
             List of enriched chunks
@@ -126,51 +294,109 @@ Be concise and specific. Do not include any preamble or explanation, just the co
 
         logger.info(f"Enriching {len(chunks)} chunks with contextual information...")
 
+        doc_hash = _hash_text(self._document_header(document_content, document_title, document_source))
+        chunk_hashes = [_hash_text(chunk) for chunk in chunks]
+        contexts: Dict[str, str] = (
+            self.cache.get_many(self.model, doc_hash, chunk_hashes) if self.cache else {}
+        )
+        cached = len(contexts)
+
+        # Unique chunks still needing a context, keyed by hash
+        pending: Dict[str, str] = {}
+        for chunk, chunk_hash in zip(chunks, chunk_hashes):
+            if chunk_hash not in contexts:
+                pending.setdefault(chunk_hash, chunk)
+
         # Create tasks with semaphore for rate limiting
         semaphore = asyncio.Semaphore(max_concurrent)
+        generated: Dict[str, str] = {}
+
+        if document_level and pending:
+            items = list(pending.items())
+            groups = [
+                items[i:i + self.chunks_per_request]
+                for i in range(0, len(items), self.chunks_per_request)
+            ]
+
+            async def enrich_group(group):
+                async with semaphore:
+                    try:
+                        return group, await self.generate_contexts_for_group(
+                            [chunk for _, chunk in group],
+                            document_content,
+                            document_title,
+                            document_source
+                        )
+                    except Exception as e:
+                        logger.error(f"Document-level enrichment failed for {len(group)} chunks: {e}")
+                        return group, {}
+
+            for group, group_contexts in await asyncio.gather(*[enrich_group(g) for g in groups]):
+                for index, context in group_contexts.items():
+                    generated[group[index][0]] = context
+
+        missing = [(h, chunk) for h, chunk in pending.items() if h not in generated]
+        if document_level and missing:
+            logger.info(f"Falling back to per-chunk enrichment for {len(missing)} chunks")
 
         async def enrich_with_semaphore(chunk: str):
             async with semaphore:
-                return await self.enrich_chunk(
+                return await self.generate_context(
                     chunk,
                     document_content,
                     document_title,
                     document_source
                 )
 
-        # Execute all enrichments concurrently (but rate-limited)
-        enriched_chunks = await asyncio.gather(
-            *[enrich_with_semaphore(chunk) for chunk in chunks],
+        # Execute remaining enrichments concurrently (but rate-limited)
+        results = await asyncio.gather(
+            *[enrich_with_semaphore(chunk) for _, chunk in missing],
             return_exceptions=True
         )
+        for (chunk_hash, _), result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to enrich chunk: {result}")
+            else:
+                generated[chunk_hash] = result
+
+        if self.cache:
+            self.cache.put_many(self.model, doc_hash, generated)
+        contexts.update(generated)
 
-        # Handle any exceptions
         final_chunks = []
-        for i, result in enumerate(enriched_chunks):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to enrich chunk {i}: {result}")
+        for chunk, chunk_hash in zip(chunks, chunk_hashes):
+            context = contexts.get(chunk_hash)
+            if context is None:
                 # Use fallback
-                fallback = f"This chunk is from '{document_title}'.\n\n{chunks[i]}"
-                final_chunks.append(fallback)
-            else:
-                final_chunks.append(result)
+                context = f"This chunk is from '{document_title}'."
+            final_chunks.append(f"{context}\n\n{chunk}")
 
-        logger.info(f"Successfully enriched {len(final_chunks)} chunks")
+        logger.info(
+            f"Successfully enriched {len(final_chunks)} chunks "
+            f"({cached} cached, {len(generated)} generated)"
+        )
         return final_chunks
 
 
 # Factory function
-def create_contextual_enricher(model: str = "gpt-4o-mini") -> ContextualEnricher:
+def create_contextual_enricher(
+    model: str = "gpt-4o-mini",
+    cache_path: Optional[str] = None
+) -> ContextualEnricher:
     """
     Create a contextual enricher instance.
 
     Args:
         model: LLM model to use
+        cache_path: Context cache file (env CONTEXT_CACHE_PATH; empty string disables)
 
     Returns:
         ContextualEnricher instance
     """
-    return ContextualEnricher(model=model)
+    if cache_path is None:
+        cache_path = os.getenv("CONTEXT_CACHE_PATH", DEFAULT_CACHE_PATH)
+    cache = ContextCache(cache_path) if cache_path else None
+    return ContextualEnricher(model=model, cache=cache)
 
 
 # Example usage
@@ -21,7 +21,6 @@ from dataclasses import dataclass
 
 from dotenv import load_dotenv
 from pydantic_ai import Agent, RunContext
-from sentence_transformers import CrossEncoder
 
 # Load environment variables
 load_dotenv(".env")
@@ -31,9 +30,12 @@ logger = logging.getLogger(__name__)
 # Global database pool
 db_pool = None
 
-# Initialize cross-encoder for re-ranking
+# Cross-encoder re-ranking service (see initialize_reranker)
 reranker = None
 
+# Shared query embedder (see get_embedder)
+embedder = None
+
 
 async def initialize_db():
     """Initialize database connection pool."""
@@ -57,12 +59,22 @@ async def close_db():
 
 
 def initialize_reranker():
-    """Initialize cross-encoder model for re-ranking."""
+    """Start the shared cross-encoder re-ranking service."""
     global reranker
     if reranker is None:
-        logger.info("Loading cross-encoder model for re-ranking...")
-        reranker = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-6-v2')
-        logger.info("Cross-encoder loaded")
+        from utils.reranker import RerankerService
+        reranker = RerankerService()
+    reranker.start()
+    return reranker
+
+
+def get_embedder():
+    """Return the shared embedding generator, creating it on first use."""
+    global embedder
+    if embedder is None:
+        from ingestion.embedder import create_embedder
+        embedder = create_embedder()
+    return embedder
 
 
 # ======================
@@ -111,67 +123,114 @@ Return only the 3 variations, one per line, without numbers or bullets."""
 # STRATEGY 2 & 3: MULTI-QUERY RAG (parallel search with variations)
 # ======================
 
-async def search_with_multi_query(ctx: RunContext[None], query: str, limit: int = 5) -> str:
+# Multi-query retrieval engine: one embedding request and one DB round-trip
+# for all query variations, fused with reciprocal-rank fusion.
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(result_lists: List[List[Any]], k: int = RRF_K) -> List[Dict[str, Any]]:
     """
-    Search using multiple query variations in parallel (Multi-Query RAG).
+    Fuse ranked result lists with reciprocal-rank fusion.
 
-    This combines query expansion with parallel execution for better recall.
+    Each chunk scores sum(1 / (k + rank)) over the lists it appears in, so
+    chunks ranked well by several query variations rise to the top.
 
     Args:
-        query: The search query
-        limit: Results per query variation
+        result_lists: One list of match_chunks rows per query, best first
+        k: RRF damping constant
 
     Returns:
-        Formatted deduplicated search results
+        Unique rows (as dicts with an added 'rrf_score'), best first
     """
-    try:
-        if not db_pool:
-            await initialize_db()
+    fused: Dict[Any, Dict[str, Any]] = {}
+    for results in result_lists:
+        for rank, row in enumerate(results, 1):
+            entry = fused.get(row['chunk_id'])
+            if entry is None:
+                entry = fused[row['chunk_id']] = {**dict(row), 'rrf_score': 0.0}
+            entry['rrf_score'] += 1.0 / (k + rank)
+            entry['similarity'] = max(entry['similarity'], row['similarity'])
+    return sorted(fused.values(), key=lambda x: x['rrf_score'], reverse=True)
+
+
+async def multi_query_search(queries: List[str], limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Run several queries as a single batched vector search.
 
-        # Generate query variations
-        queries = await expand_query_variations(ctx, query)
-        logger.info(f"Multi-query search with {len(queries)} variations")
+    All queries are embedded in one batch request and matched with a single
+    match_chunks_multi call. If the database predates that function, the
+    per-query searches run concurrently on separate pooled connections.
 
-        # Generate embeddings for all queries
-        from ingestion.embedder import create_embedder
-        embedder = create_embedder()
+    Args:
+        queries: Query strings (duplicates and blanks are ignored)
+        limit: Results per query and in the fused output
 
-        # Execute searches in parallel
-        all_results = []
-        search_tasks = []
+    Returns:
+        RRF-fused rows, best first
+    """
+    queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+    if not queries:
+        return []
+
+    embeddings = await get_embedder().generate_embeddings_batch(queries)
+    embedding_strs = ['[' + ','.join(map(str, e)) + ']' for e in embeddings]
 
+    try:
         async with db_pool.acquire() as conn:
-            for q in queries:
-                query_embedding = await embedder.embed_query(q)
-                embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
+            rows = await conn.fetch(
+                """
+                SELECT * FROM match_chunks_multi($1::text[], $2)
+                """,
+                embedding_strs,
+                limit
+            )
+        result_lists = [[] for _ in queries]
+        for row in rows:
+            result_lists[row['query_index'] - 1].append(row)
+    except asyncpg.exceptions.UndefinedFunctionError:
+        logger.warning("match_chunks_multi not found; falling back to pooled per-query searches")
 
-                task = conn.fetch(
+        async def search_one(embedding_str: str):
+            async with db_pool.acquire() as conn:
+                return await conn.fetch(
                     """
                     SELECT * FROM match_chunks($1::vector, $2)
                     """,
                     embedding_str,
                     limit
                 )
-                search_tasks.append(task)
 
-            # Execute all searches concurrently
-            results_lists = await asyncio.gather(*search_tasks)
+        result_lists = await asyncio.gather(*(search_one(e) for e in embedding_strs))
 
-            # Collect all results
-            for results in results_lists:
-                all_results.extend(results)
+    return reciprocal_rank_fusion(result_lists)[:limit]
 
-        if not all_results:
-            return "No relevant information found."
 
-        # Deduplicate by chunk ID and keep highest similarity
-        seen = {}
-        for row in all_results:
-            chunk_id = row['chunk_id']
-            if chunk_id not in seen or row['similarity'] > seen[chunk_id]['similarity']:
-                seen[chunk_id] = row
+async def search_with_multi_query(ctx: RunContext[None], query: str, limit: int = 5) -> str:
+    """
+    Search using multiple query variations in parallel (Multi-Query RAG).
+
+    This combines query expansion with parallel execution for better recall.
 
-        unique_results = sorted(seen.values(), key=lambda x: x['similarity'], reverse=True)[:limit]
+    Args:
+        query: The search query
+        limit: Results per query variation
+
+    Returns:
+        Formatted deduplicated search results
+    """
+    try:
+        if not db_pool:
+            await initialize_db()
+
+        # Generate query variations
+        queries = await expand_query_variations(ctx, query)
+        logger.info(f"Multi-query search with {len(queries)} variations")
+
+        # One embedding request + one DB round-trip, fused with RRF
+        unique_results = await multi_query_search(queries, limit)
+
+        if not unique_results:
+            return "No relevant information found."
 
         # Format results
         response_parts = []
@@ -206,11 +265,10 @@ async def search_with_reranking(ctx: RunContext[None], query: str, limit: int =
         if not db_pool:
             await initialize_db()
 
-        initialize_reranker()
+        reranker = initialize_reranker()
 
         # Stage 1: Fast vector retrieval (retrieve more candidates)
-        from ingestion.embedder import create_embedder
-        embedder = create_embedder()
+        embedder = get_embedder()
         query_embedding = await embedder.embed_query(query)
         embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
 
@@ -232,8 +290,11 @@ async def search_with_reranking(ctx: RunContext[None], query: str, limit: int =
         # Stage 2: Re-rank with cross-encoder
         logger.info(f"Re-ranking {len(results)} candidates")
 
-        pairs = [[query, row['content']] for row in results]
-        scores = reranker.predict(pairs)
+        # Scored on the service's worker thread, batched with other sessions
+        scores = await reranker.score(
+            query,
+            [(row['chunk_id'], row['content']) for row in results]
+        )
 
         # Combine results with new scores
         reranked = sorted(
@@ -275,8 +336,7 @@ async def search_knowledge_base(ctx: RunContext[None], query: str, limit: int =
         if not db_pool:
             await initialize_db()
 
-        from ingestion.embedder import create_embedder
-        embedder = create_embedder()
+        embedder = get_embedder()
         query_embedding = await embedder.embed_query(query)
         embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
 
@@ -379,10 +439,9 @@ async def search_with_self_reflection(ctx: RunContext[None], query: str, limit:
             await initialize_db()
 
         from openai import AsyncOpenAI
-        from ingestion.embedder import create_embedder
 
         client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        embedder = create_embedder()
+        embedder = get_embedder()
 
         # Initial search
         query_embedding = await embedder.embed_query(query)
@@ -569,6 +628,8 @@ async def run_cli():
     except KeyboardInterrupt:
         print("\n\nGoodbye!")
     finally:
+        if reranker is not None:
+            reranker.stop()
         await close_db()
 
 
@@ -68,6 +68,49 @@ BEGIN
 END;
 $$;
 
+-- Multi-query variant: one round-trip for several query vectors.
+-- Embeddings are passed as pgvector text literals ('[0.1,0.2,...]') so
+-- clients without a vector codec can bind them as a plain text[].
+CREATE OR REPLACE FUNCTION match_chunks_multi(
+    query_embeddings TEXT[],
+    match_count INT DEFAULT 10
+)
+RETURNS TABLE (
+    query_index INT,
+    rank INT,
+    chunk_id UUID,
+    document_id UUID,
+    content TEXT,
+    similarity FLOAT,
+    metadata JSONB,
+    document_title TEXT,
+    document_source TEXT
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        q.ordinality::INT AS query_index,
+        m.rank::INT,
+        m.chunk_id,
+        m.document_id,
+        m.content,
+        m.similarity,
+        m.metadata,
+        m.document_title,
+        m.document_source
+    FROM unnest(query_embeddings) WITH ORDINALITY AS q(embedding, ordinality)
+    CROSS JOIN LATERAL (
+        SELECT
+            mc.*,
+            row_number() OVER (ORDER BY mc.similarity DESC) AS rank
+        FROM match_chunks(q.embedding::vector, match_count) mc
+    ) m
+    ORDER BY q.ordinality, m.rank;
+END;
+$$;
+
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
@@ -0,0 +1,239 @@
+"""
+Cross-encoder reranking service with dynamic batching and score caching.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+
+@dataclass
+class _RerankRequest:
+    """Pairs from one caller waiting to be scored."""
+    pairs: List[Tuple[str, str]]
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+
+class ScoreCache:
+    """Thread-safe LRU of cross-encoder scores keyed by (query hash, chunk id)."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._scores: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[float]:
+        with self._lock:
+            score = self._scores.get(key)
+            if score is not None:
+                self._scores.move_to_end(key)
+            return score
+
+    def put(self, key: Tuple[str, str], score: float) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+class RerankerService:
+    """
+    Runs a CrossEncoder on a dedicated worker thread.
+
+    Requests from concurrent sessions are queued and the worker scores them
+    together: it waits up to `max_wait_ms` after the first request for more
+    pairs to arrive, then runs a single `predict` over at most `max_batch`
+    pairs. The event loop never blocks on the model, and concurrent searches
+    share forward passes instead of serializing on them.
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        cache_size: Optional[int] = None,
+        model: Any = None,
+    ):
+        """
+        Initialize reranking service.
+
+        Args:
+            model_name: Cross-encoder model (env RERANK_MODEL)
+            max_batch: Max pairs per forward pass (env RERANK_MAX_BATCH, default 64)
+            max_wait_ms: Max time to wait for more requests (env RERANK_MAX_WAIT_MS, default 5)
+            cache_size: Cached (query, chunk) scores (env RERANK_CACHE_SIZE, default 10000)
+            model: Preloaded model exposing `predict(pairs)`, mainly for testing
+        """
+        self.model_name = model_name or os.getenv("RERANK_MODEL", DEFAULT_RERANK_MODEL)
+        self.max_batch = max(1, max_batch or int(os.getenv("RERANK_MAX_BATCH", "64")))
+        self.max_wait = (
+            max_wait_ms if max_wait_ms is not None else float(os.getenv("RERANK_MAX_WAIT_MS", "5"))
+        ) / 1000
+        self.cache = ScoreCache(
+            cache_size if cache_size is not None else int(os.getenv("RERANK_CACHE_SIZE", "10000"))
+        )
+        self._model = model
+        self._requests: "queue.Queue[Optional[_RerankRequest]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._carry: Optional[_RerankRequest] = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        """Start the worker thread (the model is loaded on its first batch)."""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="reranker", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker thread after pending requests are scored."""
+        if self._thread and self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join(timeout)
+        if self._thread and not self._thread.is_alive():
+            self._thread = None
+
+    async def score(self, query: str, candidates: Sequence[Tuple[str, str]]) -> List[float]:
+        """
+        Score candidates against a query.
+
+        Args:
+            query: Search query
+            candidates: (chunk_id, content) pairs
+
+        Returns:
+            Cross-encoder scores in candidate order
+        """
+        if not candidates:
+            return []
+
+        query_key = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        scores: List[Optional[float]] = [
+            self.cache.get((query_key, str(chunk_id))) for chunk_id, _ in candidates
+        ]
+        missing = [i for i, score in enumerate(scores) if score is None]
+
+        if missing:
+            self.start()
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._requests.put(
+                _RerankRequest(
+                    pairs=[(query, candidates[i][1]) for i in missing],
+                    future=future,
+                    loop=loop,
+                )
+            )
+            for i, score in zip(missing, await future):
+                scores[i] = score
+                self.cache.put((query_key, str(candidates[i][0])), score)
+
+        return scores
+
+    def _load_model(self):
+        if self._model is None:
+            from sentence_transformers import CrossEncoder
+
+            logger.info(f"Loading cross-encoder model {self.model_name} for re-ranking...")
+            self._model = CrossEncoder(self.model_name)
+            logger.info("Cross-encoder loaded")
+        return self._model
+
+    def _collect_batch(self, first: _RerankRequest) -> Tuple[List[_RerankRequest], bool]:
+        """Gather requests until max_batch pairs or max_wait elapses."""
+        batch = [first]
+        size = len(first.pairs)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                request = self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            if size + len(request.pairs) > self.max_batch:
+                # Start the next batch with it rather than splitting a pass
+                self._carry = request
+                break
+            batch.append(request)
+            size += len(request.pairs)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while True:
+            if self._carry is not None:
+                first, self._carry = self._carry, None
+            elif stopping:
+                break
+            else:
+                first = self._requests.get()
+                if first is None:
+                    break
+            batch, stop = self._collect_batch(first)
+            stopping = stopping or stop
+
+            pairs = [pair for request in batch for pair in request.pairs]
+            try:
+                # A failed load fails this batch and is retried on the next one
+                model = self._load_model()
+                # Oversized batches (one large request) are chunked into max_batch passes
+                flat: List[float] = []
+                for start in range(0, len(pairs), self.max_batch):
+                    flat.extend(
+                        float(s) for s in model.predict([list(p) for p in pairs[start:start + self.max_batch]])
+                    )
+            except Exception as e:
+                logger.error(f"Cross-encoder scoring failed: {e}", exc_info=True)
+                for request in batch:
+                    request.loop.call_soon_threadsafe(_set_exception, request.future, e)
+                continue
+
+            offset = 0
+            for request in batch:
+                result = flat[offset:offset + len(request.pairs)]
+                offset += len(request.pairs)
+                request.loop.call_soon_threadsafe(_set_result, request.future, result)
+
+        self._fail_queued(RuntimeError("Reranker stopped"))
+
+    def _fail_queued(self, exc: Exception):
+        """Fail requests queued behind the stop sentinel so their callers don't hang."""
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None:
+                request.loop.call_soon_threadsafe(_set_exception, request.future, exc)
+
+
+def _set_result(future: asyncio.Future, result: List[float]):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exc: Exception):
+    if not future.done():
+        future.set_exception(exc)
@@ -0,0 +1,325 @@
+"""
+ingest_pipeline.py
+------------------
+Streaming crawl -> chunk -> embed -> write pipeline for insert_docs.py.
+
+Instead of crawling everything, then chunking everything, then embedding on a
+single thread through Chroma's embedding function, pages flow through bounded
+queues as soon as they are crawled:
+
+    crawl (Crawl4AI, streamed)  ->  chunk  ->  embed (process pool)  ->  write (batched Chroma adds)
+
+Embeddings are computed by a pool of worker processes, each holding its own
+SentenceTransformer, so all cores are used. The vectors match what the
+collection's SentenceTransformerEmbeddingFunction would produce for the same
+model, so queries keep working unchanged. Per-stage throughput is printed at
+the end.
+
+Usage:
+    python insert_docs.py <URL> --pipeline [--embed-workers N] [--embed-batch-size 256]
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urldefrag
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode, MemoryAdaptiveDispatcher
+
+from insert_docs import extract_section_info, is_sitemap, is_txt, parse_sitemap, smart_chunk_markdown
+from utils import (
+    add_documents_to_collection,
+    get_chroma_client,
+    get_or_create_collection,
+    make_chunk_id,
+    prune_and_diff_chunks,
+)
+
+_DONE = object()
+
+# Per-process model for embedding workers
+_worker_model = None
+
+
+def _init_embedding_worker(model_name: str, threads: int) -> None:
+    """Load the SentenceTransformer once per worker process."""
+    global _worker_model
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    # Keep workers from oversubscribing cores with their own thread pools
+    torch.set_num_threads(threads)
+    _worker_model = SentenceTransformer(model_name, device="cpu")
+
+
+def _embed_batch(texts: List[str]) -> List[List[float]]:
+    # Same call SentenceTransformerEmbeddingFunction makes for the collection
+    return _worker_model.encode(texts, convert_to_numpy=True).tolist()
+
+
+@dataclass
+class StageStats:
+    """Throughput counters for one pipeline stage."""
+
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    def record(self, start: float, end: float, items: int = 1) -> None:
+        if self.started_at is None:
+            self.started_at = start
+        self.busy_seconds += end - start
+        self.items += items
+        self.finished_at = end
+
+    @contextmanager
+    def track(self, items: int = 1):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(start, time.perf_counter(), items)
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    def summary(self) -> str:
+        rate = self.items / self.wall_seconds if self.wall_seconds else 0.0
+        return (
+            f"{self.name:<6} {self.items:>8} items  {self.wall_seconds:>8.2f}s  "
+            f"{rate:>9.1f}/s  busy {self.busy_seconds:>8.2f}s"
+        )
+
+
+async def stream_crawl(url: str, max_depth: int = 3, max_concurrent: int = 10) -> AsyncIterator[Dict[str, Any]]:
+    """Yield {'url', 'markdown'} dicts as soon as each page finishes crawling.
+
+    Mirrors the URL-type detection and crawl strategies of insert_docs.py, but
+    uses Crawl4AI's streaming mode instead of waiting for whole batches.
+    """
+    browser_config = BrowserConfig(headless=True, verbose=False)
+    run_config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True)
+
+    def dispatcher():
+        return MemoryAdaptiveDispatcher(
+            memory_threshold_percent=70.0,
+            check_interval=1.0,
+            max_session_permit=max_concurrent
+        )
+
+    async with AsyncWebCrawler(config=browser_config) as crawler:
+        if is_txt(url):
+            result = await crawler.arun(url=url, config=CrawlerRunConfig())
+            if result.success and result.markdown:
+                yield {'url': url, 'markdown': result.markdown}
+            else:
+                print(f"Failed to crawl {url}: {result.error_message}")
+            return
+
+        if is_sitemap(url):
+            sitemap_urls = await asyncio.to_thread(parse_sitemap, url)
+            async for result in await crawler.arun_many(urls=sitemap_urls, config=run_config, dispatcher=dispatcher()):
+                if result.success and result.markdown:
+                    yield {'url': result.url, 'markdown': result.markdown}
+            return
+
+        # Regular URL: breadth-first over internal links, streaming each level
+        visited = set()
+        current_urls = {urldefrag(url)[0]}
+        for _ in range(max_depth):
+            urls_to_crawl = [u for u in current_urls if u not in visited]
+            if not urls_to_crawl:
+                break
+            next_level_urls = set()
+            async for result in await crawler.arun_many(urls=urls_to_crawl, config=run_config, dispatcher=dispatcher()):
+                visited.add(urldefrag(result.url)[0])
+                if result.success and result.markdown:
+                    yield {'url': result.url, 'markdown': result.markdown}
+                    for link in result.links.get("internal", []):
+                        next_url = urldefrag(link["href"])[0]
+                        if next_url not in visited:
+                            next_level_urls.add(next_url)
+            current_urls = next_level_urls
+
+
+async def run_pipeline(
+    url: str,
+    collection_name: str = "docs",
+    db_dir: str = "./chroma_db",
+    embedding_model: str = "all-MiniLM-L6-v2",
+    chunk_size: int = 1000,
+    max_depth: int = 3,
+    max_concurrent: int = 10,
+    batch_size: int = 100,
+    embed_batch_size: int = 256,
+    embed_workers: Optional[int] = None,
+    embed_threads: int = 2,
+    incremental: bool = False,
+) -> Dict[str, StageStats]:
+    """Crawl, chunk, embed and store `url` as a streaming pipeline.
+
+    Args:
+        url: URL to crawl (regular, .txt, or sitemap)
+        collection_name: ChromaDB collection name
+        db_dir: ChromaDB directory
+        embedding_model: SentenceTransformer model used by the collection
+        chunk_size: Max chunk size (chars)
+        max_depth: Recursion depth for regular URLs
+        max_concurrent: Max parallel browser sessions
+        batch_size: Chunks per Chroma write
+        embed_batch_size: Chunks per embedding task sent to a worker
+        embed_workers: Embedding worker processes (default: cores / embed_threads)
+        embed_threads: Torch threads per embedding worker
+        incremental: Skip chunks already stored and delete stale ones per URL
+
+    Returns:
+        Stage name -> StageStats
+    """
+    embed_workers = embed_workers or max(1, (os.cpu_count() or 1) // embed_threads)
+    stats = {name: StageStats(name) for name in ("crawl", "chunk", "embed", "write")}
+
+    client = get_chroma_client(db_dir)
+    collection = get_or_create_collection(client, collection_name, embedding_model_name=embedding_model)
+
+    # All Chroma calls go through one thread so the client is never used concurrently
+    chroma_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma")
+    embed_pool = ProcessPoolExecutor(
+        max_workers=embed_workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_embedding_worker,
+        initargs=(embedding_model, embed_threads),
+    )
+    loop = asyncio.get_running_loop()
+
+    pages: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
+    batches: asyncio.Queue = asyncio.Queue(maxsize=embed_workers * 2)
+    embedded: asyncio.Queue = asyncio.Queue(maxsize=embed_workers * 2)
+    sync_stats = {"updated": 0, "unchanged": 0, "deleted": 0}
+
+    async def crawl_stage():
+        try:
+            # Busy time is time spent waiting on the crawler, not on a full queue
+            crawl_start = time.perf_counter()
+            async for page in stream_crawl(url, max_depth=max_depth, max_concurrent=max_concurrent):
+                stats["crawl"].record(crawl_start, time.perf_counter())
+                await pages.put(page)
+                crawl_start = time.perf_counter()
+        finally:
+            await pages.put(_DONE)
+
+    async def chunk_stage():
+        seen_ids = set()
+        pending: Dict[str, List[Any]] = {"ids": [], "documents": [], "metadatas": []}
+        try:
+            while (page := await pages.get()) is not _DONE:
+                ids, documents, metadatas = [], [], []
+                chunks = smart_chunk_markdown(page['markdown'], max_len=chunk_size)
+                # Index within the page: pages arrive in crawl-completion order,
+                # so a running index would differ between otherwise identical runs
+                chunk_idx = 0
+                with stats["chunk"].track(len(chunks)):
+                    for chunk in chunks:
+                        chunk_id = make_chunk_id(page['url'], chunk)
+                        if chunk_id in seen_ids:
+                            continue
+                        seen_ids.add(chunk_id)
+                        meta = extract_section_info(chunk)
+                        meta["chunk_index"] = chunk_idx
+                        meta["source"] = page['url']
+                        ids.append(chunk_id)
+                        documents.append(chunk)
+                        metadatas.append(meta)
+                        chunk_idx += 1
+
+                if incremental and ids:
+                    new_indexes, page_stats = await loop.run_in_executor(
+                        chroma_executor, prune_and_diff_chunks, collection, ids, metadatas, batch_size
+                    )
+                    for key, value in page_stats.items():
+                        sync_stats[key] += value
+                    ids = [ids[i] for i in new_indexes]
+                    documents = [documents[i] for i in new_indexes]
+                    metadatas = [metadatas[i] for i in new_indexes]
+
+                pending["ids"] += ids
+                pending["documents"] += documents
+                pending["metadatas"] += metadatas
+                while len(pending["ids"]) >= embed_batch_size:
+                    await batches.put({key: value[:embed_batch_size] for key, value in pending.items()})
+                    pending = {key: value[embed_batch_size:] for key, value in pending.items()}
+            if pending["ids"]:
+                await batches.put(pending)
+        finally:
+            for _ in range(embed_workers):
+                await batches.put(_DONE)
+
+    async def embed_stage():
+        try:
+            while (batch := await batches.get()) is not _DONE:
+                with stats["embed"].track(len(batch["ids"])):
+                    batch["embeddings"] = await loop.run_in_executor(embed_pool, _embed_batch, batch["documents"])
+                await embedded.put(batch)
+        finally:
+            await embedded.put(_DONE)
+
+    async def write_stage():
+        finished = 0
+        pending: Dict[str, List[Any]] = {"ids": [], "documents": [], "metadatas": [], "embeddings": []}
+
+        async def flush(count: int):
+            nonlocal pending
+            chunk = {key: value[:count] for key, value in pending.items()}
+            pending = {key: value[count:] for key, value in pending.items()}
+            with stats["write"].track(len(chunk["ids"])):
+                await loop.run_in_executor(
+                    chroma_executor,
+                    lambda: add_documents_to_collection(
+                        collection,
+                        chunk["ids"],
+                        chunk["documents"],
+                        chunk["metadatas"],
+                        batch_size=batch_size,
+                        embeddings=chunk["embeddings"],
+                    ),
+                )
+
+        while finished < embed_workers:
+            batch = await embedded.get()
+            if batch is _DONE:
+                finished += 1
+                continue
+            for key in pending:
+                pending[key] += batch[key]
+            while len(pending["ids"]) >= batch_size:
+                await flush(batch_size)
+        if pending["ids"]:
+            await flush(len(pending["ids"]))
+
+    try:
+        await asyncio.gather(
+            crawl_stage(),
+            chunk_stage(),
+            *(embed_stage() for _ in range(embed_workers)),
+            write_stage(),
+        )
+    finally:
+        embed_pool.shutdown(cancel_futures=True)
+        chroma_executor.shutdown()
+
+    for stage in stats.values():
+        print(stage.summary())
+    if incremental:
+        print(
+            f"Incremental: {sync_stats['unchanged']} unchanged, {sync_stats['updated']} updated, "
+            f"{sync_stats['deleted']} deleted"
+        )
+    return stats
@@ -6,7 +6,7 @@ use the appropriate crawl method, chunk the resulting Markdown into <1000 charac
 and insert all chunks into ChromaDB with metadata.
 
 Usage:
-    python insert_docs.py <URL> [--collection ...] [--db-dir ...] [--embedding-model ...]
+    python insert_docs.py <URL> [--collection ...] [--db-dir ...] [--embedding-model ...] [--incremental] [--pipeline]
 """
 import argparse
 import sys
@@ -17,7 +17,13 @@ from urllib.parse import urlparse, urldefrag
 from xml.etree import ElementTree
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode, MemoryAdaptiveDispatcher
 import requests
-from utils import get_chroma_client, get_or_create_collection, add_documents_to_collection
+from utils import (
+    get_chroma_client,
+    get_or_create_collection,
+    add_documents_to_collection,
+    make_chunk_id,
+    sync_documents_to_collection,
+)
 
 def smart_chunk_markdown(markdown: str, max_len: int = 1000) -> List[str]:
     """Hierarchically splits markdown by #, ##, ### headers, then by characters, to ensure all chunks < max_len."""
@@ -162,8 +168,35 @@ def main():
     parser.add_argument("--max-depth", type=int, default=3, help="Recursion depth for regular URLs")
     parser.add_argument("--max-concurrent", type=int, default=10, help="Max parallel browser sessions")
     parser.add_argument("--batch-size", type=int, default=100, help="ChromaDB insert batch size")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only embed new chunks and delete stale ones for the crawled URLs")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Stream pages through chunking, a multi-process embedding pool and batched writes")
+    parser.add_argument("--embed-workers", type=int, default=None,
+                        help="Embedding worker processes for --pipeline (default: cores / --embed-threads)")
+    parser.add_argument("--embed-threads", type=int, default=2, help="Torch threads per embedding worker")
+    parser.add_argument("--embed-batch-size", type=int, default=256, help="Chunks per embedding task")
     args = parser.parse_args()
 
+    if args.pipeline:
+        from ingest_pipeline import run_pipeline
+
+        asyncio.run(run_pipeline(
+            args.url,
+            collection_name=args.collection,
+            db_dir=args.db_dir,
+            embedding_model=args.embedding_model,
+            chunk_size=args.chunk_size,
+            max_depth=args.max_depth,
+            max_concurrent=args.max_concurrent,
+            batch_size=args.batch_size,
+            embed_batch_size=args.embed_batch_size,
+            embed_workers=args.embed_workers,
+            embed_threads=args.embed_threads,
+            incremental=args.incremental,
+        ))
+        return
+
     # Detect URL type
     url = args.url
     if is_txt(url):
@@ -182,13 +215,22 @@ def main():
 
     # Chunk and collect metadata
     ids, documents, metadatas = [], [], []
-    chunk_idx = 0
+    seen_ids = set()
     for doc in crawl_results:
         url = doc['url']
         md = doc['markdown']
         chunks = smart_chunk_markdown(md, max_len=args.chunk_size)
+        # Index within the page, so a change on one page doesn't renumber
+        # (and re-sync) the chunks of every page after it
+        chunk_idx = 0
         for chunk in chunks:
-            ids.append(f"chunk-{chunk_idx}")
+            # Content-addressed IDs stay stable across re-crawls; repeated
+            # boilerplate on the same page collapses into one chunk
+            chunk_id = make_chunk_id(url, chunk)
+            if chunk_id in seen_ids:
+                continue
+            seen_ids.add(chunk_id)
+            ids.append(chunk_id)
             documents.append(chunk)
             meta = extract_section_info(chunk)
             meta["chunk_index"] = chunk_idx
@@ -200,10 +242,19 @@ def main():
         print("No documents found to insert.")
         sys.exit(1)
 
-    print(f"Inserting {len(documents)} chunks into ChromaDB collection '{args.collection}'...")
-
     client = get_chroma_client(args.db_dir)
     collection = get_or_create_collection(client, args.collection, embedding_model_name=args.embedding_model)
+
+    if args.incremental:
+        print(f"Syncing {len(documents)} chunks into ChromaDB collection '{args.collection}'...")
+        stats = sync_documents_to_collection(collection, ids, documents, metadatas, batch_size=args.batch_size)
+        print(
+            f"Synced ChromaDB collection '{args.collection}': {stats['added']} added, "
+            f"{stats['updated']} updated, {stats['unchanged']} unchanged, {stats['deleted']} deleted."
+        )
+        return
+
+    print(f"Inserting {len(documents)} chunks into ChromaDB collection '{args.collection}'...")
     add_documents_to_collection(collection, ids, documents, metadatas, batch_size=args.batch_size)
 
     print(f"Successfully added {len(documents)} chunks to ChromaDB collection '{args.collection}'.")
@@ -1,8 +1,9 @@
 """Utility functions for text processing and ChromaDB operations."""
 
+import hashlib
 import os
 import pathlib
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import chromadb
 from chromadb.utils import embedding_functions
@@ -67,6 +68,7 @@ def add_documents_to_collection(
     documents: List[str],
     metadatas: Optional[List[Dict[str, Any]]] = None,
     batch_size: int = 100,
+    embeddings: Optional[List[List[float]]] = None,
 ) -> None:
     """Add documents to a ChromaDB collection in batches.
     
@@ -76,6 +78,8 @@ def add_documents_to_collection(
         documents: List of document texts
         metadatas: Optional list of metadata dictionaries for each document
         batch_size: Size of batches for adding documents
+        embeddings: Optional precomputed embeddings; when omitted the
+            collection's embedding function embeds the documents
     """
     # Create default metadata if none provided
     if metadatas is None:
@@ -95,9 +99,148 @@ def add_documents_to_collection(
             ids=ids[start_idx:end_idx],
             documents=documents[start_idx:end_idx],
             metadatas=metadatas[start_idx:end_idx],
+            embeddings=embeddings[start_idx:end_idx] if embeddings is not None else None,
         )
 
 
+def make_chunk_id(source: str, chunk: str) -> str:
+    """Build a content-addressed ID for a chunk.
+    
+    The ID only depends on the source URL and the chunk text, so re-crawling an
+    unchanged page yields the same IDs and changed chunks get new ones.
+    
+    Args:
+        source: URL the chunk was crawled from
+        chunk: Chunk text
+        
+    Returns:
+        A stable chunk ID
+    """
+    digest = hashlib.sha256(f"{source}\0{chunk}".encode("utf-8")).hexdigest()
+    return f"chunk-{digest[:32]}"
+
+
+def get_existing_chunks(
+    collection: chromadb.Collection,
+    sources: List[str],
+    batch_size: int = 100,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch the IDs and metadata already stored for the given source URLs.
+    
+    Only metadata is requested, so no documents or embeddings are loaded.
+    
+    Args:
+        collection: ChromaDB collection
+        sources: Source URLs to look up
+        batch_size: Number of URLs per lookup query
+        
+    Returns:
+        Mapping of chunk ID to its stored metadata
+    """
+    existing = {}
+    for batch in batched(sorted(set(sources)), batch_size):
+        result = collection.get(
+            where={"source": {"$in": list(batch)}},
+            include=["metadatas"],
+        )
+        for chunk_id, metadata in zip(result["ids"], result["metadatas"]):
+            existing[chunk_id] = metadata or {}
+    return existing
+
+
+def prune_and_diff_chunks(
+    collection: chromadb.Collection,
+    ids: List[str],
+    metadatas: List[Dict[str, Any]],
+    batch_size: int = 100,
+) -> Tuple[List[int], Dict[str, int]]:
+    """Reconcile stored chunks with freshly crawled ones without embedding anything.
+    
+    For every source URL in `metadatas`, stored chunks that no longer appear are
+    deleted and chunks that still exist get their metadata updated in place if
+    it changed (e.g. a shifted chunk index). IDs must be unique and
+    content-addressed (see `make_chunk_id`).
+    
+    Args:
+        collection: ChromaDB collection
+        ids: List of chunk IDs
+        metadatas: List of metadata dictionaries, each with a `source` key
+        batch_size: Size of batches for deletes and updates
+        
+    Returns:
+        Indexes into `ids` of the chunks that still need to be embedded and
+        added, and counts of `updated`, `unchanged` and `deleted` chunks
+    """
+    existing = get_existing_chunks(collection, [m["source"] for m in metadatas])
+    wanted = set(ids)
+
+    stale_ids = [chunk_id for chunk_id in existing if chunk_id not in wanted]
+    for batch in batched(stale_ids, batch_size):
+        collection.delete(ids=list(batch))
+
+    new_indexes, changed_ids, changed_metadatas = [], [], []
+    for index, (chunk_id, metadata) in enumerate(zip(ids, metadatas)):
+        if chunk_id not in existing:
+            new_indexes.append(index)
+        elif existing[chunk_id] != metadata:
+            changed_ids.append(chunk_id)
+            changed_metadatas.append(metadata)
+
+    for start in range(0, len(changed_ids), batch_size):
+        collection.update(
+            ids=changed_ids[start:start + batch_size],
+            metadatas=changed_metadatas[start:start + batch_size],
+        )
+
+    return new_indexes, {
+        "updated": len(changed_ids),
+        "unchanged": len(ids) - len(new_indexes) - len(changed_ids),
+        "deleted": len(stale_ids),
+    }
+
+
+def sync_documents_to_collection(
+    collection: chromadb.Collection,
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    batch_size: int = 100,
+) -> Dict[str, int]:
+    """Incrementally sync crawled chunks for a set of pages into a collection.
+    
+    Stale chunks are deleted and existing ones are left un-embedded (see
+    `prune_and_diff_chunks`); only new chunks are embedded and added, in
+    batches of `batch_size`.
+    
+    Args:
+        collection: ChromaDB collection
+        ids: List of content-addressed chunk IDs
+        documents: List of chunk texts
+        metadatas: List of metadata dictionaries, each with a `source` key
+        batch_size: Size of batches for adding documents
+        
+    Returns:
+        Counts of `added`, `updated`, `unchanged` and `deleted` chunks
+    """
+    # Drop duplicate chunks (same text repeated on a page) keeping the first
+    unique = {}
+    for chunk_id, document, metadata in zip(ids, documents, metadatas):
+        unique.setdefault(chunk_id, (document, metadata))
+    ids = list(unique)
+    documents = [unique[chunk_id][0] for chunk_id in ids]
+    metadatas = [unique[chunk_id][1] for chunk_id in ids]
+
+    new_indexes, stats = prune_and_diff_chunks(collection, ids, metadatas, batch_size=batch_size)
+    add_documents_to_collection(
+        collection,
+        [ids[i] for i in new_indexes],
+        [documents[i] for i in new_indexes],
+        [metadatas[i] for i in new_indexes],
+        batch_size=batch_size,
+    )
+    return {"added": len(new_indexes), **stats}
+
+
 def query_collection(
     collection: chromadb.Collection,
     query_text: str,
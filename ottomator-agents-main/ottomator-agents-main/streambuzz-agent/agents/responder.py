@@ -3,7 +3,7 @@ from constants.prompts import RESPONDER_SYSTEM_PROMPT
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.settings import ModelSettings
 from utils import supabase_util
-from utils.rag_util import get_embedding
+from utils.rag_util import get_query_embedding
 
 # Create Agent Instance with System Prompt and Result Type
 responder_agent = Agent(
@@ -58,7 +58,7 @@ async def respond(ctx: RunContext[str], user_query: str) -> str | None:
             return None
 
         # Get the embedding for the query
-        query_embedding = await get_embedding(user_query)
+        query_embedding = await get_query_embedding(user_query)
 
         # Query Supabase for relevant documents
         result = await supabase_util.get_matching_chunks(
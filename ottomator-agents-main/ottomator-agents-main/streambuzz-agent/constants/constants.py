@@ -146,6 +146,31 @@ STREAMER_INTENT_EXAMPLES = {
     that a streamer might use to trigger that intent.
 """
 
+# Buzz processing
+BUZZ_WORKER_CONCURRENCY = 4
+"""Maximum number of buzzes answered concurrently by the responder agent."""
+BUZZ_RESPONDER_RATE = 1.0
+"""Sustained responder agent calls per second (token bucket refill rate)."""
+BUZZ_RESPONDER_BURST = 4
+"""Responder agent calls allowed back-to-back before rate limiting applies."""
+BUZZ_STATUS_FLUSH_SIZE = 5
+"""Number of answered buzzes buffered before their statuses are written."""
+BUZZ_STATUS_FLUSH_INTERVAL = 3.0
+"""Maximum seconds an answered buzz waits in the buffer before being written."""
+BUZZ_TYPE_PRIORITY = {"QUESTION": 0, "CONCERN": 1, "REQUEST": 2}
+"""Order in which buzz types are answered; newer buzzes go first within a type."""
+
+# Knowledge base ingest
+KB_EMBEDDING_BATCH_SIZE = 100
+"""Chunks embedded per batch embedding request (Gemini allows up to 100)."""
+KB_INSERT_BATCH_SIZE = 100
+"""Chunks written per multi-row insert into the knowledge base table."""
+KB_LLM_CONCURRENCY = 4
+"""Title/summary LLM calls running at once while building a knowledge base, kept
+low so knowledge base uploads do not starve chat processing."""
+QUERY_EMBEDDING_CACHE_SIZE = 256
+"""Number of query embeddings kept in the in-memory LRU cache."""
+
 # Model Constants
 EMBEDDING_MODEL_NAME = "models/text-embedding-004"
 """Name of the embedding model.
@@ -26,6 +26,8 @@ class ProcessedChunk:
         embedding (List[float]): A numerical representation (embedding) of the chunk's
             content. This is used for semantic search and other machine learning tasks.
             Embeddings capture the meaning of the text in a vector space.
+        content_hash (Optional[str]): SHA-256 of the content, used to detect
+            unchanged chunks when a knowledge base is re-uploaded.
     """
 
     session_id: str
@@ -35,6 +37,7 @@ class ProcessedChunk:
     summary: str
     content: str
     embedding: List[float]
+    content_hash: Optional[str] = None
 
 
 @dataclass
@@ -25,12 +25,15 @@ create table streamer_knowledge (
   summary character varying not null,
   content text not null,
   embedding vector(768),
+  content_hash text null,
   created_at timestamp with time zone not null default timezone ('utc'::text, now()),
   constraint streamer_knowledge_pkey primary key (id),
   constraint streamer_knowledge_session_id_chunk_number_key unique (session_id, chunk_number)
 ) TABLESPACE pg_default;
 
 create index IF not exists streamer_knowledge_embedding_idx on streamer_knowledge using ivfflat (embedding vector_cosine_ops) TABLESPACE pg_default;
+-- Existing deployments: add the content hash used to diff re-uploaded knowledge bases
+alter table streamer_knowledge add column if not exists content_hash text null;
 
 
 -- Create a function to search for documentation chunks
@@ -1,41 +1,177 @@
 import asyncio
 import json
 import re
+import time
 from collections import defaultdict
-from typing import Any, Dict, List
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import APIRouter
 
 from agents.buzz_intern import buzz_intern_agent
 from agents.responder import responder_agent
-from constants.constants import YOUTUBE_LIVE_API_ENDPOINT
+from constants.constants import (BUZZ_RESPONDER_BURST, BUZZ_RESPONDER_RATE,
+                                 BUZZ_STATUS_FLUSH_INTERVAL, BUZZ_STATUS_FLUSH_SIZE,
+                                 BUZZ_TYPE_PRIORITY, BUZZ_WORKER_CONCURRENCY,
+                                 YOUTUBE_LIVE_API_ENDPOINT)
 from constants.enums import BuzzStatusEnum
 from constants.prompts import CHAT_ANALYSER_PROMPT, REPLY_SUMMARISER_PROMPT
 from logger import log_method
 from models.agent_models import ProcessFoundBuzz
 from models.youtube_models import ChatIntent, StreamBuzzModel, WriteChatModel
 from utils import supabase_util, youtube_util
+from utils.rate_limit_util import TokenBucket
 from utils.supabase_util import store_message
 
 # Create API router for managing live chats
 router = APIRouter()
 
 
+# Shared across scheduler runs so the responder rate limit holds between batches
+responder_rate_limiter = TokenBucket(rate=BUZZ_RESPONDER_RATE, capacity=BUZZ_RESPONDER_BURST)
+
+
+def buzz_priority(buzz: ProcessFoundBuzz) -> Tuple[int, int]:
+    """Returns the queue priority of a buzz (lower is answered first).
+
+    Buzzes are ordered by type as configured in `BUZZ_TYPE_PRIORITY`, then
+    newest first (higher `id`) so the live conversation is answered before a
+    stale backlog.
+
+    Args:
+        buzz: The buzz to prioritise.
+
+    Returns:
+        A `(type_rank, -id)` tuple usable as a priority queue key.
+    """
+    type_rank = BUZZ_TYPE_PRIORITY.get(
+        buzz.buzz_type.strip().upper(), len(BUZZ_TYPE_PRIORITY)
+    )
+    return type_rank, -buzz.id
+
+
+class BuzzStatusBatcher:
+    """Buffers buzz results and writes them to Supabase in batches.
+
+    Answered buzzes are flushed with a single upsert once `BUZZ_STATUS_FLUSH_SIZE`
+    results are buffered or the oldest buffered result is
+    `BUZZ_STATUS_FLUSH_INTERVAL` seconds old. Failed buzzes are reset to
+    'FOUND' in one update per flush so they are retried on the next run.
+
+    After each flush, sessions that had no active buzz before this run get
+    their new current buzz displayed once.
+
+    Attributes:
+        sessions_to_display (Set[str]): Sessions still waiting for a buzz to
+            be displayed.
+    """
+
+    def __init__(self, sessions_to_display: Set[str]):
+        self.sessions_to_display = sessions_to_display
+        self._answered: List[Dict[str, Any]] = []
+        self._failed: List[int] = []
+        self._oldest_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def add_response(self, buzz: ProcessFoundBuzz, generated_response: str):
+        self._answered.append({**asdict(buzz), "generated_response": generated_response})
+        await self._maybe_flush()
+
+    async def add_failure(self, buzz: ProcessFoundBuzz):
+        self._failed.append(buzz.id)
+        await self._maybe_flush()
+
+    async def _maybe_flush(self):
+        now = time.monotonic()
+        if self._oldest_at is None:
+            self._oldest_at = now
+        pending = len(self._answered) + len(self._failed)
+        if (
+            pending >= BUZZ_STATUS_FLUSH_SIZE
+            or now - self._oldest_at >= BUZZ_STATUS_FLUSH_INTERVAL
+        ):
+            await self.flush()
+
+    async def flush(self):
+        """Writes all buffered results, then displays newly available buzzes."""
+        async with self._lock:
+            answered, self._answered = self._answered, []
+            failed, self._failed = self._failed, []
+            self._oldest_at = None
+            if answered:
+                try:
+                    await supabase_util.update_buzz_response_batch(answered)
+                except Exception as e:
+                    print(f"Error>> process_buzz: {str(e)}")
+                    failed.extend(buzz["id"] for buzz in answered)
+                    answered = []
+            if failed:
+                await supabase_util.update_buzz_status_batch_by_id(
+                    id_list=failed, buzz_status=BuzzStatusEnum.FOUND.value
+                )
+
+            answered_sessions = {buzz["session_id"] for buzz in answered}
+            for session_id in answered_sessions & self.sessions_to_display:
+                try:
+                    await display_current_buzz(session_id)
+                    self.sessions_to_display.discard(session_id)
+                except Exception as e:
+                    print(f"Error>> process_buzz: {str(e)}")
+
+
+async def display_current_buzz(session_id: str):
+    """Formats the session's current buzz and stores it as an AI message.
+
+    Args:
+        session_id (str): The session whose current buzz should be displayed.
+    """
+    current_buzz = await supabase_util.get_current_buzz(session_id)
+    if not current_buzz:
+        return
+    buzz_message_display = await buzz_intern_agent.run(
+        f"""
+    1. Extract: `buzz_type`, `original_chat`, `author`, 
+    `generated_response` from the given json
+    2. Format and return the data in a readable, concise manner. Use 
+    spacing and line breaks for clarity, if required.\n{current_buzz}""")
+    await supabase_util.store_message(
+        session_id=session_id,
+        message_type="ai",
+        content=buzz_message_display.data,
+    )
+
+
+async def generate_buzz_response(buzz: ProcessFoundBuzz) -> str:
+    """Generates a response for a buzz, respecting the responder rate limit.
+
+    Args:
+        buzz: The buzz to answer.
+
+    Returns:
+        The generated response text.
+    """
+    await responder_rate_limiter.acquire()
+    response = await responder_agent.run(
+        user_prompt=f"Generate response within 300 words for this "
+                    f"{buzz.buzz_type.strip().upper()}:\n{buzz.original_chat}",
+        result_type=str,
+    )
+    return response.data
+
+
 @log_method
 async def process_buzz():
     """
     Processes buzzes that are in the 'FOUND' state.
 
     This function retrieves buzzes in the 'FOUND' state from the database,
-    updates their status to 'PROCESSING', and then uses a responder agent to
-    generate a response for each buzz. The generated response is stored back
-    in the database, and the buzz status is updated to 'ACTIVE'. If any error
-    occurs during the process, the buzz status is set back to 'FOUND'.
-
-    Raises:
-        Exception: If any error occurs during the processing of a buzz,
-            the exception is caught, logged, and re-raised after setting the
-            buzz status back to 'FOUND'.
+    updates their status to 'PROCESSING', and answers them with the responder
+    agent using a pool of `BUZZ_WORKER_CONCURRENCY` workers. Buzzes are taken
+    from a priority queue (see `buzz_priority`) and responder calls are
+    rate limited by a token bucket. Generated responses are stored in batches
+    and their buzz status is set to 'ACTIVE'; a buzz whose processing fails is
+    set back to 'FOUND'. Sessions that had no active buzz get the first newly
+    active one displayed.
     """
     found_buzz_list = await supabase_util.get_found_buzz()
     found_buzz_object_list = [ProcessFoundBuzz(**buzz) for buzz in found_buzz_list]
@@ -45,42 +181,36 @@ async def process_buzz():
     await supabase_util.update_buzz_status_batch_by_id(
         id_list=found_buzz_id_list, buzz_status=BuzzStatusEnum.PROCESSING.value
     )
-    for buzz in found_buzz_object_list:
-        try:
-            await asyncio.sleep(2)
-            response = await responder_agent.run(
-                user_prompt=f"Generate response within 300 words for this "
-                            f"{buzz.buzz_type.strip().upper()}:\n{buzz.original_chat}",
-                result_type=str,
-            )
 
-            current_buzz = await supabase_util.get_current_buzz(buzz.session_id)
-            if not current_buzz:
-                # Display buzz
-                buzz_message = {"buzz_type": buzz.buzz_type, "original_chat":
-                    buzz.original_chat, "author": buzz.author, "generated_response":
-                    response.data}
-                buzz_message_display = await buzz_intern_agent.run(
-                    f"""
-                1. Extract: `buzz_type`, `original_chat`, `author`, 
-                `generated_response` from the given json
-                2. Format and return the data in a readable, concise manner. Use 
-                spacing and line breaks for clarity, if required.\n{buzz_message}""")
-                await supabase_util.store_message(
-                    session_id=buzz.session_id,
-                    message_type="ai",
-                    content=buzz_message_display.data,
-                )
+    # Sessions without a current buzz get one displayed once responses land
+    session_ids = list({buzz.session_id for buzz in found_buzz_object_list})
+    current_buzzes = await asyncio.gather(
+        *(supabase_util.get_current_buzz(session_id) for session_id in session_ids)
+    )
+    batcher = BuzzStatusBatcher(
+        {session_id for session_id, current in zip(session_ids, current_buzzes) if not current}
+    )
 
-            await supabase_util.update_buzz_response_by_id(
-                buzz_id=buzz.id, generated_response=response.data
-            )
+    buzz_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+    for buzz in found_buzz_object_list:
+        buzz_queue.put_nowait((buzz_priority(buzz), buzz))
 
-        except Exception as e:
-            print(f"Error>> process_buzz: {str(e)}")
-            await supabase_util.update_buzz_status_by_id(
-                buzz_id=buzz.id, buzz_status=BuzzStatusEnum.FOUND.value
-            )
+    async def worker():
+        while True:
+            try:
+                _, buzz = buzz_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                generated_response = await generate_buzz_response(buzz)
+                await batcher.add_response(buzz, generated_response)
+            except Exception as e:
+                print(f"Error>> process_buzz: {str(e)}")
+                await batcher.add_failure(buzz)
+
+    worker_count = min(BUZZ_WORKER_CONCURRENCY, len(found_buzz_object_list))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+    await batcher.flush()
 
 
 def filter_chat_message(chat: str) -> str:
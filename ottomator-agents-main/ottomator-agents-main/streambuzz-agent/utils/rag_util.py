@@ -1,9 +1,11 @@
 import asyncio
 import base64
+import hashlib
 import json
 import os
 import re
-from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -12,7 +14,9 @@ from agents.buzz_intern import buzz_intern_agent
 from constants.constants import (ACCEPTED_FILE_EXTENSION, ACCEPTED_FILE_MIME,
                                  ACCEPTED_FILE_QUANTITY, CHUNK_SIZE,
                                  EMBEDDING_DIMENSIONS, EMBEDDING_MODEL_NAME,
-                                 MAX_FILE_SIZE_B, MAX_FILE_SIZE_MB, SUMMARY, TITLE)
+                                 KB_EMBEDDING_BATCH_SIZE, KB_LLM_CONCURRENCY,
+                                 MAX_FILE_SIZE_B, MAX_FILE_SIZE_MB,
+                                 QUERY_EMBEDDING_CACHE_SIZE, SUMMARY, TITLE)
 from constants.prompts import TITLE_SUMMARY_PROMPT
 from exceptions.user_error import UserError
 from logger import log_method
@@ -21,6 +25,9 @@ from utils import supabase_util
 
 load_dotenv()
 
+# Query text -> embedding, most recently used last
+_query_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
 
 @log_method
 async def get_title_and_summary(chunk: str) -> dict:
@@ -160,7 +167,10 @@ async def get_embedding(text: str) -> List[float]:
     """
     try:
         genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        response = genai.embed_content(model=EMBEDDING_MODEL_NAME, content=text)
+        # The Gemini client is synchronous; keep the request off the event loop
+        response = await asyncio.to_thread(
+            genai.embed_content, model=EMBEDDING_MODEL_NAME, content=text
+        )
         return response["embedding"]
     except Exception as e:
         print(f"Error getting embedding: {e}")
@@ -168,40 +178,58 @@ async def get_embedding(text: str) -> List[float]:
 
 
 @log_method
-async def process_chunk(
-    chunk_number: int, session_id: str, file_name: str, chunk: str
-) -> ProcessedChunk:
-    """Processes a single chunk of text to extract metadata and generate embeddings.
+async def get_embeddings(texts: List[str]) -> List[List[float]]:
+    """Generates embedding vectors for many texts with batched Gemini requests.
 
-    This function orchestrates the extraction of title and summary using
-    `get_title_and_summary`, generates embeddings using `get_embedding`, and
-    packages the results into a `ProcessedChunk` object.
+    Texts are sent `KB_EMBEDDING_BATCH_SIZE` at a time in a single
+    `embed_content` call each, instead of one request per text.
 
     Args:
-        chunk_number: The index of the chunk in the original document.
-        session_id: The unique ID of the user session.
-        file_name: The name of the file the chunk belongs to.
-        chunk: The text content of the chunk.
+        texts: The input text strings to embed.
 
     Returns:
-        A `ProcessedChunk` object containing the session ID, file name, chunk
-        number, extracted title, summary, content, and embedding vector.
+        One embedding per input text, in order. A batch that fails is returned
+        as zero vectors of size `EMBEDDING_DIMENSIONS`.
     """
-    # Get title and summary
-    extracted = await get_title_and_summary(chunk)
-
-    # Get embedding
-    embedding = await get_embedding(chunk)
-
-    return ProcessedChunk(
-        session_id=session_id,
-        file_name=file_name,
-        chunk_number=chunk_number,
-        title=extracted[TITLE],
-        summary=extracted[SUMMARY],
-        content=chunk,
-        embedding=embedding,
-    )
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+    embeddings: List[List[float]] = []
+    for start in range(0, len(texts), KB_EMBEDDING_BATCH_SIZE):
+        batch = texts[start:start + KB_EMBEDDING_BATCH_SIZE]
+        try:
+            response = await asyncio.to_thread(
+                genai.embed_content, model=EMBEDDING_MODEL_NAME, content=batch
+            )
+            embeddings.extend(response["embedding"])
+        except Exception as e:
+            print(f"Error getting embeddings: {e}")
+            embeddings.extend([0] * EMBEDDING_DIMENSIONS for _ in batch)
+    return embeddings
+
+
+@log_method
+async def get_query_embedding(query: str) -> List[float]:
+    """Returns the embedding for a search query, using an in-memory LRU cache.
+
+    Viewers often ask the same questions during a stream, so repeated queries
+    skip the embedding request. Failed (zero vector) embeddings are not cached.
+
+    Args:
+        query: The query text.
+
+    Returns:
+        A list of floats representing the query embedding.
+    """
+    cached = _query_embedding_cache.get(query)
+    if cached is not None:
+        _query_embedding_cache.move_to_end(query)
+        return cached
+
+    embedding = await get_embedding(query)
+    if any(embedding):
+        _query_embedding_cache[query] = embedding
+        if len(_query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            _query_embedding_cache.popitem(last=False)
+    return embedding
 
 
 @log_method
@@ -269,35 +297,150 @@ async def chunk_text(text: str, chunk_size: int = CHUNK_SIZE) -> List[str]:
     return chunks
 
 
+def get_content_hash(content: str) -> str:
+    """Returns the SHA-256 hex digest of a chunk's content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@log_method
+async def process_chunks(
+    session_id: str, file_name: str, chunks: List[Tuple[int, str]]
+) -> List[ProcessedChunk]:
+    """Processes many chunks with batched embeddings and bounded LLM calls.
+
+    Embeddings for all chunks are generated with `get_embeddings`, while
+    titles and summaries are extracted at most `KB_LLM_CONCURRENCY` at a time
+    so a knowledge base upload does not crowd out chat processing.
+
+    Args:
+        session_id: The unique ID of the user session.
+        file_name: The name of the file the chunks belong to.
+        chunks: (chunk_number, chunk text) pairs.
+
+    Returns:
+        One `ProcessedChunk` per input chunk, in order.
+    """
+    if not chunks:
+        return []
+
+    semaphore = asyncio.Semaphore(KB_LLM_CONCURRENCY)
+
+    async def bounded_title_and_summary(chunk: str) -> dict:
+        async with semaphore:
+            return await get_title_and_summary(chunk)
+
+    extracted_list, embeddings = await asyncio.gather(
+        asyncio.gather(*[bounded_title_and_summary(chunk) for _, chunk in chunks]),
+        get_embeddings([chunk for _, chunk in chunks]),
+    )
+
+    return [
+        ProcessedChunk(
+            session_id=session_id,
+            file_name=file_name,
+            chunk_number=chunk_number,
+            title=extracted[TITLE],
+            summary=extracted[SUMMARY],
+            content=chunk,
+            embedding=embedding,
+            content_hash=get_content_hash(chunk),
+        )
+        for (chunk_number, chunk), extracted, embedding in zip(
+            chunks, extracted_list, embeddings
+        )
+    ]
+
+
 @log_method
 async def process_and_store_document(
     session_id: str, file_name: str, file_content: str
-):
-    """Processes a document by splitting it into chunks, extracting metadata, and storing it.
+) -> Dict[str, int]:
+    """Processes a document and stores only the chunks that changed.
 
-    This function orchestrates the processing of a document by first splitting it into
-    chunks using `chunk_text`, then processes each chunk in parallel using
-    `process_chunk`, and finally stores the processed chunks in a database
-    in parallel using `supabase_util.insert_chunk`.
+    The document is split with `chunk_text` and each chunk is hashed. The
+    result is diffed against the hashes already stored for the session:
+
+    - Chunks with the same hash at the same position are left untouched.
+    - Chunks whose content moved to another position reuse the stored title,
+      summary and embedding.
+    - Only genuinely new chunks go through `process_chunks`.
+    - Stale rows are deleted, and new rows are written with multi-row inserts.
 
     Args:
         session_id: The unique ID of the user session.
         file_name: The name of the file being processed.
         file_content: The text content of the file.
+
+    Returns:
+        A dictionary with the number of `unchanged`, `reused`, `new` and
+        `deleted` chunks.
     """
     # Split into chunks
     chunks = await chunk_text(file_content)
+    hashes = [get_content_hash(chunk) for chunk in chunks]
+
+    existing = await supabase_util.get_kb_chunk_hashes(session_id)
+    existing_by_position: Dict[int, Dict[str, Any]] = {
+        row["chunk_number"]: row for row in existing
+    }
+
+    unchanged_ids = set()
+    pending: List[Tuple[int, str, str]] = []
+    for chunk_number, (chunk, content_hash) in enumerate(zip(chunks, hashes)):
+        row = existing_by_position.get(chunk_number)
+        if row and row.get("content_hash") == content_hash:
+            unchanged_ids.add(row["id"])
+        else:
+            pending.append((chunk_number, chunk, content_hash))
+
+    stale_rows = [row for row in existing if row["id"] not in unchanged_ids]
+
+    # Reuse metadata and embeddings of stale rows whose content moved
+    pending_hashes = {content_hash for _, _, content_hash in pending}
+    reusable_ids: Dict[str, int] = {}
+    for row in stale_rows:
+        if row.get("content_hash") in pending_hashes:
+            reusable_ids.setdefault(row["content_hash"], row["id"])
+    reusable: Dict[str, Dict[str, Any]] = {
+        row["content_hash"]: row
+        for row in await supabase_util.get_kb_chunks_by_id(list(reusable_ids.values()))
+    }
+
+    processed: List[ProcessedChunk] = []
+    to_process: List[Tuple[int, str]] = []
+    for chunk_number, chunk, content_hash in pending:
+        row = reusable.get(content_hash)
+        if row is None:
+            to_process.append((chunk_number, chunk))
+            continue
+        embedding = row["embedding"]
+        processed.append(
+            ProcessedChunk(
+                session_id=session_id,
+                file_name=file_name,
+                chunk_number=chunk_number,
+                title=row[TITLE],
+                summary=row[SUMMARY],
+                content=chunk,
+                embedding=json.loads(embedding) if isinstance(embedding, str) else embedding,
+                content_hash=content_hash,
+            )
+        )
+    reused = len(processed)
+    processed.extend(await process_chunks(session_id, file_name, to_process))
 
-    # Process chunks in parallel
-    tasks = [
-        process_chunk(index, session_id, file_name, chunk)
-        for index, chunk in enumerate(chunks)
-    ]
-    processed_chunks = await asyncio.gather(*tasks)
+    # Delete first so re-numbered chunks do not hit the (session_id, chunk_number) key
+    await supabase_util.delete_kb_entries_by_id([row["id"] for row in stale_rows])
+    if unchanged_ids:
+        await supabase_util.update_kb_file_name(session_id, file_name)
+    await supabase_util.insert_chunks(processed)
 
-    # Store chunks in parallel
-    insert_tasks = [supabase_util.insert_chunk(chunk) for chunk in processed_chunks]
-    await asyncio.gather(*insert_tasks)
+    return {
+        "unchanged": len(unchanged_ids),
+        "reused": reused,
+        "new": len(to_process),
+        "deleted": len(stale_rows),
+    }
 
 
 @log_method
@@ -305,9 +448,9 @@ async def create_knowledge_base(request: AgentRequest) -> None:
     """Creates a knowledge base from a user-uploaded document.
 
     This function handles the creation of a knowledge base from a document,
-    including retrieving the file content, checking for and deleting any existing
-    knowledge base associated with the session, processing the new document to
-    create a new knowledge base, and storing a success message in the database.
+    including retrieving the file content, diffing the new document against any
+    existing knowledge base associated with the session so that only changed
+    chunks are processed, and storing a success message in the database.
 
     Args:
         request: An `AgentRequest` object containing the session ID and file
@@ -316,10 +459,12 @@ async def create_knowledge_base(request: AgentRequest) -> None:
     response_string = ""
     file_name, file_content = await get_file_contents(request.files)
     previous_file_name: str = await supabase_util.get_kb_file_name(request.session_id)
+    stats = await process_and_store_document(request.session_id, file_name, file_content)
     if previous_file_name:
-        await supabase_util.delete_previous_kb_entries(request.session_id)
-        response_string += f"Discarding previous knowledge base {previous_file_name}.\n"
-    await process_and_store_document(request.session_id, file_name, file_content)
+        response_string += (
+            f"Replacing previous knowledge base {previous_file_name} "
+            f"({stats['unchanged'] + stats['reused']} unchanged chunks reused).\n"
+        )
     response_string += (
         f"Knowledge base built with {file_name} successfully and ready for use. "
         f"Analyzing a response to your query ..."
@@ -0,0 +1,45 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Asynchronous token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each
+    `acquire` call takes one token, waiting until one is available. Waiters
+    are served in arrival order.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (int): Maximum number of tokens the bucket can hold, i.e. the
+            largest burst allowed without waiting.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket requires rate > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self):
+        """Waits for and consumes one token."""
+        # Created lazily so the lock binds to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
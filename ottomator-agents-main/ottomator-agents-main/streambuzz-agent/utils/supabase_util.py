@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
@@ -5,9 +6,9 @@ from fastapi import HTTPException
 from pydantic_ai.messages import (ModelRequest, ModelResponse, TextPart,
                                   UserPromptPart)
 
-from constants.constants import (CONVERSATION_CONTEXT, MESSAGES, MODEL_RETRIES,
-                                 STREAMER_KB, SUPABASE_CLIENT, YT_BUZZ,
-                                 YT_REPLY, YT_STREAMS)
+from constants.constants import (CONVERSATION_CONTEXT, KB_INSERT_BATCH_SIZE,
+                                 MESSAGES, MODEL_RETRIES, STREAMER_KB,
+                                 SUPABASE_CLIENT, YT_BUZZ, YT_REPLY, YT_STREAMS)
 from constants.enums import BuzzStatusEnum, StateEnum
 from models.agent_models import ProcessedChunk
 from models.youtube_models import (StreamBuzzModel, StreamMetadataDB,
@@ -542,6 +543,36 @@ async def update_buzz_response_by_id(buzz_id: int, generated_response: str):
         )
 
 
+async def update_buzz_response_batch(buzz_list: List[Dict[str, Any]]):
+    """Stores generated responses for multiple buzz events in one request.
+
+    Each buzz is written with `buzz_status` set to `BuzzStatusEnum.ACTIVE.value`
+    and its `generated_response`. Rows are upserted on `id`, so every row must
+    carry all not-null columns of the `YT_BUZZ` table (`id`, `session_id`,
+    `author`, `buzz_type`, `original_chat`, `generated_response`); `created_at`
+    is left untouched.
+
+    Args:
+        buzz_list: A list of dictionaries, one per buzz event to update.
+
+    Raises:
+        HTTPException: If an error occurs during the database update, with a 500
+        status code and error details.
+    """
+    if not buzz_list:
+        return
+    try:
+        SUPABASE_CLIENT.table(YT_BUZZ).upsert(
+            [{**buzz, "buzz_status": BuzzStatusEnum.ACTIVE.value} for buzz in buzz_list],
+            on_conflict="id",
+        ).execute()
+    except Exception as e:
+        print(f"Error>> Failed at supabase_util: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to update_buzz_response_batch: {str(e)}"
+        )
+
+
 # YT_REPLY table queries
 async def store_reply(reply: WriteChatModel):
     """Stores a chat reply in the `YT_REPLY` table.
@@ -736,64 +767,155 @@ async def get_kb_file_name(session_id: str) -> Optional[str]:
         )
 
 
-async def delete_previous_kb_entries(session_id: str):
-    """Deletes all knowledge base entries for a given session.
+async def get_kb_chunk_hashes(session_id: str) -> List[Dict[str, Any]]:
+    """Retrieves the chunk numbers and content hashes of a session's knowledge base.
 
-    This function deletes all rows in the `STREAMER_KB` table that match the
-    provided `session_id`.
+    Only lightweight columns are selected (no content or embedding), so the
+    result can be used to diff a re-uploaded document cheaply.
 
     Args:
         session_id: The unique identifier of the session.
 
+    Returns:
+        A list of dictionaries with `id`, `chunk_number` and `content_hash`.
+
     Raises:
-        HTTPException: If an error occurs during the database deletion, with a 500
+        HTTPException: If an error occurs during the database query, with a 500
         status code and error details.
     """
     try:
-        SUPABASE_CLIENT.table(STREAMER_KB).delete().eq(
-            "session_id", session_id
-        ).execute()
+        response = await asyncio.to_thread(
+            SUPABASE_CLIENT.table(STREAMER_KB)
+            .select("id, chunk_number, content_hash")
+            .eq("session_id", session_id)
+            .execute
+        )
+        return response.data
     except Exception as e:
         print(f"Error>> Failed at supabase_util: {str(e)}")
         raise HTTPException(
-            status_code=500, detail=f"Failed to delete_previous_kb_entries: {str(e)}"
+            status_code=500, detail=f"Failed to get_kb_chunk_hashes: {str(e)}"
         )
 
 
-async def insert_chunk(chunk: ProcessedChunk):
-    """Inserts a processed chunk into the `STREAMER_KB` table.
-
-    This function inserts a new row into the `STREAMER_KB` table with the
-    details of the provided processed chunk.
+async def get_kb_chunks_by_id(id_list: List[int]) -> List[Dict[str, Any]]:
+    """Retrieves title, summary, embedding and content hash for knowledge base rows.
 
     Args:
-        chunk: A `ProcessedChunk` object containing the chunk details.
+        id_list: The ids of the rows to fetch.
 
     Returns:
-        The result of the insertion operation.
+        A list of dictionaries, one per row found.
+
+    Raises:
+        HTTPException: If an error occurs during the database query, with a 500
+        status code and error details.
+    """
+    if not id_list:
+        return []
+    try:
+        response = await asyncio.to_thread(
+            SUPABASE_CLIENT.table(STREAMER_KB)
+            .select("id, title, summary, embedding, content_hash")
+            .in_("id", id_list)
+            .execute
+        )
+        return response.data
+    except Exception as e:
+        print(f"Error>> Failed at supabase_util: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get_kb_chunks_by_id: {str(e)}"
+        )
+
+
+async def delete_kb_entries_by_id(id_list: List[int]):
+    """Deletes knowledge base rows by id.
+
+    Args:
+        id_list: The ids of the rows to delete.
+
+    Raises:
+        HTTPException: If an error occurs during the database deletion, with a 500
+        status code and error details.
+    """
+    if not id_list:
+        return
+    try:
+        await asyncio.to_thread(
+            SUPABASE_CLIENT.table(STREAMER_KB).delete().in_("id", id_list).execute
+        )
+    except Exception as e:
+        print(f"Error>> Failed at supabase_util: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to delete_kb_entries_by_id: {str(e)}"
+        )
+
+
+async def update_kb_file_name(session_id: str, file_name: str):
+    """Sets the file name on every knowledge base row of a session.
+
+    Args:
+        session_id: The unique identifier of the session.
+        file_name: The name of the uploaded file.
+
+    Raises:
+        HTTPException: If an error occurs during the database update, with a 500
+        status code and error details.
+    """
+    try:
+        await asyncio.to_thread(
+            SUPABASE_CLIENT.table(STREAMER_KB)
+            .update({"file_name": file_name})
+            .eq("session_id", session_id)
+            .neq("file_name", file_name)
+            .execute
+        )
+    except Exception as e:
+        print(f"Error>> Failed at supabase_util: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to update_kb_file_name: {str(e)}"
+        )
+
+
+def _chunk_row(chunk: ProcessedChunk) -> Dict[str, Any]:
+    return {
+        "session_id": chunk.session_id,
+        "file_name": chunk.file_name,
+        "chunk_number": chunk.chunk_number,
+        "title": chunk.title,
+        "summary": chunk.summary,
+        "content": chunk.content,
+        "embedding": chunk.embedding,
+        "content_hash": chunk.content_hash,
+    }
+
+
+async def insert_chunks(chunks: List[ProcessedChunk]):
+    """Inserts processed chunks into the `STREAMER_KB` table with multi-row inserts.
+
+    Rows are written `KB_INSERT_BATCH_SIZE` at a time, off the event loop.
+
+    Args:
+        chunks: The `ProcessedChunk` objects to insert.
 
     Raises:
         HTTPException: If an error occurs during the database insertion, with a 500
         status code and error details.
     """
     try:
-        data = {
-            "session_id": chunk.session_id,
-            "file_name": chunk.file_name,
-            "chunk_number": chunk.chunk_number,
-            "title": chunk.title,
-            "summary": chunk.summary,
-            "content": chunk.content,
-            "embedding": chunk.embedding,
-        }
-
-        result = SUPABASE_CLIENT.table(STREAMER_KB).insert(data).execute()
-        print(f"Inserted chunk {chunk.chunk_number} for {chunk.session_id}")
-        return result
+        for start in range(0, len(chunks), KB_INSERT_BATCH_SIZE):
+            batch = chunks[start:start + KB_INSERT_BATCH_SIZE]
+            await asyncio.to_thread(
+                SUPABASE_CLIENT.table(STREAMER_KB)
+                .insert([_chunk_row(chunk) for chunk in batch])
+                .execute
+            )
+        if chunks:
+            print(f"Inserted {len(chunks)} chunks for {chunks[0].session_id}")
     except Exception as e:
         print(f"Error>> Failed at supabase_util: {str(e)}")
         raise HTTPException(
-            status_code=500, detail=f"Failed to insert_chunk: {chunk=}\n{str(e)}"
+            status_code=500, detail=f"Failed to insert_chunks: {str(e)}"
         )
 
 
@@ -820,14 +942,17 @@ async def get_matching_chunks(
         status code and error details.
     """
     try:
-        response = SUPABASE_CLIENT.rpc(
-            "match_streamer_knowledge",
-            {
-                "query_embedding": query_embedding,
-                "user_session_id": session_id,
-                "match_count": CONVERSATION_CONTEXT,
-            },
-        ).execute()
+        # The Supabase client is synchronous; keep the request off the event loop
+        response = await asyncio.to_thread(
+            SUPABASE_CLIENT.rpc(
+                "match_streamer_knowledge",
+                {
+                    "query_embedding": query_embedding,
+                    "user_session_id": session_id,
+                    "match_count": CONVERSATION_CONTEXT,
+                },
+            ).execute
+        )
 
         return response.data
     except Exception as e:
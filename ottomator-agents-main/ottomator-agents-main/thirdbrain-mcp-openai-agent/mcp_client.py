@@ -8,7 +8,6 @@ from exceptions import ConfigurationError, ConnectionError, ToolError
 from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Optional, Union, Any, Dict, List
-from contextlib import AsyncExitStack
 from colorama import init, Fore, Style
 init(autoreset=True)  # Initialize colorama with autoreset=True
 
@@ -96,136 +95,307 @@ class Deps:
     supabase: Client
     session_id: str
 
+# Tools whose schema is known to be rejected by the LLM API
+EXCLUDED_TOOLS = {"xxx"}
+
+
+def simplify_schema(schema: dict) -> dict:
+    """
+    Simplifies a JSON schema by removing unsupported constructs like 'allOf', 'oneOf', etc.,
+    and preserving the core structure and properties. Needed for pandoc to work with the LLM.
+
+    Args:
+        schema (dict): The original JSON schema.
+
+    Returns:
+        dict: A simplified JSON schema.
+    """
+    # Create a new schema with only the basic structure
+    simplified_schema = {
+        "type": "object",
+        "properties": schema.get("properties", {}),
+        "required": schema.get("required", []),
+        "additionalProperties": schema.get("additionalProperties", False)
+    }
+
+    # Remove unsupported constructs like 'allOf', 'oneOf', 'anyOf', 'not', 'enum' at the top level
+    for key in ["allOf", "oneOf", "anyOf", "not", "enum"]:
+        if key in simplified_schema:
+            del simplified_schema[key]
+
+    return simplified_schema
+
 class MCPClient:
     """
     A client class for interacting with the MCP (Model Control Protocol) server.
     This class manages the connection and communication with the tools through MCP.
+
+    Each server session is owned by its own background task, so servers start
+    concurrently and can be connected or disconnected independently. Tool
+    schemas are simplified once per server and served from a versioned
+    registry that only changes when the set of connected servers does.
     """
     def __init__(self):
         # Initialize sessions and agents dictionaries
         self.sessions: Dict[str, ClientSession] = {}  # Dictionary to store {server_name: session}
         self.agents: Dict[str, Agent] = {}  # Dictionary to store {server_name: agent}
-        self.exit_stack = AsyncExitStack()
+        self.server_tasks: Dict[str, tuple[asyncio.Task, asyncio.Event]] = {}  # {server_name: (task, stop event)}
+        self.server_timeout = float(os.getenv("MCP_SERVER_TIMEOUT", "30"))  # Seconds per server startup
         self.available_tools = []
         self.tools = {}
+        self.server_tools: Dict[str, Dict[str, dict]] = {}  # {server_name: {tool_name: registry entry}}
+        self.tool_registry: Dict[str, dict] = {}  # Merged view returned by get_available_tools
+        self.tools_version = 0  # Bumped whenever the tool registry is rebuilt
         self.connected = False
         self.config_file = 'mcp_config.json'
         self.dynamic_tools: List[Tool] = []  # List to store dynamic pydantic tools
 
+    def _load_config(self) -> dict:
+        try:
+            with open(self.config_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise ConfigurationError(f"{self.config_file} file not found.")
+        except json.JSONDecodeError:
+            raise ConfigurationError(f"{self.config_file} is not a valid JSON file.")
+
     async def connect_to_server(self) -> None:
         """
-        Connect to the MCP server using the configuration file.
-        
+        Connect to all enabled MCP servers in the configuration file concurrently.
+
+        Each server gets `MCP_SERVER_TIMEOUT` seconds (default 30) to start and
+        list its tools. Servers that fail or time out are logged and skipped so
+        one slow server does not hold up the others.
+
         Raises:
             ConfigurationError: If the configuration file is missing or invalid.
-            ConnectionError: If unable to connect to the MCP server.
+            ConnectionError: If none of the enabled MCP servers could be connected.
         """
         if self.connected:
             logging.info("Already connected to servers.")
             return
 
         logger.info(f"Loading configuration from {self.config_file}.")
-        try:
-            with open(self.config_file) as f:
-                config = json.load(f)
-        except FileNotFoundError:
-            raise ConfigurationError(f"{self.config_file} file not found.")
-        except json.JSONDecodeError:
-            raise ConfigurationError(f"{self.config_file} is not a valid JSON file.")
-        
+        config = self._load_config()
+
         logger.debug("Available servers in config: %s", list(config['mcpServers'].keys()))
-        
+
         # Connect only to enabled servers in config
+        enabled = {}
         for server_name, server_config in config['mcpServers'].items():
             logger.info(f"Processing server configuration for {server_name}.")
             logger.debug(f"Server configuration details: %s", json.dumps(server_config, indent=2))
             if server_config.get("enable", False):
-                logger.debug(f"Attempting to load {server_name} server config.")
-                
-                server_params = StdioServerParameters(
-                    command=server_config['command'],
-                    args=server_config['args'],
-                    env=server_config.get('env'),
-                )
-                logger.info("Created server parameters: command=%s, args=%s, env=%s",
-                              server_params.command, server_params.args, server_params.env)
-               
-                try:
-                    # Create and store session with server name as key
-                    stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
-                    stdio, write = stdio_transport
-                    session = await self.exit_stack.enter_async_context(ClientSession(stdio, write))
+                enabled[server_name] = server_config
+            else:
+                logging.info(f"Server {server_name} is disabled. Skipping connection.")
+
+        errors = await self._connect_servers(enabled)
+        if enabled and len(errors) == len(enabled):
+            raise ConnectionError(
+                "Failed to connect to MCP servers: "
+                + "; ".join(f"{name}: {error}" for name, error in errors.items())
+            )
+        logging.info("Done connecting to servers.")
+
+    async def _connect_servers(self, servers: Dict[str, dict]) -> Dict[str, str]:
+        """
+        Start several servers concurrently and rebuild the tool registry once.
+
+        Args:
+            servers (Dict[str, dict]): {server_name: server_config} to connect.
+
+        Returns:
+            Dict[str, str]: {server_name: error message} for servers that failed.
+        """
+        servers = {name: cfg for name, cfg in servers.items() if name not in self.sessions}
+        if not servers:
+            return {}
+
+        results = await asyncio.gather(
+            *(self._connect_one(name, cfg) for name, cfg in servers.items()),
+            return_exceptions=True,
+        )
+        errors = {}
+        for server_name, result in zip(servers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to connect to MCP server {server_name}: {result}")
+                errors[server_name] = str(result) or type(result).__name__
+
+        if len(errors) < len(servers):
+            self.connected = True
+            self._refresh_tool_registry()
+        return errors
+
+    async def _connect_one(self, server_name: str, server_config: dict) -> None:
+        """
+        Start a server session in its own task and register its tools.
+
+        Raises:
+            ConnectionError: If the server fails to start or exceeds the startup timeout.
+        """
+        server_params = StdioServerParameters(
+            command=server_config['command'],
+            args=server_config['args'],
+            env=server_config.get('env'),
+        )
+        logger.info("Created server parameters: command=%s, args=%s, env=%s",
+                      server_params.command, server_params.args, server_params.env)
+
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._serve(server_name, server_params, ready, stop))
+        try:
+            session, tools = await asyncio.wait_for(asyncio.shield(ready), timeout=self.server_timeout)
+        except Exception as e:
+            stop.set()
+            task.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                raise ConnectionError(f"Timed out after {self.server_timeout:g}s starting MCP server {server_name}")
+            raise ConnectionError(f"Failed to connect to MCP server {server_name}: {str(e)}")
+
+        self.server_tasks[server_name] = (task, stop)
+        self.sessions[server_name] = session
+        self._register_server_tools(server_name, tools)
+
+    async def _serve(self, server_name: str, server_params: StdioServerParameters,
+                     ready: asyncio.Future, stop: asyncio.Event) -> None:
+        """
+        Own a server's stdio transport and session until `stop` is set.
+
+        The transport's task group must be entered and exited by the same task,
+        so each server keeps its contexts open here instead of on a shared exit stack.
+        """
+        try:
+            async with stdio_client(server_params) as (stdio, write):
+                async with ClientSession(stdio, write) as session:
                     await session.initialize()
-                    self.sessions[server_name] = session
-                    
-                    # Create and store an Agent for this server
-                    server_agent: Agent = Agent(
-                        model,
-                        system_prompt=(
-                            f"You are an AI assistant that helps interact with the {server_name} server. "
-                            "You will use the available tools to process requests and provide responses."
-                            "Make sure to always give feedback to the user after you have called the tool, especially when the tool does not generate any message itself."
-                        )
-                    )
-                    self.agents[server_name] = server_agent
-                    
-                    # List available tools for this server
                     response = await session.list_tools()
-                    server_tools = [{
-                        "name": f"{server_name}__{tool.name}",
-                        "description": tool.description,
-                        "input_schema": tool.inputSchema
-                    } for tool in response.tools]
+                    if not ready.done():
+                        ready.set_result((session, response.tools))
+                    await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error(f"MCP server {server_name} exited with error: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+    async def _disconnect_server(self, server_name: str) -> None:
+        """Stop a server's session task and forget its session, agent and tools."""
+        self.sessions.pop(server_name, None)
+        self.agents.pop(server_name, None)
+        self.server_tools.pop(server_name, None)
+        self.available_tools = [
+            tool for tool in self.available_tools
+            if not tool["name"].startswith(f"{server_name}__")
+        ]
+        self.tools = {name: tool for name, tool in self.tools.items() if tool.get("server") != server_name}
+
+        task, stop = self.server_tasks.pop(server_name, (None, None))
+        if task is not None:
+            stop.set()
+            try:
+                await asyncio.wait_for(task, timeout=self.server_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"MCP server {server_name} did not shut down in time.")
+            except Exception as e:
+                logger.error(f"Error shutting down MCP server {server_name}: {e}")
+
+    def _register_server_tools(self, server_name: str, tools: list) -> None:
+        """
+        Build the agent, dynamic tools and precomputed schemas for one server.
+
+        Args:
+            server_name (str): The name of the server.
+            tools (list): Tools returned by the server's list_tools call.
+        """
+        # Create and store an Agent for this server
+        server_agent: Agent = Agent(
+            model,
+            system_prompt=(
+                f"You are an AI assistant that helps interact with the {server_name} server. "
+                "You will use the available tools to process requests and provide responses."
+                "Make sure to always give feedback to the user after you have called the tool, especially when the tool does not generate any message itself."
+            )
+        )
+        self.agents[server_name] = server_agent
+
+        server_tools = [{
+            "name": f"{server_name}__{tool.name}",
+            "description": tool.description,
+            "input_schema": tool.inputSchema
+        } for tool in tools]
+
+        # Add server's tools to overall available tools
+        self.available_tools.extend(server_tools)
+
+        registry = {}
+        for tool in tools:
+
+            # Long descriptions beyond 1023 are not supported with OpenAI,
+            # so replacing with a local file description optimized for use if it exists.
+            file_name = f"./mcp-tool-description-overrides/{server_name}__{tool.name}"
+
+            if os.path.exists(file_name):
+                try:
+                    with open(file_name, 'r') as f:
+                        tool.description = f.read()
                 except Exception as e:
-                    raise ConnectionError(f"Failed to connect to MCP server {server_name}: {str(e)}")
-                
-                # Add server's tools to overall available tools
-                self.available_tools.extend(server_tools)
-
-                # Create corresponding dynamic pydantic tools
-                # if pydantic-ai provides fix for OpenAI this can be used
-                # now no dynalic tools are used
-                for tool in response.tools:
-                    
-                    # Long descriptions beyond 1023 are not supported with OpenAI,
-                    # so replacing with a local file description optimized for use if it exists.
-                    file_name = f"./mcp-tool-description-overrides/{server_name}__{tool.name}"
-
-                    if os.path.exists(file_name):
-                        try:
-                            with open(file_name, 'r') as f:
-                                file_content = f.read()
-                            tool.description = file_content
-                        except Exception as e:
-                            logging.error(f"An error occurred while reading the file: {e}")
-                            raise
-                        finally: 
-                            f.close
-                    else:
-                        logger.debug(f"File '{file_name}' not found. Using default description.")
-
-                    # Create corresponding dynamic pydantic tools
-                    dynamic_tool = self.create_dynamic_tool(tool, server_name, server_agent)
-                    self.tools[tool.name] = {
+                    logging.error(f"An error occurred while reading the file: {e}")
+                    raise
+            else:
+                logger.debug(f"File '{file_name}' not found. Using default description.")
+
+            # Create corresponding dynamic pydantic tools
+            # if pydantic-ai provides fix for OpenAI this can be used
+            # now no dynalic tools are used
+            dynamic_tool = self.create_dynamic_tool(tool, server_name, server_agent)
+            self.tools[tool.name] = {
+                "name": tool.name,
+                "server": server_name,
+                "callable": self.call_tool(f"{server_name}__{tool.name}"),
+                "schema": {
+                    "type": "function",
+                    "function": {
                         "name": tool.name,
-                        "callable": self.call_tool(f"{server_name}__{tool.name}"),
-                        "schema": {
-                            "type": "function",
-                            "function": {
-                                "name": tool.name,
-                                "description": tool.description,
-                                "parameters": tool.inputSchema,
-                            },
+                        "description": tool.description,
+                        "parameters": tool.inputSchema,
+                    },
+                },
+            }
+
+            # Precompute the OpenAI-compatible entry served by get_available_tools
+            name = f"{server_name}__{tool.name}"
+            if name not in EXCLUDED_TOOLS:
+                registry[name] = {
+                    "name": name,
+                    "callable": self.call_tool(name),  # returns a callable function for the rpc call
+                    "schema": {
+                        "type": "function",
+                        "function": {
+                            "name": name,
+                            "description": (tool.description or "")[:1023],
+                            "parameters": simplify_schema(tool.inputSchema or {})
                         },
-                    }
-                    logger.debug(f"Added tool: {tool.name}")
-                
-                logger.info(f"Connected to server {server_name} with tools: {', '.join(tool['name'] for tool in server_tools)}")
+                    },
+                }
+            logger.debug(f"Added tool: {tool.name}")
 
-                self.connected = True
-            else:
-                logging.info(f"Server {server_name} is disabled. Skipping connection.")
-        logging.info("Done connecting to servers.")
+        self.server_tools[server_name] = registry
+        logger.info(f"Connected to server {server_name} with tools: {', '.join(tool['name'] for tool in server_tools)}")
+
+    def _refresh_tool_registry(self) -> None:
+        """Rebuild the merged tool registry from the per-server schemas and bump its version."""
+        self.tool_registry = {
+            name: entry
+            for server_name in self.sessions
+            for name, entry in self.server_tools.get(server_name, {}).items()
+        }
+        self.tools_version += 1
+        logger.info(f"Tool registry v{self.tools_version}: {len(self.tool_registry)} tools from {len(self.sessions)} servers")
 
     async def add_mcp_configuration(self, query: str) -> Optional[str]:
         """
@@ -301,6 +471,9 @@ class MCPClient:
             with open(self.config_file, "w") as f:
                 json.dump(config, f, indent=2)
 
+            if not config["mcpServers"][server_name]["enable"]:
+                return f"Successfully added server '{server_name}' (disabled)."
+
             # Connect to the new server
             await self.connect_to_server_with_config(server_name, config["mcpServers"][server_name])
 
@@ -338,8 +511,8 @@ class MCPClient:
 
             # Disconnect the server if it is connected
             if server_name in self.sessions:
-                del self.sessions[server_name]
-                del self.agents[server_name]
+                await self._disconnect_server(server_name)
+                self._refresh_tool_registry()
 
             return f"Successfully removed and disconnected server '{server_name}'."
 
@@ -357,26 +530,13 @@ class MCPClient:
         Args:
             server_name (str): The name of the server.
             server_config (dict): The server configuration dictionary.
-        """
-        server_params = StdioServerParameters(
-            command=server_config['command'],
-            args=server_config['args'],
-            env=None
-        )
-        stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
-        stdio, write = stdio_transport
-        session = await self.exit_stack.enter_async_context(ClientSession(stdio, write))
-        await session.initialize()
-        self.sessions[server_name] = session
-
-        response = await session.list_tools()
-        server_tools = [{
-            "name": f"{server_name}__{tool.name}",
-            "description": tool.description,
-            "input_schema": tool.inputSchema
-        } for tool in response.tools]
 
-        self.available_tools.extend(server_tools)
+        Raises:
+            ConnectionError: If the server fails to start or times out.
+        """
+        errors = await self._connect_servers({server_name: server_config})
+        if server_name in errors:
+            raise ConnectionError(errors[server_name])
         return None
 
     async def list_mcp_servers(self) -> str:
@@ -432,17 +592,6 @@ class MCPClient:
         except Exception as e:
             return f"Error listing functions for server '{server_name}': {str(e)}"
 
-    async def cleanup(self) -> None:
-        """
-        Clean up resources by closing sessions and clearing tool lists.
-        """
-        logging.debug("Cleaning up resources...")
-        await self.exit_stack.aclose()
-        self.sessions.clear()
-        self.available_tools.clear()
-        self.connected = False
-        logging.info("Cleanup completed.")
-
     async def toggle_server_status(self, server_names: List[str], enable: bool) -> str:
         """
         Enable or disable specific MCP servers.
@@ -459,6 +608,7 @@ class MCPClient:
                 config = json.load(f)
 
             results = []
+            toggled = []
             for server_name in server_names:
                 if server_name not in config.get("mcpServers", {}):
                     results.append(f"Error: Server '{server_name}' does not exist in the configuration.")
@@ -466,6 +616,7 @@ class MCPClient:
 
                 # Update the enabled status
                 config["mcpServers"][server_name]["enable"] = enable
+                toggled.append(server_name)
                 status = "enabled" if enable else "disabled"
                 results.append(f"Successfully {status} server '{server_name}'.")
 
@@ -473,6 +624,16 @@ class MCPClient:
             with open(self.config_file, "w") as f:
                 json.dump(config, f, indent=2)
 
+            # Start or stop the toggled servers and refresh the tool registry once
+            if enable:
+                errors = await self._connect_servers({name: config["mcpServers"][name] for name in toggled})
+                results.extend(f"Error: Could not connect to server '{name}': {error}" for name, error in errors.items())
+            else:
+                connected = [name for name in toggled if name in self.sessions]
+                await asyncio.gather(*(self._disconnect_server(name) for name in connected))
+                if connected:
+                    self._refresh_tool_registry()
+
             return "\n".join(results)
 
         except FileNotFoundError:
@@ -482,72 +643,37 @@ class MCPClient:
         except Exception as e:
             return f"Error toggling server status: {str(e)}"
         
-    async def cleanup(self):
-        """Clean up resources."""
+    async def cleanup(self) -> None:
+        """
+        Clean up resources by closing sessions and clearing tool lists.
+        """
         logging.debug("Cleaning up resources...")
-        await self.exit_stack.aclose()
+        await asyncio.gather(*(self._disconnect_server(name) for name in list(self.server_tasks)))
         self.sessions.clear()
         self.available_tools.clear()
+        self.tools.clear()
+        self.server_tools.clear()
+        self._refresh_tool_registry()
         self.connected = False
         logging.info("Cleanup completed.")
     
-    async def get_available_tools(self) -> List[Any]:
+    async def get_available_tools(self) -> Dict[str, Any]:
         """
-        Retrieve a list of available tools from the MCP server.
-        Simplify the schema for each tool to make it compatible with the OpenAI API.
+        Retrieve the available tools from the connected MCP servers.
+
+        Schemas are simplified for the OpenAI API once, when a server connects,
+        and the registry is only rebuilt when servers are added, dropped, enabled
+        or disabled, so this is a lookup rather than a re-listing of every server.
+        Compare `tools_version` to detect changes.
 
         Returns:
-            List[Any]: A list of available tools with simplified schemas.
+            Dict[str, Any]: Available tools with simplified schemas, keyed by tool name.
         """
         if not self.sessions:
             raise RuntimeError("Not connected to MCP server")
-    
-        def simplify_schema(schema):
-            """
-            Simplifies a JSON schema by removing unsupported constructs like 'allOf', 'oneOf', etc.,
-            and preserving the core structure and properties. Needed for pandoc to work with the LLM.
-
-            Args:
-                schema (dict): The original JSON schema.
-
-            Returns:
-                dict: A simplified JSON schema.
-            """
-            # Create a new schema with only the basic structure
-            simplified_schema = {
-                "type": "object",
-                "properties": schema.get("properties", {}),
-                "required": schema.get("required", []),
-                "additionalProperties": schema.get("additionalProperties", False)
-            }
-
-            # Remove unsupported constructs like 'allOf', 'oneOf', 'anyOf', 'not', 'enum' at the top level
-            for key in ["allOf", "oneOf", "anyOf", "not", "enum"]:
-                if key in simplified_schema:
-                    del simplified_schema[key]
 
-            return simplified_schema
+        return self.tool_registry
 
-        return  {
-            tool['name']: {
-                "name": tool['name'],
-                "callable": self.call_tool(
-                    tool['name']
-                ),  # returns a callable function for the rpc call
-                "schema": {
-                    "type": "function",
-                    "function": {
-                        "name": tool['name'],
-                        "description": tool['description'][:1023],
-                        "parameters": simplify_schema(tool['input_schema'])
-                    },
-                },
-            }
-            for tool in self.available_tools
-            if tool['name']
-            != "xxx"  # Excludes xxx tool as it has an incorrect schema
-        }
-        
     def call_tool(self, server__tool_name: str) -> Any:
         """
         Create a callable function for a specific tool.
@@ -794,8 +920,6 @@ async def main():
     mcp_client = MCPClient()
     await mcp_client.connect_to_server()
 
-    tools = await mcp_client.get_available_tools()
-    
     # Start interactive prompt loop for user queries
     messages = None
     while True:
@@ -807,6 +931,8 @@ async def main():
             if user_input.startswith("/"):
                 response = await mcp_client.handle_slash_commands(user_input)
             else:
+                # Registry lookup is cheap and picks up servers changed via slash commands
+                tools = await mcp_client.get_available_tools()
                 # Process the prompt and run agent loop
                 response, messages = await agent_loop(user_input, tools, messages)
             logging.debug("Response:", response)